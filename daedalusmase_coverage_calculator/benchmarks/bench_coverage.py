@@ -0,0 +1,92 @@
+"""
+Rows per second and peak memory (RSS) of calculate_coverage on a synthetic orbit file of millions of rows, for several
+OrbitChunkSize values. Each chunk size runs in its own process, whose peak RSS (VmHWM of /proc/self/status, Linux) is not
+that of the others.
+
+    python benchmarks/bench_coverage.py [--rows 3000000] [--step 1] [--chunk-sizes 10000 100000 1000000] [--kp-year 2015]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(here, "..", "daedalusmase_coverage_calculator")]
+
+import data  # noqa: E402
+from utils import MonthAbbreviations  # noqa: E402
+
+COLUMNS = ["Epoch(UTCG)", "Lat_GEOD(deg)", "Lon_GEOD(deg)", "Height_WGS84 (km)", "Magnetic Latitude", "Magnetic Longitude", "MLT"]
+
+
+def write_orbit(filename, rows, step=1.0, start="2015-01-01", block=100000):
+    # a polar elliptic orbit of 90 minutes between 150 and 500 km, written in blocks so that the writer stays small
+    period = 5400.0
+    with open(filename, "w") as F:
+        F.write(",".join(COLUMNS) + "\n")
+        for first in range(0, rows, block):
+            t = np.arange(first, min(rows, first + block)) * step
+            times = np.datetime_as_string(np.datetime64(start, "ms") + (t * 1000).astype("m8[ms]"), unit="ms")
+            phase = 2 * np.pi * t / period
+            lat = np.degrees(np.arcsin(np.sin(phase) * np.sin(np.radians(96))))
+            lon = (np.degrees(np.arctan2(np.sin(phase) * np.cos(np.radians(96)), np.cos(phase))) - 360 * t / 86400 + 180) % 360 - 180
+            height = 325 - 175 * np.cos(phase / 1.1)
+            maglat = lat - 9 * np.cos(np.radians(lon + 72))
+            maglon = (lon + 72 + 180) % 360 - 180
+            mlt = (lon / 15 + (t % 86400) / 3600) % 24
+            for s, values in zip(times, zip(lat, lon, height, maglat, maglon, mlt)):
+                F.write("%s %s %s %s,%.3f,%.3f,%.3f,%.3f,%.3f,%.3f\n" % ((s[8:10], MonthAbbreviations[int(s[5:7]) - 1], s[0:4], s[11:23]) + values))
+
+
+def memory(field):
+    # MB of the VmRSS (current) or VmHWM (peak) field of the process
+    with open("/proc/self/status") as F:
+        return next(int(line.split()[1]) for line in F if line.startswith(field + ":")) / 1024
+
+
+def run(orbit, rows, chunk_size, kp_year, kp_path):
+    # one calculation, prints a row of the table
+    data.OrbitChunkSize = chunk_size
+    data.load_kp_indices(kp_path)
+    rss = memory("VmRSS")
+    results = os.path.join(tempfile.mkdtemp(), "coverage.txt")
+    start = time.perf_counter()
+    misses, hits, _, _ = data.calculate_coverage("bench", "synthetic orbit", orbit, str(kp_year), results)
+    seconds = time.perf_counter() - start
+    os.remove(results)
+    peak = memory("VmHWM")
+    print("%10d %9.2f %11.0f %9.0f %9.0f %10d" % (chunk_size, seconds, rows / seconds, peak, peak - rss, hits), flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=3000000)
+    parser.add_argument("--step", type=float, default=1.0, help="seconds between the rows")
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--kp-year", type=int, default=2015)
+    parser.add_argument("--kp-path", default=os.path.join(here, "..", "..", "Sample_Data", "geomagnetic_indices"))
+    parser.add_argument("--orbit", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.orbit:
+        run(args.orbit, args.rows, args.chunk_sizes[0], args.kp_year, args.kp_path)
+        return
+    folder = tempfile.mkdtemp()
+    orbit = os.path.join(folder, "orbit.csv")
+    start = time.perf_counter()
+    write_orbit(orbit, args.rows, args.step)
+    print("%d rows, %.0f MB written in %.1f s" % (args.rows, os.path.getsize(orbit) / 2 ** 20, time.perf_counter() - start))
+    print("%10s %9s %11s %9s %9s %10s" % ("chunk", "time s", "rows/s", "RSS MB", "+RSS MB", "hits"), flush=True)
+    for chunk_size in args.chunk_sizes:
+        subprocess.run([sys.executable, __file__, "--orbit", orbit, "--rows", str(args.rows), "--chunk-sizes", str(chunk_size), "--kp-year", str(args.kp_year),
+                        "--kp-path", args.kp_path], check=True)
+    os.remove(orbit)
+    os.rmdir(folder)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,12 @@ Thus the coverage for this Bin can be calculated.
 # imports used by the coverage calculation
 import csv
 import time
+import bisect
+import numpy as np
+import pandas as pd
+import os
 from os import path
+from datetime import date
 from utils import *
 
 Orbit_Files_Path = "../../Sample_Data/orbital_data/"  # holds the csv files which describe the orbit. Columns: Time Latitude Longitude MagneticLatitude MagneticLongitude MagneticLocalTime
@@ -267,18 +272,101 @@ def GetMatchedBin( MLT, MagLat, Altitude, Kp ):
                 Bin: the Bin in which the position represented by the arguments is matched.
     """
     
-    MatchedBin = None
-    for B in Bins:
-        Kp_min_to_check = B.Kp_min
-        if Kp_min_to_check == 0: Kp_min_to_check = -1
-        ####
-        if is_MLT_inside_range(MLT, B.MLT_min, B.MLT_max):
-            if         MagLat   > B.MagLat_min    and  MagLat   <= B.MagLat_max:
-                if     Altitude > B.Altitude_min  and  Altitude <= B.Altitude_max:
-                    if Kp       > Kp_min_to_check and  Kp       <= B.Kp_max:
-                        MatchedBin = B
-                        break
-    return MatchedBin
+    idx = get_bin_lookup().match( MLT, MagLat, Altitude, Kp )
+    if idx < 0: return None
+    return Bins[idx]
+
+
+'''
+Precompiled form of the Bins used by GetMatchedBin and match_bins.
+Each axis (MLT, MagLat, Altitude, Kp) is split into cells by the range limits of all Bins, so that every Bin covers whole cells.
+Table holds, for every combination of cells, the index of the first matching Bin or -1. The last cell of each axis is for nan values.
+'''
+class BinLookup:
+    
+    def __init__(self, BinsToSearch):
+        self.SearchedBins = tuple( BinsToSearch )
+        MLT_min      = np.array( [B.MLT_min for B in BinsToSearch], dtype=float )[:, None]
+        MLT_max      = np.array( [B.MLT_max for B in BinsToSearch], dtype=float )[:, None]
+        MagLat_min   = np.array( [B.MagLat_min for B in BinsToSearch], dtype=float )[:, None]
+        MagLat_max   = np.array( [B.MagLat_max for B in BinsToSearch], dtype=float )[:, None]
+        Altitude_min = np.array( [B.Altitude_min for B in BinsToSearch], dtype=float )[:, None]
+        Altitude_max = np.array( [B.Altitude_max for B in BinsToSearch], dtype=float )[:, None]
+        Kp_min       = np.array( [-1 if B.Kp_min == 0 else B.Kp_min for B in BinsToSearch], dtype=float )[:, None]
+        Kp_max       = np.array( [B.Kp_max for B in BinsToSearch], dtype=float )[:, None]
+        # all ranges are min<value<=max
+        self.Edges = [ np.unique( np.concatenate( ([0.], MLT_min.ravel(), MLT_max.ravel()) ) ),
+                       np.unique( np.concatenate( ([0.], MagLat_min.ravel(), MagLat_max.ravel()) ) ),
+                       np.unique( np.concatenate( ([0.], Altitude_min.ravel(), Altitude_max.ravel()) ) ),
+                       np.unique( np.concatenate( ([0.], Kp_min.ravel(), Kp_max.ravel()) ) ) ]
+        self.EdgeLists = [ E.tolist() for E in self.Edges ]
+        # one representative value for each cell: its right edge
+        MLT, MagLat, Altitude, Kp = [ np.concatenate( (E, [E[-1]+1, np.nan]) ) for E in self.Edges ]
+        # which cells each Bin covers, with the same comparisons as the linear search
+        with np.errstate(invalid='ignore'):
+            in_MLT = np.where( MLT_min <= MLT_max, (MLT > MLT_min) & (MLT <= MLT_max), (MLT > MLT_min) | (MLT <= MLT_max) )
+            in_MagLat   = (MagLat > MagLat_min) & (MagLat <= MagLat_max)
+            in_Altitude = (Altitude > Altitude_min) & (Altitude <= Altitude_max)
+            in_Kp       = (Kp > Kp_min) & (Kp <= Kp_max)
+        self.Table = np.full( (len(MLT), len(MagLat), len(Altitude), len(Kp)), -1, dtype=np.int32 )
+        for i in range(len(BinsToSearch)-1, -1, -1): # the first matching Bin is written last
+            self.Table[ np.ix_(in_MLT[i], in_MagLat[i], in_Altitude[i], in_Kp[i]) ] = i
+    
+    def describes(self, BinsToSearch):
+        return self.SearchedBins == tuple( BinsToSearch )
+    
+    def match(self, MLT, MagLat, Altitude, Kp):
+        # index of the Bin matching a single position, -1 if there is none
+        cells = list()
+        for n, value in enumerate( (MLT, MagLat, Altitude, Kp) ):
+            if value != value:
+                cells.append( self.Table.shape[n] - 1 )
+            else:
+                cells.append( bisect.bisect_left( self.EdgeLists[n], value ) )
+        return int( self.Table[ tuple(cells) ] )
+    
+    def match_array(self, MLT, MagLat, Altitude, Kp):
+        # index of the Bin matching each position, -1 where there is none
+        cells = list()
+        for n, values in enumerate( np.broadcast_arrays( *[ np.asarray(V, dtype=float) for V in (MLT, MagLat, Altitude, Kp) ] ) ):
+            cell = np.searchsorted( self.Edges[n], values )
+            cell[ np.isnan(values) ] = self.Table.shape[n] - 1
+            cells.append( cell )
+        return self.Table[ tuple(cells) ]
+
+CompiledBins = None # the BinLookup of the Bins as they were last searched
+
+def get_bin_lookup():
+    """
+        Returns the BinLookup of the Bins, compiling it again if Bins have been added, removed or replaced.
+        Call compile_bins() after changing the ranges of an existing Bin.
+    """
+    global CompiledBins
+    if CompiledBins is None  or  not CompiledBins.describes( Bins ):
+        CompiledBins = BinLookup( Bins )
+    return CompiledBins
+
+def compile_bins():
+    """
+        Compiles again the lookup table of the Bins. It is needed only when the ranges of an existing Bin have been changed.
+    """
+    global CompiledBins
+    CompiledBins = BinLookup( Bins )
+    return CompiledBins
+
+def match_bins( MLT, MagLat, Altitude, Kp ):
+    """
+        Vectorized form of GetMatchedBin. Finds the Bin of many satellite positions at once.
+        
+        Args:
+                MLT: array of Magnetic Local Times
+                MagLat: array of Magnetic Latitudes
+                Altitude: array of Altitudes
+                Kp: array of Kp-indices (or a single value for all positions)
+        Returns:
+                integer array: for each position the index of the matched Bin inside Bins, -1 where no Bin matches.
+    """
+    return get_bin_lookup().match_array( MLT, MagLat, Altitude, Kp )
 
 
 
@@ -336,6 +424,7 @@ def read_geomagnetic_indices(fromYear, toYear):
         Geomagnetic kp Indices Files Source (explanation): https://www.ngdc.noaa.gov/stp/GEOMAG/kp_ap.html
         Geomagnetic kp Indices Files Source (download)   : ftp://ftp.ngdc.noaa.gov/STP/GEOMAGNETIC_DATA/INDICES/KP_AP
         Allows the user to select which yeats to load in order to speed up execution.
+        The values are taken from the Kp-index store (see load_kp_indices), so the text files are parsed only when they change.
         
         Args:
                 fromYear: the first year for which the Geomagnetic kp Indices will be loaded
@@ -345,29 +434,115 @@ def read_geomagnetic_indices(fromYear, toYear):
     """
     
     global GeomagneticIndices
+    load_kp_indices()
+    FirstDay = date(KpFirstYear, 1, 1).toordinal()
     for Y in range(fromYear, toYear): # this range should be small for execution speed
-        with open(GeomagneticIndices_Files_Path + str(Y)) as fp:
+        if Y not in KpYears:
+            raise FileNotFoundError( GeomagneticIndices_Files_Path + str(Y) )
+        for d in range( date(Y, 1, 1).toordinal(), date(Y+1, 1, 1).toordinal() ):
+            day_kp = KpIndices[ (d-FirstDay)*8 : (d-FirstDay)*8+8 ]
+            if np.isnan(day_kp[0]): continue # this day is missing from the file
+            D = date.fromordinal(d)
+            day, month, year = num_to_2digit_str(D.day), num_to_2digit_str(D.month), str(Y)
+            for i in range(0, 8):
+                GeomagneticIndices[(day, month, year, str(i))] = float(day_kp[i])
+
+
+
+# Kp-index store: the Kp indices of all yearly files in a contiguous array. 
+# KpIndices[8*d + i] holds the kp index of the i-th 3-hour period of the d-th day since the 1st of January of KpFirstYear (nan if missing).
+# It is cached in a .npy file next to the yearly files and is rebuilt when any of those files changes.
+KpIndices     = None
+KpFirstYear   = 0
+KpYears       = set()
+KpCacheName   = "KpIndices.npy"
+KpSourcesName = "KpIndices.sources.npy" # holds year, modification time and size of each yearly file used to build the cache
+
+
+def parse_kp_files( Sources ):
+    """
+        Parses yearly Kp-index files into a Kp-index array.
+        
+        Args:
+                Sources: sorted list of (year, filename)
+        Returns:
+                array: the Kp indices, 8 per day, starting from the 1st of January of the first year
+    """
+    FirstDay = date(Sources[0][0], 1, 1).toordinal()
+    Values = np.full( (date(Sources[-1][0]+1, 1, 1).toordinal() - FirstDay) * 8, np.nan )
+    for year, filename in Sources:
+        with open(filename) as fp:
             for line in fp:
-                year  = "20" + line[0:2]
-                month = line[2:4]
-                day   = line[4:6]
-                kp00  = float(line[12:14]) / 10
-                kp03  = float(line[14:16]) / 10
-                kp06  = float(line[16:18]) / 10
-                kp09  = float(line[18:20]) / 10
-                kp12  = float(line[20:22]) / 10
-                kp15  = float(line[22:24]) / 10
-                kp18  = float(line[24:26]) / 10
-                kp21  = float(line[26:28]) / 10
-                GeomagneticIndices[(day, month, year, "0")] = kp00
-                GeomagneticIndices[(day, month, year, "1")] = kp03
-                GeomagneticIndices[(day, month, year, "2")] = kp06
-                GeomagneticIndices[(day, month, year, "3")] = kp09
-                GeomagneticIndices[(day, month, year, "4")] = kp12
-                GeomagneticIndices[(day, month, year, "5")] = kp15
-                GeomagneticIndices[(day, month, year, "6")] = kp18
-                GeomagneticIndices[(day, month, year, "7")] = kp21
-            fp.close()
+                if len(line) < 28: continue
+                d = date(year, int(line[2:4]), int(line[4:6])).toordinal() - FirstDay
+                Values[d*8 : d*8+8] = [ float(line[k:k+2]) / 10 for k in range(12, 28, 2) ]
+    return Values
+
+
+def load_kp_indices( IndicesPath="" ):
+    """
+        Loads the Kp-index store from the yearly Kp-index files (named by their year) of a folder.
+        The store is read from its .npy cache if none of the yearly files has changed since the cache was written, 
+        otherwise the files are parsed and the cache is written again.
+        
+        Args:
+                IndicesPath (string): the folder of the yearly files. By default GeomagneticIndices_Files_Path.
+        Returns:
+                array: the Kp-index store (KpIndices)
+    """
+    global KpIndices, KpFirstYear, KpYears
+    if len(IndicesPath) == 0: IndicesPath = GeomagneticIndices_Files_Path
+    Sources = sorted( (int(f), path.join(IndicesPath, f)) for f in os.listdir(IndicesPath) if f.isdigit() and len(f) == 4 )
+    if len(Sources) == 0:
+        raise FileNotFoundError( "No yearly Kp-index files in " + IndicesPath )
+    Signature = np.array( [ (year, path.getmtime(filename), path.getsize(filename)) for year, filename in Sources ], dtype=float )
+    CacheFilename   = path.join(IndicesPath, KpCacheName)
+    SourcesFilename = path.join(IndicesPath, KpSourcesName)
+    Values = None
+    if path.exists(CacheFilename) and path.exists(SourcesFilename):
+        try:
+            if np.array_equal( np.load(SourcesFilename), Signature ):
+                Values = np.load(CacheFilename)
+        except Exception as e:
+            print( "Cannot read the Kp-index cache", CacheFilename, ":", e )
+    if Values is None:
+        Values = parse_kp_files( Sources )
+        try:
+            np.save( CacheFilename, Values )
+            np.save( SourcesFilename, Signature )
+        except Exception as e:
+            print( "Cannot write the Kp-index cache", CacheFilename, ":", e )
+    KpIndices   = Values
+    KpFirstYear = Sources[0][0]
+    KpYears     = set( year for year, filename in Sources )
+    return KpIndices
+
+
+def kp_at( Timestamps, YearOffset=0 ):
+    """
+        Returns the Kp-index for each of the given times. The Kp-index store is loaded on first use.
+        
+        Args:
+                Timestamps: UTC timestamps in seconds (scalar or array)
+                YearOffset: take the Kp-index of the same date and time YearOffset years later (or earlier if negative). 
+                            The 29th of February is mapped to the 28th if the target year is not a leap year.
+        Returns:
+                array: the Kp-index of each timestamp (float for a single timestamp), nan where no Kp index is available
+    """
+    if KpIndices is None: load_kp_indices()
+    T = np.floor( np.asarray(Timestamps, dtype=float) ).astype(np.int64)
+    if YearOffset != 0:
+        T = T.astype('M8[s]')
+        Year  = T.astype('M8[Y]')
+        Month = T.astype('M8[M]')
+        Day   = T.astype('M8[D]')
+        TargetMonth = (Year + YearOffset).astype('M8[M]') + (Month - Year.astype('M8[M]'))
+        MonthLength = (TargetMonth + 1).astype('M8[D]') - TargetMonth.astype('M8[D]')
+        TargetDay   = TargetMonth.astype('M8[D]') + np.minimum( Day - Month.astype('M8[D]'), MonthLength - 1 )
+        T = (TargetDay.astype('M8[s]') + (T - Day.astype('M8[s]'))).astype(np.int64)
+    slot = (T - np.datetime64(str(KpFirstYear), 's').astype(np.int64)) // (3*60*60)
+    inside = (slot >= 0) & (slot < len(KpIndices))
+    return np.where( inside, KpIndices[ np.where(inside, slot, 0) ], np.nan )[()]
 
 
 
@@ -384,10 +559,14 @@ def is_MLT_inside_range( MLT, MLT_min, MLT_max ):
 
             
             
+# number of orbit-file rows which calculate_coverage reads and processes at once
+OrbitChunkSize = 100000
+
 def calculate_coverage( Title, Description, OrbitFilename, KpStartYear, ResultsFilename="" ):
     """
         Read an orbit file and for each position of the satellite calculates how much time the satellite spends inside each bin.
         The results are stored in a text file for later usage.
+        The orbit file is read and processed in blocks of OrbitChunkSize rows, so the memory needed does not depend on the length of the orbit.
         Args:
             Title: to be stored inside the results text file
             Description: to be stored inside the results text file
@@ -407,11 +586,8 @@ def calculate_coverage( Title, Description, OrbitFilename, KpStartYear, ResultsF
             s = s[ s.rindex("/")+1 : ]
         ResultsFilename = CoverageResults_Files_Path + s + "." + KpStartYear + ".CoverageResults.txt"    
     ####
-    Kp = 0
     startSecs = time.time()
     BinMisses = BinHits = 0
-    PREV_time  = CURR_time  = None
-    PREV_BinID = CURR_BinID = ""
     if path.exists( ResultsFilename ):
         print( "File " + ResultsFilename + " already exists. Cannot continue in order to prevent overwriting useful data." )
         return 0, 0, "", 0 # <<<<
@@ -425,66 +601,62 @@ def calculate_coverage( Title, Description, OrbitFilename, KpStartYear, ResultsF
         return 0, 0, "", 0
     ########
     with open( orbit_filename_to_load ) as CSVfile:        
-        CSVreader = csv.reader( CSVfile )
         # locate the column numnbers of interest inside the csv file
-        CSVheader = next( CSVreader )
-        Time_idx     = CSVheader.index( "Epoch(UTCG)" ) 
-        Lat_idx      = CSVheader.index( "Lat_GEOD(deg)" )
-        Lon_idx      = CSVheader.index( "Lon_GEOD(deg)" )
-        Altitude_idx = CSVheader.index( "Height_WGS84 (km)" )
-        try:
-            MagLat_idx   = CSVheader.index( "Magnetic Latitude" )
-        except:
-            MagLat_idx   = CSVheader.index( "Daedalus.Magnetic Latitude" )
-        try:
-            MLT_idx      = CSVheader.index( "MLT" )
-        except:
-            MLT_idx      = CSVheader.index( "Daedalus.MLT" )
-        # read the satellite positions and try to fill the bins
-        n = 0
-        num_of_errors = 0
-        for row in CSVreader: # for each satellite position
-            n = n + 1
-            if n == 1: OrbitStartYear = parseDate( row[Time_idx] ).year
-            PREV_time = CURR_time
-            # parse the date-time of this satellite position
-            CURR_time = parseDate( row[Time_idx] ) 
-            if CURR_time == None:
-                print( "ERROR during coverage calculation while reading", orbit_filename_to_load, ": Wrong time format:",row[Time_idx],".:  ", row )
-                num_of_errors += 1
-                if num_of_errors < 50:
-                    continue
-                else:
-                    print("Too many errors. Aborting.")
-                    return 0, 0, "", 0 # <<<<
-            year  = CURR_time.year
-            month = CURR_time.month
-            day   = CURR_time.day
-            hour  = CURR_time.hour
-            # calculate the Kp index for this particular time
-            try:
-                Kp = GeomagneticIndices[(num_to_2digit_str(day), num_to_2digit_str(month), num_to_2digit_str(Years_Dropdown.value+year-OrbitStartYear), str(hour//3))]
-            except:
-                if month==2 and day==29: # the leap years may correspond to non-leap years at the selected range of years for Kp calculation
-                    Kp = GeomagneticIndices[(num_to_2digit_str(28), num_to_2digit_str(month), num_to_2digit_str(Years_Dropdown.value+year-OrbitStartYear), str(hour//3))]
-            # remember some useful properties of this satellite position
-            MLT      = float( row[MLT_idx] )
-            MagLat   = float( row[MagLat_idx] )
-            Altitude = float( row[Altitude_idx] )
-            # Check if the satellite position can be assigned to a bin
-            mathedBin = GetMatchedBin( MLT, MagLat, Altitude, Kp )
-            # If the satellite is inside a bin during the last 2 positions then calculate the duration
-            PREV_BinID = CURR_BinID
-            if mathedBin is None:
-                CURR_BinID = ""
-            else:
-                CURR_BinID = mathedBin.ID            
-            if len(CURR_BinID) > 0  and  CURR_BinID == PREV_BinID:
-                BinHits = BinHits + 1
-                DurationInsideBin = (CURR_time - PREV_time).seconds
-                mathedBin.CumulativeTime += DurationInsideBin 
-            elif len(CURR_BinID) > 0:
-                BinMisses = BinMisses + 1
+        CSVheader = next( csv.reader( CSVfile ) )
+    Time_idx     = CSVheader.index( "Epoch(UTCG)" ) 
+    Lat_idx      = CSVheader.index( "Lat_GEOD(deg)" )
+    Lon_idx      = CSVheader.index( "Lon_GEOD(deg)" )
+    Altitude_idx = CSVheader.index( "Height_WGS84 (km)" )
+    try:
+        MagLat_idx   = CSVheader.index( "Magnetic Latitude" )
+    except:
+        MagLat_idx   = CSVheader.index( "Daedalus.Magnetic Latitude" )
+    try:
+        MLT_idx      = CSVheader.index( "MLT" )
+    except:
+        MLT_idx      = CSVheader.index( "Daedalus.MLT" )
+    # read the satellite positions in chunks of rows and try to fill the bins
+    n = 0
+    num_of_errors = 0
+    OrbitStartYear = None
+    PREV_time   = None # time of the last position of the previous chunk
+    PREV_BinIdx = -1   # bin of the last position of the previous chunk
+    CumulativeTimes = np.zeros( len(Bins), dtype=np.int64 )
+    CSVreader = pd.read_csv( orbit_filename_to_load, header=0, names=list(range(len(CSVheader))), usecols=[Time_idx, Altitude_idx, MagLat_idx, MLT_idx], 
+                             dtype={Time_idx: str}, float_precision="round_trip", chunksize=OrbitChunkSize )
+    for chunk in CSVreader: # for each block of satellite positions
+        n = n + len(chunk)
+        # parse the date-times of these satellite positions
+        CURR_times = parseDates( chunk[Time_idx].to_numpy() )
+        wrong = np.isnat( CURR_times )
+        for i in np.flatnonzero( wrong ):
+            print( "ERROR during coverage calculation while reading", orbit_filename_to_load, ": Wrong time format:", chunk[Time_idx].iloc[i], ".:  ", chunk.iloc[i].tolist() )
+            num_of_errors += 1
+            if num_of_errors >= 50:
+                print("Too many errors. Aborting.")
+                return 0, 0, "", 0 # <<<<
+        if wrong.any():
+            chunk      = chunk[ ~wrong ]
+            CURR_times = CURR_times[ ~wrong ]
+        if len(chunk) == 0: continue
+        if OrbitStartYear is None: OrbitStartYear = int( str(CURR_times[0])[0:4] )
+        # calculate the Kp index for these particular times
+        Kp = kp_at( CURR_times.astype(np.int64) // 1000000, int(KpStartYear) - OrbitStartYear )
+        # Check if the satellite positions can be assigned to a bin
+        CURR_BinIdx = match_bins( chunk[MLT_idx].to_numpy(dtype=float), chunk[MagLat_idx].to_numpy(dtype=float), chunk[Altitude_idx].to_numpy(dtype=float), Kp )
+        # If the satellite is inside a bin during the last 2 positions then calculate the duration
+        PREV_BinIdx = np.concatenate( ([PREV_BinIdx], CURR_BinIdx[:-1]) )
+        PREV_times  = np.concatenate( ([CURR_times[0] if PREV_time is None else PREV_time], CURR_times[:-1]) )
+        inside = CURR_BinIdx >= 0
+        hit    = inside & (CURR_BinIdx == PREV_BinIdx)
+        BinHits   = BinHits + int( np.count_nonzero(hit) )
+        BinMisses = BinMisses + int( np.count_nonzero(inside & ~hit) )
+        DurationsInsideBin = ( (CURR_times[hit] - PREV_times[hit]).astype(np.int64) // 1000000 ) % 86400 # as timedelta.seconds
+        CumulativeTimes += np.bincount( CURR_BinIdx[hit], weights=DurationsInsideBin, minlength=len(Bins) ).astype(np.int64)
+        PREV_BinIdx = CURR_BinIdx[-1]
+        PREV_time   = CURR_times[-1]
+    for B, T in zip(Bins, CumulativeTimes):
+        B.CumulativeTime += int(T)
     # calculate duration of execution
     finishSecs = time.time()
     DurationOfExecution = finishSecs-startSecs
@@ -3,6 +3,7 @@ This module holds source code of utiliy functions used by the Coverage Calculato
 """
 
 import matplotlib.cm
+import numpy as np
 from datetime import datetime
 
 
@@ -91,3 +92,67 @@ def parseDate( dateString ):
             except:
                 result = None
     return result
+
+
+
+# Month abbreviations as they appear in the orbit files
+MonthAbbreviations = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+def parseDates( dateStrings ):
+    """
+        Vectorized form of parseDate for many strings of the same format, like the time column of an orbit file.
+        The format (day or month first, number of decimal digits) is detected once from the first string 
+        and all strings are converted together to datetime64. The strings which do not follow that format are parsed by parseDate.
+        
+        Args:
+                dateStrings: list or array of strings
+        Returns:
+                array of datetime64[us]: the parsed dates, NaT where a string could not be parsed.
+    """
+    dateStrings = np.asarray( dateStrings, dtype=object )
+    result = np.full( len(dateStrings), np.datetime64("NaT"), dtype="M8[us]" )
+    if len(dateStrings) == 0: return result
+    first = str( dateStrings[0] )
+    # detect the format: "01 Jan 2015 00:00:00.000" or "Jan 01 2015 00:00:00.000" (of which parseDate uses the first 24 characters)
+    if first[0:3] in MonthAbbreviations:
+        width = 24
+        month_col, day_col = 0, 4
+    else:
+        width = len(first)
+        month_col, day_col = 3, 0
+    valid = np.zeros( len(dateStrings), dtype=bool )
+    if width > 21:
+        try:
+            B = dateStrings.astype( "S" + str(width+1) ).view( np.uint8 ).reshape( len(dateStrings), width+1 )
+        except (UnicodeEncodeError, ValueError):
+            B = None
+        if B is not None:
+            if month_col == 0: B[:, width] = 0 # parseDate ignores the characters after the 24th
+            digits = np.array( [day_col, day_col+1, 7, 8, 9, 10, 12, 13, 15, 16, 18, 19] + list(range(21, width)) )
+            month_key = B[:, month_col].astype(np.int64)*65536 + B[:, month_col+1].astype(np.int64)*256 + B[:, month_col+2]
+            month_keys = np.array( [ ord(m[0])*65536 + ord(m[1])*256 + ord(m[2]) for m in MonthAbbreviations ] )
+            valid = np.all( (B[:, digits] >= ord("0")) & (B[:, digits] <= ord("9")), axis=1 )
+            valid &= np.all( B[:, [2 if day_col == 0 else 3, 6, 11]] == ord(" "), axis=1 ) & (B[:, 14] == ord(":")) & (B[:, 17] == ord(":")) 
+            valid &= (B[:, 20] == ord(".")) & (B[:, width-1] != 0) & (B[:, width] == 0) & np.isin( month_key, month_keys )
+            # rearrange to ISO format: YYYY-MM-DDThh:mm:ss.fff
+            month = np.argmax( month_key[:, None] == month_keys, axis=1 ) + 1
+            ISO = np.empty( (len(dateStrings), width-1), dtype=np.uint8 )
+            ISO[:, 0:4]   = B[:, 7:11]
+            ISO[:, 4]     = ord("-")
+            ISO[:, 5]     = ord("0") + month // 10
+            ISO[:, 6]     = ord("0") + month % 10
+            ISO[:, 7]     = ord("-")
+            ISO[:, 8:10]  = B[:, day_col:day_col+2]
+            ISO[:, 10]    = ord("T")
+            ISO[:, 11:]   = B[:, 12:width]
+            ISO[~valid]   = np.frombuffer( b"2000-01-01T00:00:00." + b"0"*(width-21), dtype=np.uint8 )
+            try:
+                result[valid] = ISO.view( "S" + str(width-1) ).ravel().astype( "M8[us]" )[valid]
+            except ValueError: # an impossible date, e.g. 31 Feb
+                valid[:] = False
+    # strings of another format
+    for i in np.flatnonzero( ~valid ):
+        d = parseDate( str(dateStrings[i]) )
+        if d is not None: result[i] = np.datetime64( d, "us" )
+    return result
+
@@ -0,0 +1,17 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "daedalusmase_coverage_calculator"))
+
+import data  # noqa: E402
+
+
+@pytest.fixture
+def bins():
+    # the Bins of the module, restored after the test
+    saved = list(data.Bins)
+    yield data.Bins
+    data.clear_bins()
+    data.Bins.extend(saved)
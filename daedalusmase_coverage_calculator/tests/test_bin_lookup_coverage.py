@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+import data
+
+
+def is_MLT_inside_range_scan(MLT, MLT_min, MLT_max):
+    if MLT_min <= MLT_max:
+        return (MLT > MLT_min and MLT <= MLT_max)
+    else:
+        return (MLT > MLT_min or MLT <= MLT_max)
+
+
+def scan(MLT, MagLat, Altitude, Kp, BinsToSearch):
+    # the linear search of GetMatchedBin() before BinLookup, returning the index of the Bin
+    for i, B in enumerate(BinsToSearch):
+        Kp_min_to_check = B.Kp_min
+        if Kp_min_to_check == 0: Kp_min_to_check = -1
+        if is_MLT_inside_range_scan(MLT, B.MLT_min, B.MLT_max):
+            if MagLat > B.MagLat_min and MagLat <= B.MagLat_max:
+                if Altitude > B.Altitude_min and Altitude <= B.Altitude_max:
+                    if Kp > Kp_min_to_check and Kp <= B.Kp_max:
+                        return i
+    return -1
+
+
+def random_bins(rng, n):
+    # ranges on a coarse grid, so that Bins overlap and share edges, with wrapping and equal MLT limits
+    def limits(choices):
+        a, b = rng.choice(choices, 2)
+        return min(a, b), max(a, b)
+    BinsToSearch = list()
+    for i in range(n):
+        MLT_min, MLT_max = rng.choice(np.arange(0, 25, 3), 2)
+        MagLat_min, MagLat_max = limits(np.arange(-90, 91, 15))
+        Altitude_min, Altitude_max = limits(np.arange(100, 501, 50))
+        Kp_min, Kp_max = limits(np.arange(0, 10, 1.5))
+        BinsToSearch.append(data.Bin("R%d" % i, "random", MLT_min, MLT_max, MagLat_min, MagLat_max, Altitude_min, Altitude_max,
+                                     Kp_min, Kp_max, 0))
+    return BinsToSearch
+
+
+def samples(rng, BinsToSearch, n):
+    # uniform values, the range limits of the Bins, their floating point neighbours and nan, on each axis
+    columns = list()
+    for attrs, low, high in ((("MLT_min", "MLT_max"), -1, 25), (("MagLat_min", "MagLat_max"), -95, 95),
+                             (("Altitude_min", "Altitude_max"), 50, 550), (("Kp_min", "Kp_max"), -1, 10)):
+        edges = np.array([getattr(B, a) for B in BinsToSearch for a in attrs] + [0.0], dtype=float)
+        special = np.concatenate((edges, np.nextafter(edges, -np.inf), np.nextafter(edges, np.inf), [np.nan]))
+        values = rng.uniform(low, high, n)
+        pick = rng.random(n) < 0.6
+        values[pick] = rng.choice(special, pick.sum())
+        columns.append(values)
+    return columns
+
+
+def check(columns):
+    expected = np.array([scan(*position, data.Bins) for position in zip(*columns)])
+    np.testing.assert_array_equal(data.match_bins(*columns), expected)
+    for position, index in zip(zip(*columns[:500]), expected[:500]):
+        found = data.GetMatchedBin(*position)
+        assert found is (None if index < 0 else data.Bins[index])
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_random_bins_match_the_scan(bins, seed):
+    rng = np.random.default_rng(seed)
+    data.clear_bins()
+    bins.extend(random_bins(rng, int(rng.integers(1, 40))))
+    check(samples(rng, bins, 4000))
+
+
+def test_default_bins_match_the_scan():
+    check(samples(np.random.default_rng(100), data.Bins, 20000))
+
+
+def test_single_kp_for_all_positions():
+    columns = samples(np.random.default_rng(7), data.Bins, 3000)
+    for Kp in (0.0, 2.0, 3.3, np.nextafter(4.0, 5), np.nan):
+        np.testing.assert_array_equal(data.match_bins(*columns[:3], Kp), data.match_bins(*columns[:3], np.full(3000, Kp)))
+
+
+def test_lookup_follows_changes_of_the_bins(bins):
+    data.clear_bins()
+    bins.extend(random_bins(np.random.default_rng(3), 10))
+    columns = samples(np.random.default_rng(4), bins, 2000)
+    check(columns)
+    bins.reverse()
+    check(columns)
+    bins[0].Altitude_max += 25
+    data.compile_bins()
+    check(columns)
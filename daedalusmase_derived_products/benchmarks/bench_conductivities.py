@@ -0,0 +1,69 @@
+"""
+Elements per second and peak temporary memory of conductivities on a whole 57x72x144 grid, against the three calls of
+pedersen_cond, hall_cond and parallel_cond on the same arrays. The memory is the peak of the numpy allocations
+(tracemalloc) during the call, without the inputs.
+
+    python benchmarks/bench_conductivities.py [--shape 57 72 144] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(here, "..")]
+
+from daedalusmase_derived_products.mod_conductivities import conductivities, hall_cond, parallel_cond, pedersen_cond  # noqa: E402
+
+
+def log_uniform(rng, low, high, shape):
+    return np.exp(rng.uniform(np.log(low), np.log(high), shape))
+
+
+def separate(B, Ti, Te, Tn, NO2, NN2, NO, NOp, NO2p, NNOp, Ne):
+    return (pedersen_cond(B, Ti, Tn, Te, NO2, NN2, NO, NOp, NO2p, NNOp),
+            hall_cond(B, Ti, Te, Tn, NO2, NN2, NO, NOp, NO2p, NNOp),
+            parallel_cond(Ne, B, Te, NO2, NN2, NO))
+
+
+def measure(function, inputs, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(**inputs)
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    function(**inputs)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(times), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--shape", type=int, nargs="+", default=[57, 72, 144])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    shape = tuple(args.shape)
+    rng = np.random.default_rng(0)
+    inputs = dict(B=rng.choice([-1, 1], (3,) + shape) * log_uniform(rng, 1e-7, 6e-5, (3,) + shape),
+                  Ti=log_uniform(rng, 150, 3000, shape), Te=log_uniform(rng, 150, 5000, shape),
+                  Tn=log_uniform(rng, 150, 2000, shape), NO2=log_uniform(rng, 1e4, 1e13, shape),
+                  NN2=log_uniform(rng, 1e5, 1e14, shape), NO=log_uniform(rng, 1e6, 1e12, shape),
+                  NOp=log_uniform(rng, 1, 1e6, shape), NO2p=log_uniform(rng, 1, 1e6, shape),
+                  NNOp=log_uniform(rng, 1, 1e6, shape), Ne=log_uniform(rng, 1e6, 1e12, shape))
+    n = int(np.prod(shape))
+    field = n * 8
+    print("grid %s, %d elements, %.1f MB per field" % ("x".join(map(str, shape)), n, field / 1e6))
+    print("%-16s %10s %16s %16s %10s" % ("", "time s", "elements/s", "temporaries MB", "fields"))
+    for name, function in (("conductivities", conductivities), ("separate calls", separate)):
+        best, peak = measure(function, inputs, args.repeat)
+        print("%-16s %10.3f %16.3g %16.1f %10.1f" % (name, best, n / best, peak / 1e6, peak / field))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Nanoseconds per element of the electron cooling rate kernels on arrays of 10^3 to 10^7 elements, with Te spread over
+all the temperature ranges of the kernels (300 to 6000 K), and of a loop of scalar calls for comparison.
+
+    python benchmarks/bench_cooling_rates.py [--sizes 1000 100000 10000000] [--scalar 1000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(here, "..")]
+
+from daedalusmase_derived_products.mod_heating_sources.sub_cooling_rates import N2_rot, N2_vib, O2_rot, O2_vib, O_fine  # noqa: E402
+
+# the arguments of every kernel from Necm, the neutral density, Te and Tn
+KERNELS = {"N2_vib": (N2_vib, lambda Necm, N, Te, Tn: (Necm, N, Tn, Te)),
+           "O2_vib": (O2_vib, lambda Necm, N, Te, Tn: (Necm, N, Tn, Te)),
+           "O_fine": (O_fine, lambda Necm, N, Te, Tn: (Necm, N, Te, Tn)),
+           "N2_rot": (N2_rot, lambda Necm, N, Te, Tn: (Necm, N, Te, Tn)),
+           "O2_rot": (O2_rot, lambda Necm, N, Te, Tn: (Necm, N, Te, Tn))}
+
+
+def inputs(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return (np.exp(rng.uniform(np.log(1e2), np.log(1e6), n)), np.exp(rng.uniform(np.log(1e6), np.log(1e13), n)),
+            rng.uniform(300, 6000, n), rng.uniform(150, 2000, n))
+
+
+def ns_per_element(function, args, n):
+    start = time.perf_counter()
+    function(*args)
+    return (time.perf_counter() - start) / n * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**3, 10**5, 10**7])
+    parser.add_argument("--scalar", type=int, default=1000, help="elements of the loop of scalar calls")
+    args = parser.parse_args()
+
+    print("%-8s" % "ns/elem" + "".join("%12s" % ("n=%.0e" % n) for n in args.sizes) + "%12s" % "scalar")
+    data = {n: inputs(n) for n in args.sizes}
+    scalar_data = inputs(args.scalar, seed=1)
+    for name, (function, order) in KERNELS.items():
+        function(*order(*scalar_data))
+        row = [ns_per_element(function, order(*data[n]), n) for n in args.sizes]
+        start = time.perf_counter()
+        for x in zip(*scalar_data):
+            function(*order(*x))
+        row.append((time.perf_counter() - start) / args.scalar * 1e9)
+        print("%-8s" % name + "".join("%12.0f" % value for value in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Cold and warm wall time of igrf_grid (mod_tiegcm_utils) and of the copy in the supportfunctions of the error propagation,
+on a 72x144 lat-lon map at one altitude and on a full 57x72x144 grid with the altitudes of each column, as ZGMID.
+Cold evaluates the model, memo is a second call with the same positions, disk a call with the memo cleared and a disk
+cache. igrf_B, one position per call, is timed on --scalar-max positions and extrapolated.
+
+    python benchmarks/bench_igrf_grid.py [--nlev 57] [--scalar-max 200]
+"""
+import argparse
+import datetime
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(here, ".."), os.path.join(here, "..", "..", "daedalusmase_errorpropagation", "source_code")]
+
+from daedalusmase_derived_products.mod_tiegcm_utils import igrf_B  # noqa: E402
+import supportfunctions  # noqa: E402
+
+# the module, the package exports the function under the same name
+igrf_grid_module = importlib.import_module("daedalusmase_derived_products.mod_tiegcm_utils.igrf_grid")
+
+DAY = datetime.datetime(2015, 3, 17)
+LAT = np.linspace(-87.5, 87.5, 72)
+LON = np.linspace(-180, 177.5, 144)
+
+
+def grids(nlev):
+    # the map at 300 km and the grid of increasing altitudes from about 97 to 500 km in each column
+    rng = np.random.default_rng(0)
+    alts = np.linspace(97, 500, nlev)[None, None, :] + rng.uniform(-2, 2, (len(LAT), len(LON), nlev))
+    return [("map", LAT[:, None], LON[None, :], 300.0),
+            ("grid", LAT[:, None, None], LON[None, :, None], alts)]
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--nlev", type=int, default=57)
+    parser.add_argument("--scalar-max", type=int, default=200, help="positions evaluated with igrf_B")
+    args = parser.parse_args()
+
+    implementations = [("derived_products", igrf_grid_module.igrf_grid, igrf_grid_module.memo),
+                       ("errorpropagation", supportfunctions.igrf_grid, supportfunctions.igrf_memo)]
+    print("igrf12fort %s" % ("used" if igrf_grid_module.igrf12fort is not None else "missing, igrf12.igrf per position"))
+    print("%-18s %-5s %9s %10s %10s %10s %11s" % ("", "", "positions", "cold s", "memo s", "disk s", "igrf_B s"))
+    for name, lat, lon, alt in grids(args.nlev):
+        lat_p, lon_p, alt_p = np.broadcast_arrays(lat, lon, alt)
+        points = min(args.scalar_max, lat_p.size)
+        scalar = timed(lambda: [igrf_B(DAY, a, b, c) for a, b, c in zip(lat_p.flat[:points], lon_p.flat[:points], alt_p.flat[:points])])
+        scalar *= lat_p.size / points
+        for implementation, igrf_grid, memo in implementations:
+            cache_dir = tempfile.mkdtemp()
+            memo.clear()
+            cold = timed(igrf_grid, DAY, lat, lon, alt, cache_dir=cache_dir)
+            warm = timed(igrf_grid, DAY, lat, lon, alt, cache_dir=cache_dir)
+            memo.clear()
+            disk = timed(igrf_grid, DAY, lat, lon, alt, cache_dir=cache_dir)
+            shutil.rmtree(cache_dir)
+            print("%-18s %-5s %9d %10.2f %10.4f %10.4f %11.0f" % (implementation, name, lat_p.size, cold, warm, disk, scalar),
+                  flush=True)
+
+
+if __name__ == "__main__":
+    main()
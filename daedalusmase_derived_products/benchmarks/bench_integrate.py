@@ -0,0 +1,57 @@
+"""
+Wall time of the northern hemisphere integral of the Joule heating of a full day (24 hourly time steps of a regridded
+72x144 file, 100-600 km) with integrate, against integration, which handles one time step and parameter per call and is
+timed on --old-steps of them and extrapolated to the whole day.
+
+    python benchmarks/bench_integrate.py [--params Ohmic Wind_heating] [--old-steps 1]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(here, ".."), os.path.join(here, "..", "tests")]
+
+from daedalusmase_derived_products.mod_height_integration import integrate, integration  # noqa: E402
+from synthetic_regrid import write_regridded  # noqa: E402
+
+NTIME, NHEIGHT, NLAT, NLON = 24, 101, 72, 144
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--params", nargs="+", default=["Ohmic", "Wind_heating"])
+    parser.add_argument("--old-steps", type=int, default=1, help="time steps of each param integrated with integration")
+    args = parser.parse_args()
+
+    folder = tempfile.mkdtemp()
+    regrid_file = os.path.join(folder, "tiegcm_regrid.nc")
+    write_regridded(regrid_file, args.params, ntime=NTIME, nheight=NHEIGHT, nlat=NLAT, nlon=NLON)
+    region = dict(minlat=NLAT // 2, maxlat=NLAT - 1, minlon=0, maxlon=NLON - 1, minalt=0, maxalt=NHEIGHT - 1)
+
+    start = time.perf_counter()
+    integrals = integrate(regrid_file, args.params, **region)
+    seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # integration prints its result
+        for param in args.params:
+            for timer in range(args.old_steps):
+                integration(regrid_file, timer, param, *region.values())
+    old = (time.perf_counter() - start) / args.old_steps * NTIME
+
+    print("%d time steps, %d params, latitudes %.1f to %.1f" % (NTIME, len(args.params), integrals.lat[0], integrals.lat[-1]))
+    print("%-12s %10s" % ("", "time s"))
+    print("%-12s %10.2f" % ("integrate", seconds))
+    print("%-12s %10.1f" % ("integration", old))
+    print("speedup %.0f" % (old / seconds))
+    os.remove(regrid_file)
+    os.rmdir(folder)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Wall time and peak memory of regrid on a multi-day hourly TIEGCM file of 57x72x144 points, 100-600 km in 5 km steps.
+With --loop the per point loop which regrid replaced (tests/test_regrid_loop.py) is timed on the first time step and
+extrapolated to the whole file (about 8 minutes per time step).
+
+    python benchmarks/bench_regrid.py [--days 3] [--params QJOULE TN UN] [--loop]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(here, ".."), os.path.join(here, "..", "tests")]
+
+from daedalusmase_derived_products.mod_height_integration.regrid import regrid  # noqa: E402
+from synthetic_regrid import write_tiegcm  # noqa: E402
+
+NLEV, NLAT, NLON = 57, 72, 144
+MIN_ALT, MAX_ALT, DZ = 100, 600, 5
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--days", type=int, default=3)
+    parser.add_argument("--params", nargs="+", default=["QJOULE", "TN", "UN"])
+    parser.add_argument("--loop", action="store_true", help="also time the per point loop on one time step")
+    args = parser.parse_args()
+
+    ntime = 24 * args.days
+    folder = tempfile.mkdtemp()
+    tiegcm_file = os.path.join(folder, "tiegcm.nc")
+    write_tiegcm(tiegcm_file, args.params, ntime=ntime, nlev=NLEV, nlat=NLAT, nlon=NLON, noise=2)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    regrid(MIN_ALT, MAX_ALT, DZ, tiegcm_file, list(range(ntime)), args.params, folder + "/")
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    output = os.path.join(folder, "tiegcm_regrid.nc")
+    print("%d time steps, %d params, input %.0f MB, output %.0f MB" % (ntime, len(args.params), os.path.getsize(tiegcm_file) / 2 ** 20,
+                                                                     os.path.getsize(output) / 2 ** 20))
+    print("%-8s %12s %14s %10s" % ("", "time s", "s/time step", "peak MB"))
+    print("%-8s %12.1f %14.3f %10.0f" % ("regrid", seconds, seconds / ntime, peak / 2 ** 20))
+    if args.loop:
+        from test_regrid_loop import regrid_loop
+
+        start = time.perf_counter()
+        regrid_loop(MIN_ALT, MAX_ALT, DZ, tiegcm_file, [0], args.params)
+        step = time.perf_counter() - start
+        print("%-8s %12.0f %14.1f %10s" % ("loop", step * ntime, step, "-"))
+        print("speedup %.0f" % (step * ntime / seconds))
+    os.remove(output)
+    os.remove(tiegcm_file)
+    os.rmdir(folder)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Wall time and file opens of the reads of the run_map driver (32 reads per grid point) of a whole 72x144 map, with
+read_tiegcm (one file open per read) and with a TiegcmStore. read_tiegcm reads the first latitude rows only and its
+time and opens are extrapolated to the whole map.
+
+    python benchmarks/bench_tiegcm_store.py [--rows 2] [--level 30]
+"""
+import argparse
+import importlib
+import os
+import sys
+import tempfile
+import time
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(here, ".."), os.path.join(here, "..", "tests")]
+
+from daedalusmase_derived_products.mod_tiegcm_utils.tiegcm_store import TiegcmStore  # noqa: E402
+from synthetic_tiegcm import MAP_READS, write_tiegcm  # noqa: E402
+
+# the module, the package exports the function under the same name
+read_tiegcm_module = importlib.import_module("daedalusmase_derived_products.mod_tiegcm_utils.read_tiegcm")
+
+NLAT, NLON = 72, 144
+
+
+def count_opens():
+    opens = [0]
+    dataset = read_tiegcm_module.Dataset
+
+    def counted(*args, **kwargs):
+        opens[0] += 1
+        return dataset(*args, **kwargs)
+
+    read_tiegcm_module.Dataset = counted
+    return opens
+
+
+def run_map(read, tiegcm_file, level, rows):
+    for lat in range(rows):
+        for lon in range(NLON):
+            for variable in MAP_READS:
+                read(tiegcm_file, variable, 0, level, lat, lon)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=2, help="latitude rows read with read_tiegcm")
+    parser.add_argument("--level", type=int, default=30)
+    args = parser.parse_args()
+
+    folder = tempfile.mkdtemp()
+    tiegcm_file = os.path.join(folder, "tiegcm.nc")
+    write_tiegcm(tiegcm_file, nlat=NLAT, nlon=NLON)
+
+    opens = count_opens()
+    start = time.perf_counter()
+    run_map(read_tiegcm_module.read_tiegcm, tiegcm_file, args.level, args.rows)
+    before = (time.perf_counter() - start) * NLAT / args.rows
+    before_opens = opens[0] * NLAT // args.rows
+
+    start = time.perf_counter()
+    with TiegcmStore() as store:
+        run_map(store.read_tiegcm, tiegcm_file, args.level, NLAT)
+        after = time.perf_counter() - start
+        after_opens = store.opens
+        cached = store.nbytes
+    print("%-12s %12s %10s %12s" % ("", "time s", "opens", "cached MB"))
+    print("%-12s %12.1f %10d %12s" % ("read_tiegcm", before, before_opens, "-"))
+    print("%-12s %12.2f %10d %12.1f" % ("TiegcmStore", after, after_opens, cached / 1e6))
+    print("speedup %.0f" % (before / after))
+    os.remove(tiegcm_file)
+    os.rmdir(folder)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,3 +2,4 @@ from .hall_cond import hall_cond
 from .parallel_cond import parallel_cond
 from .pedersen_cond import pedersen_cond
 
+from .conductivities import conductivities, Conductivities
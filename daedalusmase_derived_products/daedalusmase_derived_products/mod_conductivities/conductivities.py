@@ -0,0 +1,137 @@
+"""
+**sub_heating_sources.conductivities**
+
+**Description**:
+_____________________________________________________________________________________________________________________
+
+Calculate Pedersen, Hall and parallel conductivities in S/m for arrays of any shape (profile, lat-lon map,
+lat-alt slice or full 3D grid). The ion-neutral and electron-neutral collision frequencies are calculated once
+and shared by the three conductivities. Results are elementwise the same as pedersen_cond, hall_cond and parallel_cond.
+
+$$\\sigma_P=\\frac{e}{B}\\Bigg( N_e\\frac{\\nu_{en}\\Omega_e}{\\Omega_e^2+\\nu_{en}^2} +\\sum_i N_i\\frac{\\nu_{in}\\Omega_i}{\\Omega_i^2+\\nu_{in}^2} \\Bigg)$$
+
+$$\\sigma_H=\\frac{e}{B}\\Bigg( N_e\\frac{\\Omega_e^2 }{\\Omega_e^2+\\nu_{en}^2} -\\sum_i N_i\\frac{\\Omega_i^2 }{\\Omega_i^2+\\nu_{in}^2} \\Bigg)$$
+
+$$\\sigma_\\parallel=N_e\\frac{e^2}{\\nu_{en}m_e}$$
+_____________________________________________________________________________________________________________________
+_____________________________________________________________________________________________________________________
+
+**Inputs**:
+_____________________________________________________________________________________________________________________
+
+`B`: Magnetic field vector in T, sequence of 3 arrays or array with first axis of length 3
+
+`Ti`: Ion temperature in K
+
+`Te`: Electron temperature in K
+
+`Tn`: Neutral temperature in K
+
+`NO2`: \(O_2\) density in \(cm^{-3}\)
+
+`NN2`: \(N_2\) density in \(cm^{-3}\)
+
+`NO`: \(O\) density in \(cm^{-3}\)
+
+`NOp`: \(O^+\) density in \(cm^{-3}\)
+
+`NO2p`: \(O_2^+\) density in \(cm^{-3}\)
+
+`NNOp`: \(NO^+\) density in \(cm^{-3}\)
+
+`Ne`: electron density used for the parallel conductivity, as in parallel_cond
+____________________________________________________________________________________________________________________
+_______________________________________________________________________________________________________________________
+
+**Outputs**:
+_____________________________________________________________________________________________________________________
+
+`Conductivities`: named tuple with
+
+`pedersen`: Pedersen conductivity in S/m
+
+`hall`: Hall conductivity in S/m
+
+`parallel`: parallel conductivity in S/m
+
+`vOp`, `vO2p`, `vNOp`: \(O^+\), \(O_2^+\), \(NO^+\) - neutral collision frequencies in Hz
+
+`ven`: electron - neutral collision frequency in Hz
+_____________________________________________________________________________________________________________________
+________________________________________________________________________________________________________________________
+
+**Reference**:
+_____________________________________________________________________________________________________________________
+
+Schunk, R. and Nagy, A. (2009). Ionospheres: physics, plasma physics, and chemistry (Cambridge
+university press)
+______________________________________________________________________________________________________________________
+________________________________________________________________________________________________________________________
+
+"""
+
+
+from collections import namedtuple
+import numpy as np
+from daedalusmase_derived_products.mod_tiegcm_utils import const
+
+Conductivities = namedtuple('Conductivities', ['pedersen', 'hall', 'parallel', 'vOp', 'vO2p', 'vNOp', 'ven'])
+
+def conductivities(B,Ti,Te,Tn,NO2,NN2,NO,NOp,NO2p,NNOp,Ne):
+
+    B = np.asarray(B, dtype=float)
+    Ti, Te, Tn = np.asarray(Ti, dtype=float), np.asarray(Te, dtype=float), np.asarray(Tn, dtype=float)
+    NO2, NN2, NO = np.asarray(NO2, dtype=float), np.asarray(NN2, dtype=float), np.asarray(NO, dtype=float)
+    NOp, NO2p, NNOp = np.asarray(NOp, dtype=float), np.asarray(NO2p, dtype=float), np.asarray(NNOp, dtype=float)
+
+    bgauss = np.sqrt(B[0] * B[0] + B[1] * B[1] + B[2] * B[2]) * 10000
+    qeomeo10=1.7588028*10**7
+    qeoNa010=9.6489*10**3
+
+    omega_op_inv = 1 / (qeoNa010 * bgauss * (1 / const.mO))
+    omega_o2p_inv = 1 / (qeoNa010 * bgauss * (1 / const.mO2))
+    omega_nop_inv = 1 / (qeoNa010 * bgauss * (1 / const.mNO))
+    omega_e_inv = 1 / (qeomeo10 * bgauss)
+
+    #collision frequencies (Hz), calculated once for all conductivities
+    temps = (Ti + Tn) / 2
+    sqrt_temps = np.sqrt(temps)
+    log_temps = np.log10(temps)
+    rnu_o2p_o2 = 2.59 * (10**(-11)) * sqrt_temps * ((1 - 0.073 * log_temps)**2)
+    rnu_op_o = 3.67 * (10**(-11)) * sqrt_temps * ((1 - 0.064 * log_temps)**2) * const.fcor
+    del temps, sqrt_temps, log_temps
+
+    vOp = 6.64 * (10**(-10)) * NO2 + rnu_op_o * NO + 6.82 * (10**(-10)) * NN2
+    vO2p = rnu_o2p_o2 * NO2 + 2.31 * (10**(-10)) * NO + 4.13 * (10**(-10)) * NN2
+    vNOp = 4.27 * (10**(-10)) * NO2 + 2.44 * (10**(-10)) * NO + 4.34 * (10**(-10)) * NN2
+    del rnu_o2p_o2, rnu_op_o
+
+    sqrt_Te = np.sqrt(Te)
+    ven = (2.33 * (10**(-11)) * NN2 * Te * (1 - (1.21 * (10**(-4) * Te))) \
+        + 1.82 * (10**(-10)) * NO2 * sqrt_Te * (1 + (3.6 * (10**(-2) * sqrt_Te))) \
+        + 8.9 * (10**(-11)) * NO * sqrt_Te * (1 + (5.7 * (10**(-4) * Te))))
+    del sqrt_Te
+
+    rnu_op = vOp * omega_op_inv
+    rnu_o2p = vO2p * omega_o2p_inv
+    rnu_nop = vNOp * omega_nop_inv
+    rnu_ne = 4 * (ven * omega_e_inv)
+
+    ########################################################################
+#                   Conductivities
+    ########################################################################
+
+    qe_fac = (const.electron * 10**10) / bgauss
+    Necm2 = NOp + NO2p + NNOp
+
+    den_op = 1 + rnu_op**2
+    den_o2p = 1 + rnu_o2p**2
+    den_nop = 1 + rnu_nop**2
+    den_ne = 1 + rnu_ne**2
+
+    sigmaPed = qe_fac * ((NOp * rnu_op / den_op) + (NO2p * rnu_o2p / den_o2p) \
+                    + (NNOp * rnu_nop / den_nop) + Necm2 * rnu_ne / den_ne)
+    sigmaHall = qe_fac * (Necm2 / den_ne - NOp / den_op - NO2p / den_o2p - NNOp / den_nop)
+    sigma0 = (np.asarray(Ne, dtype=float) * const.electron * const.electron) / (const.me * ven)
+
+    return Conductivities(sigmaPed, sigmaHall, sigma0, vOp, vO2p, vNOp, ven)
@@ -6,6 +6,7 @@ ________________________________________________________________________________
 
 Calculate loss due to N2 vibrational excitation
 
+Inputs can be scalars or arrays of any shape; the Te range of each element selects its coefficient set.
 
 _____________________________________________________________________________________________________________________
 _____________________________________________________________________________________________________________________
@@ -47,354 +48,92 @@ ________________________________________________________________________________
 """
 import numpy as np
 
+#Schunk and Nagy coefficients of logQ=A+B*Te+C*Te^2+D*Te^3+F*Te^4-16, rows: 300<=Te<=1500, 1500<Te<=6000, else
+#columns of Q0: A, B, C, D, F for the 0->1 ... 0->10 transitions
+Q0 = np.zeros((3, 5, 10))
+Q0[0, :, 0] = [-6.462, 3.151*10**(-2), -4.075*10**(-5), 2.493*10**(-8), -5.479*10**(-12)]
+Q0[1] = [[2.025, -7.066, -8.211, -9.713, -10.353, -10.819, -10.183, -12.698, -14.710, -17.538],
+         [8.782*10**(-4), 1.0001*10**(-2), 1.092*10**(-2), 1.204*10**(-2), 1.243*10**(-2),
+          1.244*10**(-2), 1.185*10**(-2), 1.309*10**(-2), 1.409*10**(-2), 1.6*10**(-2)],
+         [2.954*10**(-7), -3.066*10**(-6), -3.369*10**(-6), -3.732*10**(-6), -3.850*10**(-6),
+          -3.771*10**(-6), -3.570*10**(-6), -3.952*10**(-6), -4.249*10**(-6), -4.916*10**(-6)],
+         [-9.562*10**(-11), 4.436*10**(-10), 4.891*10**(-10), 5.431*10**(-10), 5.600*10**(-10),
+          5.385*10**(-10), 5.086*10**(-10), 5.636*10**(-10), 6.058*10**(-10), 7.128*10**(-10)],
+         [7.252*10**(-15), -2.449*10**(-14), -2.706*10**(-14), -3.008*10**(-14), -3.100*10**(-14),
+          -2.936*10**(-14), -2.769*10**(-14), -3.071*10**(-14), -3.3*10**(-14), -3.941*10**(-14)]]
+
+#columns of Q1: A, B, C, D, F for the 1->2 ... 1->9 transitions
+Q1 = np.zeros((3, 5, 8))
+Q1[1] = [[-3.413, -4.160, -5.193, -5.939, -8.261, -8.185, -10.823, -11.273],
+         [7.326*10**(-3), 7.803*10**(-3), 8.360*10**(-3), 8.807*10**(-3),
+          1.01*10**(-2), 1.01*10**(-2), 1.199*10**(-2), 1.283*10**(-2)],
+         [-2.2*10**(-6), -2.352*10**(-6), -2.526*10**(-6), -2.669*10**(-6),
+          -3.039*10**(-6), -3.039*10**(-6), -3.62*10**(-6), -3.879*10**(-6)],
+         [3.128*10**(-10), 3.352*10**(-10), 3.606*10**(-10), 3.806*10**(-10),
+          4.318*10**(-10), 4.318*10**(-10), 5.159*10**(-10), 5.534*10**(-10)],
+         [-1.702*10**(-14), -1.828*10**(-14), -1.968*10**(-14), -2.073*10**(-14),
+          -2.347*10**(-14), -2.347*10**(-14), -2.810*10**(-14), -3.016*10**(-14)]]
+
+#np.digitize(Te, schunk_bins, right=True) -> row of Q0, Q1 (300 itself belongs to the first range)
+schunk_bins = np.array([np.nextafter(300, 0), 1500, 6000])
+schunk_rows = np.array([2, 0, 1, 2])
+
+#np.digitize(Te, rees_bins, right=True): 0 for Te<=1000, 1 for 1000<Te<2000, 2 for Te>=2000
+rees_bins = np.array([1000, np.nextafter(2000, 0)])
+
+
+def logQ_sum(coef, te, dT, E1):
+    #sum over the transitions of 10^logQ*(1-exp(v*E1*(1/Te-1/Tvib)))
+    te2, te3, te4 = te**2, te**3, te**4
+    total = 0
+    for v in range(coef.shape[1]):
+        A, B, C, D, F = coef[:, v]
+        logQ = A+B*te+C*te2+D*te3+F*te4-16
+        total = total+(10**(logQ)*(1-np.exp((v+1)*E1*dT)))
+    return total
+
+
 def N2_vib(Necm,NN2,Tn,Te):
+    Necm, NN2, Tn, Te = np.broadcast_arrays(np.asarray(Necm, dtype=float), np.asarray(NN2, dtype=float),
+                                            np.asarray(Tn, dtype=float), np.asarray(Te, dtype=float))
     #Schunk and Nagy
     E1=3353 #K
     Tvib=Tn
-#     print(Te)
-    if Te>=300 and Te<=1500:
-        A01=-6.462
-        A02=0
-        A03=0
-        A04=0
-        A05=0
-        A06=0
-        A07=0
-        A08=0
-        A09=0
-        A010=0
-        B01=3.151*10**(-2)
-        B02=0
-        B03=0
-        B04=0
-        B05=0
-        B06=0
-        B07=0
-        B08=0
-        B09=0
-        B010=0
-        C01=-4.075*10**(-5)
-        C02=0
-        C03=0
-        C04=0
-        C05=0
-        C06=0
-        C07=0
-        C08=0
-        C09=0
-        C010=0
-        D01=2.493*10**(-8)
-        D02=0
-        D03=0
-        D04=0
-        D05=0
-        D06=0
-        D07=0
-        D08=0
-        D09=0
-        D010=0
-        F01=-5.479*10**(-12)
-        F02=0
-        F03=0
-        F04=0
-        F05=0
-        F06=0
-        F07=0
-        F08=0
-        F09=0
-        F010=0
-
-        A12=0
-        A13=0
-        A14=0
-        A15=0
-        A16=0
-        A17=0
-        A18=0
-        A19=0
-        B12=0
-        B13=0
-        B14=0
-        B15=0
-        B16=0
-        B17=0
-        B18=0
-        B19=0
-        C12=0
-        C13=0
-        C14=0
-        C15=0
-        C16=0
-        C17=0
-        C18=0
-        C19=0
-        D12=0
-        D13=0
-        D14=0
-        D15=0
-        D16=0
-        D17=0
-        D18=0
-        D19=0
-        F12=0
-        F13=0
-        F14=0
-        F15=0
-        F16=0
-        F17=0
-        F18=0
-        F19=0
-    elif Te>=1500 and Te<=6000:
-        A01=2.025
-        A02=-7.066
-        A03=-8.211
-        A04=-9.713
-        A05=-10.353
-        A06=-10.819
-        A07=-10.183
-        A08=-12.698
-        A09=-14.710
-        A010=-17.538
-        B01=8.782*10**(-4)
-        B02=1.0001*10**(-2)
-        B03=1.092*10**(-2)
-        B04=1.204*10**(-2)
-        B05=1.243*10**(-2)
-        B06=1.244*10**(-2)
-        B07=1.185*10**(-2)
-        B08=1.309*10**(-2)
-        B09=1.409*10**(-2)
-        B010=1.6*10**(-2)
-        C01=2.954*10**(-7)
-        C02=-3.066*10**(-6)
-        C03=-3.369*10**(-6)
-        C04=-3.732*10**(-6)
-        C05=-3.850*10**(-6)
-        C06=-3.771*10**(-6)
-        C07=-3.570*10**(-6)
-        C08=-3.952*10**(-6)
-        C09=-4.249*10**(-6)
-        C010=-4.916*10**(-6)
-        D01=-9.562*10**(-11)
-        D02=4.436*10**(-10)
-        D03=4.891*10**(-10)
-        D04=5.431*10**(-10)
-        D05=5.600*10**(-10)
-        D06=5.385*10**(-10)
-        D07=5.086*10**(-10)
-        D08=5.636*10**(-10)
-        D09=6.058*10**(-10)
-        D010=7.128*10**(-10)
-        F01=7.252*10**(-15)
-        F02=-2.449*10**(-14)
-        F03=-2.706*10**(-14)
-        F04=-3.008*10**(-14)
-        F05=-3.100*10**(-14)
-        F06=-2.936*10**(-14)
-        F07=-2.769*10**(-14)
-        F08=-3.071*10**(-14)
-        F09=-3.3*10**(-14)
-        F010=-3.941*10**(-14)
-
-        A12=-3.413
-        A13=-4.160
-        A14=-5.193
-        A15=-5.939
-        A16=-8.261
-        A17=-8.185
-        A18=-10.823
-        A19=-11.273
-        B12=7.326*10**(-3)
-        B13=7.803*10**(-3)
-        B14=8.360*10**(-3)
-        B15=8.807*10**(-3)
-        B16=1.01*10**(-2)
-        B17=1.01*10**(-2)
-        B18=1.199*10**(-2)
-        B19=1.283*10**(-2)
-        C12=-2.2*10**(-6)
-        C13=-2.352*10**(-6)
-        C14=-2.526*10**(-6)
-        C15=-2.669*10**(-6)
-        C16=-3.039*10**(-6)
-        C17=-3.039*10**(-6)
-        C18=-3.62*10**(-6)
-        C19=-3.879*10**(-6)
-        D12=3.128*10**(-10)
-        D13=3.352*10**(-10)
-        D14=3.606*10**(-10)
-        D15=3.806*10**(-10)
-        D16=4.318*10**(-10)
-        D17=4.318*10**(-10)
-        D18=5.159*10**(-10)
-        D19=5.534*10**(-10)
-        F12=-1.702*10**(-14)
-        F13=-1.828*10**(-14)
-        F14=-1.968*10**(-14)
-        F15=-2.073*10**(-14)
-        F16=-2.347*10**(-14)
-        F17=-2.347*10**(-14)
-        F18=-2.810*10**(-14)
-        F19=-3.016*10**(-14)
-        
-    else:
-        A01=0
-        A02=0
-        A03=0
-        A04=0
-        A05=0
-        A06=0
-        A07=0
-        A08=0
-        A09=0
-        A010=0
-        B01=0
-        B02=0
-        B03=0
-        B04=0
-        B05=0
-        B06=0
-        B07=0
-        B08=0
-        B09=0
-        B010=0
-        C01=0
-        C02=0
-        C03=0
-        C04=0
-        C05=0
-        C06=0
-        C07=0
-        C08=0
-        C09=0
-        C010=0
-        D01=0
-        D02=0
-        D03=0
-        D04=0
-        D05=0
-        D06=0
-        D07=0
-        D08=0
-        D09=0
-        D010=0
-        F01=0
-        F02=0
-        F03=0
-        F04=0
-        F05=0
-        F06=0
-        F07=0
-        F08=0
-        F09=0
-        F010=0
-
-        A12=0
-        A13=0
-        A14=0
-        A15=0
-        A16=0
-        A17=0
-        A18=0
-        A19=0
-        B12=0
-        B13=0
-        B14=0
-        B15=0
-        B16=0
-        B17=0
-        B18=0
-        B19=0
-        C12=0
-        C13=0
-        C14=0
-        C15=0
-        C16=0
-        C17=0
-        C18=0
-        C19=0
-        D12=0
-        D13=0
-        D14=0
-        D15=0
-        D16=0
-        D17=0
-        D18=0
-        D19=0
-        F12=0
-        F13=0
-        F14=0
-        F15=0
-        F16=0
-        F17=0
-        F18=0
-        F19=0
-        
-
-
-    logQ01=A01+B01*Te+C01*(Te**2)+D01*(Te**3)+F01*(Te**4)-16
-    logQ02=A02+B02*Te+C02*(Te**2)+D02*(Te**3)+F02*(Te**4)-16
-    logQ03=A03+B03*Te+C03*(Te**2)+D03*(Te**3)+F03*(Te**4)-16
-    logQ04=A04+B04*Te+C04*(Te**2)+D04*(Te**3)+F04*(Te**4)-16
-    logQ05=A05+B05*Te+C05*(Te**2)+D05*(Te**3)+F05*(Te**4)-16
-    logQ06=A06+B06*Te+C06*(Te**2)+D06*(Te**3)+F06*(Te**4)-16
-    logQ07=A07+B07*Te+C07*(Te**2)+D07*(Te**3)+F07*(Te**4)-16
-    logQ08=A08+B08*Te+C08*(Te**2)+D08*(Te**3)+F08*(Te**4)-16
-    logQ09=A09+B09*Te+C09*(Te**2)+D09*(Te**3)+F09*(Te**4)-16
-    logQ010=A010+B010*Te+C010*(Te**2)+D010*(Te**3)+F010*(Te**4)-16
-
-    logQ12=A12+B12*Te+C12*(Te**2)+D12*(Te**3)+F12*(Te**4)-16
-    logQ13=A13+B13*Te+C13*(Te**2)+D13*(Te**3)+F13*(Te**4)-16
-    logQ14=A14+B14*Te+C14*(Te**2)+D14*(Te**3)+F14*(Te**4)-16
-    logQ15=A15+B15*Te+C15*(Te**2)+D15*(Te**3)+F15*(Te**4)-16
-    logQ16=A16+B16*Te+C16*(Te**2)+D16*(Te**3)+F16*(Te**4)-16
-    logQ17=A17+B17*Te+C17*(Te**2)+D17*(Te**3)+F17*(Te**4)-16
-    logQ18=A18+B18*Te+C18*(Te**2)+D18*(Te**3)+F18*(Te**4)-16
-    logQ19=A19+B19*Te+C19*(Te**2)+D19*(Te**3)+F19*(Te**4)-16
-
-    Le_N2_vibf_schunk=(10**(-12)*Necm*NN2*(1-np.exp(-E1/Tvib)) \
-            *((10**(logQ01)*(1-np.exp(1*E1*(Te**(-1)-Tvib**(-1))))) \
-            +(10**(logQ02)*(1-np.exp(2*E1*(Te**(-1)-Tvib**(-1)))))  \
-            +(10**(logQ03)*(1-np.exp(3*E1*(Te**(-1)-Tvib**(-1)))))  \
-            +(10**(logQ04)*(1-np.exp(4*E1*(Te**(-1)-Tvib**(-1)))))   \
-            +(10**(logQ05)*(1-np.exp(5*E1*(Te**(-1)-Tvib**(-1)))))   \
-            +(10**(logQ06)*(1-np.exp(6*E1*(Te**(-1)-Tvib**(-1)))))   \
-            +(10**(logQ07)*(1-np.exp(7*E1*(Te**(-1)-Tvib**(-1)))))   \
-            +(10**(logQ08)*(1-np.exp(8*E1*(Te**(-1)-Tvib**(-1)))))   \
-            +(10**(logQ09)*(1-np.exp(9*E1*(Te**(-1)-Tvib**(-1)))))   \
-            +(10**(logQ010)*(1-np.exp(10*E1*(Te**(-1)-Tvib**(-1)))))    \
-             )  \
-             +10**(-12)*Necm*NN2*(1-np.exp(-E1/Tvib))*np.exp(-E1/Tvib)  \
-             *((10**(logQ12)*(1-np.exp(1*E1*(Te**(-1)-Tvib**(-1)))))  \
-            +(10**(logQ13)*(1-np.exp(2*E1*(Te**(-1)-Tvib**(-1)))))  \
-            +(10**(logQ14)*(1-np.exp(3*E1*(Te**(-1)-Tvib**(-1)))))   \
-            +(10**(logQ15)*(1-np.exp(4*E1*(Te**(-1)-Tvib**(-1)))))   \
-            +(10**(logQ16)*(1-np.exp(5*E1*(Te**(-1)-Tvib**(-1)))))   \
-            +(10**(logQ17)*(1-np.exp(6*E1*(Te**(-1)-Tvib**(-1)))))   \
-            +(10**(logQ18)*(1-np.exp(7*E1*(Te**(-1)-Tvib**(-1)))))   \
-            +(10**(logQ19)*(1-np.exp(8*E1*(Te**(-1)-Tvib**(-1)))))   \
-            ))*1.60217662*10**(-13) #W/m^3
-    
+    dT = Te**(-1)-Tvib**(-1)
+
+    rows = schunk_rows[np.digitize(Te, schunk_bins, right=True)]
+    sum0 = np.empty(Te.shape)
+    sum1 = np.empty(Te.shape)
+    for row in np.unique(rows):
+        mask = rows == row
+        sum0[mask] = logQ_sum(Q0[row], Te[mask], dT[mask], E1)
+        sum1[mask] = logQ_sum(Q1[row], Te[mask], dT[mask], E1)
+
+    Le_N2_vibf_schunk=(10**(-12)*Necm*NN2*(1-np.exp(-E1/Tvib))*sum0 \
+             +10**(-12)*Necm*NN2*(1-np.exp(-E1/Tvib))*np.exp(-E1/Tvib)*sum1)*1.60217662*10**(-13) #W/m^3
+
     #Rees and Roble
-    
-    if Te>=2000:
-        A_u=2.53*10**(-6)*np.sqrt(Te)*np.exp(-17620/Te)
-        A_u_t=A_u
-    elif Te>1000 and Te<2000:
-        A_u=2*10**(-7)*np.exp(-4605.2/Te)
-        A_u_t=A_u
-    elif Te<=1000:
-        A_u=5.71*10**(-7)*np.exp(-3352.6/Te)
-        A_u_t=5.7*10**(-8)*np.exp(-3352.6/Te)
-    
+    branch = np.digitize(Te, rees_bins, right=True)
+    A_u = np.empty(Te.shape)
+    A_u_t = np.empty(Te.shape)
+    mask = branch == 2
+    A_u[mask] = 2.53*10**(-6)*np.sqrt(Te[mask])*np.exp(-17620/Te[mask])
+    A_u_t[mask] = A_u[mask]
+    mask = branch == 1
+    A_u[mask] = 2*10**(-7)*np.exp(-4605.2/Te[mask])
+    A_u_t[mask] = A_u[mask]
+    mask = branch == 0
+    A_u[mask] = 5.71*10**(-7)*np.exp(-3352.6/Te[mask])
+    A_u_t[mask] = 5.7*10**(-8)*np.exp(-3352.6/Te[mask])
+
     rees_1=A_u*(1-np.exp((3200/Te)-(3200/Tn)))
     rees_2=7.6*10**(-16)*Te
     rees_3=2*10**(-10)/np.sqrt(Te)
-    
+
     Le_N2_vibf_rees=(1.3*10**(-4)*Necm*NN2*(rees_1+(rees_2+rees_3)*(Te-Tn)))*1.60217662*10**(-13) #W/m^3
-    
+
     #TIEGCM
     fac_n2=3200*((1/Te)-(1/Tn))
     Le_N2_vibf_tiegcm=(1.3*10**(-4)*Necm*NN2*A_u_t*(-3200/(Te*Tn))*((1-np.exp(fac_n2))/fac_n2))*(Te-Tn)*1.60217662*10**(-13)
-    
-    return Le_N2_vibf_schunk,Le_N2_vibf_rees,Le_N2_vibf_tiegcm
\ No newline at end of file
+
+    return Le_N2_vibf_schunk[()],Le_N2_vibf_rees[()],Le_N2_vibf_tiegcm[()]
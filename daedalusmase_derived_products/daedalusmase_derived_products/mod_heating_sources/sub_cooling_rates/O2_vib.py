@@ -4,7 +4,9 @@
 **Description**:
 _____________________________________________________________________________________________________________________
 
-Calculate O+ by solving the coresponding momentum equation
+Calculate cooling due to O2 vibrational excitation
+
+Inputs can be scalars or arrays of any shape.
 _____________________________________________________________________________________________________________________
 _____________________________________________________________________________________________________________________
 
@@ -45,7 +47,13 @@ ________________________________________________________________________________
 """
 import numpy as np
 
+#np.digitize(Te, rees_bins, right=True) -> branch of the Rees and Roble B_L
+rees_bins = np.array([350, 500, 1000, 1400, 2000, 3000, 5000])
+
+
 def O2_vib(Necm,NO2,Tn,Te):
+    Necm, NO2, Tn, Te = np.broadcast_arrays(np.asarray(Necm, dtype=float), np.asarray(NO2, dtype=float),
+                                            np.asarray(Tn, dtype=float), np.asarray(Te, dtype=float))
     #Schunk
     logQ_Te=-19.9171+0.0267*Te-3.9960*(10**(-5))*(Te**2) \
             +3.5187*(10**(-8))*(Te**3)-1.9228*(10**(-11))*(Te**4) \
@@ -58,23 +66,23 @@ def O2_vib(Necm,NO2,Tn,Te):
 
     Le_O2_vibf_schunk=(Necm*NO2*Q_Te*(1-np.exp(2239*(Te**(-1)-Tn**(-1)))))*1.60217662*10**(-13)  #W/m^3
     
-    #Rees and Roble
-    if Te<=350:
-        B_L=0
-    elif Te>350 and Te<=500:
-        B_L=1.3*10**(-4)*np.exp(2.532*10**(-2)*(Te-350))
-    elif Te>500 and Te<=1000:
-        B_L=1.933*10**(-3)*(1+9.11*10**(-2)*(Te-500)+2*np.exp(7.6813*10**(-3)*(Te-500)))
-    elif Te>1000 and Te<=1400:
-        B_L=0.135*(1+5.185*10**(-3)*(Te-1000)+np.exp(2.8042*10**(-3)*(Te-1000)))
-    elif Te>1400 and Te<=2000:
-        B_L=0.83+1.95*10**(-3)*(Te-1400)
-    elif Te>2000 and Te<=3000:
-        B_L=2+2.75*10**(-3)*(Te-2000)
-    elif Te>3000 and Te<=5000:
-        B_L=4.75+2.925*10**(-3)*(Te-3000)
-    elif Te>5000:
-        B_L=10.6*np.exp(1.5875*10**(-4)*(Te-5000))
+    #Rees and Roble, branches Te<=350, 350<Te<=500, ..., 3000<Te<=5000, Te>5000
+    branch = np.digitize(Te, rees_bins, right=True)
+    B_L = np.zeros(Te.shape)
+    mask = branch == 1
+    B_L[mask] = 1.3*10**(-4)*np.exp(2.532*10**(-2)*(Te[mask]-350))
+    mask = branch == 2
+    B_L[mask] = 1.933*10**(-3)*(1+9.11*10**(-2)*(Te[mask]-500)+2*np.exp(7.6813*10**(-3)*(Te[mask]-500)))
+    mask = branch == 3
+    B_L[mask] = 0.135*(1+5.185*10**(-3)*(Te[mask]-1000)+np.exp(2.8042*10**(-3)*(Te[mask]-1000)))
+    mask = branch == 4
+    B_L[mask] = 0.83+1.95*10**(-3)*(Te[mask]-1400)
+    mask = branch == 5
+    B_L[mask] = 2+2.75*10**(-3)*(Te[mask]-2000)
+    mask = branch == 6
+    B_L[mask] = 4.75+2.925*10**(-3)*(Te[mask]-3000)
+    mask = branch == 7
+    B_L[mask] = 10.6*np.exp(1.5875*10**(-4)*(Te[mask]-5000))
 
 
     Le_O2_vibf_rees=10**(-11)*Necm*NO2*B_L*1.60217662*10**(-13)  #W/m^3
@@ -83,4 +91,4 @@ def O2_vib(Necm,NO2,Tn,Te):
     
     Le_O2_vibf_tiegcm=Necm*NO2*3.125*10**(-21)*Te*Te*1.60217662*10**(-13)  
     
-    return Le_O2_vibf_schunk,Le_O2_vibf_rees,Le_O2_vibf_tiegcm
+    return Le_O2_vibf_schunk[()],Le_O2_vibf_rees[()],Le_O2_vibf_tiegcm[()]
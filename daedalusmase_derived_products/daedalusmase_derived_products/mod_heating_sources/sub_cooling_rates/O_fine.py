@@ -5,6 +5,8 @@
 _____________________________________________________________________________________________________________________
 
 Calculate cooling due to O fine structure
+
+Inputs can be scalars or arrays of any shape.
 _____________________________________________________________________________________________________________________
 _____________________________________________________________________________________________________________________
 
@@ -46,6 +48,8 @@ ________________________________________________________________________________
 import numpy as np
 
 def O_fine(Necm,NO,Te,Tn):
+    Necm, NO = np.asarray(Necm, dtype=float), np.asarray(NO, dtype=float)
+    Te, Tn = np.asarray(Te, dtype=float), np.asarray(Tn, dtype=float)
     #Schunk and Nagy
     D=5+np.exp(-326.6/Tn)+3*np.exp(-227.7/Tn)
     S21=1.863*10**(-11)
@@ -67,11 +71,9 @@ def O_fine(Necm,NO,Te,Tn):
     A_4_r=8*10**(-3)*(3*10**(-21)+2.2*10**(-17))*(np.exp(-(8*10**(-3))/A_5_r)-np.exp((8*10**(-3))/A_6_r))
     
     Tdiff=Te-Tn
-    if Tdiff<=3000:
-        Bstar=A_1_r*(A_2_r+A_3_r+A_4_r)*A_5_r
-    else:
-        Bstar=0.5*((A_1_r*(A_2_r+A_3_r+A_4_r)*A_5_r)+A_7_r)
+    Bstar=A_1_r*(A_2_r+A_3_r+A_4_r)*A_5_r
+    Bstar=np.where(np.digitize(Tdiff, [3000], right=True) == 0, Bstar, 0.5*(Bstar+A_7_r))
         
     Le_O_finef_rees=Necm*NO*Bstar*1.60217662*10**(-13) #W/m^3
     
-    return Le_O_finef_schunk,Le_O_finef_rees,Le_O_finef_tiegcm
\ No newline at end of file
+    return Le_O_finef_schunk[()],Le_O_finef_rees[()],Le_O_finef_tiegcm[()]
\ No newline at end of file
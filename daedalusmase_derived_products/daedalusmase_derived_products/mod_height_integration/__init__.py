@@ -1,3 +1,4 @@
 from .regrid import regrid
 from .integration import integration
 from .integration_limits import integration_limits
+from .integrate import integrate
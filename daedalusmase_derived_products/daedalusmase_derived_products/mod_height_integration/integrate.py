@@ -0,0 +1,110 @@
+"""
+sub_Heating_Sources.integrate
+
+**Description**:
+_____________________________________________________________________________________________________________________
+
+Integrate parameters of regridded TIEGCM files (see regrid) over a region, for many parameters and timesteps in
+one call. Each column is integrated along the altitude with the trapezoidal rule and the columns are summed with
+the area of their grid cell, \(\\cos\\phi\\,d\\phi\\,d\\lambda\\,(R_e+z)^2\).
+The files are read one timestep at a time, so a time series of many files can be integrated.
+
+$$Q=\\sum_{\\phi,\\lambda}\\cos\\phi\\,d\\phi\\,d\\lambda\\int_{z_{min}}^{z_{max}} q\\,(R_e+z)^2\\,dz$$
+
+_____________________________________________________________________________________________________________________
+_____________________________________________________________________________________________________________________
+
+**Inputs**:
+_____________________________________________________________________________________________________________________
+
+`regrid_files`: regridded TIEGCM NetCDF file or list of files of a time series
+
+`params`: list of parameters to be integrated
+
+`timesteps`: list of timesteps of each file, all timesteps if None
+
+`minlat`, `maxlat`: indices of the first and last latitude of the region, whole grid if None
+
+`minlon`, `maxlon`: indices of the first and last longitude of the region, whole grid if None
+
+`minalt`, `maxalt`: indices of the first and last altitude of the region, whole grid if None
+
+`maps`: also return the height integrated maps
+
+_____________________________________________________________________________________________________________________
+_______________________________________________________________________________________________________________________
+
+**Outputs**:
+_____________________________________________________________________________________________________________________
+
+`Integrals`: named tuple with
+
+`time`: time of each integrated timestep
+
+`totals`: dictionary with an array of the integral of each parameter per timestep, in units of the parameter
+times \(m^3\) (W for heating rates in \(W/m^3\))
+
+`maps`: dictionary with the height integrated (lat, lon) maps of each parameter per timestep, in units of
+the parameter times m, None if maps is False
+
+`lat`, `lon`, `height`: the coordinates of the region
+_____________________________________________________________________________________________________________________
+________________________________________________________________________________________________________________________
+
+
+"""
+
+from collections import namedtuple
+import numpy as np
+from netCDF4 import Dataset
+
+from daedalusmase_derived_products.mod_tiegcm_utils import const
+
+Integrals = namedtuple('Integrals', ['time', 'totals', 'maps', 'lat', 'lon', 'height'])
+
+#np.trapz is called np.trapezoid since numpy 2
+trapz = getattr(np, 'trapezoid', None) or np.trapz
+
+
+def cell_areas(lat, lon):
+    #cos(lat) x dlat x dlon of each grid point in rad^2, the grid points are the centres of the cells
+    dlat = np.abs(np.gradient(np.radians(lat))) if len(lat) > 1 else np.radians([const.deltaphi])
+    dlon = np.abs(np.gradient(np.radians(lon))) if len(lon) > 1 else np.radians([const.deltalmd])
+    return (np.cos(np.radians(lat)) * dlat)[:, None] * dlon[None, :]
+
+
+def integrate(regrid_files, params, timesteps=None, minlat=None, maxlat=None, minlon=None, maxlon=None,
+              minalt=None, maxalt=None, maps=False):
+
+    if isinstance(regrid_files, str):
+        regrid_files = [regrid_files]
+    lats = slice(minlat, None if maxlat is None else maxlat + 1)
+    lons = slice(minlon, None if maxlon is None else maxlon + 1)
+    alts = slice(minalt, None if maxalt is None else maxalt + 1)
+
+    times = []
+    totals = {param: [] for param in params}
+    height_maps = {param: [] for param in params} if maps else None
+
+    for regrid_file in regrid_files:
+        nc = Dataset(regrid_file)
+        lat = np.ma.filled(nc.variables['lat'][lats].astype(float), np.nan)
+        lon = np.ma.filled(nc.variables['lon'][lons].astype(float), np.nan)
+        areas = cell_areas(lat, lon)
+        gtime = nc.variables['time'][:]
+        for timer in (range(len(gtime)) if timesteps is None else timesteps):
+            height = np.ma.filled(nc.variables['height'][timer, alts].astype(float), np.nan) #km
+            z = height * 1000 #m
+            r2 = ((const.Re + height) * 1000)**2 #m^2
+            times.append(gtime[timer])
+            for param in params:
+                var = np.ma.filled(nc.variables[param][timer, alts, lats, lons].astype(float), np.nan)
+                totals[param].append(np.sum(areas * trapz(var * r2[:, None, None], z, axis=0)))
+                if maps:
+                    height_maps[param].append(trapz(var, z, axis=0))
+        nc.close()
+
+    totals = {param: np.array(values) for param, values in totals.items()}
+    if maps:
+        height_maps = {param: np.array(values) for param, values in height_maps.items()}
+    return Integrals(np.array(times), totals, height_maps, lat, lon, height)
@@ -6,6 +6,11 @@ ________________________________________________________________________________
 
 Regrids a TIEGCM NetCDF file from pressure defined grid to altitude defined grid
 
+ZGMID is used as an increasing altitude coordinate of each (lat, lon) column. The bracketing levels of all target
+altitudes are found for all columns at once and all params are interpolated with the same brackets and weights.
+Altitudes outside a column are extrapolated from its two lowest or two highest levels.
+The file is read and written one timestep at a time, so memory does not grow with the length of the file.
+
 _____________________________________________________________________________________________________________________
 _____________________________________________________________________________________________________________________
 
@@ -41,44 +46,29 @@ ________________________________________________________________________________
 
 import numpy as np
 from netCDF4 import Dataset
-import sys
 from tqdm import tqdm
-from daedalusmase_derived_products.mod_tiegcm_utils import read_tiegcm_whole 
 import os
-def regrid(minAlt,maxAlt,dz,tiegcm_file,timesteps,params,output_path):
 
-#
-    Nz=int((maxAlt-minAlt)/dz)
 
-    def local(y,x):
-        local_pos=0
-        
-        if y>=x[-1]:
-            return int(len(x)-1)
-        if y<=x[0]:
-            return 0
+def brackets(alts, heights):
+    #index of the level below each height in each column, alts is (lev, lat, lon) and increasing along lev
+    #same as searchsorted(alts[:, k, z], heights, side='right') - 1 for every column, clipped to the levels
+    below = np.zeros((len(heights),) + alts.shape[1:], dtype=np.intp)
+    for level in alts[1:-1]:
+        below += level[None, :, :] <= heights[:, None, None]
+    return below
+
 
-        for i in range(0,len(x)-1):
-            if y >= x[i] and y < x[i+1]:
-                local_pos=i
-                return (local_pos)
-        
-        print("No local neighbors...")
+def regrid(minAlt,maxAlt,dz,tiegcm_file,timesteps,params,output_path):
 
-    dictOfvars = {} #Make a Dictionary fro variables
+    Nz=int((maxAlt-minAlt)/dz)
+    heights=minAlt+np.arange(Nz)*dz
 
     nc=Dataset(tiegcm_file)
-    ZGMID=nc.variables["ZGMID"][:]
     time=nc.variables["time"][:]
     lat=nc.variables["lat"][:]
     lon=nc.variables["lon"][:]
     lev=nc.variables["ilev"][:]
-    nc.close()
-
-    for i in range(0,len(params)):
-        # print(params[i])
-        x=params[i]
-        dictOfvars[x]=read_tiegcm_whole(tiegcm_file,params[i])   
 
     nalt=len(lev)
     ntimesT=len(time)
@@ -89,31 +79,7 @@ def regrid(minAlt,maxAlt,dz,tiegcm_file,timesteps,params,output_path):
     print("Dimensions Of Regridded: time x alt x loat x lon",ntimes,Nz,nlat,nlon)
     print("Timesteps to calculate-->",timesteps)
 
-    dictOfallocs={} #Make a Dictionary fro allocations
-    
-    for j in range(len(dictOfvars)):
-        dictOfallocs["retval{0}".format(j)] = np.zeros((ntimesT,Nz,nlat,nlon))
-
-    # print(list(dictOfallocs.keys())[0])
-
-
-    # print(dictOfallocs["retval{0}".format(0)])
-    # print('shape',np.shape(dictOfallocs["retval{0}".format(0)]))
-    height_out=np.zeros((ntimes, Nz),order='F')
-    for i in range(ntimes):
-        for j in tqdm(range (Nz)):
-            height=minAlt+j*dz
-            height_out[i,j]=height
-            for k in range(nlat):
-                for z in range(nlon):
-                    for jj in range(0,len(dictOfvars)):
-
-                        alts=ZGMID[timesteps[i],:,k,z]/1.e5
-                        lrho=local(height,alts)
-                        dr=alts[lrho+1]-alts[lrho]
-                        dictOfallocs["retval{0}".format(jj)][timesteps[i],j,k,z]=((height-alts[lrho])/(dr))*dictOfvars[params[jj]][timesteps[i],lrho,k,z]+(1-((height-alts[lrho])/(dr)))*dictOfvars[params[jj]][timesteps[i],lrho+1,k,z]
-
-    # # Write out
+    # # Write out, one timestep at a time
     file_name = os.path.basename(tiegcm_file)
     ncout = Dataset(output_path+os.path.splitext(file_name)[0]+"_regrid.nc", "w", format="NETCDF4")    
     ncout.createDimension("time",ntimesT )
@@ -126,11 +92,27 @@ def regrid(minAlt,maxAlt,dz,tiegcm_file,timesteps,params,output_path):
     data_lon = ncout.createVariable("lon","f4",("lon"))
     data_lon[:]=lon
     data_heigh = ncout.createVariable("height","f4",("time","height"))
-    data_heigh[:]=height_out
+    data_heigh[:]=np.broadcast_to(heights,(ntimesT,Nz))
     data_time = ncout.createVariable("time","f4",("time"))
     data_time[:]=time
 
-    for jj in range(len(dictOfvars)):
-        data = ncout.createVariable(params[jj],"f4",("time","height","lat","lon"))
-        data[:]=dictOfallocs["retval{0}".format(jj)]  
-    ncout.close()
\ No newline at end of file
+    outvars=[ncout.createVariable(param,"f4",("time","height","lat","lon"),chunksizes=(1,Nz,nlat,nlon)) for param in params]
+    calculated=set(timesteps)
+    for timer in range(ntimesT):
+        if timer not in calculated:
+            for data in outvars:
+                data[timer]=np.zeros((Nz,nlat,nlon))
+
+    for timer in tqdm(sorted(calculated)):
+        alts=np.ma.filled(nc.variables["ZGMID"][timer].astype(float),np.nan)/1.e5
+        lrho=brackets(alts,heights)
+        alts_low=np.take_along_axis(alts,lrho,axis=0)
+        alts_high=np.take_along_axis(alts,lrho+1,axis=0)
+        #weights as in the original per point loop
+        w=(heights[:,None,None]-alts_low)/(alts_high-alts_low)
+        for param,data in zip(params,outvars):
+            var=np.ma.filled(nc.variables[param][timer].astype(float),np.nan)
+            data[timer]=w*np.take_along_axis(var,lrho,axis=0)+(1-w)*np.take_along_axis(var,lrho+1,axis=0)
+
+    nc.close()
+    ncout.close()
@@ -8,3 +8,5 @@ from .gyro_freqs import gyro_freqs
 from .igrf_B import igrf_B
 from .electric_field import electric_field
 from .read_tiegcm_whole import read_tiegcm_whole
+from .tiegcm_store import TiegcmStore
+from .igrf_grid import igrf_grid
@@ -0,0 +1,119 @@
+"""
+tiegcm_utils.tiegcm_store
+
+**Description**:
+_____________________________________________________________________________________________________________________
+
+Cached access to tiegcm input files. The store keeps the files open and reads each (variable, timer) slab once,
+with the unit conversions of read_tiegcm applied, keeping the most recently used slabs up to a memory limit.
+`TiegcmStore.read_tiegcm` has the same arguments and returns the same values as read_tiegcm.
+_____________________________________________________________________________________________________________________
+_____________________________________________________________________________________________________________________
+
+
+**Inputs**:
+_____________________________________________________________________________________________________________________
+
+`max_bytes`: memory limit of the cached slabs in bytes
+
+`max_files`: maximum number of open files
+
+_____________________________________________________________________________________________________________________
+_______________________________________________________________________________________________________________________
+
+**Outputs**:
+_____________________________________________________________________________________________________________________
+
+`slab`: 3D array (lev, lat, lon) of a variable at a time step, 2D (lat, lon) for BX, BY, BZ
+
+`opens`: number of files opened by the store
+_____________________________________________________________________________________________________________________
+________________________________________________________________________________________________________________________
+"""
+
+from collections import OrderedDict
+import numpy as np
+from netCDF4 import Dataset
+
+#unit conversions of read_tiegcm
+scale = {'Ui_lev': 1 / 100, 'Vi_lev': 1 / 100, 'Wi_lev': 1 / 100,
+         'UN': 1 / 100, 'VN': 1 / 100, 'WN_lev': 1 / 100,
+         'ZGMID': 1 / 1e5,
+         'EEX': 100, 'EEY': 100, 'EEZ': 100,
+         'DEN': 1000}
+
+magnetic = ('BX', 'BY', 'BZ')
+
+
+class TiegcmStore:
+
+    def __init__(self, max_bytes=1024 ** 3, max_files=8):
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.files = OrderedDict()
+        self.slabs = OrderedDict()
+        self.nbytes = 0
+        self.opens = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def dataset(self, tiegcm_file):
+        #return the open handle of the file, opening it if needed
+        if tiegcm_file in self.files:
+            self.files.move_to_end(tiegcm_file)
+            return self.files[tiegcm_file]
+        TIEGCM = Dataset(tiegcm_file)
+        self.opens += 1
+        self.files[tiegcm_file] = TIEGCM
+        while len(self.files) > self.max_files:
+            self.files.popitem(last=False)[1].close()
+        return TIEGCM
+
+    def slab(self, tiegcm_file, variable, timer):
+        key = (tiegcm_file, variable, timer)
+        if key in self.slabs:
+            self.slabs.move_to_end(key)
+            return self.slabs[key]
+
+        TIEGCM = self.dataset(tiegcm_file)
+        if variable in ('lat', 'lon', 'time'):
+            var = np.ma.filled(TIEGCM.variables[variable][:].astype(float), np.nan)
+        elif variable in magnetic:
+            bmag = np.ma.filled(TIEGCM.variables['BMAG'][timer].astype(float), np.nan)
+            var = bmag * np.ma.filled(TIEGCM.variables[variable][timer].astype(float), np.nan) * 0.0001
+        else:
+            var = np.ma.filled(TIEGCM.variables[variable][timer].astype(float), np.nan)
+            if variable in scale:
+                var = var * scale[variable]
+
+        self.slabs[key] = var
+        self.nbytes += var.nbytes
+        while len(self.slabs) > 1 and self.nbytes > self.max_bytes:
+            self.nbytes -= self.slabs.popitem(last=False)[1].nbytes
+        return var
+
+    def read_tiegcm(self, tiegcm_file, variable, timer, lev, lat, lon):
+        #same arguments and values as read_tiegcm
+        if variable == 'lat':
+            return self.slab(tiegcm_file, variable, None)[lat]
+        elif variable == 'lon':
+            return self.slab(tiegcm_file, variable, None)[lon]
+        elif variable == 'time':
+            return self.slab(tiegcm_file, variable, None)[timer]
+        elif variable in magnetic:
+            return self.slab(tiegcm_file, variable, timer)[lat, lon]
+        return self.slab(tiegcm_file, variable, timer)[lev, lat, lon]
+
+    def clear(self):
+        self.slabs.clear()
+        self.nbytes = 0
+
+    def close(self):
+        self.clear()
+        for TIEGCM in self.files.values():
+            TIEGCM.close()
+        self.files.clear()
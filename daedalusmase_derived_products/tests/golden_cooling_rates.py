@@ -0,0 +1,450 @@
+"""Golden values of the cooling rates, from the scalar if/elif versions of N2_vib, O2_vib and O_fine
+preceding their array rewrite, at Necm=NECM, density=DENSITY, Tn=TN and the electron temperatures TE
+(every range boundary of the three functions, one ulp below and above it, and a point inside each range)."""
+
+NECM = 200000.0
+DENSITY = 30000000000.0
+TN = 600.0
+
+TE = [
+    200.0,
+    299.99999999999994,
+    300.0,
+    300.00000000000006,
+    349.99999999999994,
+    350.0,
+    350.00000000000006,
+    499.99999999999994,
+    500.0,
+    500.00000000000006,
+    700.0,
+    999.9999999999999,
+    1000.0,
+    1000.0000000000001,
+    1200.0,
+    1399.9999999999998,
+    1400.0,
+    1400.0000000000002,
+    1499.9999999999998,
+    1500.0,
+    1500.0000000000002,
+    1800.0,
+    1999.9999999999998,
+    2000.0,
+    2000.0000000000002,
+    2500.0,
+    2999.9999999999995,
+    3000.0,
+    3000.0000000000005,
+    3599.9999999999995,
+    3600.0,
+    3600.0000000000005,
+    4000.0,
+    4999.999999999999,
+    5000.0,
+    5000.000000000001,
+    5500.0,
+    5999.999999999999,
+    6000.0,
+    6000.000000000001,
+    7000.0,
+]
+
+#schunk, rees, tiegcm
+N2_VIB = (
+    [
+        -3.318076987365035e+23,
+        -0.17893074084653168,
+        -0.1789307408465291,
+        -0.17893074084652277,
+        -2.1130917152835378e-08,
+        -2.1130917152835077e-08,
+        -2.1130917152834776e-08,
+        -1.0185107087897648e-20,
+        -1.0185107087897648e-20,
+        -1.0185107087897514e-20,
+        3.9245655519340936e-23,
+        4.80714545089266e-22,
+        4.807145450892718e-22,
+        4.807145450892719e-22,
+        2.1967427452906747e-21,
+        1.273091744444837e-20,
+        1.273091744444837e-20,
+        1.273091744444837e-20,
+        3.038052636732691e-20,
+        3.0380526367328647e-20,
+        5.339013250943977e-22,
+        1.57821410998125e-21,
+        3.471526759035597e-21,
+        3.471526759035603e-21,
+        3.471526759035603e-21,
+        2.2027208059398923e-20,
+        8.700428678738823e-20,
+        8.700428678738905e-20,
+        8.700428678738911e-20,
+        2.6431593367176504e-19,
+        2.6431593367176552e-19,
+        2.6431593367176403e-19,
+        4.556438765666985e-19,
+        1.2991814058239724e-18,
+        1.2991814058239753e-18,
+        1.2991814058239784e-18,
+        1.901584531440578e-18,
+        2.2790337193896008e-18,
+        2.2790337193896562e-18,
+        9.599428822773235e-25,
+        9.599917494403934e-25,
+    ],
+    [
+        -8.751641178036858e-10,
+        -6.476095294954846e-10,
+        -6.476095294954845e-10,
+        -6.476095294954844e-10,
+        -5.60137340847521e-10,
+        -5.601373408475208e-10,
+        -5.601373408475208e-10,
+        -2.830424573558809e-10,
+        -2.83042457355881e-10,
+        -2.8304245735588086e-10,
+        4.1758334782061685e-10,
+        2.5554277349457097e-09,
+        2.5554277349457114e-09,
+        5.744718035401604e-10,
+        1.0023421191699927e-09,
+        1.5281935080868561e-09,
+        1.5281935080868568e-09,
+        1.5281935080868576e-09,
+        1.8218316333262247e-09,
+        1.8218316333262253e-09,
+        1.8218316333262261e-09,
+        2.7919665380204705e-09,
+        3.487961378827156e-09,
+        3.108026087719586e-09,
+        3.10802608771959e-09,
+        1.4902364080309163e-08,
+        4.9818048266943815e-08,
+        4.9818048266943875e-08,
+        4.981804826694391e-08,
+        1.4265898430910504e-07,
+        1.4265898430910511e-07,
+        1.4265898430910522e-07,
+        2.442908163937763e-07,
+        6.567181537321818e-07,
+        6.567181537321823e-07,
+        6.567181537321826e-07,
+        9.483094403047609e-07,
+        1.2931703492372091e-06,
+        1.2931703492372095e-06,
+        1.2931703492372102e-06,
+        2.1243751167370155e-06,
+    ],
+    [
+        -1.6034883120186842e-11,
+        -2.0579255309354965e-11,
+        -2.0579255309354988e-11,
+        -2.0579255309354965e-11,
+        -2.1744958390658355e-11,
+        -2.174495839065837e-11,
+        -2.1744958390658385e-11,
+        -1.6622561593702944e-11,
+        -1.6622561593702944e-11,
+        -1.662256159370294e-11,
+        3.159124520183262e-11,
+        2.1974304761624458e-10,
+        2.1974304761624476e-10,
+        2.2032968594314707e-10,
+        5.010506534137205e-10,
+        8.874259923453594e-10,
+        8.874259923453599e-10,
+        8.874259923453608e-10,
+        1.11280560763501e-09,
+        1.112805607635011e-09,
+        1.1128056076350111e-09,
+        1.879880342687715e-09,
+        2.4395911325261377e-09,
+        2.059655841418568e-09,
+        2.059655841418572e-09,
+        1.350145288731356e-08,
+        4.8039033402401926e-08,
+        4.803903340240198e-08,
+        4.8039033402402025e-08,
+        1.4038353462114218e-07,
+        1.4038353462114218e-07,
+        1.403835346211423e-07,
+        2.4165548573658916e-07,
+        6.530734002884303e-07,
+        6.530734002884308e-07,
+        6.53073400288431e-07,
+        9.440984190670891e-07,
+        1.2883506723586827e-06,
+        1.2883506723586837e-06,
+        1.288350672358684e-06,
+        2.118208242405813e-06,
+    ],
+)
+
+#schunk, rees, tiegcm
+O2_VIB = (
+    [
+        -2.000670804445219e-10,
+        -7.924827499740653e-11,
+        -7.924827499740615e-11,
+        -7.924827499740631e-11,
+        -7.844712176565554e-11,
+        -7.844712176565546e-11,
+        -7.84471217656554e-11,
+        -7.157683056776831e-11,
+        -7.15768305677686e-11,
+        -7.157683056776728e-11,
+        1.6200611124952687e-10,
+        1.116905196736774e-09,
+        1.116905196736788e-09,
+        1.1169051967367695e-09,
+        2.0029276940853173e-09,
+        3.06485113512653e-09,
+        3.064851135126593e-09,
+        3.0648511351266306e-09,
+        3.662684857378452e-09,
+        3.662684857378721e-09,
+        3.6626848573786607e-09,
+        5.615700150239279e-09,
+        6.8707987823186284e-09,
+        6.870798782318461e-09,
+        6.8707987823183216e-09,
+        9.017120939196603e-09,
+        1.0066096391376753e-08,
+        1.0066096391386262e-08,
+        1.0066096391378356e-08,
+        1.0808477054806774e-08,
+        1.0808477054791214e-08,
+        1.0808477054792804e-08,
+        1.0513785165028126e-08,
+        8.70552626661775e-09,
+        8.705526266631425e-09,
+        8.70552626669979e-09,
+        8.759780469766886e-09,
+        1.055258119638635e-08,
+        1.0552581196894627e-08,
+        1.0552581196452647e-08,
+        24215.798733659063,
+    ],
+    [
+        0.0,
+        0.0,
+        0.0,
+        0.0,
+        0.0,
+        0.0,
+        1.2496977636000017e-12,
+        5.575135600245973e-11,
+        5.575135600245983e-11,
+        5.5746133316280125e-11,
+        5.298550037977463e-10,
+        2.5951953010836774e-09,
+        2.5951953010836786e-09,
+        2.5955261244000013e-09,
+        4.917410709174409e-09,
+        7.973465969081138e-09,
+        7.973465969081141e-09,
+        7.978839567600005e-09,
+        9.853386212999995e-09,
+        9.853386213e-09,
+        9.853386213000005e-09,
+        1.5477026149199998e-08,
+        1.9226119439999994e-08,
+        1.922611944e-08,
+        1.9226119440000007e-08,
+        3.2444076555e-08,
+        4.566203366999998e-08,
+        4.566203367000001e-08,
+        4.5662033670000013e-08,
+        6.253295347859999e-08,
+        6.25329534786e-08,
+        6.253295347860002e-08,
+        7.378023335100001e-08,
+        1.0189843303199999e-07,
+        1.0189843303200002e-07,
+        1.0189843303200002e-07,
+        1.1031628549083765e-07,
+        1.1942953863357495e-07,
+        1.19429538633575e-07,
+        1.19429538633575e-07,
+        1.3997678152469062e-07,
+    ],
+    [
+        1.201632465e-13,
+        2.703673046249999e-13,
+        2.70367304625e-13,
+        2.703673046250001e-13,
+        3.679999424062499e-13,
+        3.6799994240625006e-13,
+        3.6799994240625006e-13,
+        7.510202906249997e-13,
+        7.51020290625e-13,
+        7.51020290625e-13,
+        1.4719997696250002e-12,
+        3.004081162499999e-12,
+        3.0040811625e-12,
+        3.0040811625e-12,
+        4.325876874e-12,
+        5.8879990784999985e-12,
+        5.887999078500001e-12,
+        5.887999078500001e-12,
+        6.7591826156249985e-12,
+        6.759182615624999e-12,
+        6.759182615625001e-12,
+        9.733222966499999e-12,
+        1.2016324649999996e-11,
+        1.201632465e-11,
+        1.201632465e-11,
+        1.8775507265624997e-11,
+        2.7036730462499994e-11,
+        2.7036730462499997e-11,
+        2.7036730462500004e-11,
+        3.8932891865999995e-11,
+        3.8932891865999995e-11,
+        3.8932891866000014e-11,
+        4.80652986e-11,
+        7.510202906249998e-11,
+        7.510202906249999e-11,
+        7.510202906250003e-11,
+        9.087345516562501e-11,
+        1.0814692184999998e-10,
+        1.0814692184999999e-10,
+        1.0814692185000001e-10,
+        1.4719997696249997e-10,
+    ],
+)
+
+#schunk, rees, tiegcm
+O_FINE = (
+    [
+        -5.621859335597111e-09,
+        -2.1685243702291974e-09,
+        -2.168524370229196e-09,
+        -2.1685243702291957e-09,
+        -1.4436999676421349e-09,
+        -1.4436999676421344e-09,
+        -1.4436999676421338e-09,
+        -3.576369315904234e-10,
+        -3.576369315904234e-10,
+        -3.5763693159042305e-10,
+        2.3612395905073504e-10,
+        6.242300225128502e-10,
+        6.242300225128502e-10,
+        6.242300225128504e-10,
+        7.633268371913233e-10,
+        8.588993461641732e-10,
+        8.588993461641736e-10,
+        8.588993461641736e-10,
+        8.962750474436994e-10,
+        8.962750474436994e-10,
+        8.962750474436994e-10,
+        9.81643655691367e-10,
+        1.023384315972985e-09,
+        1.023384315972985e-09,
+        1.0233843159729858e-09,
+        1.0969846030440481e-09,
+        1.1449936164508997e-09,
+        1.1449936164508997e-09,
+        1.1449936164508997e-09,
+        1.1843843571452584e-09,
+        1.1843843571452584e-09,
+        1.184384357145259e-09,
+        1.2038793860781497e-09,
+        1.2386573233829183e-09,
+        1.2386573233829183e-09,
+        1.2386573233829183e-09,
+        1.2512125276154008e-09,
+        1.2616425293960784e-09,
+        1.2616425293960784e-09,
+        1.2616425293960784e-09,
+        1.2779816665116894e-09,
+    ],
+    [
+        -6.747023667793158e-07,
+        -7.858459074820688e-07,
+        -7.858459074820693e-07,
+        -7.858459074820693e-07,
+        -7.786093001746096e-07,
+        -7.786093001746098e-07,
+        -7.786093001746095e-07,
+        -5.543163701119151e-07,
+        -5.543163701119147e-07,
+        -5.543163701119147e-07,
+        1.2825927033783783e-07,
+        1.81129802192996e-06,
+        1.8112980219299626e-06,
+        1.8112980219299626e-06,
+        3.3147440078715256e-06,
+        5.098751321834402e-06,
+        5.098751321834403e-06,
+        5.098751321834406e-06,
+        6.092029579425304e-06,
+        6.092029579425304e-06,
+        6.092029579425306e-06,
+        9.465013827529249e-06,
+        1.203499649721748e-05,
+        1.203499649721748e-05,
+        1.203499649721748e-05,
+        1.9565685576426687e-05,
+        2.8668163508019777e-05,
+        2.8668163508019777e-05,
+        2.866816350801978e-05,
+        4.168024923430244e-05,
+        4.168024923430245e-05,
+        2.084623660052121e-05,
+        2.5826287896080517e-05,
+        4.05804127490927e-05,
+        4.058041274909271e-05,
+        4.058041274909272e-05,
+        4.9224460370006766e-05,
+        5.873741685800321e-05,
+        5.873741685800321e-05,
+        5.8737416858003245e-05,
+        8.044492745538752e-05,
+    ],
+    [
+        1.0294679060035332e-27,
+        7.999507645998001e-28,
+        7.999507645998e-28,
+        7.999507645997998e-28,
+        7.338296984336477e-28,
+        7.338296984336475e-28,
+        7.338296984336475e-28,
+        6.132865071923333e-28,
+        6.132865071923332e-28,
+        6.132865071923332e-28,
+        5.303822594610571e-28,
+        4.64390893307e-28,
+        4.6439089330699995e-28,
+        4.6439089330699995e-28,
+        4.366091507162e-28,
+        4.153124087301619e-28,
+        4.153124087301618e-28,
+        4.153124087301617e-28,
+        4.0628528788833335e-28,
+        4.0628528788833335e-28,
+        4.0628528788833335e-28,
+        3.8352725909935553e-28,
+        3.7087718458633335e-28,
+        3.7087718458633335e-28,
+        3.7087718458633335e-28,
+        3.44548082131e-28,
+        3.22758480099e-28,
+        3.22758480099e-28,
+        3.22758480099e-28,
+        2.9993992463771116e-28,
+        2.9993992463771116e-28,
+        2.9993992463771116e-28,
+        2.8598852666999997e-28,
+        2.5375807366433334e-28,
+        2.5375807366433334e-28,
+        2.537580736643333e-28,
+        2.38571381339e-28,
+        2.2379737087033337e-28,
+        2.2379737087033332e-28,
+        2.237973708703333e-28,
+        1.9513366819728573e-28,
+    ],
+)
@@ -0,0 +1,40 @@
+"""Small synthetic TIEGCM files for regrid and regridded files for integrate."""
+import numpy as np
+from netCDF4 import Dataset
+
+
+def write_tiegcm(filename, params=("QJOULE", "TN"), ntime=3, nlev=9, nlat=6, nlon=8, seed=0, noise=8):
+    """ZGMID increases along ilev in every column, from about 97 to 500 km, and some levels sit exactly on whole kilometres.
+    noise (km) has to stay below half of the level spacing, 2 for the 57 levels of TIEGCM."""
+    rng = np.random.default_rng(seed)
+    shape = (ntime, nlev, nlat, nlon)
+    base = np.linspace(97, 500, nlev)
+    alts = base[None, :, None, None] + rng.uniform(-noise, noise, shape)
+    alts[:, 0] = rng.uniform(95, 99, (ntime, nlat, nlon))
+    alts[:, -1] = rng.uniform(498, 502, (ntime, nlat, nlon))
+    alts[:, nlev // 2, ::2, ::3] = 300.0
+    with Dataset(filename, "w") as nc:
+        for name, size in (("time", ntime), ("ilev", nlev), ("lat", nlat), ("lon", nlon)):
+            nc.createDimension(name, size)
+        nc.createVariable("time", "f8", ("time",))[:] = 60.0 * np.arange(ntime)
+        nc.createVariable("ilev", "f8", ("ilev",))[:] = np.linspace(-7, 7, nlev)
+        nc.createVariable("lat", "f8", ("lat",))[:] = np.linspace(-87.5, 87.5, nlat)
+        nc.createVariable("lon", "f8", ("lon",))[:] = np.linspace(-180, 180 - 360 / nlon, nlon)
+        nc.createVariable("ZGMID", "f4", ("time", "ilev", "lat", "lon"))[:] = alts * 1e5
+        for param in params:
+            nc.createVariable(param, "f4", ("time", "ilev", "lat", "lon"))[:] = rng.lognormal(-18, 1, shape)
+
+
+
+def write_regridded(filename, params=("QJOULE", "TN"), ntime=3, nheight=25, nlat=8, nlon=12, seed=0):
+    """A file as written by regrid: heights every 10 km from 100 km and random positive params."""
+    rng = np.random.default_rng(seed)
+    with Dataset(filename, "w") as nc:
+        for name, size in (("time", ntime), ("height", nheight), ("lat", nlat), ("lon", nlon)):
+            nc.createDimension(name, size)
+        nc.createVariable("time", "f4", ("time",))[:] = 60.0 * np.arange(ntime) + 1440.0 * seed
+        nc.createVariable("lat", "f4", ("lat",))[:] = np.linspace(-87.5, 87.5, nlat)
+        nc.createVariable("lon", "f4", ("lon",))[:] = np.linspace(-180, 180 - 360 / nlon, nlon)
+        nc.createVariable("height", "f4", ("time", "height"))[:] = np.broadcast_to(100.0 + 10.0 * np.arange(nheight), (ntime, nheight))
+        for param in params:
+            nc.createVariable(param, "f4", ("time", "height", "lat", "lon"))[:] = rng.lognormal(-18, 1, (ntime, nheight, nlat, nlon))
@@ -0,0 +1,26 @@
+"""Synthetic TIEGCM files with the variables read by the run_map driver of the derived products notebook."""
+import numpy as np
+from netCDF4 import Dataset
+
+# reads of run_map for every grid point, in order
+MAP_READS = ["XNMBAR", "ZGMID", "lat", "lon", "time", "POTEN", "DEN", "TN", "TE", "TI", "ELECDEN", "ELECDEN", "OP",
+             "O2P", "NPLUS", "NOP_LAM", "O_CM3", "O2_CM3", "N2_CM3", "HE", "BX", "BY", "BZ", "UN", "VN", "WN_lev",
+             "Ui_lev", "Vi_lev", "Wi_lev", "EEX", "EEY", "EEZ"]
+
+# 2D variables of the magnetic field, scaled by BMAG
+MAGNETIC = ["BX", "BY", "BZ", "BMAG"]
+
+
+def write_tiegcm(filename, ntime=2, nlev=57, nlat=72, nlon=144, seed=0):
+    """Every variable of MAP_READS with random values of both signs, f4 as in TIEGCM files."""
+    rng = np.random.default_rng(seed)
+    with Dataset(filename, "w") as nc:
+        for name, size in (("time", ntime), ("lev", nlev), ("lat", nlat), ("lon", nlon)):
+            nc.createDimension(name, size)
+        nc.createVariable("time", "f8", ("time",))[:] = 60.0 * np.arange(ntime)
+        nc.createVariable("lat", "f8", ("lat",))[:] = np.linspace(-88.75, 88.75, nlat)
+        nc.createVariable("lon", "f8", ("lon",))[:] = np.linspace(-180, 180 - 360 / nlon, nlon)
+        for name in sorted(set(MAP_READS) - {"lat", "lon", "time"} - set(MAGNETIC)):
+            nc.createVariable(name, "f4", ("time", "lev", "lat", "lon"))[:] = rng.normal(1, 2, (ntime, nlev, nlat, nlon))
+        for name in MAGNETIC:
+            nc.createVariable(name, "f4", ("time", "lat", "lon"))[:] = rng.normal(1, 2, (ntime, nlat, nlon))
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("igrf12")
+
+from daedalusmase_derived_products.mod_conductivities import conductivities, hall_cond, parallel_cond, pedersen_cond
+
+N = 300
+
+
+def log_uniform(rng, low, high, size):
+    return np.exp(rng.uniform(np.log(low), np.log(high), size))
+
+
+@pytest.fixture
+def inputs():
+    # magnitudes of the thermosphere and ionosphere from 100 to 600 km, random signs of the components of B
+    rng = np.random.default_rng(7)
+    B = rng.choice([-1, 1], (3, N)) * log_uniform(rng, 1e-7, 6e-5, (3, N))
+    return dict(B=B, Ti=log_uniform(rng, 150, 3000, N), Te=log_uniform(rng, 150, 5000, N),
+                Tn=log_uniform(rng, 150, 2000, N), NO2=log_uniform(rng, 1e4, 1e13, N),
+                NN2=log_uniform(rng, 1e5, 1e14, N), NO=log_uniform(rng, 1e6, 1e12, N),
+                NOp=log_uniform(rng, 1, 1e6, N), NO2p=log_uniform(rng, 1, 1e6, N), NNOp=log_uniform(rng, 1, 1e6, N),
+                Ne=log_uniform(rng, 1e6, 1e12, N))
+
+
+def test_matches_scalar_functions(inputs):
+    result = conductivities(**inputs)
+    for i in range(N):
+        x = {name: value[..., i] for name, value in inputs.items()}
+        pedersen = pedersen_cond(x["B"], x["Ti"], x["Tn"], x["Te"], x["NO2"], x["NN2"], x["NO"], x["NOp"], x["NO2p"],
+                                 x["NNOp"])
+        hall = hall_cond(x["B"], x["Ti"], x["Te"], x["Tn"], x["NO2"], x["NN2"], x["NO"], x["NOp"], x["NO2p"], x["NNOp"])
+        parallel = parallel_cond(x["Ne"], x["B"], x["Te"], x["NO2"], x["NN2"], x["NO"])
+        assert result.pedersen[i] == pedersen, i
+        assert result.hall[i] == hall, i
+        assert result.parallel[i] == parallel, i
+
+
+def test_shape_is_kept(inputs):
+    # a lat-lon map, B with the components on the first axis
+    shaped = {name: value.reshape(value.shape[:-1] + (15, 20)) for name, value in inputs.items()}
+    flat = conductivities(**inputs)
+    result = conductivities(**shaped)
+    for name in result._fields:
+        assert getattr(result, name).shape == (15, 20), name
+        np.testing.assert_array_equal(getattr(result, name).ravel(), getattr(flat, name), err_msg=name)
+
+
+def test_sequence_of_components(inputs):
+    listed = dict(inputs, B=[inputs["B"][0], inputs["B"][1], inputs["B"][2]])
+    np.testing.assert_array_equal(conductivities(**listed).pedersen, conductivities(**inputs).pedersen)
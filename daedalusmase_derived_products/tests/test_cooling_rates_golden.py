@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from daedalusmase_derived_products.mod_heating_sources.sub_cooling_rates import N2_vib, O2_vib, O_fine
+
+import golden_cooling_rates as golden
+
+#the 9th degree log10 polynomial of the O2 Schunk rate cancels to ~1e-12 relative near 5000 K,
+#where the scalar and the array powers round differently, a wrong branch is off by far more
+RTOL = 1e-11
+
+CASES = [
+    (N2_vib, golden.N2_VIB, lambda Te: (golden.NECM, golden.DENSITY, golden.TN, Te)),
+    (O2_vib, golden.O2_VIB, lambda Te: (golden.NECM, golden.DENSITY, golden.TN, Te)),
+    (O_fine, golden.O_FINE, lambda Te: (golden.NECM, golden.DENSITY, Te, golden.TN)),
+]
+IDS = ["N2_vib", "O2_vib", "O_fine"]
+
+
+@pytest.mark.parametrize("func,expected,args", CASES, ids=IDS)
+def test_array_matches_golden(func, expected, args):
+    result = func(*args(np.array(golden.TE)))
+    for got, want in zip(result, expected):
+        np.testing.assert_allclose(got, want, rtol=RTOL, atol=0)
+
+
+@pytest.mark.parametrize("func,expected,args", CASES, ids=IDS)
+def test_scalar_matches_golden(func, expected, args):
+    for i, Te in enumerate(golden.TE):
+        result = func(*args(Te))
+        for got, want in zip(result, expected):
+            assert np.ndim(got) == 0
+            np.testing.assert_allclose(got, want[i], rtol=RTOL, atol=0)
+
+
+@pytest.mark.parametrize("func,expected,args", CASES, ids=IDS)
+def test_shape_is_kept(func, expected, args):
+    Te = np.array(golden.TE[:30]).reshape(5, 6)
+    for got, want in zip(func(*args(Te)), expected):
+        assert got.shape == (5, 6)
+        np.testing.assert_allclose(got, np.reshape(want[:30], (5, 6)), rtol=RTOL, atol=0)
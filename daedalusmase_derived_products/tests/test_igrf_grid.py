@@ -0,0 +1,108 @@
+import datetime
+import importlib.util
+import os
+import sys
+import types
+
+import numpy as np
+import pytest
+
+MODULE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "daedalusmase_derived_products", "mod_tiegcm_utils",
+                      "igrf_grid.py")
+
+DAY = datetime.datetime(2015, 3, 17, 13, 30)
+
+# a grid with the positions repeated along the last axis
+LAT = np.linspace(-87.5, 87.5, 8)[:, None, None, None]
+LON = np.linspace(-180, 165, 6)[None, :, None, None]
+ALT = np.array([110.0, 200.0, 400.0])[None, None, :, None]
+REPEATS = 2
+
+
+def dipole(isv, date, itype, alt, colat, elong):
+    # north, east, down and total in nT of a dipole with an east component, in place of igrf12fort.igrf12syn
+    scale = 30000 * (6371.2 / (6371.2 + alt)) ** 3
+    theta, phi = np.radians(colat), np.radians(elong)
+    north, east, down = scale * np.sin(theta), 2000 * np.sin(phi) * np.sin(theta), 2 * scale * np.cos(theta)
+    return north, east, down, np.sqrt(north ** 2 + east ** 2 + down ** 2)
+
+
+@pytest.fixture
+def igrf_grid(monkeypatch):
+    # igrf_grid.py loaded on its own (the package imports the real igrf12) with igrf12 and igrf12fort stubbed,
+    # calls holds the arguments of every igrf12syn call
+    calls = []
+    igrf12fort = types.ModuleType("igrf12fort")
+    igrf12fort.igrf12syn = lambda *args: calls.append(args) or dipole(*args)
+    monkeypatch.setitem(sys.modules, "igrf12", types.ModuleType("igrf12"))
+    monkeypatch.setitem(sys.modules, "igrf12fort", igrf12fort)
+    spec = importlib.util.spec_from_file_location("igrf_grid_stubbed", MODULE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.calls = calls
+    return module
+
+
+def grid(igrf_grid, **kwargs):
+    return igrf_grid.igrf_grid(DAY, LAT, LON, np.repeat(ALT, REPEATS, axis=-1), **kwargs)
+
+
+def test_enu_is_the_model_field(igrf_grid):
+    field = grid(igrf_grid)
+    assert field.B_enu.shape == (3, 8, 6, 3, REPEATS)
+    lat, lon, alt = np.broadcast_arrays(LAT, LON, ALT)
+    north, east, down, _ = dipole(0, 2015.2, 1, alt, 90 - lat, (360 + lon) % 360)
+    for B, expected in zip(field.B_enu, (east, north, -down)):
+        np.testing.assert_allclose(B, np.repeat(expected, REPEATS, axis=-1) / 10 ** 9, rtol=1e-15, atol=0)
+
+
+def test_ecef_is_the_rotation_of_enu(igrf_grid):
+    field = grid(igrf_grid)
+    lat, lon = np.broadcast_arrays(LAT, LON, field.B_enu[0])[:2]
+    np.testing.assert_array_equal(field.B_ecef, igrf_grid.enu_to_ecef(lat, lon, *field.B_enu))
+    # the east, north and up unit vectors of each position in ECEF, the rotation keeps the norm
+    phi, lmd = np.radians(lat), np.radians(lon)
+    east = np.array([-np.sin(lmd), np.cos(lmd), np.zeros_like(lmd)])
+    north = np.array([-np.sin(phi) * np.cos(lmd), -np.sin(phi) * np.sin(lmd), np.cos(phi)])
+    up = np.array([np.cos(phi) * np.cos(lmd), np.cos(phi) * np.sin(lmd), np.sin(phi)])
+    np.testing.assert_allclose(field.B_ecef, field.B_enu[0] * east + field.B_enu[1] * north + field.B_enu[2] * up,
+                               rtol=0, atol=1e-20)
+    np.testing.assert_allclose(np.linalg.norm(field.B_ecef, axis=0), np.linalg.norm(field.B_enu, axis=0), rtol=1e-14)
+    np.testing.assert_allclose(igrf_grid.enu_to_ecef(0.0, 0.0, 1.0, 2.0, 3.0), [3.0, 1.0, 2.0], atol=1e-16)
+
+
+def test_unit_vector_is_normalized(igrf_grid):
+    field = grid(igrf_grid)
+    np.testing.assert_allclose(np.linalg.norm(field.b_unit_enu, axis=0), 1, rtol=1e-15)
+    np.testing.assert_allclose(field.b_unit_enu * np.linalg.norm(field.B_enu, axis=0), field.B_enu, rtol=1e-15)
+
+
+def test_each_distinct_position_once(igrf_grid):
+    grid(igrf_grid)
+    assert len(igrf_grid.calls) == 8 * 6 * 3
+    # the start of the day, whatever the time
+    assert {args[1] for args in igrf_grid.calls} == {2015 + (31 + 28 + 16) / 365}
+
+
+def test_memo_hit_returns_identical_arrays(igrf_grid):
+    first = grid(igrf_grid)
+    expected = [array.copy() for array in first]
+    calls = len(igrf_grid.calls)
+    first.B_enu[...] = 0  # the results are copies of the memo
+    second = igrf_grid.igrf_grid(DAY.replace(hour=2), LAT, LON, np.repeat(ALT, REPEATS, axis=-1))
+    assert len(igrf_grid.calls) == calls
+    for array, expected_array in zip(second, expected):
+        np.testing.assert_array_equal(array, expected_array)
+    igrf_grid.igrf_grid(DAY + datetime.timedelta(days=1), LAT, LON, np.repeat(ALT, REPEATS, axis=-1))
+    assert len(igrf_grid.calls) == 2 * calls
+
+
+def test_disk_cache_hit_returns_identical_arrays(igrf_grid, tmp_path):
+    first = grid(igrf_grid, cache_dir=str(tmp_path))
+    calls = len(igrf_grid.calls)
+    assert len(os.listdir(str(tmp_path))) == 1
+    igrf_grid.memo.clear()
+    second = grid(igrf_grid, cache_dir=str(tmp_path))
+    assert len(igrf_grid.calls) == calls
+    for array, expected in zip(second, first):
+        np.testing.assert_array_equal(array, expected)
@@ -0,0 +1,101 @@
+import math
+
+import numpy as np
+import pytest
+from netCDF4 import Dataset
+
+pytest.importorskip("igrf12")
+
+from daedalusmase_derived_products.mod_height_integration import integrate
+from daedalusmase_derived_products.mod_tiegcm_utils import const
+
+from synthetic_regrid import write_regridded
+
+PARAMS = ["QJOULE", "TN"]
+
+
+def integrate_loop(regrid_file, param, timer, minlat, maxlat, minlon, maxlon, minalt, maxalt):
+    # the same quadrature as integrate, one point at a time: trapezoids in altitude, cells cos(lat) dlat dlon around each point
+    nc = Dataset(regrid_file)
+    lat = nc.variables["lat"][:].astype(float)
+    lon = nc.variables["lon"][:].astype(float)
+    height = nc.variables["height"][timer].astype(float)
+    var = nc.variables[param][timer].astype(float)
+    nc.close()
+
+    def width(x, i, first, last):
+        if first == last:
+            return None
+        if i == first:
+            return x[i + 1] - x[i]
+        if i == last:
+            return x[i] - x[i - 1]
+        return (x[i + 1] - x[i - 1]) / 2
+
+    total = 0.0
+    height_map = np.zeros((maxlat - minlat + 1, maxlon - minlon + 1))
+    for i in range(minlat, maxlat + 1):
+        dlat = math.radians(width(lat, i, minlat, maxlat) or const.deltaphi)
+        for j in range(minlon, maxlon + 1):
+            dlon = math.radians(width(lon, j, minlon, maxlon) or const.deltalmd)
+            column = 0.0
+            for l in range(minalt, maxalt):
+                dz = (height[l + 1] - height[l]) * 1000
+                r_low = (const.Re + height[l]) * 1000
+                r_high = (const.Re + height[l + 1]) * 1000
+                column += (var[l, i, j] * r_low**2 + var[l + 1, i, j] * r_high**2) / 2 * dz
+                height_map[i - minlat, j - minlon] += (var[l, i, j] + var[l + 1, i, j]) / 2 * dz
+            total += math.cos(math.radians(lat[i])) * abs(dlat) * abs(dlon) * column
+    return total, height_map
+
+
+@pytest.fixture(scope="module")
+def regrid_files(tmp_path_factory):
+    folder = tmp_path_factory.mktemp("regridded")
+    files = [str(folder / ("day%d_regrid.nc" % i)) for i in range(2)]
+    for i, filename in enumerate(files):
+        write_regridded(filename, PARAMS, seed=i)
+    return files
+
+
+@pytest.mark.parametrize("region", [(None, None, None, None, None, None), (2, 6, 3, 9, 4, 20), (0, 0, 5, 5, 0, 24)],
+                         ids=["whole", "sub_region", "single_column"])
+def test_integrate_matches_loop(regrid_files, region):
+    minlat, maxlat, minlon, maxlon, minalt, maxalt = region
+    result = integrate(regrid_files[0], PARAMS, [0, 2], minlat, maxlat, minlon, maxlon, minalt, maxalt, maps=True)
+    with Dataset(regrid_files[0]) as nc:
+        nlat, nlon, nheight = len(nc.dimensions["lat"]), len(nc.dimensions["lon"]), len(nc.dimensions["height"])
+    bounds = (0 if minlat is None else minlat, nlat - 1 if maxlat is None else maxlat,
+              0 if minlon is None else minlon, nlon - 1 if maxlon is None else maxlon,
+              0 if minalt is None else minalt, nheight - 1 if maxalt is None else maxalt)
+    for param in PARAMS:
+        assert result.totals[param].shape == (2,)
+        for n, timer in enumerate([0, 2]):
+            total, height_map = integrate_loop(regrid_files[0], param, timer, *bounds)
+            np.testing.assert_allclose(result.totals[param][n], total, rtol=1e-12)
+            np.testing.assert_allclose(result.maps[param][n], height_map, rtol=1e-12)
+    np.testing.assert_array_equal(result.time, [0.0, 120.0])
+
+
+def test_constant_gives_the_volume_of_the_shell(tmp_path):
+    # a constant 1 on a fine whole-sphere grid integrates to the volume between the lowest and highest height
+    filename = str(tmp_path / "ones_regrid.nc")
+    write_regridded(filename, ["ONE"], ntime=1, nheight=51, nlat=72, nlon=144)
+    with Dataset(filename, "a") as nc:
+        nc.variables["lat"][:] = np.linspace(-88.75, 88.75, 72)
+        nc.variables["lon"][:] = np.linspace(-180, 177.5, 144)
+        nc.variables["ONE"][:] = 1.0
+    result = integrate(filename, ["ONE"])
+    inner, outer = (const.Re + 100) * 1000, (const.Re + 600) * 1000
+    np.testing.assert_allclose(result.totals["ONE"][0], 4 / 3 * np.pi * (outer**3 - inner**3), rtol=2e-4)
+    north = integrate(filename, ["ONE"], minlat=36)
+    np.testing.assert_allclose(north.totals["ONE"][0], result.totals["ONE"][0] / 2, rtol=2e-4)
+
+
+def test_series_is_the_files_one_after_the_other(regrid_files):
+    series = integrate(regrid_files, PARAMS, maps=True)
+    parts = [integrate(filename, PARAMS, maps=True) for filename in regrid_files]
+    np.testing.assert_array_equal(series.time, np.concatenate([part.time for part in parts]))
+    for param in PARAMS:
+        np.testing.assert_array_equal(series.totals[param], np.concatenate([part.totals[param] for part in parts]))
+        np.testing.assert_array_equal(series.maps[param], np.concatenate([part.maps[param] for part in parts]))
@@ -0,0 +1,102 @@
+import os
+
+import numpy as np
+import pytest
+from netCDF4 import Dataset
+
+pytest.importorskip("igrf12")
+
+from daedalusmase_derived_products.mod_height_integration.regrid import brackets, regrid
+
+from synthetic_regrid import write_tiegcm
+
+PARAMS = ["QJOULE", "TN"]
+
+
+def regrid_loop(minAlt, maxAlt, dz, tiegcm_file, timesteps, params):
+    # the per point loop of regrid before the array version, returning the arrays it wrote
+
+    Nz = int((maxAlt - minAlt) / dz)
+
+    def local(y, x):
+        if y >= x[-1]:
+            return int(len(x) - 1)
+        if y <= x[0]:
+            return 0
+        for i in range(0, len(x) - 1):
+            if y >= x[i] and y < x[i + 1]:
+                return i
+
+    nc = Dataset(tiegcm_file)
+    ZGMID = nc.variables["ZGMID"][:]
+    ntimesT, nlat, nlon = len(nc.variables["time"]), len(nc.variables["lat"]), len(nc.variables["lon"])
+    dictOfvars = {param: nc.variables[param][:] for param in params}
+    nc.close()
+    retval = {param: np.zeros((ntimesT, Nz, nlat, nlon)) for param in params}
+    for i in range(len(timesteps)):
+        for j in range(Nz):
+            height = minAlt + j * dz
+            for k in range(nlat):
+                for z in range(nlon):
+                    for param in params:
+                        alts = ZGMID[timesteps[i], :, k, z] / 1.e5
+                        lrho = local(height, alts)
+                        dr = alts[lrho + 1] - alts[lrho]
+                        retval[param][timesteps[i], j, k, z] = ((height - alts[lrho]) / (dr)) * dictOfvars[param][timesteps[i], lrho, k, z] \
+                            + (1 - ((height - alts[lrho]) / (dr))) * dictOfvars[param][timesteps[i], lrho + 1, k, z]
+    return retval
+
+
+def read_regridded(tmp_path, tiegcm_file):
+    with Dataset(os.path.join(str(tmp_path), os.path.splitext(os.path.basename(tiegcm_file))[0] + "_regrid.nc")) as nc:
+        return {name: nc.variables[name][:] for name in nc.variables}
+
+
+@pytest.fixture(scope="module")
+def tiegcm_file(tmp_path_factory):
+    filename = str(tmp_path_factory.mktemp("tiegcm") / "tiegcm.nc")
+    write_tiegcm(filename, PARAMS)
+    return filename
+
+
+@pytest.mark.parametrize("timesteps", [[0, 1, 2], [1], [2, 0]])
+def test_regrid_matches_loop(tiegcm_file, tmp_path, timesteps):
+    # heights inside every column, including whole kilometres equal to some levels, where the loop's local() does not fail
+    minAlt, maxAlt, dz = 100, 496, 4
+    regrid(minAlt, maxAlt, dz, tiegcm_file, timesteps, PARAMS, str(tmp_path) + "/")
+    found = read_regridded(tmp_path, tiegcm_file)
+    expected = regrid_loop(minAlt, maxAlt, dz, tiegcm_file, timesteps, PARAMS)
+    for param in PARAMS:
+        assert found[param].shape == expected[param].shape
+        # both are stored as f4, the loop divides the f4 altitudes in single precision
+        np.testing.assert_allclose(found[param], expected[param].astype(np.float32), rtol=2e-5, atol=0, err_msg=param)
+    np.testing.assert_array_equal(found["height"], np.broadcast_to(minAlt + dz * np.arange(int((maxAlt - minAlt) / dz)), found["height"].shape))
+
+
+def test_heights_outside_the_columns_are_extrapolated(tiegcm_file, tmp_path):
+    # the loop fails above the highest level, the array version uses the two highest (or lowest) levels
+    regrid(80, 540, 20, tiegcm_file, [0], PARAMS, str(tmp_path) + "/")
+    found = read_regridded(tmp_path, tiegcm_file)
+    with Dataset(tiegcm_file) as nc:
+        alts = nc.variables["ZGMID"][0].astype(float) / 1e5
+        var = nc.variables["QJOULE"][0].astype(float)
+    heights = 80 + 20 * np.arange(23)
+    for j, height in enumerate(heights):
+        for k in range(alts.shape[1]):
+            for z in range(alts.shape[2]):
+                column = alts[:, k, z]
+                l = min(max(np.searchsorted(column, height, side="right") - 1, 0), len(column) - 2)
+                w = (height - column[l]) / (column[l + 1] - column[l])
+                np.testing.assert_allclose(found["QJOULE"][0, j, k, z], w * var[l, k, z] + (1 - w) * var[l + 1, k, z], rtol=2e-5)
+
+
+def test_brackets_match_searchsorted():
+    rng = np.random.default_rng(5)
+    alts = np.sort(rng.uniform(90, 520, (12, 4, 5)), axis=0)
+    alts[4, 1, 2] = 250.0
+    heights = np.concatenate((np.linspace(60, 560, 101), [250.0, np.nextafter(250.0, 0)], alts[:, 0, 0]))
+    below = brackets(alts, heights)
+    for k in range(4):
+        for z in range(5):
+            expected = np.clip(np.searchsorted(alts[:, k, z], heights, side="right") - 1, 0, len(alts) - 2)
+            np.testing.assert_array_equal(below[:, k, z], expected)
@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+from netCDF4 import Dataset
+
+pytest.importorskip("igrf12")
+
+from daedalusmase_derived_products.mod_tiegcm_utils import tiegcm_store
+from daedalusmase_derived_products.mod_tiegcm_utils.read_tiegcm import read_tiegcm
+from daedalusmase_derived_products.mod_tiegcm_utils.tiegcm_store import TiegcmStore
+
+from synthetic_tiegcm import MAP_READS, write_tiegcm
+
+NLEV, NLAT, NLON = 5, 6, 8
+
+
+@pytest.fixture(scope="module")
+def tiegcm_files(tmp_path_factory):
+    folder = tmp_path_factory.mktemp("tiegcm")
+    filenames = [str(folder / ("tiegcm_%d.nc" % i)) for i in range(3)]
+    for seed, filename in enumerate(filenames):
+        write_tiegcm(filename, nlev=NLEV, nlat=NLAT, nlon=NLON, seed=seed)
+    return filenames
+
+
+def slab_bytes():
+    return NLEV * NLAT * NLON * 8
+
+
+def test_read_tiegcm_matches(tiegcm_files):
+    rng = np.random.default_rng(6)
+    with TiegcmStore() as store:
+        for filename in tiegcm_files[:2]:
+            for variable in sorted(set(MAP_READS)):
+                for timer, lev, lat, lon in zip(rng.integers(0, 2, 5), rng.integers(0, NLEV, 5),
+                                                rng.integers(0, NLAT, 5), rng.integers(0, NLON, 5)):
+                    expected = read_tiegcm(filename, variable, timer, lev, lat, lon)
+                    found = store.read_tiegcm(filename, variable, timer, lev, lat, lon)
+                    # read_tiegcm converts the units in single precision, the store in double
+                    np.testing.assert_allclose(found, expected, rtol=1e-6, err_msg=variable)
+        assert store.opens == 2
+
+
+def test_unit_conversions(tiegcm_files):
+    filename = tiegcm_files[0]
+    with Dataset(filename) as nc:
+        raw = {name: np.asarray(nc.variables[name][1], dtype=float) for name in nc.variables if name not in ("lat", "lon", "time")}
+    with TiegcmStore() as store:
+        for variable, factor in tiegcm_store.scale.items():
+            np.testing.assert_array_equal(store.slab(filename, variable, 1), raw[variable] * factor, err_msg=variable)
+        for variable in tiegcm_store.magnetic:
+            np.testing.assert_array_equal(store.slab(filename, variable, 1), raw["BMAG"] * raw[variable] * 0.0001,
+                                          err_msg=variable)
+        np.testing.assert_array_equal(store.slab(filename, "TN", 1), raw["TN"])
+
+
+def test_slabs_evicted_over_max_bytes(tiegcm_files):
+    filename = tiegcm_files[0]
+    # room for two slabs
+    with TiegcmStore(max_bytes=2 * slab_bytes() + slab_bytes() // 2) as store:
+        tn = store.slab(filename, "TN", 0)
+        store.slab(filename, "TE", 0)
+        assert store.slab(filename, "TN", 0) is tn
+        store.slab(filename, "TI", 0)
+        # the least recently used slab is dropped
+        assert list(store.slabs) == [(filename, "TN", 0), (filename, "TI", 0)]
+        assert store.nbytes == 2 * slab_bytes()
+        assert store.slab(filename, "TE", 0) is not None
+        assert list(store.slabs) == [(filename, "TI", 0), (filename, "TE", 0)]
+        assert store.nbytes == sum(slab.nbytes for slab in store.slabs.values())
+        store.clear()
+        assert store.nbytes == 0 and not store.slabs
+
+
+def test_one_slab_kept_over_max_bytes(tiegcm_files):
+    with TiegcmStore(max_bytes=1) as store:
+        for variable in ("TN", "TE"):
+            slab = store.slab(tiegcm_files[0], variable, 0)
+            assert list(store.slabs.values()) == [slab]
+
+
+def test_files_closed_over_max_files(tiegcm_files):
+    first, second, third = tiegcm_files
+    store = TiegcmStore(max_files=2)
+    handles = [store.dataset(filename) for filename in (first, second)]
+    assert store.dataset(first) is handles[0]
+    store.dataset(third)
+    # the least recently used file is closed
+    assert list(store.files) == [first, third]
+    assert not handles[1].isopen()
+    assert handles[0].isopen()
+    assert store.opens == 3
+    # the slabs of a closed file are still read from it after reopening
+    np.testing.assert_array_equal(store.read_tiegcm(second, "TN", 0, 1, 2, 3), read_tiegcm(second, "TN", 0, 1, 2, 3))
+    assert store.opens == 4
+    store.close()
+    assert not store.files and not any(handle.isopen() for handle in handles)
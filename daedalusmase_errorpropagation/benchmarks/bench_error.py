@@ -0,0 +1,63 @@
+"""
+Wall time of error against the per point loop it replaced (tests/reference_errorprogation.py) on the 72x144x57 TIE-GCM
+grid, in the vertical, lat-alt and lat-lon modes, with the synthetic inputs of the tests. Both write the same errors.
+
+    python benchmarks/bench_error.py [--error-flag] [--repeat 3]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+import numpy as np
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(here, "..", "source_code"), os.path.join(here, "..", "tests")]
+
+import factors  # noqa: E402
+import errorprogation as EP  # noqa: E402
+from reference_errorprogation import error_loop  # noqa: E402
+from test_error_loop import PERCENTAGES, synthetic_inputs  # noqa: E402
+
+NLAT, NLON, NLEV = factors.Bx.shape
+
+PROFILES = {"vertical": dict(lat_value=NLAT // 2, lon_value=NLON // 2),
+            "lat-alt": dict(lat_value=-1, lon_value=NLON // 2, pressure_level=-1),
+            "lat-lon": dict(lat_value=-1, lon_value=-1, pressure_level=NLEV // 2)}
+
+
+def timed(function, error_flag, profile, repeat):
+    # best of repeat calls, error and error_loop print their progress
+    best = np.inf
+    for i in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            function(error_flag, **PERCENTAGES, **PROFILES[profile])
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--error-flag", action="store_true", help="errors of the Daedalus Science Study instead of percentages")
+    parser.add_argument("--repeat", type=int, default=3, help="calls of error per mode, the loop is called once")
+    args = parser.parse_args()
+
+    factors.glat_in = np.linspace(-87.5, 87.5, NLAT)
+    factors.glon_in = np.linspace(-180, 180, NLON, endpoint=False)
+    factors.glev_in = np.linspace(-7, 7, NLEV)
+    for name, value in synthetic_inputs(seed=21).items():
+        getattr(factors, name)[...] = value
+
+    print("%-9s %8s %12s %12s %9s" % ("mode", "points", "error s", "loop s", "speedup"))
+    for profile in PROFILES:
+        loop = timed(error_loop, args.error_flag, profile, 1)
+        vectorized = timed(EP.error, args.error_flag, profile, args.repeat)
+        points = {"vertical": NLEV - 1, "lat-alt": NLAT * (NLEV - 1), "lat-lon": NLAT * NLON}[profile]
+        print("%-9s %8d %12.4f %12.3f %9.0f" % (profile, points, vectorized, loop, loop / vectorized), flush=True)
+
+
+if __name__ == "__main__":
+    main()
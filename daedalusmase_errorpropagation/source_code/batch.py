@@ -0,0 +1,289 @@
+'''
+This file contains batch_error function which calculates the LTI products and their errors for many timers of many
+TIE-GCM files without the gui, and writes them to a NetCDF file with a time dimension.
+The timers are calculated by a pool of worker processes in chunks, every worker keeps the grid of its file loaded
+for its next chunks. The finished timers are kept in a checkpoint file, so an interrupted run continues where it stopped.
+'''
+import concurrent.futures
+import contextlib
+import datetime
+import io
+import json
+import os
+import tempfile
+import time
+import numpy as np
+from netCDF4 import Dataset
+import factors
+import productderivation
+import errorprogation
+import montecarlo
+
+# variables of the output file, the altitude, the LTI products and their absolute errors as named in factors.py
+variables = ['heights'] + list(montecarlo.error_names) + ['Omega_ion', 'Omega_e'] + list(montecarlo.error_names.values())
+
+# stages of the calculation of a timer which are timed
+stages = ['read', 'products', 'error', 'write']
+
+# the file and the grid of the profile loaded by this worker process
+worker_grid = {}
+
+
+def load_grid(file_name, lat_value, lon_value, pressure_level):
+    '''
+    This function opens a TIE-GCM file and reads the grid of a profile, or returns them if they are already loaded
+    by this process for the same file and profile.
+
+        Args:
+        file_name (String): Input file of netcdf format, as comes from TIE-GCM output
+        lat_value (int), lon_value (int), pressure_level (int): Kind of function execution, see products function
+
+        Returns a dictionary with the open file, the indices of the profile and the LTIState of the profile
+
+    '''
+    key = (file_name, lat_value, lon_value, pressure_level)
+    if worker_grid.get('key') == key:
+        return worker_grid
+    if 'tiegcm' in worker_grid:
+        worker_grid['tiegcm'].close()
+    worker_grid.clear()
+
+    tiegcm = Dataset(file_name)
+    state = factors.LTIState(glat_in=tiegcm.variables['lat'][:], glon_in=tiegcm.variables['lon'][:],
+                             glev_in=tiegcm.variables['lev'][:])
+    lats, lons, levs = productderivation.profile_indices(lat_value, lon_value, pressure_level, len(state.glat_in),
+                                                         len(state.glon_in), len(state.glev_in))
+    worker_grid.update(key=key, tiegcm=tiegcm, state=state, cells=state.select(lats, lons, levs),
+                       slab=np.ix_(levs, lats, lons), time_in=tiegcm.variables['time'][:],
+                       lat_p=np.asarray(state.glat_in, dtype=float)[lats][:, None, None],
+                       lon_p=np.asarray(state.glon_in, dtype=float)[lons][None, :, None])
+    return worker_grid
+
+
+def run_chunk(file_name, timers, lat_value, lon_value, pressure_level, error_flag, errors):
+    '''
+    This function calculates the model inputs, the LTI products and their errors for some timers of a TIE-GCM file,
+    it is executed by the worker processes of batch_error.
+
+        Args:
+        file_name (String): Input file of netcdf format, as comes from TIE-GCM output
+        timers (list): timers as indices of TIEGCM file
+        lat_value (int), lon_value (int), pressure_level (int): Kind of function execution, see products function
+        error_flag (bool): see error function
+        errors (dict): B_error ... Vi_error arguments of error function
+
+        Returns a list with a tuple (timer, time in minutes, values, seconds) for every timer, where values is a
+        dictionary with a single precision array (lat, lon, lev) for every output variable and seconds a dictionary
+        with the time of every stage
+
+    '''
+    grid = load_grid(file_name, lat_value, lon_value, pressure_level)
+    state = grid['state']
+    cells = grid['cells']
+    time_IGRF = datetime.datetime(2015, 1, 1, 0, 0, 0)         # first time step of the TIE-GCM run
+
+    results = []
+    for timer in timers:
+        seconds = {}
+        start_time = time.time()
+        real_time = time_IGRF + datetime.timedelta(minutes=grid['time_in'][timer])
+        # every structure of the state is overwritten for every timer, so the state is reused
+        inputs = productderivation.read_inputs(grid['tiegcm'], timer, grid['slab'], grid['lat_p'], grid['lon_p'],
+                                               real_time)
+        for name, value in inputs.items():
+            getattr(state, name)[cells] = value
+        seconds['read'] = time.time() - start_time
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            start_time = time.time()
+            productderivation.products(lat_value, lon_value, pressure_level, state=state)
+            seconds['products'] = time.time() - start_time
+
+            start_time = time.time()
+            errorprogation.error(error_flag, lat_value=lat_value, lon_value=lon_value, pressure_level=pressure_level,
+                                 state=state, **errors)
+            seconds['error'] = time.time() - start_time
+
+        values = {name: getattr(state, name).astype(np.float32) for name in variables}
+        results.append((timer, float(grid['time_in'][timer]), values, seconds))
+    return results
+
+
+def create_output(output, files, lat_value, lon_value, pressure_level, zlib):
+    '''
+    This function creates the output file of batch_error, with the grid of the profile in the first TIE-GCM file.
+    Variables are (time, lev, lat, lon) as in TIE-GCM files, chunked per timer.
+    '''
+    tiegcm = Dataset(files[0])
+    glat = tiegcm.variables['lat'][:]
+    glon = tiegcm.variables['lon'][:]
+    glev = tiegcm.variables['lev'][:]
+    time_units = tiegcm.variables['time'].units if 'units' in tiegcm.variables['time'].ncattrs() else \
+        'minutes since 2015-1-1 0:0:0'
+    tiegcm.close()
+    lats, lons, levs = productderivation.profile_indices(lat_value, lon_value, pressure_level, len(glat), len(glon),
+                                                         len(glev))
+
+    ncout = Dataset(output, 'w', format='NETCDF4')
+    ncout.source_files = '\n'.join(files)
+    ncout.createDimension('time', None)
+    ncout.createDimension('lev', len(levs))
+    ncout.createDimension('lat', len(lats))
+    ncout.createDimension('lon', len(lons))
+
+    ncout.createVariable('lat', 'f4', ('lat',))[:] = glat[lats]
+    ncout.createVariable('lon', 'f4', ('lon',))[:] = glon[lons]
+    ncout.createVariable('lev', 'f4', ('lev',))[:] = glev[levs]
+    data_time = ncout.createVariable('time', 'f8', ('time',))
+    data_time.units = time_units
+    ncout.createVariable('file', 'i4', ('time',))   # index of the TIE-GCM file in source_files
+    ncout.createVariable('timer', 'i4', ('time',))  # timer as index of the TIE-GCM file
+    for name in variables:
+        ncout.createVariable(name, 'f4', ('time', 'lev', 'lat', 'lon'), zlib=zlib,
+                             chunksizes=(1, len(levs), len(lats), len(lons)))
+    return ncout
+
+
+def save_checkpoint(checkpoint, config, done):
+    # written after the output file is synced, so all the timers of the checkpoint are in the output file
+    with open(checkpoint + '.tmp', 'w') as f:
+        json.dump({'config': config, 'done': sorted(done)}, f)
+    os.replace(checkpoint + '.tmp', checkpoint)
+
+
+# ############################ LTI PRODUCTS AND ERRORS OF MANY TIMERS AND FILES ############################
+# ##########################################################################################################
+def batch_error(files, output, timers=None, lat_value=-1, lon_value=-1, pressure_level=-1, error_flag=True,
+                B_error=0, E_error=0, NO_error=0, NO2_error=0, NN2_error=0, NOp_error=0, NO2p_error=0, NNOp_error=0,
+                Ne_error=0, Te_error=0, Ti_error=0, Tn_error=0, Un_error=0, Vi_error=0, workers=2, chunk=4,
+                zlib=False, resume=True):
+    '''
+    This function calculates the LTI products and their errors of a profile for many timers of many TIE-GCM files,
+    as models_input, products and error functions, and writes them to a NetCDF file with a record per timer.
+    The timers of every file are split in chunks of chunk timers, which are calculated by workers processes.
+    Every worker keeps the file and the grid of its last chunk loaded, so the chunks of a file reuse them.
+    The progress is printed after every chunk. A checkpoint file (output + '.checkpoint') keeps the finished timers
+    and is removed at the end, if it exists a new run with the same arguments calculates only the remaining timers.
+
+        Args:
+        files (list): Input files of netcdf format, as comes from TIE-GCM output, or a single file
+        output (String): Output NetCDF file
+        timers (list): timers as indices of TIEGCM files, the same for every file, None for all the timers of every file
+        lat_value (int), lon_value (int), pressure_level (int): Kind of function execution, see products function
+        error_flag (bool): If error_flag==False then as error inputs used the error quantites provide by user.
+                           If error_flag==True then error values are came from Daedalus Science Study
+        B_error ... Vi_error (float): As precentage in case of error flag is not set, see error function
+        workers (int): Number of worker processes
+        chunk (int): Number of timers calculated by a worker at a time
+        zlib (bool): Compress the variables of the output file
+        resume (bool): If True continue from the checkpoint of an interrupted run, else start from the beginning
+
+        Returns a dictionary with
+        'timers': number of timers calculated by this run, 'seconds': run time, 'rate': timers per second,
+        'stages': seconds spent in every stage (summed over the workers)
+
+    '''
+    start_time = time.time()
+    print('Calculating Batch of Products and Errors.....')
+    print(' ')
+    if isinstance(files, str):
+        files = [files]
+    errors = dict(B_error=B_error, E_error=E_error, NO_error=NO_error, NO2_error=NO2_error, NN2_error=NN2_error,
+                  NOp_error=NOp_error, NO2p_error=NO2p_error, NNOp_error=NNOp_error, Ne_error=Ne_error,
+                  Te_error=Te_error, Ti_error=Ti_error, Tn_error=Tn_error, Un_error=Un_error, Vi_error=Vi_error)
+
+    # records of the output file, a timer of a file each
+    records = []
+    for file_index, file_name in enumerate(files):
+        if timers is None:
+            tiegcm = Dataset(file_name)
+            file_timers = range(len(tiegcm.variables['time']))
+            tiegcm.close()
+        else:
+            file_timers = timers
+        records += [(file_index, int(timer)) for timer in file_timers]
+
+    config = {'files': [os.path.abspath(file_name) for file_name in files], 'records': records,
+              'profile': [lat_value, lon_value, pressure_level], 'error_flag': bool(error_flag), 'errors': errors}
+    checkpoint = output + '.checkpoint'
+    done = set()
+    if resume and os.path.exists(checkpoint) and os.path.exists(output):
+        with open(checkpoint) as f:
+            saved = json.load(f)
+        if saved['config'] != json.loads(json.dumps(config)):
+            raise ValueError('Checkpoint ' + checkpoint + ' is of a run with other arguments, use resume=False')
+        done = set(saved['done'])
+        ncout = Dataset(output, 'a')
+        print('Resuming: ', len(done), ' of ', len(records), ' timers are done')
+    else:
+        ncout = create_output(output, files, lat_value, lon_value, pressure_level, zlib)
+        save_checkpoint(checkpoint, config, done)
+
+    # chunks of the remaining timers of every file, with the records where they are written
+    tasks = []
+    for file_index, file_name in enumerate(files):
+        pending = [index for index, record in enumerate(records) if record[0] == file_index and index not in done]
+        for first in range(0, len(pending), chunk):
+            tasks.append((pending[first:first + chunk], file_name))
+
+    seconds = dict.fromkeys(stages, 0.0)
+    count = 0
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(run_chunk, file_name, [records[index][1] for index in indices], lat_value,
+                                   lon_value, pressure_level, error_flag, errors): indices
+                       for indices, file_name in tasks}
+            for future in concurrent.futures.as_completed(futures):
+                indices = futures[future]
+                write_time = time.time()
+                for index, (timer, minutes, values, timer_seconds) in zip(indices, future.result()):
+                    ncout.variables['time'][index] = minutes
+                    ncout.variables['file'][index] = records[index][0]
+                    ncout.variables['timer'][index] = timer
+                    for name in variables:
+                        ncout.variables[name][index] = values[name].transpose(2, 0, 1)
+                    for stage in timer_seconds:
+                        seconds[stage] += timer_seconds[stage]
+                ncout.sync()
+                done.update(indices)
+                save_checkpoint(checkpoint, config, done)
+                seconds['write'] += time.time() - write_time
+
+                # progress
+                count += len(indices)
+                run_time = time.time() - start_time
+                print('Done ', len(done), ' of ', len(records), ' timers, ', round(count / run_time, 2),
+                      ' timers/sec, remaining ', round((len(records) - len(done)) * run_time / count), ' sec')
+    finally:
+        ncout.close()
+    os.remove(checkpoint)
+
+    run_time = time.time() - start_time
+    print('Batch calculated in: ', run_time, ' sec!')
+    print('Seconds per stage: ', {stage: round(value, 2) for stage, value in seconds.items()})
+    print(' ')
+    return {'timers': count, 'seconds': run_time, 'rate': count / run_time, 'stages': seconds}
+
+
+def benchmark(files, timers=None, worker_counts=(1, 2, 4), **kwargs):
+    '''
+    This function runs batch_error with different number of workers and reports the throughput.
+
+        Args:
+        files (list), timers (list): TIE-GCM files and timers, see batch_error
+        worker_counts (list): Numbers of workers to run with
+        kwargs: Other arguments of batch_error (profile, errors, chunk)
+
+        Returns a dictionary with the timers per second of every number of workers
+
+    '''
+    throughput = {}
+    with tempfile.TemporaryDirectory() as folder:
+        for workers in worker_counts:
+            result = batch_error(files, os.path.join(folder, 'benchmark.nc'), timers, workers=workers, resume=False,
+                                 **kwargs)
+            throughput[workers] = result['rate']
+    for workers, rate in throughput.items():
+        print('Workers: ', workers, ' timers/sec: ', round(rate, 2), ' speedup: ',
+              round(rate / throughput[worker_counts[0]], 2))
+    return throughput
@@ -4,6 +4,7 @@ which are required to execute product derivation and error propagation to estima
 overall error and error contribution on the calculation of Heating rates, Conductivites and other parameters
 '''
 
+from dataclasses import dataclass
 import numpy as np
 
 # ######################## CONSTANTS ########################
@@ -214,4 +215,105 @@ dJd_B = np.zeros((72, 144, 57), order='F')
 dJd_E = np.zeros((72, 144, 57), order='F')
 dJd_Vi = np.zeros((72, 144, 57), order='F')
 dJd_Un = np.zeros((72, 144, 57), order='F')
-dJd_Ne = np.zeros((72, 144, 57), order='F')
\ No newline at end of file
+dJd_Ne = np.zeros((72, 144, 57), order='F')
+
+# Monte Carlo errors (absolute), stored by montecarlo.error_mc with save=True
+nuOp_error_mc = np.zeros((72, 144, 57), order='F')
+nuO2p_error_mc = np.zeros((72, 144, 57), order='F')
+nuNOp_error_mc = np.zeros((72, 144, 57), order='F')
+nue_error_mc = np.zeros((72, 144, 57), order='F')
+pedersen_con_error_mc = np.zeros((72, 144, 57), order='F')
+hall_con_error_mc = np.zeros((72, 144, 57), order='F')
+parallel_con_error_mc = np.zeros((72, 144, 57), order='F')
+Joule_Heating_error_mc = np.zeros((72, 144, 57), order='F')
+Frictional_Heating_error_mc = np.zeros((72, 144, 57), order='F')
+Ohmic_Heating_error_mc = np.zeros((72, 144, 57), order='F')
+C_Op_error_mc = np.zeros((72, 144, 57), order='F')
+C_O2p_error_mc = np.zeros((72, 144, 57), order='F')
+C_NOp_error_mc = np.zeros((72, 144, 57), order='F')
+C_ion_error_mc = np.zeros((72, 144, 57), order='F')
+J_pedersen_error_mc = np.zeros((72, 144, 57), order='F')
+J_hall_error_mc = np.zeros((72, 144, 57), order='F')
+J_ohmic_error_mc = np.zeros((72, 144, 57), order='F')
+J_dens_error_mc = np.zeros((72, 144, 57), order='F')
+
+# ######################## STATE OF A PROFILE ########################
+# names of the structures above with a value per cell of the TIE-GCM grid
+grid_names = [name for name, value in list(globals().items()) if isinstance(value, np.ndarray) and value.ndim == 3]
+
+
+@dataclass(eq=False)
+class LTIState:
+    '''
+    Structures of one profile, as an alternative to the global structures of this file.
+    The structures have the same names as the global ones (state.Bx, state.pedersen_con_error, ...),
+    but they are allocated on first use and only for the cells of the profile (lat, lon, lev),
+    so a vertical profile does not allocate 3D grids and many time steps can be processed at the same time.
+    models_input, products, error and the plots take it as argument state, if None the global structures are used.
+    States are compared and hashed by identity, as their structures are arrays.
+    '''
+    glat_in: object = None  # lat values of TIE-GCMs latitude
+    glon_in: object = None  # lon values of TIE-GCMs longitude
+    glev_in: object = None  # pressure levels (lev not ilev) of TIE-GCM
+    title: str = ""         # title for plots
+    map_time: object = ""   # time used for night shadow in lat-lon map plots
+    pngNameMap: str = ""
+    lats: object = None     # latitude indices of the cells of the profile in the TIE-GCM grid
+    lons: object = None     # longitude indices of the cells of the profile in the TIE-GCM grid
+    levs: object = None     # level indices of the cells of the profile in the TIE-GCM grid
+
+    def __getattr__(self, name):
+        # structures are allocated on first use, with the shape of the profile
+        if name in grid_names:
+            value = np.zeros(self.shape, order='F')
+        elif name == 'heights_la':
+            value = np.zeros(self.shape[2], order='F')
+        else:
+            raise AttributeError(name)
+        setattr(self, name, value)
+        return value
+
+    @property
+    def shape(self):
+        if self.lats is None:
+            raise ValueError('LTIState has no profile, models_input selects it')
+        return len(self.lats), len(self.lons), len(self.levs)
+
+    def select(self, lats, lons, levs):
+        # new profile, the structures of the previous one are dropped
+        for name in grid_names + ['heights_la']:
+            self.__dict__.pop(name, None)
+        self.lats, self.lons, self.levs = np.asarray(lats), np.asarray(lons), np.asarray(levs)
+        return self.cells(lats, lons, levs)
+
+    def cells(self, lats, lons, levs):
+        # indices of the cells of the profile in the structures of the state
+        if self.lats is None or not (np.array_equal(lats, self.lats) and np.array_equal(lons, self.lons) and
+                                     np.array_equal(levs, self.levs)):
+            raise ValueError('LTIState holds another profile, run models_input for this one')
+        return np.ix_(np.arange(len(lats)), np.arange(len(lons)), np.arange(len(levs)))
+
+    def grid(self):
+        # structures indexed as the whole TIE-GCM grid, as the global ones, for plots
+        return GridView(self)
+
+
+class GridView:
+    '''
+    Structures of an LTIState placed in the whole TIE-GCM grid (zero outside of the profile), as the global ones.
+    '''
+    def __init__(self, state):
+        self.state = state
+
+    def __getattr__(self, name):
+        value = getattr(self.state, name)
+        if name in grid_names:
+            value_grid = np.zeros((len(self.state.glat_in), len(self.state.glon_in), len(self.state.glev_in)), order='F')
+            value_grid[np.ix_(self.state.lats, self.state.lons, self.state.levs)] = value
+            value = value_grid
+        elif name == 'heights_la':
+            value_grid = np.zeros(len(self.state.glev_in), order='F')
+            value_grid[self.state.levs] = value
+            value = value_grid
+        setattr(self, name, value)
+        return value
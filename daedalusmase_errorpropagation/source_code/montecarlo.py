@@ -0,0 +1,223 @@
+'''
+This file contains error_mc function which used to estimate the error of the LTI products with Monte Carlo sampling.
+The model inputs are perturbed with the same error model as error function and the LTI products are
+recalculated for all the samples, as a cross-check of the first order analytic error propagation.
+'''
+import time
+import numpy as np
+import factors
+import productderivation
+
+# model inputs perturbed by Monte Carlo, as named in factors.py
+inputs = ['Bx', 'By', 'Bz', 'Ex', 'Ey', 'Ez', 'Unx', 'Uny', 'Unz', 'NO', 'NO2', 'NN2', 'NOp', 'NO2p', 'NNOp', 'Ne',
+          'Te', 'Ti', 'Tn', 'Vi_vertx', 'Vi_verty', 'Vi_vertz']
+
+# LTI products and their absolute error structures in factors.py
+error_names = {'nu_Op_sum': 'nuOp_error', 'nu_O2p_sum': 'nuO2p_error', 'nu_NOp_sum': 'nuNOp_error', 'nu_e_sum': 'nue_error',
+               'pedersen_con': 'pedersen_con_error', 'hall_con': 'hall_con_error', 'parallel_con': 'parallel_con_error',
+               'Joule_Heating': 'Joule_Heating_error', 'Frictional_Heating': 'Frictional_Heating_error',
+               'Ohmic_Heating': 'Ohmic_Heating_error', 'C_Op': 'C_Op_error', 'C_O2p': 'C_O2p_error', 'C_NOp': 'C_NOp_error',
+               'C_ion': 'C_ion_error', 'J_pedersen': 'J_pedersen_error', 'J_hall': 'J_hall_error',
+               'J_ohmic': 'J_ohmic_error', 'J_dens': 'J_dens_error'}
+
+# approximate number of float64 arrays of the size of one sample alive during lti_products, used for the batch size
+arrays_per_sample = 120
+
+# minimum number of batches, the convergence is measured after every batch
+checkpoints = 10
+
+
+def input_errors(error_flag, values, B_error=0, E_error=0, NO_error=0, NO2_error=0, NN2_error=0, NOp_error=0,
+                 NO2p_error=0, NNOp_error=0, Ne_error=0, Te_error=0, Ti_error=0, Tn_error=0, Un_error=0, Vi_error=0):
+    '''
+    This function returns the error (standard deviation) of every model input, as assigned in error function.
+
+        Args:
+        error_flag (bool): If error_flag==False then the errors are percentages provided by user.
+                           If error_flag==True then error values are came from Daedalus Science Study
+        values (dict): Model inputs as named in factors.py
+        B_error ... Vi_error (float): As precentage in case of error flag is not set, see error function
+
+        Returns a dictionary with the error of every model input
+
+    '''
+    if not error_flag:
+        percentage = {'Bx': B_error, 'By': B_error, 'Bz': B_error, 'Ex': E_error, 'Ey': E_error, 'Ez': E_error,
+                      'Unx': Un_error, 'Uny': Un_error, 'Unz': Un_error, 'NO': NO_error, 'NO2': NO2_error,
+                      'NN2': NN2_error, 'NOp': NOp_error, 'NO2p': NO2p_error, 'NNOp': NNOp_error, 'Ne': Ne_error,
+                      'Te': Te_error, 'Ti': Ti_error, 'Tn': Tn_error, 'Vi_vertx': Vi_error, 'Vi_verty': Vi_error,
+                      'Vi_vertz': Vi_error}
+        return {name: np.abs((percentage[name] / 100) * values[name]) for name in inputs}
+
+    # Daedalus team threshold errors
+    H_wind = 20  # horizontal wind accuracy
+    V_wind = 10  # vertical wind accuracy
+    absolute = {'Bx': 5 * 10 ** (-9), 'By': 5 * 10 ** (-9), 'Bz': 5 * 10 ** (-9), 'Ex': 2 * 10 ** (-3), 'Ey': 2 * 10 ** (-3),
+                'Ez': 2 * 10 ** (-3), 'Unx': V_wind, 'Uny': V_wind, 'Unz': H_wind, 'Vi_vertx': 100, 'Vi_verty': 100,
+                'Vi_vertz': 100}
+    percentage = {'NO': 20, 'NO2': 20, 'NN2': 20, 'NOp': 10, 'NO2p': 10, 'NNOp': 10, 'Ne': 10, 'Te': 10, 'Ti': 10, 'Tn': 20}
+    errors = {name: np.full(np.shape(values[name]), absolute[name], dtype=float) for name in absolute}
+    errors.update({name: np.abs((percentage[name] / 100) * values[name]) for name in percentage})
+    return errors
+
+
+def error_mc(error_flag, B_error=0, E_error=0, NO_error=0, NO2_error=0, NN2_error=0, NOp_error=0, NO2p_error=0,
+             NNOp_error=0, Ne_error=0, Te_error=0, Ti_error=0, Tn_error=0, Un_error=0, Vi_error=0, lat_value=-1,
+             lon_value=-1, pressure_level=-1, samples=1000, seed=None, percentiles=(5, 50, 95), products=None,
+             max_memory=128, save=False, state=None):
+    '''
+    This function used to estimate the error of the LTI products with Monte Carlo sampling.
+    This fuction should be used after the execution of model_inputs and products function, as error function.
+    Every model input (B, E, densities, temperatures, neutral wind and the measured ion velocity) is perturbed
+    with gaussian noise of the error of error function, and the LTI products are recalculated for every sample.
+    The samples are calculated in batches which fit in max_memory, at least checkpoints of them. Every sample has
+    its own random stream derived from seed, so the results do not depend on the batch size.
+
+        Args:
+        error_flag (bool): If error_flag==False then as error inputs used the error quantites provide by user.
+                            If error_flag==True then error values are came from Daedalus Science Study
+        B_error ... Vi_error (float): As precentage in case of error flag is not set, see error function
+        lat_value (int), lon_value (int), pressure_level (int): Kind of function execution, see error function
+        samples (int): Number of Monte Carlo samples
+        seed (int): Seed of the random samples, the same seed gives the same results
+        percentiles (list): Percentiles (0-100) of every product to calculate, empty to keep no samples in memory
+        products (list): LTI products to calculate statistics of (names as factors.xxx), None for all of them
+        max_memory (float): Memory in MB for the samples kept for the percentiles (samples x cells x products x
+                            4 bytes) and a batch of samples. ValueError if the kept samples alone do not fit, e.g.
+                            a lat-lon map with the defaults, then use less samples or products, or percentiles=()
+        save (bool): If True the standard deviations are stored in the factors.xxx_error_mc structures, next to
+                     the factors.xxx_error ones of error function
+        state (LTIState): Structures of the inputs, as filled by models_input, where the standard deviations are
+                          stored. If None the global structures factors.xxx are used
+
+        Returns a dictionary with
+        'mean', 'std', 'sem' (standard error of the mean): dictionaries with an array per LTI product
+        'percentiles': dictionary with an array per LTI product, first axis is the percentile
+        'convergence': dictionary with the number of samples after every batch ('samples') and the median
+                       relative change of the standard deviation of every LTI product after every batch
+        'samples': number of samples, 'rate': samples calculated per second
+        All arrays of the products have the (lat, lon, lev) shape of the profile.
+
+    '''
+    start_time = time.time()
+    print('Calculating Monte Carlo Error.....')
+    print(' ')
+    state = factors if state is None else state
+
+    # Distinguish Map from Vertical profile
+    lev_range = 0
+    lat_range = 0
+    lon_range = 0
+
+    lev_start = 0
+    lat_start = 0
+    lon_start = 0
+
+    # Lat - Alt map profile
+    if lat_value == -1 and pressure_level == -1:
+        lev_range = len(state.glev_in) - 1
+        lat_range = len(state.glat_in)
+        lon_start = lon_value
+        lon_range = lon_start + 1
+
+    # Lat - Lon map profile
+    if lat_value == -1 and lon_value == -1:
+        lev_start = pressure_level
+        lev_range = lev_start + 1
+        lat_range = len(state.glat_in)
+        lon_range = len(state.glon_in)
+
+    # Vertical profile
+    if lat_value != -1 and lon_value != -1:
+        lat_start = lat_value
+        lon_start = lon_value
+        lat_range = lat_start + 1
+        lon_range = lon_start + 1
+        lev_range = len(state.glev_in) - 1
+
+    lats, lons, levs = np.arange(lat_start, lat_range), np.arange(lon_start, lon_range), np.arange(lev_start, lev_range)
+    cells = np.ix_(lats, lons, levs) if state is factors else state.cells(lats, lons, levs)
+    values = {name: getattr(state, name)[cells] for name in inputs}
+    shape = values['Ne'].shape
+    errors = input_errors(error_flag, values, B_error, E_error, NO_error, NO2_error, NN2_error, NOp_error, NO2p_error,
+                          NNOp_error, Ne_error, Te_error, Ti_error, Tn_error, Un_error, Vi_error)
+    mean_value = np.stack([values[name] for name in inputs])
+    error_value = np.stack([errors[name] for name in inputs])
+
+    if products is None:
+        products = list(error_names) + ['Omega_ion', 'Omega_e']
+    kept_memory = samples * np.prod(shape) * len(products) * 4 / 2 ** 20 if len(percentiles) else 0
+    if kept_memory > max_memory:
+        raise ValueError('The samples kept for the percentiles need %.0f MB, more than max_memory=%g MB, use less '
+                         'samples or products, or percentiles=()' % (kept_memory, max_memory))
+    batch = int(max(1, min(-(-samples // checkpoints),
+                           (max_memory - kept_memory) * 2 ** 20 // (arrays_per_sample * 8 * max(1, np.prod(shape))))))
+    streams = np.random.SeedSequence(seed).spawn(samples)
+
+    count = 0
+    mean = {}
+    m2 = {}
+    kept = {name: np.empty((samples,) + shape, dtype=np.float32) for name in products} if len(percentiles) else {}
+    convergence = {name: [] for name in products}
+    convergence['samples'] = []
+
+    for first in range(0, samples, batch):
+        n = min(batch, samples - first)
+        # gaussian noise, one stream per sample (single precision is enough for the noise and twice as fast)
+        noise = np.empty((n, len(inputs)) + shape, dtype=np.float32)
+        for j in range(n):
+            np.random.default_rng(streams[first + j]).standard_normal((len(inputs),) + shape, dtype=np.float32,
+                                                                      out=noise[j])
+        sample = error_value * noise
+        sample += mean_value
+        del noise
+        s = {name: sample[:, i] for i, name in enumerate(inputs)}
+        result = productderivation.lti_products([s['Bx'], s['By'], s['Bz']], [s['Ex'], s['Ey'], s['Ez']],
+                                                [s['Unx'], s['Uny'], s['Unz']], s['NO'], s['NO2'], s['NN2'], s['NOp'],
+                                                s['NO2p'], s['NNOp'], s['Ne'], s['Te'], s['Ti'], s['Tn'],
+                                                Vi_vert=[s['Vi_vertx'], s['Vi_verty'], s['Vi_vertz']])
+        del sample, s
+
+        # merge mean and sum of squared deviations of the batch with the previous batches
+        total = count + n
+        for name in products:
+            values_b = result[name]
+            mean_b = np.mean(values_b, axis=0)
+            m2_b = np.sum((values_b - mean_b) ** 2, axis=0)
+            if count == 0:
+                mean[name] = mean_b
+                m2[name] = m2_b
+            else:
+                std_before = np.sqrt(m2[name] / (count - 1)) if count > 1 else None
+                delta = mean_b - mean[name]
+                mean[name] = mean[name] + delta * n / total
+                m2[name] = m2[name] + m2_b + delta ** 2 * count * n / total
+                if std_before is not None:
+                    std_after = np.sqrt(m2[name] / (total - 1))
+                    with np.errstate(divide='ignore', invalid='ignore'):
+                        convergence[name].append(np.nanmedian(np.abs(std_after - std_before) / std_after))
+            if name in kept:
+                kept[name][first:first + n] = values_b
+        del result
+        count = total
+        if len(convergence[products[0]]):
+            convergence['samples'].append(count)
+
+    std = {name: np.sqrt(m2[name] / max(count - 1, 1)) for name in products}
+    sem = {name: std[name] / np.sqrt(count) for name in products}
+    quantiles = {name: np.percentile(kept[name], percentiles, axis=0) for name in kept}
+    kept.clear()
+
+    if save:
+        for name in products:
+            if name in error_names:
+                getattr(state, error_names[name] + '_mc')[cells] = std[name]
+
+    run_time = time.time() - start_time
+    # Inform user that error is ready
+    print('Calculated Monte Carlo Errors in: ', run_time, ' sec (', round(samples / run_time, 1), ' samples/sec) !')
+    print(' ')
+
+    return {'mean': mean, 'std': std, 'sem': sem, 'percentiles': quantiles,
+            'convergence': {name: np.array(value) for name, value in convergence.items()},
+            'samples': count, 'rate': samples / run_time}
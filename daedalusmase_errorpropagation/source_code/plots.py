@@ -18,16 +18,19 @@ my_dpi = 300
 
 # ############################ Vertical Profile Plots ############################
 
-def plot_collisions(lat_value, lon_value, min_alt, max_alt):
+def plot_collisions(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot collission frequencies vertical profile
 
     Args:
         lat_value (int): Latitude as index of TIEGCM file 
         lon_value (int): Longitude as index of TIEGCM file 
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
     lat = lat_value
     lon = lon_value
@@ -36,31 +39,31 @@ def plot_collisions(lat_value, lon_value, min_alt, max_alt):
 
     # mean value of ion collisions
     mean_ion_collisions = (
-        factors.nu_Op_sum[lat, lon, :-1] + factors.nu_O2p_sum[lat, lon, :-1] + factors.nu_NOp_sum[lat, lon, :-1]) / 3
+        state.nu_Op_sum[lat, lon, :-1] + state.nu_O2p_sum[lat, lon, :-1] + state.nu_NOp_sum[lat, lon, :-1]) / 3
 
     fig1 = go.Figure()
 
     # adding the various plots
-    fig1.add_trace(go.Scatter(x=factors.nu_Op_sum[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="νO+", mode='lines',
+    fig1.add_trace(go.Scatter(x=state.nu_Op_sum[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="νO+", mode='lines',
                               line=dict(shape='spline', color='red')))
-    fig1.add_trace(go.Scatter(x=factors.nu_O2p_sum[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="νO2+", mode='lines',
+    fig1.add_trace(go.Scatter(x=state.nu_O2p_sum[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="νO2+", mode='lines',
                               line=dict(shape='spline', color='blue')))
-    fig1.add_trace(go.Scatter(x=factors.nu_NOp_sum[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="νNO+", mode='lines',
+    fig1.add_trace(go.Scatter(x=state.nu_NOp_sum[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="νNO+", mode='lines',
                               line=dict(shape='spline', color='yellow')))
-    fig1.add_trace(go.Scatter(x=mean_ion_collisions, y=factors.heights[lat, lon, :-1], name="νion", mode='lines',
+    fig1.add_trace(go.Scatter(x=mean_ion_collisions, y=state.heights[lat, lon, :-1], name="νion", mode='lines',
                               line=dict(shape='spline', color='orange')))
-    fig1.add_trace(go.Scatter(x=factors.nu_e_sum[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="νe", mode='lines',
+    fig1.add_trace(go.Scatter(x=state.nu_e_sum[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="νe", mode='lines',
                               line=dict(shape='spline', color='purple')))
-    fig1.add_trace(go.Scatter(x=factors.Omega_ion[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="Ωi", mode='lines',
+    fig1.add_trace(go.Scatter(x=state.Omega_ion[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="Ωi", mode='lines',
                               line=dict(shape='spline', color='brown')))
-    fig1.add_trace(go.Scatter(x=factors.Omega_e[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="Ωe", mode='lines',
+    fig1.add_trace(go.Scatter(x=state.Omega_e[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="Ωe", mode='lines',
                               line=dict(shape='spline', color='black')))
 
     # updating the layout of the figure
     fig1.update_layout(xaxis_type="log", xaxis_showexponent='all', xaxis_exponentformat='power', yaxis=dict(range=[min_alt, max_alt],
                        tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 10)), xaxis_title="$Frequency \ (Hz)$",
                        yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                       title={'text': 'Collision-Gyro Frequencies' + factors.title, 'y': 0.9, 'x': 0.46, 'xanchor': 'center', 'yanchor': 'top'})
+                       title={'text': 'Collision-Gyro Frequencies' + state.title, 'y': 0.9, 'x': 0.46, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig1.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig1.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -72,16 +75,19 @@ def plot_collisions(lat_value, lon_value, min_alt, max_alt):
     fig1.show()
 
     
-def plot_heating_rates(lat_value, lon_value, min_alt, max_alt):
+def plot_heating_rates(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Heating Rates vertical profile
 
     Args:
         lat_value (int): Latitude as index of TIEGCM file 
         lon_value (int): Longitude as index of TIEGCM file 
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -92,20 +98,20 @@ def plot_heating_rates(lat_value, lon_value, min_alt, max_alt):
     fig = go.Figure()
 
     # adding the various plots
-    fig.add_trace(go.Scatter(x=factors.Ohmic_Heating[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="Ohmic Heating", mode='lines',
+    fig.add_trace(go.Scatter(x=state.Ohmic_Heating[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="Ohmic Heating", mode='lines',
                              line=dict(shape='spline', color='red')))
-    fig.add_trace(go.Scatter(x=factors.Frictional_Heating[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="Frictional Heating", mode='lines',
+    fig.add_trace(go.Scatter(x=state.Frictional_Heating[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="Frictional Heating", mode='lines',
                              line=dict(shape='spline', color='blue')))
-    fig.add_trace(go.Scatter(x=factors.Joule_Heating[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="Joule Heating", mode='lines',
+    fig.add_trace(go.Scatter(x=state.Joule_Heating[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="Joule Heating", mode='lines',
                              line=dict(shape='spline', color='green')))
 
-    x_range = max(factors.Joule_Heating[lat, lon, :-1])
+    x_range = max(state.Joule_Heating[lat, lon, :-1])
 
     # updating the layout of the figure
     fig.update_layout(xaxis_type="linear", xaxis_showexponent='all', xaxis_exponentformat='power', yaxis=dict(range=[min_alt, max_alt],
                       tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 10)), xaxis=dict(range=[0, x_range + x_range/4]),
                       xaxis_title="$(W/m^{3})$", yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                      title={'text': 'Heating Rates' + factors.title, 'y': 0.9, 'x': 0.41, 'xanchor': 'center', 'yanchor': 'top'})
+                      title={'text': 'Heating Rates' + state.title, 'y': 0.9, 'x': 0.41, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -117,16 +123,19 @@ def plot_heating_rates(lat_value, lon_value, min_alt, max_alt):
     fig.show()
 
 
-def plot_conductivities(lat_value, lon_value, min_alt, max_alt):
+def plot_conductivities(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot conductivities vertical profile
 
     Args:
         lat_value (int): Latitude as index of TIEGCM file 
         lon_value (int): Longitude as index of TIEGCM file 
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -137,18 +146,18 @@ def plot_conductivities(lat_value, lon_value, min_alt, max_alt):
     fig = go.Figure()
 
     # adding the various plots
-    fig.add_trace(go.Scatter(x=factors.pedersen_con[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="σPedersen", mode='lines',
+    fig.add_trace(go.Scatter(x=state.pedersen_con[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="σPedersen", mode='lines',
                              line=dict(shape='spline', color='red')))
-    fig.add_trace(go.Scatter(x=factors.hall_con[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="σHall", mode='lines',
+    fig.add_trace(go.Scatter(x=state.hall_con[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="σHall", mode='lines',
                              line=dict(shape='spline', color='blue')))
-    fig.add_trace(go.Scatter(x=factors.parallel_con[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="σParallel", mode='lines',
+    fig.add_trace(go.Scatter(x=state.parallel_con[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="σParallel", mode='lines',
                              line=dict(shape='spline', color='green')))
 
     # updating the layout of the figure
     fig.update_layout(xaxis_type="log", xaxis_showexponent='all', xaxis_exponentformat='power', yaxis=dict(range=[min_alt, max_alt],
                       tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 10)), xaxis_title="$(S/m)$", yaxis_title="$Altitude \ (km)$",
                       width=900, height=650,
-                      title={'text': 'Conductivities' + factors.title, 'y': 0.9, 'x': 0.41, 'xanchor': 'center', 'yanchor': 'top'})
+                      title={'text': 'Conductivities' + state.title, 'y': 0.9, 'x': 0.41, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -161,7 +170,7 @@ def plot_conductivities(lat_value, lon_value, min_alt, max_alt):
 
 
 
-def plot_currents(lat_value, lon_value, min_alt, max_alt):
+def plot_currents(lat_value, lon_value, min_alt, max_alt, state=None):
 
     '''
     This function used to plot currents vertical profile
@@ -169,9 +178,12 @@ def plot_currents(lat_value, lon_value, min_alt, max_alt):
     Args:
         lat_value (int): Latitude as index of TIEGCM file 
         lon_value (int): Longitude as index of TIEGCM file 
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -182,20 +194,20 @@ def plot_currents(lat_value, lon_value, min_alt, max_alt):
     fig = go.Figure()
 
     # adding the various plots
-    fig.add_trace(go.Scatter(x=factors.J_pedersen[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="Pedersen Current", mode='lines',
+    fig.add_trace(go.Scatter(x=state.J_pedersen[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="Pedersen Current", mode='lines',
                              line=dict(shape='spline', color='red')))
-    fig.add_trace(go.Scatter(x=factors.J_hall[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="Hall Current", mode='lines',
+    fig.add_trace(go.Scatter(x=state.J_hall[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="Hall Current", mode='lines',
                              line=dict(shape='spline', color='blue')))
-    fig.add_trace(go.Scatter(x=factors.J_ohmic[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="Ohmic Current", mode='lines',
+    fig.add_trace(go.Scatter(x=state.J_ohmic[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="Ohmic Current", mode='lines',
                              line=dict(shape='spline', color='green')))
-    fig.add_trace(go.Scatter(x=factors.J_dens[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="Densities Current", mode='lines',
+    fig.add_trace(go.Scatter(x=state.J_dens[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="Densities Current", mode='lines',
                              line=dict(shape='spline', color='black')))
-    x_range = max(factors.J_ohmic[lat, lon, :-1])
+    x_range = max(state.J_ohmic[lat, lon, :-1])
     # updating the layout of the figure
     fig.update_layout(xaxis_type="linear", xaxis_showexponent='all', xaxis_exponentformat='power', yaxis=dict(range=[min_alt, max_alt],
                       tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 10)), xaxis=dict(range=[0, x_range + x_range/4]),
                       xaxis_title="$(A/m^{2})$", yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                      title={'text': 'Perpendicular Currents' + factors.title, 'y': 0.9, 'x': 0.45, 'xanchor': 'center', 'yanchor': 'top'})
+                      title={'text': 'Perpendicular Currents' + state.title, 'y': 0.9, 'x': 0.45, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -208,16 +220,19 @@ def plot_currents(lat_value, lon_value, min_alt, max_alt):
 
 
 
-def plot_cross_sections(lat_value, lon_value, min_alt, max_alt):
+def plot_cross_sections(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Ctoss Sections vertical profile
 
     Args:
         lat_value (int): Latitude as index of TIEGCM file 
         lon_value (int): Longitude as index of TIEGCM file 
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -228,22 +243,22 @@ def plot_cross_sections(lat_value, lon_value, min_alt, max_alt):
     fig = go.Figure()
 
     # adding the various plots
-    fig.add_trace(go.Scatter(x=factors.C_Op[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="O+", mode='lines',
+    fig.add_trace(go.Scatter(x=state.C_Op[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="O+", mode='lines',
                              line=dict(shape='spline', color='red')))
-    fig.add_trace(go.Scatter(x=factors.C_O2p[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="O2+", mode='lines',
+    fig.add_trace(go.Scatter(x=state.C_O2p[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="O2+", mode='lines',
                              line=dict(shape='spline', color='blue')))
-    fig.add_trace(go.Scatter(x=factors.C_NOp[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="NO+", mode='lines',
+    fig.add_trace(go.Scatter(x=state.C_NOp[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="NO+", mode='lines',
                              line=dict(shape='spline', color='green')))
-    fig.add_trace(go.Scatter(x=factors.C_ion[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="Avg", mode='lines',
+    fig.add_trace(go.Scatter(x=state.C_ion[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="Avg", mode='lines',
                              line=dict(shape='spline', color='black')))
 
-    x_range = max(factors.C_Op[lat, lon, :-1])
+    x_range = max(state.C_Op[lat, lon, :-1])
 
     # updating the layout of the figure
     fig.update_layout(xaxis_type="linear", xaxis_showexponent='all', xaxis_exponentformat='power', yaxis=dict(range=[min_alt, max_alt],
                       tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 10)), xaxis=dict(range=[0, x_range + x_range/4]),
                       xaxis_title="$(m^{2})$", yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                      title={'text': 'Cross Sections' + factors.title, 'y': 0.9, 'x': 0.42, 'xanchor': 'center', 'yanchor': 'top'})
+                      title={'text': 'Cross Sections' + state.title, 'y': 0.9, 'x': 0.42, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -256,16 +271,19 @@ def plot_cross_sections(lat_value, lon_value, min_alt, max_alt):
 
 
 
-def plot_collisions_error(lat_value, lon_value, min_alt, max_alt):
+def plot_collisions_error(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Collission Frequencies error vertical profile
 
     Args:
         lat_value (int): Latitude as index of TIEGCM file 
         lon_value (int): Longitude as index of TIEGCM file 
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -276,13 +294,13 @@ def plot_collisions_error(lat_value, lon_value, min_alt, max_alt):
     fig = go.Figure()
 
     # adding the various plots
-    fig.add_trace(go.Scatter(x=factors.nuOp_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="$ν_{O^{+}}$ error", mode='lines',
+    fig.add_trace(go.Scatter(x=state.nuOp_error[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="$ν_{O^{+}}$ error", mode='lines',
                              line=dict(shape='spline', color='red')))
-    fig.add_trace(go.Scatter(x=factors.nuO2p_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="$ν_{O2^{+}}$ error", mode='lines',
+    fig.add_trace(go.Scatter(x=state.nuO2p_error[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="$ν_{O2^{+}}$ error", mode='lines',
                              line=dict(shape='spline', color='blue')))
-    fig.add_trace(go.Scatter(x=factors.nuNOp_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="$ν_{NO^{+}}$ error", mode='lines',
+    fig.add_trace(go.Scatter(x=state.nuNOp_error[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="$ν_{NO^{+}}$ error", mode='lines',
                              line=dict(shape='spline', color='green')))
-    fig.add_trace(go.Scatter(x=factors.nue_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="$ν_{e}$ error", mode='lines',
+    fig.add_trace(go.Scatter(x=state.nue_error[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="$ν_{e}$ error", mode='lines',
                              line=dict(shape='spline', color='purple')))
 
     
@@ -297,7 +315,7 @@ def plot_collisions_error(lat_value, lon_value, min_alt, max_alt):
 
 
 
-def plot_collisions_plus_error(lat_value, lon_value, min_alt, max_alt):
+def plot_collisions_plus_error(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Collission Frequencies vertical profile, including Error
 
@@ -306,9 +324,12 @@ def plot_collisions_plus_error(lat_value, lon_value, min_alt, max_alt):
         lon_value (int): Longitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -319,28 +340,28 @@ def plot_collisions_plus_error(lat_value, lon_value, min_alt, max_alt):
     fig = go.Figure()
 
     # adding the various plots
-    fig.add_trace(go.Scatter(x=factors.nuOp_error[lat, lon, :-1] + factors.nu_Op_sum[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="νO+ +error",
+    fig.add_trace(go.Scatter(x=state.nuOp_error[lat, lon, :-1] + state.nu_Op_sum[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="νO+ +error",
                              mode='lines', line=dict(shape='spline', color='red')))
-    fig.add_trace(go.Scatter(x=factors.nu_Op_sum[lat, lon, :-1] - factors.nuOp_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="νO+ -error",
+    fig.add_trace(go.Scatter(x=state.nu_Op_sum[lat, lon, :-1] - state.nuOp_error[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="νO+ -error",
                              mode='lines', line=dict(shape='spline', color='red', dash="dash")))
-    fig.add_trace(go.Scatter(x=factors.nuO2p_error[lat, lon, :-1] + factors.nu_O2p_sum[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="νO2+ + error",
+    fig.add_trace(go.Scatter(x=state.nuO2p_error[lat, lon, :-1] + state.nu_O2p_sum[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="νO2+ + error",
                              mode='lines', line=dict(shape='spline', color='blue')))
-    fig.add_trace(go.Scatter(x=factors.nu_O2p_sum[lat, lon, :-1] - factors.nuO2p_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="νO2+ - error",
+    fig.add_trace(go.Scatter(x=state.nu_O2p_sum[lat, lon, :-1] - state.nuO2p_error[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="νO2+ - error",
                              mode='lines', line=dict(shape='spline', color='blue', dash="dash")))
-    fig.add_trace(go.Scatter(x=factors.nuNOp_error[lat, lon, :-1] + factors.nu_NOp_sum[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="νNO+ + error",
+    fig.add_trace(go.Scatter(x=state.nuNOp_error[lat, lon, :-1] + state.nu_NOp_sum[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="νNO+ + error",
                              mode='lines', line=dict(shape='spline', color='green')))
-    fig.add_trace(go.Scatter(x=factors.nu_NOp_sum[lat, lon, :-1] - factors.nuNOp_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="νNO+ - error",
+    fig.add_trace(go.Scatter(x=state.nu_NOp_sum[lat, lon, :-1] - state.nuNOp_error[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="νNO+ - error",
                              mode='lines', line=dict(shape='spline', color='green', dash="dash")))
-    fig.add_trace(go.Scatter(x=factors.nue_error[lat, lon, :-1] + factors.nu_e_sum[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="νe + error", mode='lines',
+    fig.add_trace(go.Scatter(x=state.nue_error[lat, lon, :-1] + state.nu_e_sum[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="νe + error", mode='lines',
                              line=dict(shape='spline', color='purple')))
-    fig.add_trace(go.Scatter(x=factors.nu_e_sum[lat, lon, :-1] - factors.nue_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="νe - error", mode='lines',
+    fig.add_trace(go.Scatter(x=state.nu_e_sum[lat, lon, :-1] - state.nue_error[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="νe - error", mode='lines',
                              line=dict(shape='spline', color='purple', dash="dash")))
 
     # updating the layout of the figure
     fig.update_layout(xaxis_type="log", xaxis_showexponent='all', xaxis_exponentformat='power', yaxis=dict(range=[min_alt, max_alt],
                       tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 5)),
                       xaxis_title="$Frequency \ (Hz)$", yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                      title={'text': 'Collision Frequencies With Error' + factors.title, 'y': 0.9, 'x': 0.48, 'xanchor': 'center', 'yanchor': 'top'})
+                      title={'text': 'Collision Frequencies With Error' + state.title, 'y': 0.9, 'x': 0.48, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -353,7 +374,7 @@ def plot_collisions_plus_error(lat_value, lon_value, min_alt, max_alt):
 
 
 
-def plot_collisions_rel_error(lat_value, lon_value, min_alt, max_alt):
+def plot_collisions_rel_error(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Collission Frequencies vertical profile, Relative Error
 
@@ -362,9 +383,12 @@ def plot_collisions_rel_error(lat_value, lon_value, min_alt, max_alt):
         lon_value (int): Longitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -372,38 +396,38 @@ def plot_collisions_rel_error(lat_value, lon_value, min_alt, max_alt):
     min_alt = min_alt
     max_alt = max_alt
 
-    nuOp_rel = factors.nuOp_error[lat, lon,
-                                  :-1] / factors.nu_Op_sum[lat, lon, :-1]
-    nuO2p_rel = factors.nuO2p_error[lat, lon,
-                                    :-1] / factors.nu_O2p_sum[lat, lon, :-1]
-    nuNOp_rel = factors.nuNOp_error[lat, lon,
-                                    :-1] / factors.nu_NOp_sum[lat, lon, :-1]
-    nu_ion = (factors.nu_Op_sum[lat, lon, :-1] + factors.nu_O2p_sum[lat,
-              lon, :-1] + factors.nu_NOp_sum[lat, lon, :-1]) / 3
-    nuion_error = (factors.nuOp_error[lat, lon, :-1] + factors.nuO2p_error[lat,
-                   lon, :-1] + factors.nuNOp_error[lat, lon, :-1]) / 3
+    nuOp_rel = state.nuOp_error[lat, lon,
+                                  :-1] / state.nu_Op_sum[lat, lon, :-1]
+    nuO2p_rel = state.nuO2p_error[lat, lon,
+                                    :-1] / state.nu_O2p_sum[lat, lon, :-1]
+    nuNOp_rel = state.nuNOp_error[lat, lon,
+                                    :-1] / state.nu_NOp_sum[lat, lon, :-1]
+    nu_ion = (state.nu_Op_sum[lat, lon, :-1] + state.nu_O2p_sum[lat,
+              lon, :-1] + state.nu_NOp_sum[lat, lon, :-1]) / 3
+    nuion_error = (state.nuOp_error[lat, lon, :-1] + state.nuO2p_error[lat,
+                   lon, :-1] + state.nuNOp_error[lat, lon, :-1]) / 3
     nuion_rel = nuion_error / nu_ion
-    nue_rel = factors.nue_error[lat, lon, :-1] / \
-        factors.nu_e_sum[lat, lon, :-1]
+    nue_rel = state.nue_error[lat, lon, :-1] / \
+        state.nu_e_sum[lat, lon, :-1]
 
     fig = go.Figure()
 
     # adding the various plots
-    fig.add_trace(go.Scatter(x=nuOp_rel, y=factors.heights[lat, lon, :-1], name="$ν_{O^{+}}$ error", mode='lines',
+    fig.add_trace(go.Scatter(x=nuOp_rel, y=state.heights[lat, lon, :-1], name="$ν_{O^{+}}$ error", mode='lines',
                              line=dict(shape='spline', color='red')))
-    fig.add_trace(go.Scatter(x=nuO2p_rel, y=factors.heights[lat, lon, :-1], name="$ν_{O2^{+}}$ error", mode='lines',
+    fig.add_trace(go.Scatter(x=nuO2p_rel, y=state.heights[lat, lon, :-1], name="$ν_{O2^{+}}$ error", mode='lines',
                              line=dict(shape='spline', color='blue')))
-    fig.add_trace(go.Scatter(x=nuNOp_rel, y=factors.heights[lat, lon, :-1], name="$ν_{NO^{+}}$ error", mode='lines',
+    fig.add_trace(go.Scatter(x=nuNOp_rel, y=state.heights[lat, lon, :-1], name="$ν_{NO^{+}}$ error", mode='lines',
                              line=dict(shape='spline', color='green')))
-    fig.add_trace(go.Scatter(x=nue_rel, y=factors.heights[lat, lon, :-1], name="$ν_{e}$ error", mode='lines',
+    fig.add_trace(go.Scatter(x=nue_rel, y=state.heights[lat, lon, :-1], name="$ν_{e}$ error", mode='lines',
                              line=dict(shape='spline', color='purple')))
-    fig.add_trace(go.Scatter(x=nuion_rel, y=factors.heights[lat, lon, :-1], name="$ν_{ion}$ error", mode='lines',
+    fig.add_trace(go.Scatter(x=nuion_rel, y=state.heights[lat, lon, :-1], name="$ν_{ion}$ error", mode='lines',
                              line=dict(shape='spline', color='yellow')))
 
     # updating the layout of the figure
     fig.update_layout(xaxis_type="log", yaxis=dict(range=[min_alt, max_alt], tickmode='array',
                       tickvals=np.arange(min_alt, max_alt + 5, 5)), xaxis_title="", yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                      title={'text': 'Collision Frequencies Relative Error' + factors.title, 'y': 0.9, 'x': 0.5, 'xanchor': 'center', 'yanchor': 'top'})
+                      title={'text': 'Collision Frequencies Relative Error' + state.title, 'y': 0.9, 'x': 0.5, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -417,7 +441,7 @@ def plot_collisions_rel_error(lat_value, lon_value, min_alt, max_alt):
 
 
 
-def plot_collisions_contr(lat_value, lon_value, min_alt, max_alt):
+def plot_collisions_contr(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot cotibution of error of each variable to Collission Frequencies calculation in vertical profile
 
@@ -426,9 +450,12 @@ def plot_collisions_contr(lat_value, lon_value, min_alt, max_alt):
         lon_value (int): Longitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -436,47 +463,47 @@ def plot_collisions_contr(lat_value, lon_value, min_alt, max_alt):
     min_alt = min_alt
     max_alt = max_alt
 
-    nu_ion = (factors.nu_Op_sum[lat, lon, :-1] + factors.nu_O2p_sum[lat,
-              lon, :-1] + factors.nu_NOp_sum[lat, lon, :-1]) / 3
-    nuion_error = (factors.nuOp_error[lat, lon, :-1] + factors.nuO2p_error[lat,
-                   lon, :-1] + factors.nuNOp_error[lat, lon, :-1]) / 3
+    nu_ion = (state.nu_Op_sum[lat, lon, :-1] + state.nu_O2p_sum[lat,
+              lon, :-1] + state.nu_NOp_sum[lat, lon, :-1]) / 3
+    nuion_error = (state.nuOp_error[lat, lon, :-1] + state.nuO2p_error[lat,
+                   lon, :-1] + state.nuNOp_error[lat, lon, :-1]) / 3
     nuion_rel = nuion_error / nu_ion
-    nue_rel = factors.nue_error[lat, lon, :-1] / \
-        factors.nu_e_sum[lat, lon, :-1]
+    nue_rel = state.nue_error[lat, lon, :-1] / \
+        state.nu_e_sum[lat, lon, :-1]
 
-    dnui_Tn = factors.dnuion_Tn[lat, lon, :-1] ** (1/2) / nu_ion
-    dnui_Ti = factors.dnuion_Ti[lat, lon, :-1] ** (1/2) / nu_ion
-    dnui_Nn = factors.dnuion_Nneutral[lat, lon, :-1] ** (1 / 2) / nu_ion
+    dnui_Tn = state.dnuion_Tn[lat, lon, :-1] ** (1/2) / nu_ion
+    dnui_Ti = state.dnuion_Ti[lat, lon, :-1] ** (1/2) / nu_ion
+    dnui_Nn = state.dnuion_Nneutral[lat, lon, :-1] ** (1 / 2) / nu_ion
 
-    dnu_e_Te = factors.dnue_Te[lat, lon, :-
-                               1] ** (1/2) / factors.nu_e_sum[lat, lon, :-1]
-    dnu_e_Nneutral = factors.dnue_Nneutral[lat, lon,
-                                           :-1] ** (1/2) / factors.nu_e_sum[lat, lon, :-1]
+    dnu_e_Te = state.dnue_Te[lat, lon, :-
+                               1] ** (1/2) / state.nu_e_sum[lat, lon, :-1]
+    dnu_e_Nneutral = state.dnue_Nneutral[lat, lon,
+                                           :-1] ** (1/2) / state.nu_e_sum[lat, lon, :-1]
 
     fig = go.Figure()
 
     # adding the various plots
-    fig.add_trace(go.Scatter(x=nuion_rel, y=factors.heights[lat, lon, :-1], name="νion error", mode='lines',
+    fig.add_trace(go.Scatter(x=nuion_rel, y=state.heights[lat, lon, :-1], name="νion error", mode='lines',
                              line=dict(shape='spline', color='red')))
-    fig.add_trace(go.Scatter(x=dnui_Tn, y=factors.heights[lat, lon, :-1], name="dTn(i)", mode='lines',
+    fig.add_trace(go.Scatter(x=dnui_Tn, y=state.heights[lat, lon, :-1], name="dTn(i)", mode='lines',
                              line=dict(shape='spline', dash="dot", color='red')))
-    fig.add_trace(go.Scatter(x=dnui_Ti, y=factors.heights[lat, lon, :-1], name="dTi(i)", mode='lines',
+    fig.add_trace(go.Scatter(x=dnui_Ti, y=state.heights[lat, lon, :-1], name="dTi(i)", mode='lines',
                              line=dict(shape='spline', dash="dash", color='red')))
-    fig.add_trace(go.Scatter(x=dnui_Nn, y=factors.heights[lat, lon, :-1], name="dNn(i)", mode='lines',
+    fig.add_trace(go.Scatter(x=dnui_Nn, y=state.heights[lat, lon, :-1], name="dNn(i)", mode='lines',
                              line=dict(shape='spline', dash="dot", color='brown')))
 
-    fig.add_trace(go.Scatter(x=nue_rel, y=factors.heights[lat, lon, :-1], name="νe error", mode='lines',
+    fig.add_trace(go.Scatter(x=nue_rel, y=state.heights[lat, lon, :-1], name="νe error", mode='lines',
                              line=dict(shape='spline', color='blue')))
-    fig.add_trace(go.Scatter(x=dnu_e_Te, y=factors.heights[lat, lon, :-1], name="dTe(e)", mode='lines',
+    fig.add_trace(go.Scatter(x=dnu_e_Te, y=state.heights[lat, lon, :-1], name="dTe(e)", mode='lines',
                              line=dict(shape='spline', dash="dot", color='blue')))
-    fig.add_trace(go.Scatter(x=dnu_e_Nneutral, y=factors.heights[lat, lon, :-1], name="dNn(e)", mode='lines',
+    fig.add_trace(go.Scatter(x=dnu_e_Nneutral, y=state.heights[lat, lon, :-1], name="dNn(e)", mode='lines',
                              line=dict(shape='spline', dash="dash", color='blue')))
 
     # updating the layout of the figure
     fig.update_layout(xaxis_type="linear", xaxis=dict(range=[0, 1]), yaxis=dict(range=[min_alt, max_alt],
                       tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 5)), xaxis_title="",
                       yaxis_title="$Altitude \ (km)$", width=970, height=650,
-                      title={'text': 'Collision Frequencies Relative Error Contributions' + factors.title, 'y': 0.9, 'x': 0.51, 'xanchor': 'center',
+                      title={'text': 'Collision Frequencies Relative Error Contributions' + state.title, 'y': 0.9, 'x': 0.51, 'xanchor': 'center',
                              'yanchor': 'top'})
 
     fig.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -490,7 +517,7 @@ def plot_collisions_contr(lat_value, lon_value, min_alt, max_alt):
 
 
 
-def plot_heating_rates_error(lat_value, lon_value, min_alt, max_alt):
+def plot_heating_rates_error(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Heating Rates vertical profile
     Args:
@@ -498,9 +525,12 @@ def plot_heating_rates_error(lat_value, lon_value, min_alt, max_alt):
         lon_value (int): Longitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -511,18 +541,18 @@ def plot_heating_rates_error(lat_value, lon_value, min_alt, max_alt):
     fig = go.Figure()
 
     # adding the various plots
-    fig.add_trace(go.Scatter(x=factors.Ohmic_Heating_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="Ohmic Heating error", mode='lines',
+    fig.add_trace(go.Scatter(x=state.Ohmic_Heating_error[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="Ohmic Heating error", mode='lines',
                              line=dict(shape='spline', color='red')))
-    fig.add_trace(go.Scatter(x=factors.Frictional_Heating_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="Frictional Heating error", mode='lines',
+    fig.add_trace(go.Scatter(x=state.Frictional_Heating_error[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="Frictional Heating error", mode='lines',
                              line=dict(shape='spline', color='blue')))
-    fig.add_trace(go.Scatter(x=factors.Joule_Heating_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="Joule Heating error", mode='lines',
+    fig.add_trace(go.Scatter(x=state.Joule_Heating_error[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="Joule Heating error", mode='lines',
                              line=dict(shape='spline', color='green')))
 
     # updating the layout of the figure
     fig.update_layout(xaxis_type="linear", xaxis_showexponent='all', xaxis_exponentformat='power', yaxis=dict(range=[min_alt, max_alt],
                       tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 5)),
                       xaxis_title="$(W/m^{3})$", yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                      title={'text': 'Heating Rates Absolute Error' + factors.title, 'y': 0.9, 'x': 0.47, 'xanchor': 'center', 'yanchor': 'top'})
+                      title={'text': 'Heating Rates Absolute Error' + state.title, 'y': 0.9, 'x': 0.47, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -535,7 +565,7 @@ def plot_heating_rates_error(lat_value, lon_value, min_alt, max_alt):
 
     
 
-def plot_heating_rates_plus_error(lat_value, lon_value, min_alt, max_alt):
+def plot_heating_rates_plus_error(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Heating Error vertical profile, including Error
 
@@ -544,9 +574,12 @@ def plot_heating_rates_plus_error(lat_value, lon_value, min_alt, max_alt):
         lon_value (int): Longitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -557,24 +590,24 @@ def plot_heating_rates_plus_error(lat_value, lon_value, min_alt, max_alt):
     fig = go.Figure()
 
     # adding the various plots
-    fig.add_trace(go.Scatter(x=factors.Ohmic_Heating_error[lat, lon, :-1] + factors.Ohmic_Heating[lat, lon, :-1], y=factors.heights[lat, lon, :-1],
+    fig.add_trace(go.Scatter(x=state.Ohmic_Heating_error[lat, lon, :-1] + state.Ohmic_Heating[lat, lon, :-1], y=state.heights[lat, lon, :-1],
                              name="Ohmic Heating + error", mode='lines', line=dict(shape='spline', color='red')))
-    fig.add_trace(go.Scatter(x=factors.Ohmic_Heating[lat, lon, :-1] - factors.Ohmic_Heating_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1],
+    fig.add_trace(go.Scatter(x=state.Ohmic_Heating[lat, lon, :-1] - state.Ohmic_Heating_error[lat, lon, :-1], y=state.heights[lat, lon, :-1],
                              name="Ohmic Heating - error", mode='lines', line=dict(shape='spline', color='red', dash="dash")))
-    fig.add_trace(go.Scatter(x=factors.Frictional_Heating_error[lat, lon, :-1] + factors.Frictional_Heating[lat, lon, :-1], y=factors.heights[lat, lon, :-1],
+    fig.add_trace(go.Scatter(x=state.Frictional_Heating_error[lat, lon, :-1] + state.Frictional_Heating[lat, lon, :-1], y=state.heights[lat, lon, :-1],
                              name="Frictional Heating + error", mode='lines', line=dict(shape='spline', color='blue')))
-    fig.add_trace(go.Scatter(x=factors.Frictional_Heating[lat, lon, :-1] - factors.Frictional_Heating_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1],
+    fig.add_trace(go.Scatter(x=state.Frictional_Heating[lat, lon, :-1] - state.Frictional_Heating_error[lat, lon, :-1], y=state.heights[lat, lon, :-1],
                              name="Frictional Heating - error", mode='lines', line=dict(shape='spline', color='blue', dash="dash")))
-    fig.add_trace(go.Scatter(x=factors.Joule_Heating_error[lat, lon, :-1] + factors.Joule_Heating[lat, lon, :-1], y=factors.heights[lat, lon, :-1],
+    fig.add_trace(go.Scatter(x=state.Joule_Heating_error[lat, lon, :-1] + state.Joule_Heating[lat, lon, :-1], y=state.heights[lat, lon, :-1],
                              name="Joule Heating + error", mode='lines', line=dict(shape='spline', color='green')))
-    fig.add_trace(go.Scatter(x=factors.Joule_Heating[lat, lon, :-1] - factors.Joule_Heating_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1],
+    fig.add_trace(go.Scatter(x=state.Joule_Heating[lat, lon, :-1] - state.Joule_Heating_error[lat, lon, :-1], y=state.heights[lat, lon, :-1],
                              name="Joule Heating - error", mode='lines', line=dict(shape='spline', color='green', dash="dash")))
 
     # updating the layout of the figure
     fig.update_layout(xaxis_type="linear", xaxis_showexponent='all', xaxis_exponentformat='power', yaxis=dict(range=[min_alt, max_alt],
                       tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 5)),
                       xaxis_title="$(W/m^{3})$", yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                      title={'text': 'Heating Rates With Error' + factors.title, 'y': 0.9, 'x': 0.45, 'xanchor': 'center', 'yanchor': 'top'})
+                      title={'text': 'Heating Rates With Error' + state.title, 'y': 0.9, 'x': 0.45, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -587,7 +620,7 @@ def plot_heating_rates_plus_error(lat_value, lon_value, min_alt, max_alt):
 
     
 
-def plot_heating_rates_rel_error(lat_value, lon_value, min_alt, max_alt):
+def plot_heating_rates_rel_error(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Heating Error vertical profile, relative Error
 
@@ -596,9 +629,12 @@ def plot_heating_rates_rel_error(lat_value, lon_value, min_alt, max_alt):
         lon_value (int): Longitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -606,27 +642,27 @@ def plot_heating_rates_rel_error(lat_value, lon_value, min_alt, max_alt):
     min_alt = min_alt
     max_alt = max_alt
 
-    Ohmic_rel = factors.Ohmic_Heating_error[lat, lon,
-                                            :-1] / factors.Ohmic_Heating[lat, lon, :-1]
-    Frict_rel = factors.Frictional_Heating_error[lat, lon,
-                                                 :-1] / factors.Frictional_Heating[lat, lon, :-1]
-    Joule_rel = factors.Joule_Heating_error[lat, lon,
-                                            :-1] / factors.Joule_Heating[lat, lon, :-1]
+    Ohmic_rel = state.Ohmic_Heating_error[lat, lon,
+                                            :-1] / state.Ohmic_Heating[lat, lon, :-1]
+    Frict_rel = state.Frictional_Heating_error[lat, lon,
+                                                 :-1] / state.Frictional_Heating[lat, lon, :-1]
+    Joule_rel = state.Joule_Heating_error[lat, lon,
+                                            :-1] / state.Joule_Heating[lat, lon, :-1]
 
     fig = go.Figure()
 
     # adding the various plots
-    fig.add_trace(go.Scatter(x=Ohmic_rel, y=factors.heights[lat, lon, :-1], name="Ohmic Heating error", mode='lines',
+    fig.add_trace(go.Scatter(x=Ohmic_rel, y=state.heights[lat, lon, :-1], name="Ohmic Heating error", mode='lines',
                              line=dict(shape='spline', color='red')))
-    fig.add_trace(go.Scatter(x=Frict_rel, y=factors.heights[lat, lon, :-1], name="Frictional Heating error", mode='lines',
+    fig.add_trace(go.Scatter(x=Frict_rel, y=state.heights[lat, lon, :-1], name="Frictional Heating error", mode='lines',
                              line=dict(shape='spline', color='blue')))
-    fig.add_trace(go.Scatter(x=Joule_rel, y=factors.heights[lat, lon, :-1], name="Joule Heating error", mode='lines',
+    fig.add_trace(go.Scatter(x=Joule_rel, y=state.heights[lat, lon, :-1], name="Joule Heating error", mode='lines',
                              line=dict(shape='spline', color='green')))
 
     # updating the layout of the figure
     fig.update_layout(xaxis_type="linear", xaxis=dict(range=[0, 1]), yaxis=dict(range=[min_alt, max_alt], tickmode='array',
                       tickvals=np.arange(min_alt, max_alt + 5, 5)), xaxis_title="", yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                      title={'text': 'Heating Rates Relative Error' + factors.title, 'y': 0.9, 'x': 0.47, 'xanchor': 'center', 'yanchor': 'top'})
+                      title={'text': 'Heating Rates Relative Error' + state.title, 'y': 0.9, 'x': 0.47, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -638,7 +674,7 @@ def plot_heating_rates_rel_error(lat_value, lon_value, min_alt, max_alt):
     fig.show()
 
     
-def plot_heating_rates_contr(lat_value, lon_value, min_alt, max_alt):
+def plot_heating_rates_contr(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot cotibution of error of each variable to Heating Rates calculation in vertical profile
 
@@ -647,9 +683,12 @@ def plot_heating_rates_contr(lat_value, lon_value, min_alt, max_alt):
         lon_value (int): Longitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -658,59 +697,59 @@ def plot_heating_rates_contr(lat_value, lon_value, min_alt, max_alt):
     max_alt = max_alt
 
     # Ohmic Heating
-    Ohmic_rel = factors.Ohmic_Heating_error[lat, lon,
-                                            :-1] / factors.Ohmic_Heating[lat, lon, :-1]
-    dOhm_dB = factors.dOH_B[lat, lon, :-
-                            1] ** (1/2) / factors.Ohmic_Heating[lat, lon, :-1]
-    dOhm_dE = factors.dOH_E[lat, lon, :-
-                            1] ** (1/2) / factors.Ohmic_Heating[lat, lon, :-1]
-    dOhm_dNneutral = factors.dOH_Nneutral[lat, lon, :-
-                                          1] ** (1/2) / factors.Ohmic_Heating[lat, lon, :-1]
-    dOhm_dNion = factors.dOH_Nion[lat, lon, :-
-                                  1] ** (1/2) / factors.Ohmic_Heating[lat, lon, :-1]
-    dOhm_dUn = factors.dOH_Un[lat, lon, :-
-                              1] ** (1/2) / factors.Ohmic_Heating[lat, lon, :-1]
-    dOhm_dNe = factors.dOH_Ne[lat, lon, :-
-                              1] ** (1/2) / factors.Ohmic_Heating[lat, lon, :-1]
-    dOhm_dTe = factors.dOH_Te[lat, lon, :-
-                              1] ** (1/2) / factors.Ohmic_Heating[lat, lon, :-1]
-    dOhm_dTi = factors.dOH_Ti[lat, lon, :-
-                              1] ** (1/2) / factors.Ohmic_Heating[lat, lon, :-1]
-    dOhm_dTn = factors.dOH_Tn[lat, lon, :-
-                              1] ** (1/2) / factors.Ohmic_Heating[lat, lon, :-1]
-    dOhm_dsp = factors.dOH_sp[lat, lon, :-
-                              1] ** (1/2) / factors.Ohmic_Heating[lat, lon, :-1]
+    Ohmic_rel = state.Ohmic_Heating_error[lat, lon,
+                                            :-1] / state.Ohmic_Heating[lat, lon, :-1]
+    dOhm_dB = state.dOH_B[lat, lon, :-
+                            1] ** (1/2) / state.Ohmic_Heating[lat, lon, :-1]
+    dOhm_dE = state.dOH_E[lat, lon, :-
+                            1] ** (1/2) / state.Ohmic_Heating[lat, lon, :-1]
+    dOhm_dNneutral = state.dOH_Nneutral[lat, lon, :-
+                                          1] ** (1/2) / state.Ohmic_Heating[lat, lon, :-1]
+    dOhm_dNion = state.dOH_Nion[lat, lon, :-
+                                  1] ** (1/2) / state.Ohmic_Heating[lat, lon, :-1]
+    dOhm_dUn = state.dOH_Un[lat, lon, :-
+                              1] ** (1/2) / state.Ohmic_Heating[lat, lon, :-1]
+    dOhm_dNe = state.dOH_Ne[lat, lon, :-
+                              1] ** (1/2) / state.Ohmic_Heating[lat, lon, :-1]
+    dOhm_dTe = state.dOH_Te[lat, lon, :-
+                              1] ** (1/2) / state.Ohmic_Heating[lat, lon, :-1]
+    dOhm_dTi = state.dOH_Ti[lat, lon, :-
+                              1] ** (1/2) / state.Ohmic_Heating[lat, lon, :-1]
+    dOhm_dTn = state.dOH_Tn[lat, lon, :-
+                              1] ** (1/2) / state.Ohmic_Heating[lat, lon, :-1]
+    dOhm_dsp = state.dOH_sp[lat, lon, :-
+                              1] ** (1/2) / state.Ohmic_Heating[lat, lon, :-1]
 
     fig1 = go.Figure()
 
     # adding the various plots
-    fig1.add_trace(go.Scatter(x=Ohmic_rel, y=factors.heights[lat, lon, :-1], name="Ohmic Heating error", mode='lines',
+    fig1.add_trace(go.Scatter(x=Ohmic_rel, y=state.heights[lat, lon, :-1], name="Ohmic Heating error", mode='lines',
                               line=dict(shape='spline', color='red')))
-    fig1.add_trace(go.Scatter(x=dOhm_dB, y=factors.heights[lat, lon, :-1], name="dB", mode='lines',
+    fig1.add_trace(go.Scatter(x=dOhm_dB, y=state.heights[lat, lon, :-1], name="dB", mode='lines',
                               line=dict(shape='spline', dash="dot", color='red')))
-    fig1.add_trace(go.Scatter(x=dOhm_dE, y=factors.heights[lat, lon, :-1], name="dE", mode='lines',
+    fig1.add_trace(go.Scatter(x=dOhm_dE, y=state.heights[lat, lon, :-1], name="dE", mode='lines',
                               line=dict(shape='spline', dash="dash", color='red')))
-    fig1.add_trace(go.Scatter(x=dOhm_dNneutral, y=factors.heights[lat, lon, :-1], name="dNn", mode='lines',
+    fig1.add_trace(go.Scatter(x=dOhm_dNneutral, y=state.heights[lat, lon, :-1], name="dNn", mode='lines',
                               line=dict(shape='spline', dash="dash", color='lightcoral')))
-    fig1.add_trace(go.Scatter(x=dOhm_dNion, y=factors.heights[lat, lon, :-1], name="dNion", mode='lines',
+    fig1.add_trace(go.Scatter(x=dOhm_dNion, y=state.heights[lat, lon, :-1], name="dNion", mode='lines',
                               line=dict(shape='spline', dash="dot", color='lightcoral')))
-    fig1.add_trace(go.Scatter(x=dOhm_dUn, y=factors.heights[lat, lon, :-1], name="dUn", mode='lines',
+    fig1.add_trace(go.Scatter(x=dOhm_dUn, y=state.heights[lat, lon, :-1], name="dUn", mode='lines',
                               line=dict(shape='spline', dash="dot", color='maroon')))
-    fig1.add_trace(go.Scatter(x=dOhm_dNe, y=factors.heights[lat, lon, :-1], name="dNe", mode='lines',
+    fig1.add_trace(go.Scatter(x=dOhm_dNe, y=state.heights[lat, lon, :-1], name="dNe", mode='lines',
                               line=dict(shape='spline', dash="dash", color='maroon')))
-    fig1.add_trace(go.Scatter(x=dOhm_dTe, y=factors.heights[lat, lon, :-1], name="dTe", mode='lines',
+    fig1.add_trace(go.Scatter(x=dOhm_dTe, y=state.heights[lat, lon, :-1], name="dTe", mode='lines',
                               line=dict(shape='spline', dash="dot", color='sienna')))
-    fig1.add_trace(go.Scatter(x=dOhm_dTi, y=factors.heights[lat, lon, :-1], name="dTi", mode='lines',
+    fig1.add_trace(go.Scatter(x=dOhm_dTi, y=state.heights[lat, lon, :-1], name="dTi", mode='lines',
                               line=dict(shape='spline', dash="dash", color='sienna')))
-    fig1.add_trace(go.Scatter(x=dOhm_dTn, y=factors.heights[lat, lon, :-1], name="dTn", mode='lines',
+    fig1.add_trace(go.Scatter(x=dOhm_dTn, y=state.heights[lat, lon, :-1], name="dTn", mode='lines',
                               line=dict(shape='spline', dash="dot", color='rosybrown')))
-    fig1.add_trace(go.Scatter(x=dOhm_dsp, y=factors.heights[lat, lon, :-1], name="dσPedersen", mode='lines',
+    fig1.add_trace(go.Scatter(x=dOhm_dsp, y=state.heights[lat, lon, :-1], name="dσPedersen", mode='lines',
                               line=dict(shape='spline', dash="dash", color='rosybrown')))
 
     # updating the layout of the figure
     fig1.update_layout(xaxis_type="linear", xaxis=dict(range=[0, 1]), yaxis=dict(range=[min_alt, max_alt], tickmode='array',
                        tickvals=np.arange(min_alt, max_alt + 5, 5)), xaxis_title="", yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                       title={'text': 'Ohmic Heating Error Contributions' + factors.title, 'y': 0.9, 'x': 0.49, 'xanchor': 'center', 'yanchor': 'top'})
+                       title={'text': 'Ohmic Heating Error Contributions' + state.title, 'y': 0.9, 'x': 0.49, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig1.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig1.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -723,50 +762,50 @@ def plot_heating_rates_contr(lat_value, lon_value, min_alt, max_alt):
 
     
     # Frictional Heating
-    Frict_rel = factors.Frictional_Heating_error[lat, lon,
-                                                 :-1] / factors.Frictional_Heating[lat, lon, :-1]
-    dFric_dB = factors.dFH_B[lat, lon, :-
-                             1] ** (1/2) / factors.Frictional_Heating[lat, lon, :-1]
-    dFric_dNneutral = factors.dFH_Nneutral[lat, lon, :-
-                                           1] ** (1/2) / factors.Frictional_Heating[lat, lon, :-1]
-    dFric_dNion = factors.dFH_Nion[lat, lon, :-
-                                   1] ** (1/2) / factors.Frictional_Heating[lat, lon, :-1]
-    dFric_dUn = factors.dFH_Un[lat, lon, :-
-                               1] ** (1/2) / factors.Frictional_Heating[lat, lon, :-1]
-    dFric_dVi = factors.dFH_Vi[lat, lon, :-
-                               1] ** (1/2) / factors.Frictional_Heating[lat, lon, :-1]
-    dFric_dTn = factors.dFH_Tn[lat, lon, :-
-                               1] ** (1/2) / factors.Frictional_Heating[lat, lon, :-1]
-    dFric_dTi = factors.dFH_Ti[lat, lon, :-
-                               1] ** (1/2) / factors.Frictional_Heating[lat, lon, :-1]
-    dFric_dnu = factors.dFH_nu[lat, lon, :-
-                               1] ** (1/2) / factors.Frictional_Heating[lat, lon, :-1]
+    Frict_rel = state.Frictional_Heating_error[lat, lon,
+                                                 :-1] / state.Frictional_Heating[lat, lon, :-1]
+    dFric_dB = state.dFH_B[lat, lon, :-
+                             1] ** (1/2) / state.Frictional_Heating[lat, lon, :-1]
+    dFric_dNneutral = state.dFH_Nneutral[lat, lon, :-
+                                           1] ** (1/2) / state.Frictional_Heating[lat, lon, :-1]
+    dFric_dNion = state.dFH_Nion[lat, lon, :-
+                                   1] ** (1/2) / state.Frictional_Heating[lat, lon, :-1]
+    dFric_dUn = state.dFH_Un[lat, lon, :-
+                               1] ** (1/2) / state.Frictional_Heating[lat, lon, :-1]
+    dFric_dVi = state.dFH_Vi[lat, lon, :-
+                               1] ** (1/2) / state.Frictional_Heating[lat, lon, :-1]
+    dFric_dTn = state.dFH_Tn[lat, lon, :-
+                               1] ** (1/2) / state.Frictional_Heating[lat, lon, :-1]
+    dFric_dTi = state.dFH_Ti[lat, lon, :-
+                               1] ** (1/2) / state.Frictional_Heating[lat, lon, :-1]
+    dFric_dnu = state.dFH_nu[lat, lon, :-
+                               1] ** (1/2) / state.Frictional_Heating[lat, lon, :-1]
 
     fig2 = go.Figure()
 
-    fig2.add_trace(go.Scatter(x=Frict_rel, y=factors.heights[lat, lon, :-1], name="Frictional Heating error", mode='lines',
+    fig2.add_trace(go.Scatter(x=Frict_rel, y=state.heights[lat, lon, :-1], name="Frictional Heating error", mode='lines',
                               line=dict(shape='spline', color='blue')))
-    fig2.add_trace(go.Scatter(x=dFric_dB, y=factors.heights[lat, lon, :-1], name="dB", mode='lines',
+    fig2.add_trace(go.Scatter(x=dFric_dB, y=state.heights[lat, lon, :-1], name="dB", mode='lines',
                               line=dict(shape='spline', dash="dot", color='blue')))
-    fig2.add_trace(go.Scatter(x=dFric_dNneutral, y=factors.heights[lat, lon, :-1], name="dNn", mode='lines',
+    fig2.add_trace(go.Scatter(x=dFric_dNneutral, y=state.heights[lat, lon, :-1], name="dNn", mode='lines',
                               line=dict(shape='spline', dash="dash", color='blue')))
-    fig2.add_trace(go.Scatter(x=dFric_dNion, y=factors.heights[lat, lon, :-1], name="dNion", mode='lines',
+    fig2.add_trace(go.Scatter(x=dFric_dNion, y=state.heights[lat, lon, :-1], name="dNion", mode='lines',
                               line=dict(shape='spline', dash="dot", color='turquoise')))
-    fig2.add_trace(go.Scatter(x=dFric_dUn, y=factors.heights[lat, lon, :-1], name="dUn", mode='lines',
+    fig2.add_trace(go.Scatter(x=dFric_dUn, y=state.heights[lat, lon, :-1], name="dUn", mode='lines',
                               line=dict(shape='spline', dash="dash", color='turquoise')))
-    fig2.add_trace(go.Scatter(x=dFric_dVi, y=factors.heights[lat, lon, :-1], name="dVi", mode='lines',
+    fig2.add_trace(go.Scatter(x=dFric_dVi, y=state.heights[lat, lon, :-1], name="dVi", mode='lines',
                               line=dict(shape='spline', dash="dot", color='darkslategrey')))
-    fig2.add_trace(go.Scatter(x=dFric_dTn, y=factors.heights[lat, lon, :-1], name="dTn", mode='lines',
+    fig2.add_trace(go.Scatter(x=dFric_dTn, y=state.heights[lat, lon, :-1], name="dTn", mode='lines',
                               line=dict(shape='spline', dash="dash", color='darkslategrey')))
-    fig2.add_trace(go.Scatter(x=dFric_dTi, y=factors.heights[lat, lon, :-1], name="dTi", mode='lines',
+    fig2.add_trace(go.Scatter(x=dFric_dTi, y=state.heights[lat, lon, :-1], name="dTi", mode='lines',
                               line=dict(shape='spline', dash="dot", color='steelblue')))
-    fig2.add_trace(go.Scatter(x=dFric_dnu, y=factors.heights[lat, lon, :-1], name="dν", mode='lines',
+    fig2.add_trace(go.Scatter(x=dFric_dnu, y=state.heights[lat, lon, :-1], name="dν", mode='lines',
                               line=dict(shape='spline', dash="dash", color='steelblue')))
     # updating the layout of the figure
     fig2.update_layout(xaxis_type="linear", xaxis=dict(range=[0, 1]), yaxis=dict(range=[min_alt, max_alt],
                        tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 5)),
                        xaxis_title="", yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                       title={'text': 'Frictional Heating Error Contributions' + factors.title, 'y': 0.9, 'x': 0.5, 'xanchor': 'center', 'yanchor': 'top'})
+                       title={'text': 'Frictional Heating Error Contributions' + state.title, 'y': 0.9, 'x': 0.5, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig2.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig2.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -779,39 +818,39 @@ def plot_heating_rates_contr(lat_value, lon_value, min_alt, max_alt):
 
     
     # Joule Heating
-    Joule_rel = factors.Joule_Heating_error[lat, lon,
-                                            :-1] / factors.Joule_Heating[lat, lon, :-1]
-    dJoule_dB = factors.dJH_B[lat, lon, :-
-                              1] ** (1/2) / factors.Joule_Heating[lat, lon, :-1]
-    dJoule_dE = factors.dJH_E[lat, lon, :-
-                              1] ** (1/2) / factors.Joule_Heating[lat, lon, :-1]
-    dJoule_dVi = factors.dJH_Vi[lat, lon, :-
-                                1] ** (1/2) / factors.Joule_Heating[lat, lon, :-1]
-    dJoule_dUn = factors.dJH_Un[lat, lon, :-
-                                1] ** (1/2) / factors.Joule_Heating[lat, lon, :-1]
-    dJoule_dNe = factors.dJH_Ne[lat, lon, :-
-                                1] ** (1/2) / factors.Joule_Heating[lat, lon, :-1]
+    Joule_rel = state.Joule_Heating_error[lat, lon,
+                                            :-1] / state.Joule_Heating[lat, lon, :-1]
+    dJoule_dB = state.dJH_B[lat, lon, :-
+                              1] ** (1/2) / state.Joule_Heating[lat, lon, :-1]
+    dJoule_dE = state.dJH_E[lat, lon, :-
+                              1] ** (1/2) / state.Joule_Heating[lat, lon, :-1]
+    dJoule_dVi = state.dJH_Vi[lat, lon, :-
+                                1] ** (1/2) / state.Joule_Heating[lat, lon, :-1]
+    dJoule_dUn = state.dJH_Un[lat, lon, :-
+                                1] ** (1/2) / state.Joule_Heating[lat, lon, :-1]
+    dJoule_dNe = state.dJH_Ne[lat, lon, :-
+                                1] ** (1/2) / state.Joule_Heating[lat, lon, :-1]
 
     fig3 = go.Figure()
 
-    fig3.add_trace(go.Scatter(x=Joule_rel, y=factors.heights[lat, lon, :-1], name="Joule Heating error", mode='lines',
+    fig3.add_trace(go.Scatter(x=Joule_rel, y=state.heights[lat, lon, :-1], name="Joule Heating error", mode='lines',
                               line=dict(shape='spline', color='green')))
-    fig3.add_trace(go.Scatter(x=dJoule_dB, y=factors.heights[lat, lon, :-1], name="dB", mode='lines',
+    fig3.add_trace(go.Scatter(x=dJoule_dB, y=state.heights[lat, lon, :-1], name="dB", mode='lines',
                               line=dict(shape='spline', dash="dot", color='green')))
-    fig3.add_trace(go.Scatter(x=dJoule_dE, y=factors.heights[lat, lon, :-1], name="dE", mode='lines',
+    fig3.add_trace(go.Scatter(x=dJoule_dE, y=state.heights[lat, lon, :-1], name="dE", mode='lines',
                               line=dict(shape='spline', dash="dash", color='green')))
-    fig3.add_trace(go.Scatter(x=dJoule_dVi, y=factors.heights[lat, lon, :-1], name="dVi", mode='lines',
+    fig3.add_trace(go.Scatter(x=dJoule_dVi, y=state.heights[lat, lon, :-1], name="dVi", mode='lines',
                               line=dict(shape='spline', dash="dot", color='lime')))
-    fig3.add_trace(go.Scatter(x=dJoule_dUn, y=factors.heights[lat, lon, :-1], name="dUn", mode='lines',
+    fig3.add_trace(go.Scatter(x=dJoule_dUn, y=state.heights[lat, lon, :-1], name="dUn", mode='lines',
                               line=dict(shape='spline', dash="dash", color='lime')))
-    fig3.add_trace(go.Scatter(x=dJoule_dNe, y=factors.heights[lat, lon, :-1], name="dNe", mode='lines',
+    fig3.add_trace(go.Scatter(x=dJoule_dNe, y=state.heights[lat, lon, :-1], name="dNe", mode='lines',
                               line=dict(shape='spline', dash="dot", color='greenyellow')))
 
     # updating the layout of the figure
     fig3.update_layout(xaxis_type="linear", xaxis=dict(range=[0, 1]),
                        yaxis=dict(range=[min_alt, max_alt], tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 5)), xaxis_title="",
                        yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                       title={'text': 'Joule Heating Error Contributions' + factors.title, 'y': 0.9, 'x': 0.49, 'xanchor': 'center', 'yanchor': 'top'})
+                       title={'text': 'Joule Heating Error Contributions' + state.title, 'y': 0.9, 'x': 0.49, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig3.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig3.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -825,7 +864,7 @@ def plot_heating_rates_contr(lat_value, lon_value, min_alt, max_alt):
     
 
 
-def plot_conductivities_error(lat_value, lon_value, min_alt, max_alt):
+def plot_conductivities_error(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot conductivities in vertical profile
 
@@ -834,9 +873,12 @@ def plot_conductivities_error(lat_value, lon_value, min_alt, max_alt):
         lon_value (int): Longitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -847,17 +889,17 @@ def plot_conductivities_error(lat_value, lon_value, min_alt, max_alt):
     fig = go.Figure()
 
     # adding the various plots
-    fig.add_trace(go.Scatter(x=factors.pedersen_con_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="σPedersen error", mode='lines',
+    fig.add_trace(go.Scatter(x=state.pedersen_con_error[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="σPedersen error", mode='lines',
                              line=dict(shape='spline', color='red')))
-    fig.add_trace(go.Scatter(x=factors.hall_con_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="σHall error", mode='lines',
+    fig.add_trace(go.Scatter(x=state.hall_con_error[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="σHall error", mode='lines',
                              line=dict(shape='spline', color='blue')))
-    fig.add_trace(go.Scatter(x=factors.parallel_con_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="σParallel error",
+    fig.add_trace(go.Scatter(x=state.parallel_con_error[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="σParallel error",
                              mode='lines', line=dict(shape='spline', color='green'), visible="legendonly"))
     # updating the layout of the figure
     fig.update_layout(xaxis_type="linear", xaxis_showexponent='all', xaxis_exponentformat='power', yaxis=dict(range=[min_alt, max_alt],
                       tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 5)),
                       xaxis_title="$(S/m)$", yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                      title={'text': 'Conductivities Absolute Error' + factors.title, 'y': 0.9, 'x': 0.47, 'xanchor': 'center', 'yanchor': 'top'})
+                      title={'text': 'Conductivities Absolute Error' + state.title, 'y': 0.9, 'x': 0.47, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -870,7 +912,7 @@ def plot_conductivities_error(lat_value, lon_value, min_alt, max_alt):
 
     
 
-def plot_conductivities_plus_error(lat_value, lon_value, min_alt, max_alt):
+def plot_conductivities_plus_error(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Conductivities including Error in vertical profile
 
@@ -879,9 +921,12 @@ def plot_conductivities_plus_error(lat_value, lon_value, min_alt, max_alt):
         lon_value (int): Longitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -892,23 +937,23 @@ def plot_conductivities_plus_error(lat_value, lon_value, min_alt, max_alt):
     fig = go.Figure()
 
     # adding the various plots
-    fig.add_trace(go.Scatter(x=factors.pedersen_con_error[lat, lon, :-1] + factors.pedersen_con[lat, lon, :-1], y=factors.heights[lat, lon, :-1],
+    fig.add_trace(go.Scatter(x=state.pedersen_con_error[lat, lon, :-1] + state.pedersen_con[lat, lon, :-1], y=state.heights[lat, lon, :-1],
                              name="σPedersen + error", mode='lines', line=dict(shape='spline', color='red')))
-    fig.add_trace(go.Scatter(x=factors.pedersen_con[lat, lon, :-1] - factors.pedersen_con_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1],
+    fig.add_trace(go.Scatter(x=state.pedersen_con[lat, lon, :-1] - state.pedersen_con_error[lat, lon, :-1], y=state.heights[lat, lon, :-1],
                              name="σPedersen - error", mode='lines', line=dict(shape='spline', color='red', dash="dash")))
-    fig.add_trace(go.Scatter(x=factors.hall_con_error[lat, lon, :-1] + factors.hall_con[lat, lon, :-1], y=factors.heights[lat, lon, :-1],
+    fig.add_trace(go.Scatter(x=state.hall_con_error[lat, lon, :-1] + state.hall_con[lat, lon, :-1], y=state.heights[lat, lon, :-1],
                              name="σHall + error", mode='lines', line=dict(shape='spline', color='blue')))
-    fig.add_trace(go.Scatter(x=factors.hall_con[lat, lon, :-1] - factors.hall_con_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1],
+    fig.add_trace(go.Scatter(x=state.hall_con[lat, lon, :-1] - state.hall_con_error[lat, lon, :-1], y=state.heights[lat, lon, :-1],
                              name="σHall - error", mode='lines', line=dict(shape='spline', color='blue', dash="dash")))
-    fig.add_trace(go.Scatter(x=factors.parallel_con_error[lat, lon, :-1] + factors.parallel_con[lat, lon, :-1], y=factors.heights[lat, lon, :-1],
+    fig.add_trace(go.Scatter(x=state.parallel_con_error[lat, lon, :-1] + state.parallel_con[lat, lon, :-1], y=state.heights[lat, lon, :-1],
                              name="σParallel + error", mode='lines', line=dict(shape='spline', color='green'), visible="legendonly"))
-    fig.add_trace(go.Scatter(x=factors.parallel_con[lat, lon, :-1] - factors.parallel_con_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1],
+    fig.add_trace(go.Scatter(x=state.parallel_con[lat, lon, :-1] - state.parallel_con_error[lat, lon, :-1], y=state.heights[lat, lon, :-1],
                              name="σParallel - error", mode='lines', line=dict(shape='spline', color='green', dash="dash"), visible="legendonly"))
     # updating the layout of the figure
     fig.update_layout(xaxis_type="linear", xaxis_showexponent='all', xaxis_exponentformat='power', yaxis=dict(range=[min_alt, max_alt],
                       tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 5)),
                       xaxis_title="$(S/m)$", yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                      title={'text': 'Conductivities With Error' + factors.title, 'y': 0.9, 'x': 0.45, 'xanchor': 'center', 'yanchor': 'top'})
+                      title={'text': 'Conductivities With Error' + state.title, 'y': 0.9, 'x': 0.45, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -922,7 +967,7 @@ def plot_conductivities_plus_error(lat_value, lon_value, min_alt, max_alt):
     
 
 
-def plot_conductivities_rel_error(lat_value, lon_value, min_alt, max_alt):
+def plot_conductivities_rel_error(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Conductivities Relative Error in vertical profile
 
@@ -931,9 +976,12 @@ def plot_conductivities_rel_error(lat_value, lon_value, min_alt, max_alt):
         lon_value (int): Longitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -941,28 +989,28 @@ def plot_conductivities_rel_error(lat_value, lon_value, min_alt, max_alt):
     min_alt = min_alt
     max_alt = max_alt
 
-    pedersen_rel = factors.pedersen_con_error[lat,
-                                              lon, :-1] / factors.pedersen_con[lat, lon, :-1]
-    hall_rel = factors.hall_con_error[lat, lon,
-                                      :-1] / factors.hall_con[lat, lon, :-1]
-    parallel_rel = factors.parallel_con_error[lat,
-                                              lon, :-1] / factors.parallel_con[lat, lon, :-1]
+    pedersen_rel = state.pedersen_con_error[lat,
+                                              lon, :-1] / state.pedersen_con[lat, lon, :-1]
+    hall_rel = state.hall_con_error[lat, lon,
+                                      :-1] / state.hall_con[lat, lon, :-1]
+    parallel_rel = state.parallel_con_error[lat,
+                                              lon, :-1] / state.parallel_con[lat, lon, :-1]
 
     fig = go.Figure()
 
     # adding the various plots
-    fig.add_trace(go.Scatter(x=pedersen_rel, y=factors.heights[lat, lon, :-1], name="σPedersen error", mode='lines',
+    fig.add_trace(go.Scatter(x=pedersen_rel, y=state.heights[lat, lon, :-1], name="σPedersen error", mode='lines',
                              line=dict(shape='spline', color='red')))
-    fig.add_trace(go.Scatter(x=hall_rel, y=factors.heights[lat, lon, :-1],
+    fig.add_trace(go.Scatter(x=hall_rel, y=state.heights[lat, lon, :-1],
                   name="σHall error", mode='lines', line=dict(shape='spline', color='blue')))
-    fig.add_trace(go.Scatter(x=parallel_rel, y=factors.heights[lat, lon, :-1], name="σParallel error", mode='lines',
+    fig.add_trace(go.Scatter(x=parallel_rel, y=state.heights[lat, lon, :-1], name="σParallel error", mode='lines',
                              line=dict(shape='spline', color='green'), visible="legendonly"))
 
     # updating the layout of the figure
     fig.update_layout(xaxis_type="linear", xaxis=dict(range=[0, 1]), yaxis=dict(range=[min_alt, max_alt],
                       tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 5)),
                       xaxis_title="", yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                      title={'text': 'Conductivities Relative Error' + factors.title, 'y': 0.9, 'x': 0.47, 'xanchor': 'center', 'yanchor': 'top'})
+                      title={'text': 'Conductivities Relative Error' + state.title, 'y': 0.9, 'x': 0.47, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -974,7 +1022,7 @@ def plot_conductivities_rel_error(lat_value, lon_value, min_alt, max_alt):
     fig.show()
 
     
-def plot_conductivities_contr(lat_value, lon_value, min_alt, max_alt):
+def plot_conductivities_contr(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot cotibution of error of each variable to Conductivities calculation in vertical profile
 
@@ -983,9 +1031,12 @@ def plot_conductivities_contr(lat_value, lon_value, min_alt, max_alt):
         lon_value (int): Longitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -994,48 +1045,48 @@ def plot_conductivities_contr(lat_value, lon_value, min_alt, max_alt):
     max_alt = max_alt
 
     # Pedersen Conductivity
-    pedersen_rel = factors.pedersen_con_error[lat,
-                                              lon, :-1] / factors.pedersen_con[lat, lon, :-1]
-    dped_dB = factors.dsp_B[lat, lon, :-
-                            1] ** (1/2) / factors.pedersen_con[lat, lon, :-1]
-    dped_dTe = factors.dsp_Te[lat, lon, :-
-                              1] ** (1/2) / factors.pedersen_con[lat, lon, :-1]
-    dped_dTi = factors.dsp_Ti[lat, lon, :-
-                              1] ** (1/2) / factors.pedersen_con[lat, lon, :-1]
-    dped_dTn = factors.dsp_Tn[lat, lon, :-
-                              1] ** (1/2) / factors.pedersen_con[lat, lon, :-1]
-    dped_dNion = factors.dsp_Nion[lat, lon, :-
-                                  1] ** (1/2) / factors.pedersen_con[lat, lon, :-1]
-    dped_dNneutral = factors.dsp_Nneutral[lat, lon, :-
-                                          1] ** (1/2) / factors.pedersen_con[lat, lon, :-1]
-    dped_dNe = factors.dsp_Ne[lat, lon, :-
-                              1] ** (1/2) / factors.pedersen_con[lat, lon, :-1]
+    pedersen_rel = state.pedersen_con_error[lat,
+                                              lon, :-1] / state.pedersen_con[lat, lon, :-1]
+    dped_dB = state.dsp_B[lat, lon, :-
+                            1] ** (1/2) / state.pedersen_con[lat, lon, :-1]
+    dped_dTe = state.dsp_Te[lat, lon, :-
+                              1] ** (1/2) / state.pedersen_con[lat, lon, :-1]
+    dped_dTi = state.dsp_Ti[lat, lon, :-
+                              1] ** (1/2) / state.pedersen_con[lat, lon, :-1]
+    dped_dTn = state.dsp_Tn[lat, lon, :-
+                              1] ** (1/2) / state.pedersen_con[lat, lon, :-1]
+    dped_dNion = state.dsp_Nion[lat, lon, :-
+                                  1] ** (1/2) / state.pedersen_con[lat, lon, :-1]
+    dped_dNneutral = state.dsp_Nneutral[lat, lon, :-
+                                          1] ** (1/2) / state.pedersen_con[lat, lon, :-1]
+    dped_dNe = state.dsp_Ne[lat, lon, :-
+                              1] ** (1/2) / state.pedersen_con[lat, lon, :-1]
 
     fig1 = go.Figure()
 
     # adding the various plots
-    fig1.add_trace(go.Scatter(x=pedersen_rel, y=factors.heights[lat, lon, :-1], name="σPedersen error", mode='lines',
+    fig1.add_trace(go.Scatter(x=pedersen_rel, y=state.heights[lat, lon, :-1], name="σPedersen error", mode='lines',
                               line=dict(shape='spline', color='red')))
-    fig1.add_trace(go.Scatter(x=dped_dB, y=factors.heights[lat, lon, :-1], name="dB", mode='lines',
+    fig1.add_trace(go.Scatter(x=dped_dB, y=state.heights[lat, lon, :-1], name="dB", mode='lines',
                               line=dict(shape='spline', dash='dot', color='red')))
-    fig1.add_trace(go.Scatter(x=dped_dTe, y=factors.heights[lat, lon, :-1], name="dTe", mode='lines',
+    fig1.add_trace(go.Scatter(x=dped_dTe, y=state.heights[lat, lon, :-1], name="dTe", mode='lines',
                               line=dict(shape='spline', dash='dot', color='gold')))
-    fig1.add_trace(go.Scatter(x=dped_dTn, y=factors.heights[lat, lon, :-1], name="dTn", mode='lines',
+    fig1.add_trace(go.Scatter(x=dped_dTn, y=state.heights[lat, lon, :-1], name="dTn", mode='lines',
                               line=dict(shape='spline', dash='dash', color='coral')))
-    fig1.add_trace(go.Scatter(x=dped_dTi, y=factors.heights[lat, lon, :-1], name="dTi", mode='lines',
+    fig1.add_trace(go.Scatter(x=dped_dTi, y=state.heights[lat, lon, :-1], name="dTi", mode='lines',
                               line=dict(shape='spline', dash='dot', color='sienna')))
-    fig1.add_trace(go.Scatter(x=dped_dNion, y=factors.heights[lat, lon, :-1], name="dNion", mode='lines',
+    fig1.add_trace(go.Scatter(x=dped_dNion, y=state.heights[lat, lon, :-1], name="dNion", mode='lines',
                               line=dict(shape='spline', dash='dash', color='brown')))
-    fig1.add_trace(go.Scatter(x=dped_dNneutral, y=factors.heights[lat, lon, :-1], name="dNn", mode='lines',
+    fig1.add_trace(go.Scatter(x=dped_dNneutral, y=state.heights[lat, lon, :-1], name="dNn", mode='lines',
                               line=dict(shape='spline', dash='dot', color='tan')))
-    fig1.add_trace(go.Scatter(x=dped_dNe, y=factors.heights[lat, lon, :-1], name="dNe", mode='lines',
+    fig1.add_trace(go.Scatter(x=dped_dNe, y=state.heights[lat, lon, :-1], name="dNe", mode='lines',
                               line=dict(shape='spline', dash='dash', color='peru')))
 
     # updating the layout of the figure
     fig1.update_layout(xaxis_type="linear", xaxis=dict(range=[0, 1]), yaxis=dict(range=[min_alt, max_alt],
                        tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 5)),
                        xaxis_title="", yaxis_title="$Altitude \ (km)$", width=950, height=650,
-                       title={'text': 'Pedersen Conductivity Error Contributions' + factors.title, 'y': 0.9, 'x': 0.5,
+                       title={'text': 'Pedersen Conductivity Error Contributions' + state.title, 'y': 0.9, 'x': 0.5,
                               'xanchor': 'center', 'yanchor': 'top'})
 
     fig1.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -1049,47 +1100,47 @@ def plot_conductivities_contr(lat_value, lon_value, min_alt, max_alt):
 
     
     # Hall Conductivity
-    hall_rel = factors.hall_con_error[lat, lon,
-                                      :-1] / factors.hall_con[lat, lon, :-1]
-    dhall_dB = factors.dsh_B[lat, lon, :-
-                             1] ** (1/2) / factors.hall_con[lat, lon, :-1]
-    dhall_dTe = factors.dsh_Te[lat, lon, :-
-                               1] ** (1/2) / factors.hall_con[lat, lon, :-1]
-    dhall_dTi = factors.dsh_Ti[lat, lon, :-
-                               1] ** (1/2) / factors.hall_con[lat, lon, :-1]
-    dhall_dTn = factors.dsh_Tn[lat, lon, :-
-                               1] ** (1/2) / factors.hall_con[lat, lon, :-1]
-    dhall_Nion = factors.dsh_Nion[lat, lon, :-
-                                  1] ** (1/2) / factors.hall_con[lat, lon, :-1]
-    dhall_dNe = factors.dsh_Ne[lat, lon, :-
-                               1] ** (1/2) / factors.hall_con[lat, lon, :-1]
-    dhall_dNneutral = factors.dsh_Nneutral[lat, lon,
-                                           :-1] ** (1/2) / factors.hall_con[lat, lon, :-1]
+    hall_rel = state.hall_con_error[lat, lon,
+                                      :-1] / state.hall_con[lat, lon, :-1]
+    dhall_dB = state.dsh_B[lat, lon, :-
+                             1] ** (1/2) / state.hall_con[lat, lon, :-1]
+    dhall_dTe = state.dsh_Te[lat, lon, :-
+                               1] ** (1/2) / state.hall_con[lat, lon, :-1]
+    dhall_dTi = state.dsh_Ti[lat, lon, :-
+                               1] ** (1/2) / state.hall_con[lat, lon, :-1]
+    dhall_dTn = state.dsh_Tn[lat, lon, :-
+                               1] ** (1/2) / state.hall_con[lat, lon, :-1]
+    dhall_Nion = state.dsh_Nion[lat, lon, :-
+                                  1] ** (1/2) / state.hall_con[lat, lon, :-1]
+    dhall_dNe = state.dsh_Ne[lat, lon, :-
+                               1] ** (1/2) / state.hall_con[lat, lon, :-1]
+    dhall_dNneutral = state.dsh_Nneutral[lat, lon,
+                                           :-1] ** (1/2) / state.hall_con[lat, lon, :-1]
 
     fig2 = go.Figure()
 
-    fig2.add_trace(go.Scatter(x=hall_rel, y=factors.heights[lat, lon, :-1],
+    fig2.add_trace(go.Scatter(x=hall_rel, y=state.heights[lat, lon, :-1],
                    name="σHall error", mode='lines', line=dict(shape='spline', color='blue')))
-    fig2.add_trace(go.Scatter(x=dhall_dB, y=factors.heights[lat, lon, :-1], name="dB", mode='lines',
+    fig2.add_trace(go.Scatter(x=dhall_dB, y=state.heights[lat, lon, :-1], name="dB", mode='lines',
                               line=dict(shape='spline', dash="dot", color='blue')))
-    fig2.add_trace(go.Scatter(x=dhall_dTe, y=factors.heights[lat, lon, :-1], name="dTe", mode='lines',
+    fig2.add_trace(go.Scatter(x=dhall_dTe, y=state.heights[lat, lon, :-1], name="dTe", mode='lines',
                               line=dict(shape='spline', dash="dash", color='blue')))
-    fig2.add_trace(go.Scatter(x=dhall_dTi, y=factors.heights[lat, lon, :-1], name="dTi", mode='lines',
+    fig2.add_trace(go.Scatter(x=dhall_dTi, y=state.heights[lat, lon, :-1], name="dTi", mode='lines',
                               line=dict(shape='spline', dash="dot", color='dodgerblue')))
-    fig2.add_trace(go.Scatter(x=dhall_dTn, y=factors.heights[lat, lon, :-1], name="dTn", mode='lines',
+    fig2.add_trace(go.Scatter(x=dhall_dTn, y=state.heights[lat, lon, :-1], name="dTn", mode='lines',
                               line=dict(shape='spline', dash="dash", color='dodgerblue')))
-    fig2.add_trace(go.Scatter(x=dhall_Nion, y=factors.heights[lat, lon, :-1], name="dNion", mode='lines',
+    fig2.add_trace(go.Scatter(x=dhall_Nion, y=state.heights[lat, lon, :-1], name="dNion", mode='lines',
                               line=dict(shape='spline', dash="dot", color='deepskyblue')))
-    fig2.add_trace(go.Scatter(x=dhall_dNe, y=factors.heights[lat, lon, :-1], name="dNe", mode='lines',
+    fig2.add_trace(go.Scatter(x=dhall_dNe, y=state.heights[lat, lon, :-1], name="dNe", mode='lines',
                               line=dict(shape='spline', dash="dash", color='deepskyblue')))
-    fig2.add_trace(go.Scatter(x=dhall_dNneutral, y=factors.heights[lat, lon, :-1], name="dNn", mode='lines',
+    fig2.add_trace(go.Scatter(x=dhall_dNneutral, y=state.heights[lat, lon, :-1], name="dNn", mode='lines',
                               line=dict(shape='spline', dash="dash", color='indigo')))
 
     # updating the layout of the figure
     fig2.update_layout(xaxis_type="linear", xaxis=dict(range=[0, 1]), yaxis=dict(range=[min_alt, max_alt],
                        tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 5)),
                        xaxis_title="", yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                       title={'text': 'Hall Conductivity Error Contributions' + factors.title, 'y': 0.9, 'x': 0.5, 'xanchor': 'center', 'yanchor': 'top'})
+                       title={'text': 'Hall Conductivity Error Contributions' + state.title, 'y': 0.9, 'x': 0.5, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig2.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig2.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -1103,7 +1154,7 @@ def plot_conductivities_contr(lat_value, lon_value, min_alt, max_alt):
     
 
 
-def plot_currents_error(lat_value, lon_value, min_alt, max_alt):
+def plot_currents_error(lat_value, lon_value, min_alt, max_alt, state=None):
 
     '''
     This function used to plot Error of Currents calculation
@@ -1113,9 +1164,12 @@ def plot_currents_error(lat_value, lon_value, min_alt, max_alt):
         lon_value (int): Longitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -1126,22 +1180,22 @@ def plot_currents_error(lat_value, lon_value, min_alt, max_alt):
     fig = go.Figure()
 
     # adding the various plots
-    fig.add_trace(go.Scatter(x=factors.J_pedersen_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="Pedersen Current error", mode='lines',
+    fig.add_trace(go.Scatter(x=state.J_pedersen_error[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="Pedersen Current error", mode='lines',
                              line=dict(shape='spline', color='red')))
-    fig.add_trace(go.Scatter(x=factors.J_hall_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="Hall Current error", mode='lines',
+    fig.add_trace(go.Scatter(x=state.J_hall_error[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="Hall Current error", mode='lines',
                              line=dict(shape='spline', color='blue')))
-    fig.add_trace(go.Scatter(x=factors.J_ohmic_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="Ohmic current error", mode='lines',
+    fig.add_trace(go.Scatter(x=state.J_ohmic_error[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="Ohmic current error", mode='lines',
                              line=dict(shape='spline', color='green')))
-    fig.add_trace(go.Scatter(x=factors.J_dens_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="Densities current error", mode='lines',
+    fig.add_trace(go.Scatter(x=state.J_dens_error[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="Densities current error", mode='lines',
                              line=dict(shape='spline', color='black')))
 
-    x_range = max(factors.J_dens_error[lat, lon, :-1])
+    x_range = max(state.J_dens_error[lat, lon, :-1])
 
     # updating the layout of the figure
     fig.update_layout(xaxis_type="linear", xaxis_showexponent='all', xaxis_exponentformat='power', yaxis=dict(range=[min_alt, max_alt],
                       tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 5)), xaxis=dict(range=[0, x_range + x_range/8]),
                       xaxis_title="$(A/m^{2})$", yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                      title={'text': 'Perpendicular Currents Absolute Error' + factors.title, 'y': 0.9, 'x': 0.51, 'xanchor': 'center', 'yanchor': 'top'})
+                      title={'text': 'Perpendicular Currents Absolute Error' + state.title, 'y': 0.9, 'x': 0.51, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -1155,7 +1209,7 @@ def plot_currents_error(lat_value, lon_value, min_alt, max_alt):
     
 
 
-def plot_currents_plus_error(lat_value, lon_value, min_alt, max_alt):
+def plot_currents_plus_error(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Currents inclunding Error
 
@@ -1164,9 +1218,12 @@ def plot_currents_plus_error(lat_value, lon_value, min_alt, max_alt):
         lon_value (int): Longitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -1177,28 +1234,28 @@ def plot_currents_plus_error(lat_value, lon_value, min_alt, max_alt):
     fig = go.Figure()
 
     # adding the various plots
-    fig.add_trace(go.Scatter(x=factors.J_pedersen_error[lat, lon, :-1] + factors.J_pedersen[lat, lon, :-1], y=factors.heights[lat, lon, :-1],
+    fig.add_trace(go.Scatter(x=state.J_pedersen_error[lat, lon, :-1] + state.J_pedersen[lat, lon, :-1], y=state.heights[lat, lon, :-1],
                              name="Pedersen Current + error", mode='lines', line=dict(shape='spline', color='red')))
-    fig.add_trace(go.Scatter(x=factors.J_pedersen[lat, lon, :-1] - factors.J_pedersen_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1],
+    fig.add_trace(go.Scatter(x=state.J_pedersen[lat, lon, :-1] - state.J_pedersen_error[lat, lon, :-1], y=state.heights[lat, lon, :-1],
                              name="Pedersen Current - error", mode='lines', line=dict(shape='spline', color='red', dash="dash")))
-    fig.add_trace(go.Scatter(x=factors.J_hall_error[lat, lon, :-1] + factors.J_hall[lat, lon, :-1], y=factors.heights[lat, lon, :-1],
+    fig.add_trace(go.Scatter(x=state.J_hall_error[lat, lon, :-1] + state.J_hall[lat, lon, :-1], y=state.heights[lat, lon, :-1],
                              name="Hall Current + error", mode='lines', line=dict(shape='spline', color='blue')))
-    fig.add_trace(go.Scatter(x=factors.J_hall[lat, lon, :-1] - factors.J_hall_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1],
+    fig.add_trace(go.Scatter(x=state.J_hall[lat, lon, :-1] - state.J_hall_error[lat, lon, :-1], y=state.heights[lat, lon, :-1],
                              name="Hall Current - error", mode='lines', line=dict(shape='spline', color='blue', dash="dash")))
-    fig.add_trace(go.Scatter(x=factors.J_ohmic_error[lat, lon, :-1] + factors.J_ohmic[lat, lon, :-1], y=factors.heights[lat, lon, :-1],
+    fig.add_trace(go.Scatter(x=state.J_ohmic_error[lat, lon, :-1] + state.J_ohmic[lat, lon, :-1], y=state.heights[lat, lon, :-1],
                              name="Ohmic current + error", mode='lines', line=dict(shape='spline', color='green')))
-    fig.add_trace(go.Scatter(x=factors.J_ohmic[lat, lon, :-1] - factors.J_ohmic_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1],
+    fig.add_trace(go.Scatter(x=state.J_ohmic[lat, lon, :-1] - state.J_ohmic_error[lat, lon, :-1], y=state.heights[lat, lon, :-1],
                              name="Ohmic current - error", mode='lines', line=dict(shape='spline', color='green', dash="dash")))
-    fig.add_trace(go.Scatter(x=factors.J_dens_error[lat, lon, :-1] + factors.J_dens[lat, lon, :-1], y=factors.heights[lat, lon, :-1],
+    fig.add_trace(go.Scatter(x=state.J_dens_error[lat, lon, :-1] + state.J_dens[lat, lon, :-1], y=state.heights[lat, lon, :-1],
                              name="Densities current + error", mode='lines', line=dict(shape='spline', color='black')))
-    fig.add_trace(go.Scatter(x=factors.J_dens[lat, lon, :-1] - factors.J_dens_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1],
+    fig.add_trace(go.Scatter(x=state.J_dens[lat, lon, :-1] - state.J_dens_error[lat, lon, :-1], y=state.heights[lat, lon, :-1],
                              name="Densities current - error", mode='lines', line=dict(shape='spline', color='black', dash="dash")))
 
     # updating the layout of the figure
     fig.update_layout(xaxis_type="linear", xaxis_showexponent='all', xaxis_exponentformat='power', yaxis=dict(range=[min_alt, max_alt],
                       tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 5)),
                       xaxis_title="$(A/m^{2})$", yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                      title={'text': 'Perpendicular Currents With Error' + factors.title, 'y': 0.9, 'x': 0.49, 'xanchor': 'center', 'yanchor': 'top'})
+                      title={'text': 'Perpendicular Currents With Error' + state.title, 'y': 0.9, 'x': 0.49, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -1210,7 +1267,7 @@ def plot_currents_plus_error(lat_value, lon_value, min_alt, max_alt):
     fig.show()
 
     
-def plot_currents_rel_error(lat_value, lon_value, min_alt, max_alt):
+def plot_currents_rel_error(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Relative Error of Currents calculation
 
@@ -1219,9 +1276,12 @@ def plot_currents_rel_error(lat_value, lon_value, min_alt, max_alt):
         lon_value (int): Longitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -1229,32 +1289,32 @@ def plot_currents_rel_error(lat_value, lon_value, min_alt, max_alt):
     min_alt = min_alt
     max_alt = max_alt
 
-    Jp_rel = factors.J_pedersen_error[lat, lon,
-                                      :-1] / factors.J_pedersen[lat, lon, :-1]
-    Jh_rel = factors.J_hall_error[lat, lon,
-                                  :-1] / factors.J_hall[lat, lon, :-1]
-    Johmic_rel = factors.J_ohmic_error[lat,
-                                       lon, :-1] / factors.J_ohmic[lat, lon, :-1]
-    Jdens_rel = factors.J_dens_error[lat, lon,
-                                     :-1] / factors.J_dens[lat, lon, :-1]
+    Jp_rel = state.J_pedersen_error[lat, lon,
+                                      :-1] / state.J_pedersen[lat, lon, :-1]
+    Jh_rel = state.J_hall_error[lat, lon,
+                                  :-1] / state.J_hall[lat, lon, :-1]
+    Johmic_rel = state.J_ohmic_error[lat,
+                                       lon, :-1] / state.J_ohmic[lat, lon, :-1]
+    Jdens_rel = state.J_dens_error[lat, lon,
+                                     :-1] / state.J_dens[lat, lon, :-1]
 
     fig = go.Figure()
 
     # adding the various plots
-    fig.add_trace(go.Scatter(x=Jp_rel, y=factors.heights[lat, lon, :-1], name="Pedersen Current error", mode='lines',
+    fig.add_trace(go.Scatter(x=Jp_rel, y=state.heights[lat, lon, :-1], name="Pedersen Current error", mode='lines',
                              line=dict(shape='spline', color='red')))
-    fig.add_trace(go.Scatter(x=Jh_rel, y=factors.heights[lat, lon, :-1], name="Hall Current error", mode='lines',
+    fig.add_trace(go.Scatter(x=Jh_rel, y=state.heights[lat, lon, :-1], name="Hall Current error", mode='lines',
                              line=dict(shape='spline', color='blue')))
-    fig.add_trace(go.Scatter(x=Johmic_rel, y=factors.heights[lat, lon, :-1], name="Ohmic current error", mode='lines',
+    fig.add_trace(go.Scatter(x=Johmic_rel, y=state.heights[lat, lon, :-1], name="Ohmic current error", mode='lines',
                              line=dict(shape='spline', color='green')))
-    fig.add_trace(go.Scatter(x=Jdens_rel, y=factors.heights[lat, lon, :-1], name="Densities current error", mode='lines',
+    fig.add_trace(go.Scatter(x=Jdens_rel, y=state.heights[lat, lon, :-1], name="Densities current error", mode='lines',
                              line=dict(shape='spline', color='black')))
 
     # updating the layout of the figure
     fig.update_layout(xaxis_type="linear", xaxis=dict(range=[0, 1]), yaxis=dict(range=[min_alt, max_alt],
                       tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 5)),
                       xaxis_title="", yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                      title={'text': 'Perpendicular Currents Relative Error' + factors.title, 'y': 0.9, 'x': 0.51, 'xanchor': 'center', 'yanchor': 'top'})
+                      title={'text': 'Perpendicular Currents Relative Error' + state.title, 'y': 0.9, 'x': 0.51, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -1267,7 +1327,7 @@ def plot_currents_rel_error(lat_value, lon_value, min_alt, max_alt):
 
     
 
-def plot_currents_contr(lat_value, lon_value, min_alt, max_alt):
+def plot_currents_contr(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot contribution of each variable error to the total Error of Currents calculation
 
@@ -1276,9 +1336,12 @@ def plot_currents_contr(lat_value, lon_value, min_alt, max_alt):
         lon_value (int): Longitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -1287,64 +1350,64 @@ def plot_currents_contr(lat_value, lon_value, min_alt, max_alt):
     max_alt = max_alt
 
     # JOhmic
-    Johmic_rel = factors.J_ohmic_error[lat,
-                                       lon, :-1] / factors.J_ohmic[lat, lon, :-1]
-    dJohm_dB = factors.dJohm_B[lat, lon, :-
-                               1] ** (1/2) / factors.J_ohmic[lat, lon, :-1]
-    dJohm_dE = factors.dJohm_E[lat, lon, :-
-                               1] ** (1/2) / factors.J_ohmic[lat, lon, :-1]
-    dJohm_dUn = factors.dJohm_Un[lat, lon, :-
-                                 1] ** (1/2) / factors.J_ohmic[lat, lon, :-1]
-    dJohm_dsp = factors.dJohm_sp[lat, lon, :-
-                                 1] ** (1/2) / factors.J_ohmic[lat, lon, :-1]
-    dJohm_dsh = factors.dJohm_sh[lat, lon, :-
-                                 1] ** (1/2) / factors.J_ohmic[lat, lon, :-1]
-    dJohm_dTi = factors.dJohm_Ti[lat, lon, :-
-                                 1] ** (1/2) / factors.J_ohmic[lat, lon, :-1]
-    dJohm_dTn = factors.dJohm_Tn[lat, lon, :-
-                                 1] ** (1/2) / factors.J_ohmic[lat, lon, :-1]
-    dJohm_dTe = factors.dJohm_Te[lat, lon, :-
-                                 1] ** (1/2) / factors.J_ohmic[lat, lon, :-1]
-    dJohm_dNe = factors.dJohm_Ne[lat, lon, :-
-                                 1] ** (1/2) / factors.J_ohmic[lat, lon, :-1]
-    dJohm_dNn = factors.dJohm_Nneutral[lat, lon,
-                                       :-1] ** (1/2) / factors.J_ohmic[lat, lon, :-1]
-    dJohm_dNion = factors.dJohm_Nion[lat, lon, :-
-                                     1] ** (1/2) / factors.J_ohmic[lat, lon, :-1]
+    Johmic_rel = state.J_ohmic_error[lat,
+                                       lon, :-1] / state.J_ohmic[lat, lon, :-1]
+    dJohm_dB = state.dJohm_B[lat, lon, :-
+                               1] ** (1/2) / state.J_ohmic[lat, lon, :-1]
+    dJohm_dE = state.dJohm_E[lat, lon, :-
+                               1] ** (1/2) / state.J_ohmic[lat, lon, :-1]
+    dJohm_dUn = state.dJohm_Un[lat, lon, :-
+                                 1] ** (1/2) / state.J_ohmic[lat, lon, :-1]
+    dJohm_dsp = state.dJohm_sp[lat, lon, :-
+                                 1] ** (1/2) / state.J_ohmic[lat, lon, :-1]
+    dJohm_dsh = state.dJohm_sh[lat, lon, :-
+                                 1] ** (1/2) / state.J_ohmic[lat, lon, :-1]
+    dJohm_dTi = state.dJohm_Ti[lat, lon, :-
+                                 1] ** (1/2) / state.J_ohmic[lat, lon, :-1]
+    dJohm_dTn = state.dJohm_Tn[lat, lon, :-
+                                 1] ** (1/2) / state.J_ohmic[lat, lon, :-1]
+    dJohm_dTe = state.dJohm_Te[lat, lon, :-
+                                 1] ** (1/2) / state.J_ohmic[lat, lon, :-1]
+    dJohm_dNe = state.dJohm_Ne[lat, lon, :-
+                                 1] ** (1/2) / state.J_ohmic[lat, lon, :-1]
+    dJohm_dNn = state.dJohm_Nneutral[lat, lon,
+                                       :-1] ** (1/2) / state.J_ohmic[lat, lon, :-1]
+    dJohm_dNion = state.dJohm_Nion[lat, lon, :-
+                                     1] ** (1/2) / state.J_ohmic[lat, lon, :-1]
 
     fig1 = go.Figure()
 
     # adding the various plots
-    fig1.add_trace(go.Scatter(x=Johmic_rel, y=factors.heights[lat, lon, :-1], name="Ohmic current error", mode='lines',
+    fig1.add_trace(go.Scatter(x=Johmic_rel, y=state.heights[lat, lon, :-1], name="Ohmic current error", mode='lines',
                               line=dict(shape='spline', color='green')))
-    fig1.add_trace(go.Scatter(x=dJohm_dB, y=factors.heights[lat, lon, :-1], name="dB", mode='lines',
+    fig1.add_trace(go.Scatter(x=dJohm_dB, y=state.heights[lat, lon, :-1], name="dB", mode='lines',
                               line=dict(shape='spline', dash="dot", color='green')))
-    fig1.add_trace(go.Scatter(x=dJohm_dE, y=factors.heights[lat, lon, :-1], name="dE", mode='lines',
+    fig1.add_trace(go.Scatter(x=dJohm_dE, y=state.heights[lat, lon, :-1], name="dE", mode='lines',
                               line=dict(shape='spline', dash="dot", color='coral')))
-    fig1.add_trace(go.Scatter(x=dJohm_dUn, y=factors.heights[lat, lon, :-1], name="dUn", mode='lines',
+    fig1.add_trace(go.Scatter(x=dJohm_dUn, y=state.heights[lat, lon, :-1], name="dUn", mode='lines',
                               line=dict(shape='spline', dash="dash", color='coral')))
-    fig1.add_trace(go.Scatter(x=dJohm_dsp, y=factors.heights[lat, lon, :-1], name="dσP", mode='lines',
+    fig1.add_trace(go.Scatter(x=dJohm_dsp, y=state.heights[lat, lon, :-1], name="dσP", mode='lines',
                               line=dict(shape='spline', dash="dash", color='sienna')))
-    fig1.add_trace(go.Scatter(x=dJohm_dsh, y=factors.heights[lat, lon, :-1], name="dσH", mode='lines',
+    fig1.add_trace(go.Scatter(x=dJohm_dsh, y=state.heights[lat, lon, :-1], name="dσH", mode='lines',
                               line=dict(shape='spline', dash="dot", color='gold')))
-    fig1.add_trace(go.Scatter(x=dJohm_dTi, y=factors.heights[lat, lon, :-1], name="dTi", mode='lines',
+    fig1.add_trace(go.Scatter(x=dJohm_dTi, y=state.heights[lat, lon, :-1], name="dTi", mode='lines',
                               line=dict(shape='spline', dash="dot", color='orange')))
-    fig1.add_trace(go.Scatter(x=dJohm_dTn, y=factors.heights[lat, lon, :-1], name="dTn", mode='lines',
+    fig1.add_trace(go.Scatter(x=dJohm_dTn, y=state.heights[lat, lon, :-1], name="dTn", mode='lines',
                               line=dict(shape='spline', dash="dash", color='orange')))
-    fig1.add_trace(go.Scatter(x=dJohm_dTe, y=factors.heights[lat, lon, :-1], name="dTe", mode='lines',
+    fig1.add_trace(go.Scatter(x=dJohm_dTe, y=state.heights[lat, lon, :-1], name="dTe", mode='lines',
                               line=dict(shape='spline', dash="dash", color='crimson')))
-    fig1.add_trace(go.Scatter(x=dJohm_dNe, y=factors.heights[lat, lon, :-1], name="dNe", mode='lines',
+    fig1.add_trace(go.Scatter(x=dJohm_dNe, y=state.heights[lat, lon, :-1], name="dNe", mode='lines',
                               line=dict(shape='spline', dash="dot", color='crimson')))
-    fig1.add_trace(go.Scatter(x=dJohm_dNn, y=factors.heights[lat, lon, :-1], name="dNn", mode='lines',
+    fig1.add_trace(go.Scatter(x=dJohm_dNn, y=state.heights[lat, lon, :-1], name="dNn", mode='lines',
                               line=dict(shape='spline', dash="dot", color='mediumblue')))
-    fig1.add_trace(go.Scatter(x=dJohm_dNion, y=factors.heights[lat, lon, :-1], name="dNion", mode='lines',
+    fig1.add_trace(go.Scatter(x=dJohm_dNion, y=state.heights[lat, lon, :-1], name="dNion", mode='lines',
                               line=dict(shape='spline', dash="dash", color='mediumblue')))
 
     # updating the layout of the figure
     fig1.update_layout(xaxis_type="linear", xaxis=dict(range=[0, 1]), yaxis=dict(range=[min_alt, max_alt],
                        tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 5)),
                        xaxis_title="", yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                       title={'text': 'Ohmic Current Contributions' + factors.title, 'y': 0.9, 'x': 0.47, 'xanchor': 'center', 'yanchor': 'top'})
+                       title={'text': 'Ohmic Current Contributions' + state.title, 'y': 0.9, 'x': 0.47, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig1.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig1.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -1357,39 +1420,39 @@ def plot_currents_contr(lat_value, lon_value, min_alt, max_alt):
 
     
     # Jdensities
-    Jdens_rel = factors.J_dens_error[lat, lon,
-                                     :-1] / factors.J_dens[lat, lon, :-1]
-    Jdens_dB = factors.dJd_B[lat, lon, :-
-                             1] ** (1/2) / factors.J_dens[lat, lon, :-1]
-    Jdens_dE = factors.dJd_E[lat, lon, :-
-                             1] ** (1/2) / factors.J_dens[lat, lon, :-1]
-    Jdens_dVi = factors.dJd_Vi[lat, lon, :-
-                               1] ** (1/2) / factors.J_dens[lat, lon, :-1]
-    Jdens_dUn = factors.dJd_Un[lat, lon, :-
-                               1] ** (1/2) / factors.J_dens[lat, lon, :-1]
-    Jdens_dNe = factors.dJd_Ne[lat, lon, :-
-                               1] ** (1/2) / factors.J_dens[lat, lon, :-1]
+    Jdens_rel = state.J_dens_error[lat, lon,
+                                     :-1] / state.J_dens[lat, lon, :-1]
+    Jdens_dB = state.dJd_B[lat, lon, :-
+                             1] ** (1/2) / state.J_dens[lat, lon, :-1]
+    Jdens_dE = state.dJd_E[lat, lon, :-
+                             1] ** (1/2) / state.J_dens[lat, lon, :-1]
+    Jdens_dVi = state.dJd_Vi[lat, lon, :-
+                               1] ** (1/2) / state.J_dens[lat, lon, :-1]
+    Jdens_dUn = state.dJd_Un[lat, lon, :-
+                               1] ** (1/2) / state.J_dens[lat, lon, :-1]
+    Jdens_dNe = state.dJd_Ne[lat, lon, :-
+                               1] ** (1/2) / state.J_dens[lat, lon, :-1]
 
     fig2 = go.Figure()
 
-    fig2.add_trace(go.Scatter(x=Jdens_rel, y=factors.heights[lat, lon, :-1], name="Densities current error", mode='lines',
+    fig2.add_trace(go.Scatter(x=Jdens_rel, y=state.heights[lat, lon, :-1], name="Densities current error", mode='lines',
                               line=dict(shape='spline', color='black')))
-    fig2.add_trace(go.Scatter(x=Jdens_dB, y=factors.heights[lat, lon, :-1], name="dB", mode='lines',
+    fig2.add_trace(go.Scatter(x=Jdens_dB, y=state.heights[lat, lon, :-1], name="dB", mode='lines',
                               line=dict(shape='spline', dash="dot", color='gold')))
-    fig2.add_trace(go.Scatter(x=Jdens_dE, y=factors.heights[lat, lon, :-1], name="dE", mode='lines',
+    fig2.add_trace(go.Scatter(x=Jdens_dE, y=state.heights[lat, lon, :-1], name="dE", mode='lines',
                               line=dict(shape='spline', dash="dash", color='gold')))
-    fig2.add_trace(go.Scatter(x=Jdens_dVi, y=factors.heights[lat, lon, :-1], name="dVi", mode='lines',
+    fig2.add_trace(go.Scatter(x=Jdens_dVi, y=state.heights[lat, lon, :-1], name="dVi", mode='lines',
                               line=dict(shape='spline', dash="dot", color='red')))
-    fig2.add_trace(go.Scatter(x=Jdens_dUn, y=factors.heights[lat, lon, :-1], name="dUn", mode='lines',
+    fig2.add_trace(go.Scatter(x=Jdens_dUn, y=state.heights[lat, lon, :-1], name="dUn", mode='lines',
                               line=dict(shape='spline', dash="dash", color='red')))
-    fig2.add_trace(go.Scatter(x=Jdens_dNe, y=factors.heights[lat, lon, :-1], name="dNe", mode='lines',
+    fig2.add_trace(go.Scatter(x=Jdens_dNe, y=state.heights[lat, lon, :-1], name="dNe", mode='lines',
                               line=dict(shape='spline', dash="dash", color='coral')))
 
     # updating the layout of the figure
     fig2.update_layout(xaxis_type="linear", xaxis=dict(range=[0, 1]), yaxis=dict(range=[min_alt, max_alt],
                        tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 5)),
                        xaxis_title="", yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                       title={'text': 'Densities Current Contributions' + factors.title, 'y': 0.9, 'x': 0.48, 'xanchor': 'center', 'yanchor': 'top'})
+                       title={'text': 'Densities Current Contributions' + state.title, 'y': 0.9, 'x': 0.48, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig2.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig2.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -1402,7 +1465,7 @@ def plot_currents_contr(lat_value, lon_value, min_alt, max_alt):
 
     
 
-def plot_csections_error(lat_value, lon_value, min_alt, max_alt):
+def plot_csections_error(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Error of Cross Sections
 
@@ -1411,9 +1474,12 @@ def plot_csections_error(lat_value, lon_value, min_alt, max_alt):
         lon_value (int): Longitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -1424,20 +1490,20 @@ def plot_csections_error(lat_value, lon_value, min_alt, max_alt):
     fig = go.Figure()
 
     # adding the various plots
-    fig.add_trace(go.Scatter(x=factors.C_Op_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="$O^{+}$", mode='lines',
+    fig.add_trace(go.Scatter(x=state.C_Op_error[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="$O^{+}$", mode='lines',
                              line=dict(shape='spline', color='red')))
-    fig.add_trace(go.Scatter(x=factors.C_O2p_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="$O_{2}^{+}$", mode='lines',
+    fig.add_trace(go.Scatter(x=state.C_O2p_error[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="$O_{2}^{+}$", mode='lines',
                              line=dict(shape='spline', color='blue')))
-    fig.add_trace(go.Scatter(x=factors.C_NOp_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="$NO^{+}$", mode='lines',
+    fig.add_trace(go.Scatter(x=state.C_NOp_error[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="$NO^{+}$", mode='lines',
                              line=dict(shape='spline', color='green')))
-    fig.add_trace(go.Scatter(x=factors.C_ion_error[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="$Avg$", mode='lines',
+    fig.add_trace(go.Scatter(x=state.C_ion_error[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="$Avg$", mode='lines',
                              line=dict(shape='spline', color='black')))
 
     # updating the layout of the figure
     fig.update_layout(xaxis_type="linear", xaxis_showexponent='all', xaxis_exponentformat='power', yaxis=dict(range=[min_alt, max_alt],
-                      tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 5)), xaxis=dict(range=[0, max(factors.C_ionC_Op_error[lat, lon, :-1])]),
+                      tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 5)), xaxis=dict(range=[0, max(state.C_ionC_Op_error[lat, lon, :-1])]),
                       xaxis_title="$(m^{2})$", yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                      title={'text': 'Cross Sections Absolute Error' + factors.title, 'y': 0.9, 'x': 0.48, 'xanchor': 'center', 'yanchor': 'top'})
+                      title={'text': 'Cross Sections Absolute Error' + state.title, 'y': 0.9, 'x': 0.48, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -1451,7 +1517,7 @@ def plot_csections_error(lat_value, lon_value, min_alt, max_alt):
     
 
 
-def plot_csections_plus_error(lat_value, lon_value, min_alt, max_alt):
+def plot_csections_plus_error(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Cross Sections including Error
 
@@ -1460,9 +1526,12 @@ def plot_csections_plus_error(lat_value, lon_value, min_alt, max_alt):
         lon_value (int): Longitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -1473,28 +1542,28 @@ def plot_csections_plus_error(lat_value, lon_value, min_alt, max_alt):
     fig = go.Figure()
 
     # adding the various plots
-    fig.add_trace(go.Scatter(x=factors.C_Op_error[lat, lon, :-1] + factors.C_Op[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="O{+} + error",
+    fig.add_trace(go.Scatter(x=state.C_Op_error[lat, lon, :-1] + state.C_Op[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="O{+} + error",
                              mode='lines', line=dict(shape='spline', color='red')))
-    fig.add_trace(go.Scatter(x=- factors.C_Op_error[lat, lon, :-1] + factors.C_Op[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="O{+} - error",
+    fig.add_trace(go.Scatter(x=- state.C_Op_error[lat, lon, :-1] + state.C_Op[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="O{+} - error",
                              mode='lines', line=dict(shape='spline', color='red', dash="dash")))
-    fig.add_trace(go.Scatter(x=factors.C_O2p_error[lat, lon, :-1] + factors.C_O2p[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="O2{+} + error",
+    fig.add_trace(go.Scatter(x=state.C_O2p_error[lat, lon, :-1] + state.C_O2p[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="O2{+} + error",
                              mode='lines', line=dict(shape='spline', color='blue')))
-    fig.add_trace(go.Scatter(x=- factors.C_O2p_error[lat, lon, :-1] + factors.C_O2p[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="O2{+} - error",
+    fig.add_trace(go.Scatter(x=- state.C_O2p_error[lat, lon, :-1] + state.C_O2p[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="O2{+} - error",
                              mode='lines', line=dict(shape='spline', color='blue', dash="dash")))
-    fig.add_trace(go.Scatter(x=factors.C_NOp_error[lat, lon, :-1] + factors.C_NOp[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="NO{+} + error",
+    fig.add_trace(go.Scatter(x=state.C_NOp_error[lat, lon, :-1] + state.C_NOp[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="NO{+} + error",
                              mode='lines', line=dict(shape='spline', color='green')))
-    fig.add_trace(go.Scatter(x=- factors.C_NOp_error[lat, lon, :-1] + factors.C_NOp[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="NO{+} - error",
+    fig.add_trace(go.Scatter(x=- state.C_NOp_error[lat, lon, :-1] + state.C_NOp[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="NO{+} - error",
                              mode='lines', line=dict(shape='spline', color='green', dash="dash")))
-    fig.add_trace(go.Scatter(x=factors.C_ion_error[lat, lon, :-1] + factors.C_ion[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="Avg + error",
+    fig.add_trace(go.Scatter(x=state.C_ion_error[lat, lon, :-1] + state.C_ion[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="Avg + error",
                              mode='lines', line=dict(shape='spline', color='black')))
-    fig.add_trace(go.Scatter(x=- factors.C_ion_error[lat, lon, :-1] + factors.C_ion[lat, lon, :-1], y=factors.heights[lat, lon, :-1], name="Avg - error",
+    fig.add_trace(go.Scatter(x=- state.C_ion_error[lat, lon, :-1] + state.C_ion[lat, lon, :-1], y=state.heights[lat, lon, :-1], name="Avg - error",
                              mode='lines', line=dict(shape='spline', color='black', dash="dash")))
 
     # updating the layout of the figure
     fig.update_layout(xaxis_type="linear", xaxis_showexponent='all', xaxis_exponentformat='power', yaxis=dict(range=[min_alt, max_alt],
                       tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 5)),
                       xaxis_title="$(m^{2})$", yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                      title={'text': 'Cross Sections With Error' + factors.title, 'y': 0.9, 'x': 0.46, 'xanchor': 'center', 'yanchor': 'top'})
+                      title={'text': 'Cross Sections With Error' + state.title, 'y': 0.9, 'x': 0.46, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -1507,7 +1576,7 @@ def plot_csections_plus_error(lat_value, lon_value, min_alt, max_alt):
 
     
 
-def plot_csections_rel_error(lat_value, lon_value, min_alt, max_alt):
+def plot_csections_rel_error(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Cross Section Relative Error
 
@@ -1516,9 +1585,12 @@ def plot_csections_rel_error(lat_value, lon_value, min_alt, max_alt):
         lon_value (int): Longitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -1526,31 +1598,31 @@ def plot_csections_rel_error(lat_value, lon_value, min_alt, max_alt):
     min_alt = min_alt
     max_alt = max_alt
 
-    COp_rel = factors.C_Op_error[lat, lon, :-1] / factors.C_Op[lat, lon, :-1]
-    CO2p_rel = factors.C_O2p_error[lat, lon,
-                                   :-1] / factors.C_O2p[lat, lon, :-1]
-    CNOp_rel = factors.C_NOp_error[lat, lon,
-                                   :-1] / factors.C_NOp[lat, lon, :-1]
-    Cion_rel = factors.C_ion_error[lat, lon,
-                                   :-1] / factors.C_ion[lat, lon, :-1]
+    COp_rel = state.C_Op_error[lat, lon, :-1] / state.C_Op[lat, lon, :-1]
+    CO2p_rel = state.C_O2p_error[lat, lon,
+                                   :-1] / state.C_O2p[lat, lon, :-1]
+    CNOp_rel = state.C_NOp_error[lat, lon,
+                                   :-1] / state.C_NOp[lat, lon, :-1]
+    Cion_rel = state.C_ion_error[lat, lon,
+                                   :-1] / state.C_ion[lat, lon, :-1]
 
     fig = go.Figure()
 
     # adding the various plots
-    fig.add_trace(go.Scatter(x=COp_rel, y=factors.heights[lat, lon, :-1], name="$O^{+}$", mode='lines',
+    fig.add_trace(go.Scatter(x=COp_rel, y=state.heights[lat, lon, :-1], name="$O^{+}$", mode='lines',
                              line=dict(shape='spline', color='red')))
-    fig.add_trace(go.Scatter(x=CO2p_rel, y=factors.heights[lat, lon, :-1], name="$O_{2}^{+}$", mode='lines',
+    fig.add_trace(go.Scatter(x=CO2p_rel, y=state.heights[lat, lon, :-1], name="$O_{2}^{+}$", mode='lines',
                              line=dict(shape='spline', color='blue')))
-    fig.add_trace(go.Scatter(x=CNOp_rel, y=factors.heights[lat, lon, :-1], name="$NO^{+}$", mode='lines',
+    fig.add_trace(go.Scatter(x=CNOp_rel, y=state.heights[lat, lon, :-1], name="$NO^{+}$", mode='lines',
                              line=dict(shape='spline', color='green')))
-    fig.add_trace(go.Scatter(x=Cion_rel, y=factors.heights[lat, lon, :-1], name="$Avg$", mode='lines',
+    fig.add_trace(go.Scatter(x=Cion_rel, y=state.heights[lat, lon, :-1], name="$Avg$", mode='lines',
                              line=dict(shape='spline', color='black')))
 
     # updating the layout of the figure
     fig.update_layout(xaxis_type="linear", yaxis=dict(range=[min_alt, max_alt],
                       tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 5)),
                       xaxis_title="", yaxis_title="$Altitude \ (km)$", width=900, height=650,
-                      title={'text': 'Cross Sections Relative Error' + factors.title, 'y': 0.9, 'x': 0.48, 'xanchor': 'center', 'yanchor': 'top'})
+                      title={'text': 'Cross Sections Relative Error' + state.title, 'y': 0.9, 'x': 0.48, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -1564,7 +1636,7 @@ def plot_csections_rel_error(lat_value, lon_value, min_alt, max_alt):
     
 
 
-def plot_csections_contr(lat_value, lon_value, min_alt, max_alt):
+def plot_csections_contr(lat_value, lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot contibution of each variable Error to the total Error fo Cross Section
 
@@ -1573,9 +1645,12 @@ def plot_csections_contr(lat_value, lon_value, min_alt, max_alt):
         lon_value (int): Longitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lat = lat_value
@@ -1583,36 +1658,36 @@ def plot_csections_contr(lat_value, lon_value, min_alt, max_alt):
     min_alt = min_alt
     max_alt = max_alt
 
-    Cion_rel = factors.C_ion_error[lat, lon,
-                                   :-1] / factors.C_ion[lat, lon, :-1]
-    Cion_dTi = factors.dCion_Ti[lat, lon, :-
-                                1] ** (1/2) / factors.C_ion[lat, lon, :-1]
-    Cion_dTn = factors.dCion_Tn[lat, lon, :-
-                                1] ** (1/2) / factors.C_ion[lat, lon, :-1]
-    Cion_dnu = factors.dCion_nu[lat, lon, :-
-                                1] ** (1/2) / factors.C_ion[lat, lon, :-1]
-    Cion_dNn = factors.dCion_Nneutral[lat, lon,
-                                      :-1] ** (1/2) / factors.C_ion[lat, lon, :-1]
+    Cion_rel = state.C_ion_error[lat, lon,
+                                   :-1] / state.C_ion[lat, lon, :-1]
+    Cion_dTi = state.dCion_Ti[lat, lon, :-
+                                1] ** (1/2) / state.C_ion[lat, lon, :-1]
+    Cion_dTn = state.dCion_Tn[lat, lon, :-
+                                1] ** (1/2) / state.C_ion[lat, lon, :-1]
+    Cion_dnu = state.dCion_nu[lat, lon, :-
+                                1] ** (1/2) / state.C_ion[lat, lon, :-1]
+    Cion_dNn = state.dCion_Nneutral[lat, lon,
+                                      :-1] ** (1/2) / state.C_ion[lat, lon, :-1]
 
     fig = go.Figure()
 
     # adding the various plots
-    fig.add_trace(go.Scatter(x=Cion_rel, y=factors.heights[lat, lon, :-1], name="Avg Ion Csection error", mode='lines',
+    fig.add_trace(go.Scatter(x=Cion_rel, y=state.heights[lat, lon, :-1], name="Avg Ion Csection error", mode='lines',
                              line=dict(shape='spline', color='red')))
-    fig.add_trace(go.Scatter(x=Cion_dTi, y=factors.heights[lat, lon, :-1], name="dTi", mode='lines',
+    fig.add_trace(go.Scatter(x=Cion_dTi, y=state.heights[lat, lon, :-1], name="dTi", mode='lines',
                              line=dict(shape='spline', dash="dot", color='blue')))
-    fig.add_trace(go.Scatter(x=Cion_dTn, y=factors.heights[lat, lon, :-1], name="dTn", mode='lines',
+    fig.add_trace(go.Scatter(x=Cion_dTn, y=state.heights[lat, lon, :-1], name="dTn", mode='lines',
                              line=dict(shape='spline', dash="dash", color='green')))
-    fig.add_trace(go.Scatter(x=Cion_dnu, y=factors.heights[lat, lon, :-1], name="dν", mode='lines',
+    fig.add_trace(go.Scatter(x=Cion_dnu, y=state.heights[lat, lon, :-1], name="dν", mode='lines',
                              line=dict(shape='spline', dash="dot", color='green')))
-    fig.add_trace(go.Scatter(x=Cion_dNn, y=factors.heights[lat, lon, :-1], name="dNn", mode='lines',
+    fig.add_trace(go.Scatter(x=Cion_dNn, y=state.heights[lat, lon, :-1], name="dNn", mode='lines',
                              line=dict(shape='spline', dash="dash", color='blue')))
 
     # updating the layout of the figure
     fig.update_layout(xaxis_type="linear", yaxis=dict(range=[min_alt, max_alt],
                       tickmode='array', tickvals=np.arange(min_alt, max_alt + 5, 5)),
                       xaxis_title="", yaxis_title="$Altitude \ (km)$", width=950, height=650,
-                      title={'text': 'Average Ion Csection Error Contributions' + factors.title, 'y': 0.9, 'x': 0.49, 'xanchor': 'center', 'yanchor': 'top'})
+                      title={'text': 'Average Ion Csection Error Contributions' + state.title, 'y': 0.9, 'x': 0.49, 'xanchor': 'center', 'yanchor': 'top'})
 
     fig.update_xaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
     fig.update_yaxes(showgrid=True, gridwidth=0.5, gridcolor='grey')
@@ -1627,16 +1702,19 @@ def plot_csections_contr(lat_value, lon_value, min_alt, max_alt):
 
 
 # ############################### Lat-Lon Map Profile Plots ###############################
-def mapll_heating_rates_plot(pressure_level, night_shade):
+def mapll_heating_rates_plot(pressure_level, night_shade, state=None):
     '''
     This function used to plot Heating Rates over the Earth's map
 
     Args:
         pressure_value (int): Pressure level as index of TIEGCM file 
         night_shade (bool): to indicate night time in terms of Local Time
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lev = pressure_level
@@ -1650,10 +1728,10 @@ def mapll_heating_rates_plot(pressure_level, night_shade):
     m1.drawcoastlines()
 
     sc1 = m1.imshow(
-        factors.Joule_Heating[:, :, lev], cmap=cm.batlow, interpolation='bicubic')
+        state.Joule_Heating[:, :, lev], cmap=cm.batlow, interpolation='bicubic')
 
     if night_shade:
-        m1.nightshade(factors.title, alpha=0.3)
+        m1.nightshade(state.title, alpha=0.3)
 
     m1.drawparallels(np.arange(-90., 91., 5.))
     m1.drawmeridians(np.arange(-180., 181., 10.))
@@ -1663,14 +1741,14 @@ def mapll_heating_rates_plot(pressure_level, night_shade):
     plt.xlabel('$Longitude \ (deg)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Joule Heating' + factors.title)
+    plt.title('Joule Heating' + state.title)
 
     divider = make_axes_locatable(ax1)
     cax1 = divider.append_axes("right", size="5%", pad=0.2, aspect=15)
     cbar = plt.colorbar(sc1, cax=cax1)
     cbar.set_label(label='$(W/m^{3})$', size='large',
                    weight='bold', rotation=270, labelpad=30)
-    name = 'Joule_Heating_'+factors.pngNameMap
+    name = 'Joule_Heating_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
     
 
@@ -1683,10 +1761,10 @@ def mapll_heating_rates_plot(pressure_level, night_shade):
     m2.drawcoastlines()
 
     sc2 = m2.imshow(
-        factors.Ohmic_Heating[:, :, lev], cmap=cm.batlow, interpolation='bicubic')
+        state.Ohmic_Heating[:, :, lev], cmap=cm.batlow, interpolation='bicubic')
 
     if night_shade:
-        m2.nightshade(factors.title, alpha=0.3)
+        m2.nightshade(state.title, alpha=0.3)
 
     m2.drawparallels(np.arange(-90., 91., 5.))
     m2.drawmeridians(np.arange(-180., 181., 10.))
@@ -1696,14 +1774,14 @@ def mapll_heating_rates_plot(pressure_level, night_shade):
     plt.xlabel('$Longitude \ (deg)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Ohmic Heating' + factors.title)
+    plt.title('Ohmic Heating' + state.title)
 
     divider = make_axes_locatable(ax2)
     cax2 = divider.append_axes("right", size="5%", pad=0.2, aspect=15)
     cbar = plt.colorbar(sc2, cax=cax2)
     cbar.set_label(label='$(W/m^{3})$', size='large',
                    weight='bold', rotation=270, labelpad=30)
-    name = 'Ohmic_Heating_'+factors.pngNameMap
+    name = 'Ohmic_Heating_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
     
 
@@ -1716,10 +1794,10 @@ def mapll_heating_rates_plot(pressure_level, night_shade):
     m3.drawcoastlines()
 
     sc3 = m3.imshow(
-        factors.Frictional_Heating[:, :, lev], cmap=cm.batlow, interpolation='bicubic')
+        state.Frictional_Heating[:, :, lev], cmap=cm.batlow, interpolation='bicubic')
 
     if night_shade:
-        m3.nightshade(factors.title, alpha=0.3)
+        m3.nightshade(state.title, alpha=0.3)
 
     m3.drawparallels(np.arange(-90., 91., 5.))
     m3.drawmeridians(np.arange(-180., 181., 10.))
@@ -1729,28 +1807,31 @@ def mapll_heating_rates_plot(pressure_level, night_shade):
     plt.xlabel('$Longitude \ (deg)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Frictional Heating' + factors.title)
+    plt.title('Frictional Heating' + state.title)
 
     divider = make_axes_locatable(ax3)
     cax3 = divider.append_axes("right", size="5%", pad=0.2, aspect=15)
     cbar = plt.colorbar(sc3, cax=cax3)
     cbar.set_label(label='$(W/m^{3})$', size='large',
                    weight='bold', rotation=270, labelpad=30)
-    name = 'Frictional_Heating_'+factors.pngNameMap
+    name = 'Frictional_Heating_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
     plt.show()
 
 
-def mapll_collisions_plot(pressure_level, night_shade):
+def mapll_collisions_plot(pressure_level, night_shade, state=None):
     '''
     This function used to plot Collision Frequencies over the Earth's map
 
     Args:
         pressure_value (int): Pressure level as index of TIEGCM file 
         night_shade (bool): to indicate night time in terms of Local Time
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lev = pressure_level
@@ -1763,11 +1844,11 @@ def mapll_collisions_plot(pressure_level, night_shade):
                  llcrnrlon=-180, urcrnrlon=180, resolution='c')
     m1.drawcoastlines()
 
-    sc1 = m1.imshow((factors.nu_Op_sum[:, :, lev] + factors.nu_O2p_sum[:, :, lev] +
-                    factors.nu_NOp_sum[:, :, lev]) / 3, cmap=cm.batlow, interpolation='bicubic')
+    sc1 = m1.imshow((state.nu_Op_sum[:, :, lev] + state.nu_O2p_sum[:, :, lev] +
+                    state.nu_NOp_sum[:, :, lev]) / 3, cmap=cm.batlow, interpolation='bicubic')
 
     if night_shade:
-        m1.nightshade(factors.title, alpha=0.3)
+        m1.nightshade(state.title, alpha=0.3)
 
     m1.drawparallels(np.arange(-90., 91., 5.))
     m1.drawmeridians(np.arange(-180., 181., 10.))
@@ -1777,14 +1858,14 @@ def mapll_collisions_plot(pressure_level, night_shade):
     plt.xlabel('$Longitude \ (deg)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Average Ion Collision Frequency' + factors.title)
+    plt.title('Average Ion Collision Frequency' + state.title)
 
     divider = make_axes_locatable(ax1)
     cax1 = divider.append_axes("right", size="5%", pad=0.2, aspect=15)
     cbar = plt.colorbar(sc1, cax=cax1)
     cbar.set_label(label='$(Hz)$', size='large',
                    weight='bold', rotation=270, labelpad=30)
-    name = 'AvG_Ion_Col_Freq_'+factors.pngNameMap
+    name = 'AvG_Ion_Col_Freq_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
     
 
@@ -1796,11 +1877,11 @@ def mapll_collisions_plot(pressure_level, night_shade):
                  llcrnrlon=-180, urcrnrlon=180, resolution='c')
     m2.drawcoastlines()
 
-    sc2 = m2.imshow(factors.nu_e_sum[:, :, lev],
+    sc2 = m2.imshow(state.nu_e_sum[:, :, lev],
                     cmap=cm.batlow, interpolation='bicubic')
 
     if night_shade:
-        m2.nightshade(factors.title, alpha=0.3)
+        m2.nightshade(state.title, alpha=0.3)
 
     m2.drawparallels(np.arange(-90., 91., 5.))
     m2.drawmeridians(np.arange(-180., 181., 10.))
@@ -1810,29 +1891,32 @@ def mapll_collisions_plot(pressure_level, night_shade):
     plt.xlabel('$Longitude \ (deg)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Electron Collision Frequency' + factors.title)
+    plt.title('Electron Collision Frequency' + state.title)
 
     divider = make_axes_locatable(ax2)
     cax2 = divider.append_axes("right", size="5%", pad=0.2, aspect=15)
     cbar = plt.colorbar(sc2, cax=cax2)
     cbar.set_label(label='$(Hz)$', size='large',
                    weight='bold', rotation=270, labelpad=30)
-    name = 'Electron_Col_Freq_'+factors.pngNameMap
+    name = 'Electron_Col_Freq_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     plt.show()
 
 
-def mapll_conductivities_plot(pressure_level, night_shade):
+def mapll_conductivities_plot(pressure_level, night_shade, state=None):
     '''
     This function used to plot Conductivities over the Earth's map
 
     Args:
         pressure_value (int): Pressure level as index of TIEGCM file 
         night_shade (bool): to indicate night time in terms of Local Time
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lev = pressure_level
@@ -1846,10 +1930,10 @@ def mapll_conductivities_plot(pressure_level, night_shade):
     m1.drawcoastlines()
 
     sc1 = m1.imshow(
-        factors.pedersen_con[:, :, lev], cmap=cm.batlow, interpolation='bicubic')
+        state.pedersen_con[:, :, lev], cmap=cm.batlow, interpolation='bicubic')
 
     if night_shade:
-        m1.nightshade(factors.title, alpha=0.3)
+        m1.nightshade(state.title, alpha=0.3)
 
     m1.drawparallels(np.arange(-90., 91., 5.))
     m1.drawmeridians(np.arange(-180., 181., 10.))
@@ -1859,14 +1943,14 @@ def mapll_conductivities_plot(pressure_level, night_shade):
     plt.xlabel('$Longitude \ (deg)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Pedersen Conductivity' + factors.title)
+    plt.title('Pedersen Conductivity' + state.title)
 
     divider = make_axes_locatable(ax1)
     cax1 = divider.append_axes("right", size="5%", pad=0.2, aspect=15)
     cbar = plt.colorbar(sc1, cax=cax1)
     cbar.set_label(label='$(S/m)$', size='large',
                    weight='bold', rotation=270, labelpad=30)
-    name = 'Pedersen_Cond_'+factors.pngNameMap
+    name = 'Pedersen_Cond_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     # Hall Conductivity
@@ -1877,11 +1961,11 @@ def mapll_conductivities_plot(pressure_level, night_shade):
                  llcrnrlon=-180, urcrnrlon=180, resolution='c')
     m2.drawcoastlines()
 
-    sc2 = m2.imshow(factors.hall_con[:, :, lev],
+    sc2 = m2.imshow(state.hall_con[:, :, lev],
                     cmap=cm.batlow, interpolation='bicubic')
 
     if night_shade:
-        m2.nightshade(factors.title, alpha=0.3)
+        m2.nightshade(state.title, alpha=0.3)
 
     m2.drawparallels(np.arange(-90., 91., 5.))
     m2.drawmeridians(np.arange(-180., 181., 10.))
@@ -1891,14 +1975,14 @@ def mapll_conductivities_plot(pressure_level, night_shade):
     plt.xlabel('$Longitude \ (deg)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Hall Conductivity' + factors.title)
+    plt.title('Hall Conductivity' + state.title)
 
     divider = make_axes_locatable(ax2)
     cax2 = divider.append_axes("right", size="5%", pad=0.2, aspect=15)
     cbar = plt.colorbar(sc2, cax=cax2)
     cbar.set_label(label='$(S/m)$', size='large',
                    weight='bold', rotation=270, labelpad=30)
-    name = 'Hall_Cond_'+factors.pngNameMap
+    name = 'Hall_Cond_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     # Parallel Conductivity
@@ -1910,10 +1994,10 @@ def mapll_conductivities_plot(pressure_level, night_shade):
     m3.drawcoastlines()
 
     sc3 = m3.imshow(
-        factors.parallel_con[:, :, lev], cmap=cm.batlow, interpolation='bicubic')
+        state.parallel_con[:, :, lev], cmap=cm.batlow, interpolation='bicubic')
 
     if night_shade:
-        m3.nightshade(factors.title, alpha=0.3)
+        m3.nightshade(state.title, alpha=0.3)
 
     m3.drawparallels(np.arange(-90., 91., 5.))
     m3.drawmeridians(np.arange(-180., 181., 10.))
@@ -1923,29 +2007,32 @@ def mapll_conductivities_plot(pressure_level, night_shade):
     plt.xlabel('$Longitude \ (deg)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Parallel Conductivity' + factors.title)
+    plt.title('Parallel Conductivity' + state.title)
 
     divider = make_axes_locatable(ax3)
     cax3 = divider.append_axes("right", size="5%", pad=0.2, aspect=15)
     cbar = plt.colorbar(sc3, cax=cax3)
     cbar.set_label(label='$(S/m)$', size='large',
                    weight='bold', rotation=270, labelpad=30)
-    name = 'Parallel_Cond_'+factors.pngNameMap
+    name = 'Parallel_Cond_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     plt.show()
 
 
-def mapll_currents_plot(pressure_level, night_shade):
+def mapll_currents_plot(pressure_level, night_shade, state=None):
     '''
     This function used to plot Currents over the Earth's map
 
     Args:
         pressure_value (int): Pressure level as index of TIEGCM file 
         night_shade (bool): to indicate night time in terms of Local Time
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lev = pressure_level
@@ -1958,11 +2045,11 @@ def mapll_currents_plot(pressure_level, night_shade):
                  llcrnrlon=-180, urcrnrlon=180, resolution='c')
     m1.drawcoastlines()
 
-    sc1 = m1.imshow(factors.J_ohmic[:, :, lev],
+    sc1 = m1.imshow(state.J_ohmic[:, :, lev],
                     cmap=cm.batlow, interpolation='bicubic')
 
     if night_shade:
-        m1.nightshade(factors.title, alpha=0.3)
+        m1.nightshade(state.title, alpha=0.3)
 
     m1.drawparallels(np.arange(-90., 91., 5.))
     m1.drawmeridians(np.arange(-180., 181., 10.))
@@ -1972,14 +2059,14 @@ def mapll_currents_plot(pressure_level, night_shade):
     plt.xlabel('$Longitude \ (deg)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Ohmic Current' + factors.title)
+    plt.title('Ohmic Current' + state.title)
 
     divider = make_axes_locatable(ax1)
     cax1 = divider.append_axes("right", size="5%", pad=0.2, aspect=15)
     cbar = plt.colorbar(sc1, cax=cax1)
     cbar.set_label(label='$(A/m^{2})$', size='large',
                    weight='bold', rotation=270, labelpad=30)
-    name = 'Ohmic_Cur_'+factors.pngNameMap
+    name = 'Ohmic_Cur_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     # Densities Current
@@ -1990,11 +2077,11 @@ def mapll_currents_plot(pressure_level, night_shade):
                  llcrnrlon=-180, urcrnrlon=180, resolution='c')
     m2.drawcoastlines()
 
-    sc2 = m2.imshow(factors.J_dens[:, :, lev],
+    sc2 = m2.imshow(state.J_dens[:, :, lev],
                     cmap=cm.batlow, interpolation='bicubic')
 
     if night_shade:
-        m2.nightshade(factors.title, alpha=0.3)
+        m2.nightshade(state.title, alpha=0.3)
 
     m2.drawparallels(np.arange(-90., 91., 5.))
     m2.drawmeridians(np.arange(-180., 181., 10.))
@@ -2004,29 +2091,32 @@ def mapll_currents_plot(pressure_level, night_shade):
     plt.xlabel('$Longitude \ (deg)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Densities Current' + factors.title)
+    plt.title('Densities Current' + state.title)
 
     divider = make_axes_locatable(ax2)
     cax2 = divider.append_axes("right", size="5%", pad=0.2, aspect=15)
     cbar = plt.colorbar(sc2, cax=cax2)
     cbar.set_label(label='$(A/m^{2})$', size='large',
                    weight='bold', rotation=270, labelpad=30)
-    name = 'Densities_Cur_'+factors.pngNameMap
+    name = 'Densities_Cur_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     plt.show()
 
 
-def mapll_csection_plot(pressure_level, night_shade):
+def mapll_csection_plot(pressure_level, night_shade, state=None):
     '''
     This function used to plot Cross Sections over the Earth's map
 
     Args:
         pressure_value (int): Pressure level as index of TIEGCM file 
         night_shade (bool): to indicate night time in terms of Local Time
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lev = pressure_level
@@ -2038,11 +2128,11 @@ def mapll_csection_plot(pressure_level, night_shade):
                  llcrnrlon=-180, urcrnrlon=180, resolution='c')
     m1.drawcoastlines()
 
-    sc1 = m1.imshow(factors.C_ion[:, :, lev],
+    sc1 = m1.imshow(state.C_ion[:, :, lev],
                     cmap=cm.batlow, interpolation='bicubic')
 
     if night_shade:
-        m1.nightshade(factors.title, alpha=0.3)
+        m1.nightshade(state.title, alpha=0.3)
 
     m1.drawparallels(np.arange(-90., 91., 5.))
     m1.drawmeridians(np.arange(-180., 181., 10.))
@@ -2052,29 +2142,32 @@ def mapll_csection_plot(pressure_level, night_shade):
     plt.xlabel('$Longitude \ (deg)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Average Ion Cross Section' + factors.title)
+    plt.title('Average Ion Cross Section' + state.title)
 
     divider = make_axes_locatable(ax1)
     cax1 = divider.append_axes("right", size="5%", pad=0.2, aspect=15)
     cbar = plt.colorbar(sc1, cax=cax1)
     cbar.set_label(label='$(m^{2})$', size='large',
                    weight='bold', rotation=270, labelpad=30)
-    name = 'Avg_Ion_CS_'+factors.pngNameMap
+    name = 'Avg_Ion_CS_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     plt.show()
 
 
-def mapll_heating_rates_rel_error_plot(pressure_level, night_shade):
+def mapll_heating_rates_rel_error_plot(pressure_level, night_shade, state=None):
     '''
     This function used to plot Heating Rates relative Error over the Earth's map
 
     Args:
         pressure_value (int): Pressure level as index of TIEGCM file 
         night_shade (bool): to indicate night time in terms of Local Time
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lev = pressure_level
@@ -2087,11 +2180,11 @@ def mapll_heating_rates_rel_error_plot(pressure_level, night_shade):
                  llcrnrlon=-180, urcrnrlon=180, resolution='c')
     m1.drawcoastlines()
 
-    sc1 = m1.imshow(factors.Joule_Heating_error[:, :, lev] /
-                    factors.Joule_Heating[:, :, lev], cmap=cm.batlow, interpolation='bicubic')
+    sc1 = m1.imshow(state.Joule_Heating_error[:, :, lev] /
+                    state.Joule_Heating[:, :, lev], cmap=cm.batlow, interpolation='bicubic')
 
     if night_shade:
-        m1.nightshade(factors.title, alpha=0.3)
+        m1.nightshade(state.title, alpha=0.3)
 
     m1.drawparallels(np.arange(-90., 91., 5.))
     m1.drawmeridians(np.arange(-180., 181., 10.))
@@ -2101,12 +2194,12 @@ def mapll_heating_rates_rel_error_plot(pressure_level, night_shade):
     plt.xlabel('$Longitude \ (deg)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Joule Heating Relative Error' + factors.title)
+    plt.title('Joule Heating Relative Error' + state.title)
 
     divider = make_axes_locatable(ax1)
     cax1 = divider.append_axes("right", size="5%", pad=0.2, aspect=15)
     plt.colorbar(sc1, cax=cax1)
-    name = 'Joule_Heating_REL_'+factors.pngNameMap
+    name = 'Joule_Heating_REL_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     # Ohmic Heating
@@ -2117,11 +2210,11 @@ def mapll_heating_rates_rel_error_plot(pressure_level, night_shade):
                  llcrnrlon=-180, urcrnrlon=180, resolution='c')
     m2.drawcoastlines()
 
-    sc2 = m2.imshow(factors.Ohmic_Heating_error[:, :, lev] /
-                    factors.Ohmic_Heating[:, :, lev], cmap=cm.batlow, interpolation='bicubic')
+    sc2 = m2.imshow(state.Ohmic_Heating_error[:, :, lev] /
+                    state.Ohmic_Heating[:, :, lev], cmap=cm.batlow, interpolation='bicubic')
 
     if night_shade:
-        m2.nightshade(factors.title, alpha=0.3)
+        m2.nightshade(state.title, alpha=0.3)
 
     m2.drawparallels(np.arange(-90., 91., 5.))
     m2.drawmeridians(np.arange(-180., 181., 10.))
@@ -2131,12 +2224,12 @@ def mapll_heating_rates_rel_error_plot(pressure_level, night_shade):
     plt.xlabel('$Longitude \ (deg)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Ohmic Heating Relative Error' + factors.title)
+    plt.title('Ohmic Heating Relative Error' + state.title)
 
     divider = make_axes_locatable(ax2)
     cax2 = divider.append_axes("right", size="5%", pad=0.2, aspect=15)
     plt.colorbar(sc2, cax=cax2)
-    name = 'Ohmic_Heating_REL_'+factors.pngNameMap
+    name = 'Ohmic_Heating_REL_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     # Frictional Heating
@@ -2147,11 +2240,11 @@ def mapll_heating_rates_rel_error_plot(pressure_level, night_shade):
                  llcrnrlon=-180, urcrnrlon=180, resolution='c')
     m3.drawcoastlines()
 
-    sc3 = m3.imshow(factors.Frictional_Heating_error[:, :, lev] /
-                    factors.Frictional_Heating[:, :, lev], cmap=cm.batlow, interpolation='bicubic')
+    sc3 = m3.imshow(state.Frictional_Heating_error[:, :, lev] /
+                    state.Frictional_Heating[:, :, lev], cmap=cm.batlow, interpolation='bicubic')
 
     if night_shade:
-        m3.nightshade(factors.title, alpha=0.3)
+        m3.nightshade(state.title, alpha=0.3)
 
     m3.drawparallels(np.arange(-90., 91., 5.))
     m3.drawmeridians(np.arange(-180., 181., 10.))
@@ -2161,27 +2254,30 @@ def mapll_heating_rates_rel_error_plot(pressure_level, night_shade):
     plt.xlabel('$Longitude \ (deg)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Frictional Heating Relative Error' + factors.title)
+    plt.title('Frictional Heating Relative Error' + state.title)
 
     divider = make_axes_locatable(ax3)
     cax3 = divider.append_axes("right", size="5%", pad=0.2, aspect=15)
     plt.colorbar(sc3, cax=cax3)
-    name = 'Frictional_Heating_REL_'+factors.pngNameMap
+    name = 'Frictional_Heating_REL_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     plt.show()
 
 
-def mapll_collisions_rel_error_plot(pressure_level, night_shade):
+def mapll_collisions_rel_error_plot(pressure_level, night_shade, state=None):
     '''
     This function used to plot Collsion Frequencies Relative Error over the Earth's map
 
     Args:
         pressure_value (int): Pressure level as index of TIEGCM file 
         night_shade (bool): to indicate night time in terms of Local Time
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lev = pressure_level
@@ -2194,13 +2290,13 @@ def mapll_collisions_rel_error_plot(pressure_level, night_shade):
                  llcrnrlon=-180, urcrnrlon=180, resolution='c')
     m1.drawcoastlines()
 
-    sc1 = m1.imshow(((factors.factors.nuOp_error[:, :, lev] + factors.nuO2p_error[:, :, lev] + factors.nuNOp_error[:, :, lev]) / 3) /
-                    ((factors.nu_Op_sum[:, :, lev] + factors.nu_O2p_sum[:,
-                     :, lev] + factors.nu_NOp_sum[:, :, lev]) / 3),
+    sc1 = m1.imshow(((state.nuOp_error[:, :, lev] + state.nuO2p_error[:, :, lev] + state.nuNOp_error[:, :, lev]) / 3) /
+                    ((state.nu_Op_sum[:, :, lev] + state.nu_O2p_sum[:,
+                     :, lev] + state.nu_NOp_sum[:, :, lev]) / 3),
                     cmap=cm.batlow, interpolation='bicubic')
 
     if night_shade:
-        m1.nightshade(factors.title, alpha=0.3)
+        m1.nightshade(state.title, alpha=0.3)
 
     m1.drawparallels(np.arange(-90., 91., 5.))
     m1.drawmeridians(np.arange(-180., 181., 10.))
@@ -2210,12 +2306,12 @@ def mapll_collisions_rel_error_plot(pressure_level, night_shade):
     plt.xlabel('$Longitude \ (deg)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Average Ion Collision Frequency Relative Error' + factors.title)
+    plt.title('Average Ion Collision Frequency Relative Error' + state.title)
 
     divider = make_axes_locatable(ax1)
     cax1 = divider.append_axes("right", size="5%", pad=0.2, aspect=15)
     plt.colorbar(sc1, cax=cax1)
-    name = 'Avg_Ion_ColFreq_REL_'+factors.pngNameMap
+    name = 'Avg_Ion_ColFreq_REL_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     # Electron Collision Frequency Relative Error
@@ -2226,11 +2322,11 @@ def mapll_collisions_rel_error_plot(pressure_level, night_shade):
                  llcrnrlon=-180, urcrnrlon=180, resolution='c')
     m2.drawcoastlines()
 
-    sc2 = m2.imshow(factors.nue_error[:, :, lev] / factors.nu_e_sum[:,
+    sc2 = m2.imshow(state.nue_error[:, :, lev] / state.nu_e_sum[:,
                     :, lev], cmap=cm.batlow, interpolation='bicubic')
 
     if night_shade:
-        m2.nightshade(factors.title, alpha=0.3)
+        m2.nightshade(state.title, alpha=0.3)
 
     m2.drawparallels(np.arange(-90., 91., 5.))
     m2.drawmeridians(np.arange(-180., 181., 10.))
@@ -2240,27 +2336,30 @@ def mapll_collisions_rel_error_plot(pressure_level, night_shade):
     plt.xlabel('$Longitude \ (deg)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Electron Collision Frequency Relative Error' + factors.title)
+    plt.title('Electron Collision Frequency Relative Error' + state.title)
 
     divider = make_axes_locatable(ax2)
     cax2 = divider.append_axes("right", size="5%", pad=0.2, aspect=15)
     plt.colorbar(sc2, cax=cax2)
-    name = 'Electron_Ion_ColFreq_REL_'+factors.pngNameMap
+    name = 'Electron_Ion_ColFreq_REL_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     plt.show()
 
 
-def mapll_conductivities_rel_error_plot(pressure_level, night_shade):
+def mapll_conductivities_rel_error_plot(pressure_level, night_shade, state=None):
     '''
     This function used to plot Conductivities Relative Error over the Earth's map
 
     Args:
         pressure_value (int): Pressure level as index of TIEGCM file 
         night_shade (bool): to indicate night time in terms of Local Time
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lev = pressure_level
@@ -2273,11 +2372,11 @@ def mapll_conductivities_rel_error_plot(pressure_level, night_shade):
                  llcrnrlon=-180, urcrnrlon=180, resolution='c')
     m1.drawcoastlines()
 
-    sc1 = m1.imshow(factors.pedersen_con_error[:, :, lev] /
-                    factors.pedersen_con[:, :, lev], cmap=cm.batlow, interpolation='bicubic')
+    sc1 = m1.imshow(state.pedersen_con_error[:, :, lev] /
+                    state.pedersen_con[:, :, lev], cmap=cm.batlow, interpolation='bicubic')
 
     if night_shade:
-        m1.nightshade(factors.title, alpha=0.3)
+        m1.nightshade(state.title, alpha=0.3)
 
     m1.drawparallels(np.arange(-90., 91., 5.))
     m1.drawmeridians(np.arange(-180., 181., 10.))
@@ -2287,12 +2386,12 @@ def mapll_conductivities_rel_error_plot(pressure_level, night_shade):
     plt.xlabel('$Longitude \ (deg)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Pedersen Conductivity Relative Error' + factors.title)
+    plt.title('Pedersen Conductivity Relative Error' + state.title)
 
     divider = make_axes_locatable(ax1)
     cax1 = divider.append_axes("right", size="5%", pad=0.2, aspect=15)
     plt.colorbar(sc1, cax=cax1)
-    name = 'Pedersen_Cond_REL_'+factors.pngNameMap
+    name = 'Pedersen_Cond_REL_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     # Hall Conductivity
@@ -2303,11 +2402,11 @@ def mapll_conductivities_rel_error_plot(pressure_level, night_shade):
                  llcrnrlon=-180, urcrnrlon=180, resolution='c')
     m2.drawcoastlines()
 
-    sc2 = m2.imshow(factors.hall_con_error[:, :, lev] /
-                    factors.hall_con[:, :, lev], cmap=cm.batlow, interpolation='bicubic')
+    sc2 = m2.imshow(state.hall_con_error[:, :, lev] /
+                    state.hall_con[:, :, lev], cmap=cm.batlow, interpolation='bicubic')
 
     if night_shade:
-        m2.nightshade(factors.title, alpha=0.3)
+        m2.nightshade(state.title, alpha=0.3)
 
     m2.drawparallels(np.arange(-90., 91., 5.))
     m2.drawmeridians(np.arange(-180., 181., 10.))
@@ -2317,12 +2416,12 @@ def mapll_conductivities_rel_error_plot(pressure_level, night_shade):
     plt.xlabel('$Longitude \ (deg)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Hall Conductivity Relative Error' + factors.title)
+    plt.title('Hall Conductivity Relative Error' + state.title)
 
     divider = make_axes_locatable(ax2)
     cax2 = divider.append_axes("right", size="5%", pad=0.2, aspect=15)
     plt.colorbar(sc2, cax=cax2)
-    name = 'Hall_Cond_REL_'+factors.pngNameMap
+    name = 'Hall_Cond_REL_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     # Parallel Conductivity
@@ -2333,11 +2432,11 @@ def mapll_conductivities_rel_error_plot(pressure_level, night_shade):
                  llcrnrlon=-180, urcrnrlon=180, resolution='c')
     m3.drawcoastlines()
 
-    sc3 = m3.imshow(factors.parallel_con_error[:, :, lev] /
-                    factors.parallel_con[:, :, lev], cmap=cm.batlow, interpolation='bicubic')
+    sc3 = m3.imshow(state.parallel_con_error[:, :, lev] /
+                    state.parallel_con[:, :, lev], cmap=cm.batlow, interpolation='bicubic')
 
     if night_shade:
-        m3.nightshade(factors.title, alpha=0.3)
+        m3.nightshade(state.title, alpha=0.3)
 
     m3.drawparallels(np.arange(-90., 91., 5.))
     m3.drawmeridians(np.arange(-180., 181., 10.))
@@ -2347,27 +2446,30 @@ def mapll_conductivities_rel_error_plot(pressure_level, night_shade):
     plt.xlabel('$Longitude \ (deg)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Parallel Conductivity Relative Error' + factors.title)
+    plt.title('Parallel Conductivity Relative Error' + state.title)
 
     divider = make_axes_locatable(ax3)
     cax3 = divider.append_axes("right", size="5%", pad=0.2, aspect=15)
     plt.colorbar(sc3, cax=cax3)
-    name = 'Parallel_Cond_REL_'+factors.pngNameMap
+    name = 'Parallel_Cond_REL_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     plt.show()
 
 
-def mapll_currents_rel_error_plot(pressure_level, night_shade):
+def mapll_currents_rel_error_plot(pressure_level, night_shade, state=None):
     '''
     This function used to plot Currents Relative Error over the Earth's map
 
     Args:
         pressure_value (int): Pressure level as index of TIEGCM file 
         night_shade (bool): to indicate night time in terms of Local Time
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lev = pressure_level
@@ -2380,11 +2482,11 @@ def mapll_currents_rel_error_plot(pressure_level, night_shade):
                  llcrnrlon=-180, urcrnrlon=180, resolution='c')
     m1.drawcoastlines()
 
-    sc1 = m1.imshow(factors.J_ohmic_error[:, :, lev] / factors.J_ohmic[:,
+    sc1 = m1.imshow(state.J_ohmic_error[:, :, lev] / state.J_ohmic[:,
                     :, lev], cmap=cm.batlow, interpolation='bicubic')
 
     if night_shade:
-        m1.nightshade(factors.title, alpha=0.3)
+        m1.nightshade(state.title, alpha=0.3)
 
     m1.drawparallels(np.arange(-90., 91., 5.))
     m1.drawmeridians(np.arange(-180., 181., 10.))
@@ -2394,12 +2496,12 @@ def mapll_currents_rel_error_plot(pressure_level, night_shade):
     plt.xlabel('$Longitude \ (deg)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Ohmic Current Relative Error' + factors.title)
+    plt.title('Ohmic Current Relative Error' + state.title)
 
     divider = make_axes_locatable(ax1)
     cax1 = divider.append_axes("right", size="5%", pad=0.2, aspect=15)
     plt.colorbar(sc1, cax=cax1)
-    name = 'Ohmic_Cur_REL_'+factors.pngNameMap
+    name = 'Ohmic_Cur_REL_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     # Densities Current
@@ -2410,11 +2512,11 @@ def mapll_currents_rel_error_plot(pressure_level, night_shade):
                  llcrnrlon=-180, urcrnrlon=180, resolution='c')
     m2.drawcoastlines()
 
-    sc2 = m2.imshow(factors.J_dens_error[:, :, lev] / factors.J_dens[:,
+    sc2 = m2.imshow(state.J_dens_error[:, :, lev] / state.J_dens[:,
                     :, lev], cmap=cm.batlow, interpolation='bicubic')
 
     if night_shade:
-        m2.nightshade(factors.title, alpha=0.3)
+        m2.nightshade(state.title, alpha=0.3)
 
     m2.drawparallels(np.arange(-90., 91., 5.))
     m2.drawmeridians(np.arange(-180., 181., 10.))
@@ -2424,27 +2526,30 @@ def mapll_currents_rel_error_plot(pressure_level, night_shade):
     plt.xlabel('$Longitude \ (deg)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Densities Current Relative Error' + factors.title)
+    plt.title('Densities Current Relative Error' + state.title)
 
     divider = make_axes_locatable(ax2)
     cax2 = divider.append_axes("right", size="5%", pad=0.2, aspect=15)
     plt.colorbar(sc2, cax=cax2)
-    name = 'Densities_Cur_REL_'+factors.pngNameMap
+    name = 'Densities_Cur_REL_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     plt.show()
 
 
-def mapll_csection_rel_error_plot(pressure_level, night_shade):
+def mapll_csection_rel_error_plot(pressure_level, night_shade, state=None):
     '''
     This function used to plot Cross Section Relative Error over the Earth's map
 
     Args:
         pressure_value (int): Pressure level as index of TIEGCM file 
         night_shade (bool): to indicate night time in terms of Local Time
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lev = pressure_level
@@ -2456,11 +2561,11 @@ def mapll_csection_rel_error_plot(pressure_level, night_shade):
                  llcrnrlon=-180, urcrnrlon=180, resolution='c')
     m1.drawcoastlines()
 
-    sc1 = m1.imshow(factors.C_ion_error[:, :, lev] / factors.C_ion[:,
+    sc1 = m1.imshow(state.C_ion_error[:, :, lev] / state.C_ion[:,
                     :, lev], cmap=cm.batlow, interpolation='bicubic')
 
     if night_shade:
-        m1.nightshade(factors.title, alpha=0.3)
+        m1.nightshade(state.title, alpha=0.3)
 
     m1.drawparallels(np.arange(-90., 91., 5.))
     m1.drawmeridians(np.arange(-180., 181., 10.))
@@ -2470,19 +2575,19 @@ def mapll_csection_rel_error_plot(pressure_level, night_shade):
     plt.xlabel('$Longitude \ (deg)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Average Ion Cross Section Relative Error' + factors.title)
+    plt.title('Average Ion Cross Section Relative Error' + state.title)
 
     divider = make_axes_locatable(ax1)
     cax1 = divider.append_axes("right", size="5%", pad=0.2, aspect=15)
     plt.colorbar(sc1, cax=cax1)
-    name = 'Avg_Ion_CS_REL_'+factors.pngNameMap
+    name = 'Avg_Ion_CS_REL_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     plt.show()
 
 
 # ####################################### Lat - Alt Profile Plots #######################################
-def mapla_heating_rates_plot(lon_value, min_alt, max_alt):
+def mapla_heating_rates_plot(lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Heating Rates, Lat vs. Alt
 
@@ -2490,9 +2595,12 @@ def mapla_heating_rates_plot(lon_value, min_alt, max_alt):
         lon_value (int): Longtitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lon = lon_value
@@ -2501,8 +2609,8 @@ def mapla_heating_rates_plot(lon_value, min_alt, max_alt):
 
     # Joule Heating
     plt.figure(figsize=(12, 12))
-    cp1 = plt.contourf(factors.heights_la[:-1], factors.glat_in[:],
-                       factors.Joule_Heating[:, lon, :-1], cmap=cm.batlow, interpolation='bicubic')
+    cp1 = plt.contourf(state.heights_la[:-1], state.glat_in[:],
+                       state.Joule_Heating[:, lon, :-1], cmap=cm.batlow, interpolation='bicubic')
 
     plt.xlim(min_alt, max_alt)
     plt.xticks(np.arange(min_alt, max_alt + 10, 10))
@@ -2510,17 +2618,17 @@ def mapla_heating_rates_plot(lon_value, min_alt, max_alt):
     plt.xlabel('~$Altitude \ (km)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Joule Heating' + factors.title)
+    plt.title('Joule Heating' + state.title)
     cbar = plt.colorbar(cp1)
     cbar.set_label(label='$(W/m^{3})$', size='large',
                    weight='bold', rotation=270, labelpad=30)
-    name = 'Joule_Heating_'+factors.pngNameMap
+    name = 'Joule_Heating_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     # Ohmic Heating
     plt.figure(figsize=(12, 12))
-    cp2 = plt.contourf(factors.heights_la[:-1], factors.glat_in[:],
-                       factors.Ohmic_Heating[:, lon, :-1], cmap=cm.batlow, interpolation='bicubic')
+    cp2 = plt.contourf(state.heights_la[:-1], state.glat_in[:],
+                       state.Ohmic_Heating[:, lon, :-1], cmap=cm.batlow, interpolation='bicubic')
 
     plt.xlim(min_alt, max_alt)
     plt.xticks(np.arange(min_alt, max_alt + 10, 10))
@@ -2528,17 +2636,17 @@ def mapla_heating_rates_plot(lon_value, min_alt, max_alt):
     plt.xlabel('~$Altitude \ (km)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Ohmic Heating' + factors.title)
+    plt.title('Ohmic Heating' + state.title)
     cbar = plt.colorbar(cp2)
     cbar.set_label(label='$(W/m^{3})$', size='large',
                    weight='bold', rotation=270, labelpad=30)
-    name = 'Ohmic_Heating_'+factors.pngNameMap
+    name = 'Ohmic_Heating_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     # Frictional Heating
     plt.figure(figsize=(12, 12))
-    cp3 = plt.contourf(factors.heights_la[:-1], factors.glat_in[:],
-                       factors.Frictional_Heating[:, lon, :-1], cmap=cm.batlow, interpolation='bicubic')
+    cp3 = plt.contourf(state.heights_la[:-1], state.glat_in[:],
+                       state.Frictional_Heating[:, lon, :-1], cmap=cm.batlow, interpolation='bicubic')
 
     plt.xlim(min_alt, max_alt)
     plt.xticks(np.arange(min_alt, max_alt + 10, 10))
@@ -2546,17 +2654,17 @@ def mapla_heating_rates_plot(lon_value, min_alt, max_alt):
     plt.xlabel('~$Altitude \ (km)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Frictional Heating' + factors.title)
+    plt.title('Frictional Heating' + state.title)
     cbar = plt.colorbar(cp3)
     cbar.set_label(label='$(W/m^{3})$', size='large',
                    weight='bold', rotation=270, labelpad=30)
-    name = 'Frictional_Heating_'+factors.pngNameMap
+    name = 'Frictional_Heating_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     plt.show()
 
 
-def mapla_collisions_plot(lon_value, min_alt, max_alt):
+def mapla_collisions_plot(lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Collision Frequencies, Lat vs. Alt
 
@@ -2564,9 +2672,12 @@ def mapla_collisions_plot(lon_value, min_alt, max_alt):
         lon_value (int): Longtitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lon = lon_value
@@ -2575,7 +2686,7 @@ def mapla_collisions_plot(lon_value, min_alt, max_alt):
 
     # Ion Average Collision Frequency
     plt.figure(figsize=(12, 12))
-    cp1 = plt.contourf(factors.heights_la[:-1], factors.glat_in[:], (factors.nu_Op_sum[:, lon, :-1] + factors.nu_O2p_sum[:, lon, :-1] + factors.nu_NOp_sum[:, lon, :-1]) / 3,
+    cp1 = plt.contourf(state.heights_la[:-1], state.glat_in[:], (state.nu_Op_sum[:, lon, :-1] + state.nu_O2p_sum[:, lon, :-1] + state.nu_NOp_sum[:, lon, :-1]) / 3,
                        locator=ticker.LogLocator(), norm=LogNorm(), cmap=cm.batlow, interpolation='bicubic')
 
     plt.xlim(min_alt, max_alt)
@@ -2584,16 +2695,16 @@ def mapla_collisions_plot(lon_value, min_alt, max_alt):
     plt.xlabel('~$Altitude \ (km)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Average Ion Collision Frequency' + factors.title)
+    plt.title('Average Ion Collision Frequency' + state.title)
     cbar = plt.colorbar(cp1)
     cbar.set_label(label='$(Hz)$', size='large',
                    weight='bold', rotation=270, labelpad=30)
-    name = 'Avg_Ion_ColFreq_'+factors.pngNameMap
+    name = 'Avg_Ion_ColFreq_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     # Electron Collision Frequency
     plt.figure(figsize=(12, 12))
-    cp2 = plt.contourf(factors.heights_la[:-1], factors.glat_in[:], factors.nu_e_sum[:, lon, :-1], locator=ticker.LogLocator(subs=[1.0, 5.0]),
+    cp2 = plt.contourf(state.heights_la[:-1], state.glat_in[:], state.nu_e_sum[:, lon, :-1], locator=ticker.LogLocator(subs=[1.0, 5.0]),
                        norm=LogNorm(), cmap=cm.batlow, interpolation='bicubic')
 
     plt.xlim(min_alt, max_alt)
@@ -2602,17 +2713,17 @@ def mapla_collisions_plot(lon_value, min_alt, max_alt):
     plt.xlabel('~$Altitude \ (km)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Electron Collision Frequency' + factors.title)
+    plt.title('Electron Collision Frequency' + state.title)
     cbar = plt.colorbar(cp2)
     cbar.set_label(label='$(Hz)$', size='large',
                    weight='bold', rotation=270, labelpad=30)
-    name = 'Electron_Ion_ColFreq_'+factors.pngNameMap
+    name = 'Electron_Ion_ColFreq_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     plt.show()
 
 
-def mapla_conductivities_plot(lon_value, min_alt, max_alt):
+def mapla_conductivities_plot(lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Conductivities, Lat vs. Alt
 
@@ -2620,9 +2731,12 @@ def mapla_conductivities_plot(lon_value, min_alt, max_alt):
         lon_value (int): Longtitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lon = lon_value
@@ -2631,8 +2745,8 @@ def mapla_conductivities_plot(lon_value, min_alt, max_alt):
 
     # Pedersen
     plt.figure(figsize=(12, 12))
-    cp1 = plt.contourf(factors.heights_la[:-1], factors.glat_in[:],
-                       factors.pedersen_con[:, lon, :-1], cmap=cm.batlow, interpolation='bicubic')
+    cp1 = plt.contourf(state.heights_la[:-1], state.glat_in[:],
+                       state.pedersen_con[:, lon, :-1], cmap=cm.batlow, interpolation='bicubic')
 
     plt.xlim(min_alt, max_alt)
     plt.xticks(np.arange(min_alt, max_alt + 10, 10))
@@ -2640,17 +2754,17 @@ def mapla_conductivities_plot(lon_value, min_alt, max_alt):
     plt.xlabel('~$Altitude \ (km)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Pedersen Conductivity' + factors.title)
+    plt.title('Pedersen Conductivity' + state.title)
     cbar = plt.colorbar(cp1)
     cbar.set_label(label='$(S/m)$', size='large',
                    weight='bold', rotation=270, labelpad=30)
-    name = 'Pedersen_Cond_'+factors.pngNameMap
+    name = 'Pedersen_Cond_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     # Hall Conductivity
     plt.figure(figsize=(12, 12))
-    cp2 = plt.contourf(factors.heights_la[:-1], factors.glat_in[:],
-                       factors.hall_con[:, lon, :-1], cmap=cm.batlow, interpolation='bicubic')
+    cp2 = plt.contourf(state.heights_la[:-1], state.glat_in[:],
+                       state.hall_con[:, lon, :-1], cmap=cm.batlow, interpolation='bicubic')
 
     plt.xlim(min_alt, max_alt)
     plt.xticks(np.arange(min_alt, max_alt + 10, 10))
@@ -2658,16 +2772,16 @@ def mapla_conductivities_plot(lon_value, min_alt, max_alt):
     plt.xlabel('~$Altitude \ (km)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Hall Conductivity' + factors.title)
+    plt.title('Hall Conductivity' + state.title)
     cbar = plt.colorbar(cp2)
     cbar.set_label(label='$(S/m)$', size='large',
                    weight='bold', rotation=270, labelpad=30)
-    name = 'Hall_Cond_'+factors.pngNameMap
+    name = 'Hall_Cond_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     # Parallel Conductivity
     plt.figure(figsize=(12, 12))
-    cp3 = plt.contourf(factors.heights_la[:-1], factors.glat_in[:], factors.parallel_con[:, lon, :-1], locator=ticker.LogLocator(subs=[1.0, 5.0]),
+    cp3 = plt.contourf(state.heights_la[:-1], state.glat_in[:], state.parallel_con[:, lon, :-1], locator=ticker.LogLocator(subs=[1.0, 5.0]),
                        norm=LogNorm(), cmap=cm.batlow, interpolation='bicubic')
 
     plt.xlim(min_alt, max_alt)
@@ -2675,17 +2789,17 @@ def mapla_conductivities_plot(lon_value, min_alt, max_alt):
     plt.yticks(np.arange(-85, 85 + 10, 10))
     plt.xlabel('~$Altitude \ (km)$')
     plt.ylabel('$Latitude \ (deg)$')
-    plt.title('Parallel Conductivity' + factors.title)
+    plt.title('Parallel Conductivity' + state.title)
     cbar = plt.colorbar(cp3)
     cbar.set_label(label='$(S/m)$', size='large',
                    weight='bold', rotation=270, labelpad=30)
-    name = 'Parallel_Cond_'+factors.pngNameMap
+    name = 'Parallel_Cond_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     plt.show()
 
 
-def mapla_currents_plot(lon_value, min_alt, max_alt):
+def mapla_currents_plot(lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Currents, Lat vs. Alt
 
@@ -2693,9 +2807,12 @@ def mapla_currents_plot(lon_value, min_alt, max_alt):
         lon_value (int): Longtitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lon = lon_value
@@ -2704,8 +2821,8 @@ def mapla_currents_plot(lon_value, min_alt, max_alt):
 
     # Ohmic Current
     plt.figure(figsize=(12, 12))
-    cp1 = plt.contourf(factors.heights_la[:-1], factors.glat_in[:],
-                       factors.J_ohmic[:, lon, :-1], cmap=cm.batlow, interpolation='bicubic')
+    cp1 = plt.contourf(state.heights_la[:-1], state.glat_in[:],
+                       state.J_ohmic[:, lon, :-1], cmap=cm.batlow, interpolation='bicubic')
 
     plt.xlim(min_alt, max_alt)
     plt.xticks(np.arange(min_alt, max_alt + 10, 10))
@@ -2713,17 +2830,17 @@ def mapla_currents_plot(lon_value, min_alt, max_alt):
     plt.xlabel('~$Altitude \ (km)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Ohmic Current' + factors.title)
+    plt.title('Ohmic Current' + state.title)
     cbar = plt.colorbar(cp1)
     cbar.set_label(label='$(A/m^{2})$', size='large',
                    weight='bold', rotation=270, labelpad=30)
-    name = 'Ohmic_Current_'+factors.pngNameMap
+    name = 'Ohmic_Current_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     # Densities Current
     plt.figure(figsize=(12, 12))
-    cp2 = plt.contourf(factors.heights_la[:-1], factors.glat_in[:],
-                       factors.J_dens[:, lon, :-1], cmap=cm.batlow, interpolation='bicubic')
+    cp2 = plt.contourf(state.heights_la[:-1], state.glat_in[:],
+                       state.J_dens[:, lon, :-1], cmap=cm.batlow, interpolation='bicubic')
 
     plt.xlim(min_alt, max_alt)
     plt.xticks(np.arange(min_alt, max_alt + 10, 10))
@@ -2731,17 +2848,17 @@ def mapla_currents_plot(lon_value, min_alt, max_alt):
     plt.xlabel('~$Altitude \ (km)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Densities Current' + factors.title)
+    plt.title('Densities Current' + state.title)
     cbar = plt.colorbar(cp2)
     cbar.set_label(label='$(A/m^{2})$', size='large',
                    weight='bold', rotation=270, labelpad=30)
-    name = 'Densities_Current_'+factors.pngNameMap
+    name = 'Densities_Current_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     plt.show()
 
 
-def mapla_cross_section_plot(lon_value, min_alt, max_alt):
+def mapla_cross_section_plot(lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Cross Sections, Lat vs. Alt
 
@@ -2749,9 +2866,12 @@ def mapla_cross_section_plot(lon_value, min_alt, max_alt):
         lon_value (int): Longtitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lon = lon_value
@@ -2760,8 +2880,8 @@ def mapla_cross_section_plot(lon_value, min_alt, max_alt):
 
     # Average Ion Cross Section
     plt.figure(figsize=(12, 12))
-    cp1 = plt.contourf(factors.heights_la[:-1], factors.glat_in[:],
-                       factors.C_ion[:, lon, :-1], cmap=cm.batlow, interpolation='bicubic')
+    cp1 = plt.contourf(state.heights_la[:-1], state.glat_in[:],
+                       state.C_ion[:, lon, :-1], cmap=cm.batlow, interpolation='bicubic')
 
     plt.xlim(min_alt, max_alt)
     plt.xticks(np.arange(min_alt, max_alt + 10, 10))
@@ -2769,17 +2889,17 @@ def mapla_cross_section_plot(lon_value, min_alt, max_alt):
     plt.xlabel('~$Altitude \ (km)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Average Ion Cross Section' + factors.title)
+    plt.title('Average Ion Cross Section' + state.title)
     cbar = plt.colorbar(cp1)
     cbar.set_label(label='$(m^{2})$', size='large',
                    weight='bold', rotation=270, labelpad=30)
-    name = 'Avg_Ion_CS_'+factors.pngNameMap
+    name = 'Avg_Ion_CS_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     plt.show()
 
 
-def mapla_heating_rates_rel_error_plot(lon_value, min_alt, max_alt):
+def mapla_heating_rates_rel_error_plot(lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Heating Rates Relative Error, Lat vs. Alt
 
@@ -2787,9 +2907,12 @@ def mapla_heating_rates_rel_error_plot(lon_value, min_alt, max_alt):
         lon_value (int): Longtitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lon = lon_value
@@ -2798,7 +2921,7 @@ def mapla_heating_rates_rel_error_plot(lon_value, min_alt, max_alt):
 
     # Joule Heating
     plt.figure(figsize=(12, 12))
-    cp1 = plt.contourf(factors.heights_la[:-1], factors.glat_in[:], factors.Joule_Heating_error[:, lon, :-1] / factors.Joule_Heating[:, lon, :-1],
+    cp1 = plt.contourf(state.heights_la[:-1], state.glat_in[:], state.Joule_Heating_error[:, lon, :-1] / state.Joule_Heating[:, lon, :-1],
                        locator=ticker.LogLocator(subs=[1.0, 4.0]), norm=LogNorm(), cmap=cm.batlow, interpolation='bicubic')
 
     plt.xlim(min_alt, max_alt)
@@ -2807,14 +2930,14 @@ def mapla_heating_rates_rel_error_plot(lon_value, min_alt, max_alt):
     plt.xlabel('~$Altitude \ (km)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Joule Heating Relative Error' + factors.title)
+    plt.title('Joule Heating Relative Error' + state.title)
     cbar = plt.colorbar(cp1)
-    name = 'Joule_Heating_REL_'+factors.pngNameMap
+    name = 'Joule_Heating_REL_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     # Ohmic Heating
     plt.figure(figsize=(12, 12))
-    cp2 = plt.contourf(factors.heights_la[:-1], factors.glat_in[:], factors.Ohmic_Heating_error[:, lon, :-1] / factors.Ohmic_Heating[:, lon, :-1],
+    cp2 = plt.contourf(state.heights_la[:-1], state.glat_in[:], state.Ohmic_Heating_error[:, lon, :-1] / state.Ohmic_Heating[:, lon, :-1],
                        locator=ticker.LogLocator(subs=[1.0, 2.5, 4.0]), norm=LogNorm(), cmap=cm.batlow, interpolation='bicubic')
 
     plt.xlim(min_alt, max_alt)
@@ -2823,14 +2946,14 @@ def mapla_heating_rates_rel_error_plot(lon_value, min_alt, max_alt):
     plt.xlabel('~$Altitude \ (km)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Ohmic Heating Relative Error' + factors.title)
+    plt.title('Ohmic Heating Relative Error' + state.title)
     cbar = plt.colorbar(cp2)
-    name = 'Ohmic_Heating_REL_'+factors.pngNameMap
+    name = 'Ohmic_Heating_REL_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     # Frictional Heating
     plt.figure(figsize=(12, 12))
-    cp3 = plt.contourf(factors.heights_la[:-1], factors.glat_in[:], factors.Frictional_Heating_error[:, lon, :-1] / factors.Frictional_Heating[:, lon, :-1],
+    cp3 = plt.contourf(state.heights_la[:-1], state.glat_in[:], state.Frictional_Heating_error[:, lon, :-1] / state.Frictional_Heating[:, lon, :-1],
                        locator=ticker.LogLocator(subs=[1.0, 4.5]), norm=LogNorm(), cmap=cm.batlow, interpolation='bicubic')
 
     plt.xlim(min_alt, max_alt)
@@ -2839,15 +2962,15 @@ def mapla_heating_rates_rel_error_plot(lon_value, min_alt, max_alt):
     plt.xlabel('~$Altitude \ (km)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Frictional Heating Relative Error' + factors.title)
+    plt.title('Frictional Heating Relative Error' + state.title)
     cbar = plt.colorbar(cp3)
-    name = 'Frictional_Heating_REL_'+factors.pngNameMap
+    name = 'Frictional_Heating_REL_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     plt.show()
 
 
-def mapla_collisions_rel_error_plot(lon_value, min_alt, max_alt):
+def mapla_collisions_rel_error_plot(lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Collision Frequencies Relative Error, Lat vs. Alt
 
@@ -2855,9 +2978,12 @@ def mapla_collisions_rel_error_plot(lon_value, min_alt, max_alt):
         lon_value (int): Longtitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lon = lon_value
@@ -2866,9 +2992,9 @@ def mapla_collisions_rel_error_plot(lon_value, min_alt, max_alt):
 
     # Ion Average Collision Frequency
     plt.figure(figsize=(12, 12))
-    cp1 = plt.contourf(factors.heights_la[:-1], factors.glat_in[:], ((factors.nuOp_error[:, lon, :-1] + factors.nuO2p_error[:, lon, :-1] + factors.nuNOp_error[:, lon, :-1]) / 3) /
-                       ((factors.nu_Op_sum[:, lon, :-1] + factors.nu_O2p_sum[:,
-                        lon, :-1] + factors.nu_NOp_sum[:, lon, :-1]) / 3),
+    cp1 = plt.contourf(state.heights_la[:-1], state.glat_in[:], ((state.nuOp_error[:, lon, :-1] + state.nuO2p_error[:, lon, :-1] + state.nuNOp_error[:, lon, :-1]) / 3) /
+                       ((state.nu_Op_sum[:, lon, :-1] + state.nu_O2p_sum[:,
+                        lon, :-1] + state.nu_NOp_sum[:, lon, :-1]) / 3),
                        cmap=cm.batlow, interpolation='bicubic')
 
     plt.xlim(min_alt, max_alt)
@@ -2877,15 +3003,15 @@ def mapla_collisions_rel_error_plot(lon_value, min_alt, max_alt):
     plt.xlabel('~$Altitude \ (km)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Average Ion Collision Frequency Relative Error' + factors.title)
+    plt.title('Average Ion Collision Frequency Relative Error' + state.title)
     cbar = plt.colorbar(cp1)
-    name = 'Ang_Ion_ColFreq_REL_'+factors.pngNameMap
+    name = 'Ang_Ion_ColFreq_REL_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     # Electron Collision Frequency
     plt.figure(figsize=(12, 12))
-    cp2 = plt.contourf(factors.heights_la[:-1], factors.glat_in[:], factors.nue_error[:,
-                       lon, :-1] / factors.nu_e_sum[:, lon, :-1], cmap=cm.batlow, interpolation='bicubic')
+    cp2 = plt.contourf(state.heights_la[:-1], state.glat_in[:], state.nue_error[:,
+                       lon, :-1] / state.nu_e_sum[:, lon, :-1], cmap=cm.batlow, interpolation='bicubic')
 
     plt.xlim(min_alt, max_alt)
     plt.xticks(np.arange(min_alt, max_alt + 10, 10))
@@ -2893,15 +3019,15 @@ def mapla_collisions_rel_error_plot(lon_value, min_alt, max_alt):
     plt.xlabel('~$Altitude \ (km)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Electron Collision Frequency Relative Error' + factors.title)
+    plt.title('Electron Collision Frequency Relative Error' + state.title)
     cbar = plt.colorbar(cp2)
-    name = 'Electron_ColFreq_REL_'+factors.pngNameMap
+    name = 'Electron_ColFreq_REL_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     plt.show()
 
 
-def mapla_conductivities_rel_error_plot(lon_value, min_alt, max_alt):
+def mapla_conductivities_rel_error_plot(lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Conductivities Relative Error, Lat vs. Alt
 
@@ -2909,9 +3035,12 @@ def mapla_conductivities_rel_error_plot(lon_value, min_alt, max_alt):
         lon_value (int): Longtitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lon = lon_value
@@ -2920,7 +3049,7 @@ def mapla_conductivities_rel_error_plot(lon_value, min_alt, max_alt):
 
     # Pedersen
     plt.figure(figsize=(12, 12))
-    cp1 = plt.contourf(factors.heights_la[:-1], factors.glat_in[:], factors.pedersen_con_error[:, lon, :-1] / factors.pedersen_con[:, lon, :-1], cmap=cm.batlow,
+    cp1 = plt.contourf(state.heights_la[:-1], state.glat_in[:], state.pedersen_con_error[:, lon, :-1] / state.pedersen_con[:, lon, :-1], cmap=cm.batlow,
                        interpolation='bicubic')
 
     plt.xlim(min_alt, max_alt)
@@ -2929,14 +3058,14 @@ def mapla_conductivities_rel_error_plot(lon_value, min_alt, max_alt):
     plt.xlabel('~$Altitude \ (km)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Pedersen Conductivity Relative Error' + factors.title)
+    plt.title('Pedersen Conductivity Relative Error' + state.title)
     cbar = plt.colorbar(cp1)
-    name = 'Pedersen_Cond_REL_'+factors.pngNameMap
+    name = 'Pedersen_Cond_REL_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     # Hall Conductivity
     plt.figure(figsize=(12, 12))
-    cp2 = plt.contourf(factors.heights_la[:-1], factors.glat_in[:], factors.hall_con_error[:, lon, :-1] / factors.hall_con[:, lon, :-1],
+    cp2 = plt.contourf(state.heights_la[:-1], state.glat_in[:], state.hall_con_error[:, lon, :-1] / state.hall_con[:, lon, :-1],
                        locator=ticker.LogLocator(), norm=LogNorm(), cmap=cm.batlow, interpolation='bicubic')
 
     plt.xlim(min_alt, max_alt)
@@ -2945,14 +3074,14 @@ def mapla_conductivities_rel_error_plot(lon_value, min_alt, max_alt):
     plt.xlabel('~$Altitude \ (km)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Hall Conductivity Relative Error' + factors.title)
+    plt.title('Hall Conductivity Relative Error' + state.title)
     cbar = plt.colorbar(cp2)
-    name = 'Hall_Cond_REL_'+factors.pngNameMap
+    name = 'Hall_Cond_REL_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     # Parallel Conductivity
     plt.figure(figsize=(12, 12))
-    cp3 = plt.contourf(factors.heights_la[:-1], factors.glat_in[:], factors.parallel_con_error[:, lon, :-1] / factors.parallel_con[:, lon, :-1], cmap=cm.batlow,
+    cp3 = plt.contourf(state.heights_la[:-1], state.glat_in[:], state.parallel_con_error[:, lon, :-1] / state.parallel_con[:, lon, :-1], cmap=cm.batlow,
                        interpolation='bicubic')
 
     plt.xlim(min_alt, max_alt)
@@ -2961,15 +3090,15 @@ def mapla_conductivities_rel_error_plot(lon_value, min_alt, max_alt):
     plt.xlabel('~$Altitude \ (km)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Parallel Conductivity Relative Error' + factors.title)
+    plt.title('Parallel Conductivity Relative Error' + state.title)
     cbar = plt.colorbar(cp3)
-    name = 'Parallel_Cond_REL_'+factors.pngNameMap
+    name = 'Parallel_Cond_REL_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     plt.show()
 
 
-def mapla_currents_rel_error_plot(lon_value, min_alt, max_alt):
+def mapla_currents_rel_error_plot(lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Currents Relative Error, Lat vs. Alt
 
@@ -2977,9 +3106,12 @@ def mapla_currents_rel_error_plot(lon_value, min_alt, max_alt):
         lon_value (int): Longtitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lon = lon_value
@@ -2988,7 +3120,7 @@ def mapla_currents_rel_error_plot(lon_value, min_alt, max_alt):
 
     # Ohmic Current
     plt.figure(figsize=(12, 12))
-    cp1 = plt.contourf(factors.heights_la[:-1], factors.glat_in[:], factors.J_ohmic_error[:, lon, :-1] / factors.J_ohmic[:, lon, :-1],
+    cp1 = plt.contourf(state.heights_la[:-1], state.glat_in[:], state.J_ohmic_error[:, lon, :-1] / state.J_ohmic[:, lon, :-1],
                        locator=ticker.LogLocator(subs=[1.0, 2.0, 4.0]), norm=LogNorm(), cmap=cm.batlow, interpolation='bicubic')
 
     plt.xlim(min_alt, max_alt)
@@ -2997,14 +3129,14 @@ def mapla_currents_rel_error_plot(lon_value, min_alt, max_alt):
     plt.xlabel('~$Altitude \ (km)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Ohmic Current Relative Error' + factors.title)
+    plt.title('Ohmic Current Relative Error' + state.title)
     cbar = plt.colorbar(cp1)
-    name = 'Ohmic_Curr_REL_'+factors.pngNameMap
+    name = 'Ohmic_Curr_REL_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     # Densities Current
     plt.figure(figsize=(12, 12))
-    cp2 = plt.contourf(factors.heights_la[:-1], factors.glat_in[:], factors.J_dens_error[:, lon, :-1] / factors.J_dens[:, lon, :-1],
+    cp2 = plt.contourf(state.heights_la[:-1], state.glat_in[:], state.J_dens_error[:, lon, :-1] / state.J_dens[:, lon, :-1],
                        locator=ticker.LogLocator(subs=[1.0, 4.0]), norm=LogNorm(), cmap=cm.batlow, interpolation='bicubic')
 
     plt.xlim(min_alt, max_alt)
@@ -3013,15 +3145,15 @@ def mapla_currents_rel_error_plot(lon_value, min_alt, max_alt):
     plt.xlabel('~$Altitude \ (km)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Densities Current Relative Error' + factors.title)
+    plt.title('Densities Current Relative Error' + state.title)
     cbar = plt.colorbar(cp2)
-    name = 'Densities_Curr_REL_'+factors.pngNameMap
+    name = 'Densities_Curr_REL_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     plt.show()
 
 
-def mapla_cross_section_rel_error_plot(lon_value, min_alt, max_alt):
+def mapla_cross_section_rel_error_plot(lon_value, min_alt, max_alt, state=None):
     '''
     This function used to plot Cross Sections Relative Error, Lat vs. Alt
 
@@ -3029,9 +3161,12 @@ def mapla_cross_section_rel_error_plot(lon_value, min_alt, max_alt):
         lon_value (int): Longtitude as index of TIEGCM file 
         min_alt (float): the minimum altitude to plot
         max_alt (float): the maximum altitude to plot
+        state (LTIState): Structures to plot, as filled by models_input, products and error, if None the global
+                          structures factors.xxx are used
     Returns plot in live window
 
     '''
+    state = factors if state is None else state.grid()
     print("Plotting.....")
 
     lon = lon_value
@@ -3040,7 +3175,7 @@ def mapla_cross_section_rel_error_plot(lon_value, min_alt, max_alt):
 
     # Average Ion Cross Section
     plt.figure(figsize=(12, 12))
-    cp1 = plt.contourf(factors.heights_la[:-1], factors.glat_in[:], factors.C_ion_error[:, lon, :-1] / factors.C_ion[:, lon, :-1], cmap=cm.batlow,
+    cp1 = plt.contourf(state.heights_la[:-1], state.glat_in[:], state.C_ion_error[:, lon, :-1] / state.C_ion[:, lon, :-1], cmap=cm.batlow,
                        interpolation='bicubic')
 
     plt.xlim(min_alt, max_alt)
@@ -3049,9 +3184,9 @@ def mapla_cross_section_rel_error_plot(lon_value, min_alt, max_alt):
     plt.xlabel('~$Altitude \ (km)$')
     plt.ylabel('$Latitude \ (deg)$')
 
-    plt.title('Average Ion Cross Section Relative Error' + factors.title)
+    plt.title('Average Ion Cross Section Relative Error' + state.title)
     cbar = plt.colorbar(cp1)
-    name = 'Avg_Ion_CS_REL_'+factors.pngNameMap
+    name = 'Avg_Ion_CS_REL_'+state.pngNameMap
     # plt.savefig(name, bbox_inches='tight', pad_inches=0)
 
     plt.show()
@@ -61,3 +61,91 @@ def igrf_B(time_p, lat_p, lon_p, alt_p):
     b_unit_enu = [Be / bnorm, Bn / bnorm, Bu / bnorm]
 
     return B_enu,b_unit_enu
+
+###
+
+"""
+igrf_grid
+**Description**:
+_____________________________________________________________________________________________________________________
+Calculate IGRF-12 magnetic field in ENU and ECEF for a whole array of positions at one epoch, the start of the day of
+time_p. The model is still evaluated one position per call (igrf_points), the work is saved by evaluating each distinct
+position once and by keeping the results in memory, and optionally on disk, keyed by the day and a hash of the positions.
+_____________________________________________________________________________________________________________________
+_____________________________________________________________________________________________________________________
+**Inputs**:
+_____________________________________________________________________________________________________________________
+`time_p`: time (datetime object) 
+`lat_p`: latitude in \(deg\), array broadcastable with lon_p and alt_p
+`lon_p`: longitude in \(deg\)
+`alt_p`: altitude in \(km\)
+`cache_dir`: folder of a disk cache of the results, for example ~/.cache/daedalusmase_igrf. None (default) keeps them in memory only
+_____________________________________________________________________________________________________________________
+_______________________________________________________________________________________________________________________
+**Outputs**:
+_____________________________________________________________________________________________________________________
+`B_enu`: Magnetic field vector in \(T\) [ENU], array with first axis of length 3
+`b_unit_enu`: Magnetic field unit vector [ENU]
+`B_ecef`: Magnetic field vector in \(T\) [ECEF]
+_____________________________________________________________________________________________________________________
+________________________________________________________________________________________________________________________
+"""
+
+import datetime
+import hashlib
+import os
+from collections import OrderedDict
+try:
+    import igrf12fort # the compiled model of igrf12, calling it directly skips building an xarray Dataset per point
+except ImportError:
+    igrf12fort = None
+
+igrf_memo = OrderedDict()
+igrf_memo_size = 8
+
+def igrf_points(epoch, lat_p, lon_p, alt_p):
+    # north, east, down in nT for 1D arrays of positions
+    boy = datetime.datetime(epoch.year, 1, 1)
+    eoy = datetime.datetime(epoch.year + 1, 1, 1)
+    yeardec = epoch.year + (epoch - boy).total_seconds() / (eoy - boy).total_seconds()
+    ned = np.empty((len(lat_p), 3))
+    if igrf12fort is None:
+        for i in range(len(lat_p)):
+            mag = igrf12.igrf(epoch, lat_p[i], lon_p[i], alt_p[i])
+            ned[i] = mag.north.values[0], mag.east.values[0], mag.down.values[0]
+        return ned
+    for i in range(len(lat_p)):
+        ned[i] = igrf12fort.igrf12syn(0, yeardec, 1, alt_p[i], 90 - lat_p[i], (360 + lon_p[i]) % 360)[:3]
+    return ned
+
+def igrf_grid(time_p, lat_p, lon_p, alt_p, cache_dir=None):
+    lat_p, lon_p, alt_p = np.broadcast_arrays(np.asarray(lat_p, dtype=float), np.asarray(lon_p, dtype=float), np.asarray(alt_p, dtype=float))
+    epoch = datetime.datetime(time_p.year, time_p.month, time_p.day)
+
+    grid = hashlib.sha1(str(lat_p.shape).encode())
+    for coordinate in (lat_p, lon_p, alt_p):
+        grid.update(np.ascontiguousarray(coordinate).tobytes())
+    key = epoch.strftime('%Y%m%d') + '_' + grid.hexdigest()
+    cache_file = None if cache_dir is None else os.path.join(cache_dir, 'igrf_' + key + '.npy')
+
+    if key in igrf_memo:
+        igrf_memo.move_to_end(key)
+        B_enu = igrf_memo[key].copy()
+    elif cache_file is not None and os.path.exists(cache_file):
+        B_enu = np.load(cache_file)
+    else:
+        # each distinct position once
+        points, inverse = np.unique(np.stack([lat_p.ravel(), lon_p.ravel(), alt_p.ravel()], axis=1), axis=0, return_inverse=True)
+        ned = igrf_points(epoch, points[:, 0], points[:, 1], points[:, 2])[inverse.ravel()] / 10**9 # in tesla
+        B_enu = np.array([ned[:, 1], ned[:, 0], -ned[:, 2]]).reshape((3,) + lat_p.shape)
+        if cache_file is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            np.save(cache_file + '.tmp.npy', B_enu)
+            os.replace(cache_file + '.tmp.npy', cache_file)
+    igrf_memo[key] = B_enu.copy()
+    while len(igrf_memo) > igrf_memo_size:
+        igrf_memo.popitem(last=False)
+
+    bnorm = np.sqrt(B_enu[0] * B_enu[0] + B_enu[1] * B_enu[1] + B_enu[2] * B_enu[2])
+    B_ecef = np.array(enu_ecef(lat_p, lon_p, B_enu[0], B_enu[1], B_enu[2]))
+    return B_enu, B_enu / bnorm, B_ecef
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+import factors
+import errorprogation as EP
+
+from reference_errorprogation import error_loop
+
+# errors and error contributions written by error, from nuOp_error to dJd_Ne in factors.py
+ERROR_NAMES = factors.grid_names[factors.grid_names.index("nuOp_error"):factors.grid_names.index("dJd_Ne") + 1]
+
+# inputs of error, as filled by models_input and products, with the ranges of their magnitudes
+VECTOR_INPUTS = {"B": (1e-5, 6e-5), "E": (1e-4, 5e-2), "Un": (1, 300), "Vi_vert": (1, 1000)}
+INPUTS = {"NO": (1e7, 1e12), "NO2": (1e6, 1e11), "NN2": (1e7, 1e13), "NOp": (1e2, 1e6), "NO2p": (1e2, 1e6),
+          "NNOp": (1e2, 1e6), "Ne": (1e3, 1e6), "Te": (200, 3000), "Ti": (200, 2000), "Tn": (200, 1500),
+          "nu_Op_sum": (1e-2, 1e4), "nu_O2p_sum": (1e-2, 1e4), "nu_NOp_sum": (1e-2, 1e4), "nu_e_sum": (1e1, 1e6),
+          "pedersen_con": (1e-8, 1e-3), "hall_con": (1e-8, 1e-3), "Joule_Heating": (1e-10, 1e-6)}
+
+PERCENTAGES = dict(B_error=3, E_error=7, NO_error=11, NO2_error=13, NN2_error=17, NOp_error=19, NO2p_error=23,
+                   NNOp_error=29, Ne_error=31, Te_error=37, Ti_error=41, Tn_error=43, Un_error=47, Vi_error=53)
+
+# smaller grid than the TIE-GCM one, error takes the ranges of the maps from glat_in, glon_in and glev_in
+NLAT, NLON, NLEV = 6, 8, 12
+
+PROFILES = {"vertical": dict(lat_value=4, lon_value=5),
+            "lat-alt": dict(lat_value=-1, lon_value=3, pressure_level=-1),
+            "lat-lon": dict(lat_value=-1, lon_value=-1, pressure_level=7)}
+
+RTOL = 1e-13
+
+
+def synthetic_inputs(seed):
+    # log-uniform magnitudes, random signs for the components of the vectors
+    rng = np.random.default_rng(seed)
+    shape = factors.Bx.shape
+    values = {}
+    for name, (low, high) in VECTOR_INPUTS.items():
+        for axis in "xyz":
+            values[name + axis] = rng.choice([-1, 1], shape) * np.exp(rng.uniform(np.log(low), np.log(high), shape))
+    for name, (low, high) in INPUTS.items():
+        values[name] = np.exp(rng.uniform(np.log(low), np.log(high), shape))
+    return values
+
+
+@pytest.fixture
+def synthetic_factors(monkeypatch):
+    monkeypatch.setattr(factors, "glat_in", np.linspace(-87.5, 87.5, NLAT))
+    monkeypatch.setattr(factors, "glon_in", np.linspace(-180, 180, NLON, endpoint=False))
+    monkeypatch.setattr(factors, "glev_in", np.linspace(-7, 7, NLEV))
+    values = synthetic_inputs(seed=21)
+    for name, value in values.items():
+        getattr(factors, name)[...] = value
+    yield values
+    for name in list(values) + ERROR_NAMES:
+        getattr(factors, name)[...] = 0
+
+
+def run(function, error_flag, profile):
+    for name in ERROR_NAMES:
+        getattr(factors, name)[...] = 0
+    function(error_flag, **PERCENTAGES, **PROFILES[profile])
+    return {name: getattr(factors, name).copy() for name in ERROR_NAMES}
+
+
+def test_error_names():
+    assert len(ERROR_NAMES) == 80
+    assert ERROR_NAMES[-1] == "dJd_Ne"
+
+
+@pytest.mark.parametrize("error_flag", [False, True])
+@pytest.mark.parametrize("profile", list(PROFILES))
+def test_error_matches_loop(synthetic_factors, error_flag, profile):
+    expected = run(error_loop, error_flag, profile)
+    result = run(EP.error, error_flag, profile)
+    for name in ERROR_NAMES:
+        assert np.count_nonzero(expected[name]) > 0, name
+        np.testing.assert_allclose(result[name], expected[name], rtol=RTOL, atol=0, err_msg=name)
+
+
+@pytest.mark.parametrize("error_flag", [False, True])
+def test_error_state_matches_loop(synthetic_factors, error_flag):
+    # the same vertical profile with the structures of an LTIState instead of the global ones
+    expected = run(error_loop, error_flag, "vertical")
+    lats, lons, levs = [4], [5], np.arange(NLEV - 1)
+    state = factors.LTIState(glat_in=factors.glat_in, glon_in=factors.glon_in, glev_in=factors.glev_in)
+    state.select(lats, lons, levs)
+    for name, value in synthetic_factors.items():
+        setattr(state, name, value[np.ix_(lats, lons, levs)].copy(order="F"))
+    EP.error(error_flag, **PERCENTAGES, **PROFILES["vertical"], state=state)
+    for name in ERROR_NAMES:
+        np.testing.assert_allclose(getattr(state, name), expected[name][np.ix_(lats, lons, levs)], rtol=RTOL, atol=0,
+                                   err_msg=name)
@@ -0,0 +1,55 @@
+import concurrent.futures
+import multiprocessing
+
+import numpy as np
+
+import factors
+import errorprogation as EP
+
+NLAT, NLON, NLEV = 6, 8, 12
+
+# vertical profiles computed at the same time, with their seeds of the synthetic inputs
+PROFILES = [(1, 2, 31), (4, 6, 32)]
+
+INPUTS = {"Bx": (1e-5, 6e-5), "By": (1e-5, 6e-5), "Bz": (1e-5, 6e-5), "Ex": (1e-4, 5e-2), "Ey": (1e-4, 5e-2),
+          "Ez": (1e-4, 5e-2), "Unx": (1, 300), "Uny": (1, 300), "Unz": (1, 300), "Vi_vertx": (1, 1000),
+          "Vi_verty": (1, 1000), "Vi_vertz": (1, 1000), "NO": (1e7, 1e12), "NO2": (1e6, 1e11), "NN2": (1e7, 1e13),
+          "NOp": (1e2, 1e6), "NO2p": (1e2, 1e6), "NNOp": (1e2, 1e6), "Ne": (1e3, 1e6), "Te": (200, 3000),
+          "Ti": (200, 2000), "Tn": (200, 1500), "nu_Op_sum": (1e-2, 1e4), "nu_O2p_sum": (1e-2, 1e4),
+          "nu_NOp_sum": (1e-2, 1e4), "nu_e_sum": (1e1, 1e6), "pedersen_con": (1e-8, 1e-3),
+          "hall_con": (1e-8, 1e-3), "Joule_Heating": (1e-10, 1e-6)}
+
+
+def profile_errors(lat_value, lon_value, seed):
+    # errors of a vertical profile in its own LTIState, as a worker of batch.py does
+    state = factors.LTIState(glat_in=np.linspace(-87.5, 87.5, NLAT), glon_in=np.linspace(-180, 180, NLON, endpoint=False),
+                             glev_in=np.linspace(-7, 7, NLEV))
+    state.select([lat_value], [lon_value], np.arange(NLEV - 1))
+    rng = np.random.default_rng(seed)
+    for name, (low, high) in INPUTS.items():
+        getattr(state, name)[...] = np.exp(rng.uniform(np.log(low), np.log(high), state.shape))
+    EP.error(True, lat_value=lat_value, lon_value=lon_value, state=state)
+    return state
+
+
+def test_states_in_parallel_processes():
+    expected = [profile_errors(*profile) for profile in PROFILES]
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2, mp_context=context) as pool:
+        results = list(pool.map(profile_errors, *zip(*PROFILES)))
+    for result, state in zip(results, expected):
+        np.testing.assert_array_equal(result.lats, state.lats)
+        np.testing.assert_array_equal(result.lons, state.lons)
+        for name in ["pedersen_con_error", "Joule_Heating_error", "dJH_E", "dJd_Ne"]:
+            assert getattr(result, name).shape == (1, 1, NLEV - 1)
+            np.testing.assert_array_equal(getattr(result, name), getattr(state, name), err_msg=name)
+    assert not np.array_equal(results[0].pedersen_con_error, results[1].pedersen_con_error)
+    # the global structures are not used
+    assert not np.any(factors.pedersen_con_error)
+
+
+def test_states_compare_by_identity():
+    state, other = profile_errors(*PROFILES[0]), profile_errors(*PROFILES[0])
+    assert state == state
+    assert state != other
+    assert len({state, other}) == 2
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("cmcrameri")
+pytest.importorskip("igrf12")
+
+import factors
+import montecarlo as MC
+
+NLAT, NLON, NLEV = 6, 8, 12
+LAT, LON = 2, 3
+SAMPLES = 200
+
+
+def synthetic_state(seed=22):
+    # vertical profile of an LTIState with inputs of realistic magnitudes, as filled by models_input
+    state = factors.LTIState(glat_in=np.linspace(-87.5, 87.5, NLAT), glon_in=np.linspace(-180, 180, NLON, endpoint=False),
+                             glev_in=np.linspace(-7, 7, NLEV))
+    state.select([LAT], [LON], np.arange(NLEV - 1))
+    rng = np.random.default_rng(seed)
+    shape = state.shape
+    for name, value in [("Bx", 2e-5), ("By", -5e-6), ("Bz", -4e-5), ("Ex", 1e-3), ("Ey", -2e-3), ("Ez", 5e-4),
+                        ("Unx", 80), ("Uny", -40), ("Unz", 5), ("Vi_vertx", 300), ("Vi_verty", -150), ("Vi_vertz", 20)]:
+        getattr(state, name)[...] = value * rng.uniform(0.5, 1.5, shape)
+    for name, low, high in [("NO", 1e8, 1e11), ("NO2", 1e7, 1e10), ("NN2", 1e8, 1e12), ("NOp", 1e3, 1e5),
+                            ("NO2p", 1e3, 1e5), ("NNOp", 1e3, 1e5), ("Tn", 400, 1000)]:
+        getattr(state, name)[...] = np.exp(rng.uniform(np.log(low), np.log(high), shape))
+    state.Ne[...] = state.NOp + state.NO2p + state.NNOp
+    state.Ti[...] = 1.2 * state.Tn
+    state.Te[...] = 1.5 * state.Ti
+    return state
+
+
+def run(state, **kwargs):
+    return MC.error_mc(True, lat_value=LAT, lon_value=LON, samples=SAMPLES, state=state,
+                       products=["pedersen_con", "Joule_Heating"], **kwargs)
+
+
+def kept_memory(products):
+    # MB of the samples kept for the percentiles of a vertical profile
+    return SAMPLES * (NLEV - 1) * products * 4 / 2 ** 20
+
+
+def assert_same(result, expected):
+    for key in ("mean", "std", "sem", "percentiles"):
+        for name in expected[key]:
+            np.testing.assert_array_equal(result[key][name], expected[key][name], err_msg=key + " " + name)
+
+
+def test_same_seed_same_results():
+    state = synthetic_state()
+    assert_same(run(state, seed=7), run(state, seed=7))
+
+
+def test_seed_results_do_not_depend_on_batch_size():
+    # one sample per batch instead of SAMPLES / checkpoints of them, the same samples merged in another order
+    state = synthetic_state()
+    result, expected = run(state, seed=7, max_memory=kept_memory(2) + 1e-9), run(state, seed=7)
+    for name in expected["percentiles"]:
+        np.testing.assert_array_equal(result["percentiles"][name], expected["percentiles"][name], err_msg=name)
+    for key in ("mean", "std", "sem"):
+        for name in expected[key]:
+            np.testing.assert_allclose(result[key][name], expected[key][name], rtol=1e-12, err_msg=key + " " + name)
+
+
+def test_other_seed_other_results():
+    state = synthetic_state()
+    result, other = run(state, seed=7), run(state, seed=8)
+    assert not np.array_equal(result["std"]["pedersen_con"], other["std"]["pedersen_con"])
+    np.testing.assert_allclose(result["std"]["pedersen_con"], other["std"]["pedersen_con"], rtol=0.5)
+
+
+def test_convergence_with_one_batch_of_memory():
+    # all the samples fit in max_memory, convergence is still measured at checkpoints
+    result = run(synthetic_state(), seed=7)
+    assert len(result["convergence"]["samples"]) == MC.checkpoints - 1
+    assert result["convergence"]["samples"][-1] == SAMPLES
+    assert len(result["convergence"]["pedersen_con"]) == MC.checkpoints - 1
+    assert np.all(np.isfinite(result["convergence"]["pedersen_con"]))
+
+
+def test_save_keeps_analytic_errors():
+    state = synthetic_state()
+    state.pedersen_con_error[...] = 1.0
+    result = run(state, seed=7, save=True)
+    np.testing.assert_array_equal(state.pedersen_con_error, 1.0)
+    np.testing.assert_array_equal(state.pedersen_con_error_mc, result["std"]["pedersen_con"])
+    np.testing.assert_array_equal(state.Joule_Heating_error_mc, result["std"]["Joule_Heating"])
+
+
+def test_kept_samples_count_against_max_memory():
+    state = synthetic_state()
+    with pytest.raises(ValueError, match="percentiles"):
+        run(state, seed=7, max_memory=kept_memory(2) / 2)
+    result = run(state, seed=7, max_memory=kept_memory(2) / 2, percentiles=())
+    assert result["percentiles"] == {}
+    np.testing.assert_allclose(result["std"]["pedersen_con"], run(state, seed=7)["std"]["pedersen_con"], rtol=1e-12)
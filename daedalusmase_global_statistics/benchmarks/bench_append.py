@@ -0,0 +1,63 @@
+"""
+Time of each save into a result-file (data.save_file_results) over many saves, to check that appending does not get slower
+as the file grows. The times are printed and plotted against the number of the save.
+
+    python benchmarks/bench_append.py [--saves 100] [--bins 20] [--hits 40000] [--plot bench_append.png]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(here, "..", "daedalusmase_global_statistics"), os.path.join(here, "..", "tests")]
+
+import data  # noqa: E402
+from synthetic_statistics import synthetic_hits  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--saves", type=int, default=100)
+    parser.add_argument("--bins", type=int, default=20, help="the first BINS of the default Bins are kept, 0 keeps all of them")
+    parser.add_argument("--hits", type=int, default=40000, help="values per variable of each save, spread over the Bins")
+    parser.add_argument("--plot", default="bench_append.png", help="png file of the plot, empty for none")
+    args = parser.parse_args()
+
+    if args.bins > 0:
+        del data.Bins[args.bins:]
+    folder = tempfile.mkdtemp()
+    filename = os.path.join(folder, "results.nc")
+    data.CreateResults_CDF(filename)
+    times = []
+    for i in range(args.saves):
+        hits, values = synthetic_hits(len(data.Bins), args.hits, i)
+        start = time.perf_counter()
+        data.save_file_results(filename, hits, values)
+        times.append(time.perf_counter() - start)
+        print("save %4d  %8.3f s  %10d values per variable" % (i + 1, times[-1], (i + 1) * args.hits))
+    first, last = times[:10], times[-10:]
+    print("mean of the first %d saves %.3f s, of the last %d saves %.3f s, file %.1f MB" % (
+        len(first), sum(first) / len(first), len(last), sum(last) / len(last), os.path.getsize(filename) / 1e6))
+    os.remove(filename)
+    os.rmdir(folder)
+
+    if args.plot:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        fig, ax = plt.subplots(figsize=(7, 4))
+        ax.plot(range(1, len(times) + 1), times, marker=".")
+        ax.set_xlabel("save")
+        ax.set_ylabel("time per save (s)")
+        ax.set_ylim(0, 1.2 * max(times))
+        ax.set_title("%d Bins, %d values per variable per save" % (len(data.Bins), args.hits))
+        fig.tight_layout()
+        fig.savefig(args.plot)
+        print("plot saved to", args.plot)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Time and peak memory (RSS) of reading a result-file with iterate_results and load_results_arrays, against load_results
+which fills the lists of the Bins. Only WindHeatingValues is written (read as Wind_heating), 10^8 values by default,
+spread over the Bins and repeated in allWindHeatingValues. load_results keeps a Python float per value, so it runs on a
+smaller file (--baseline-values), where the numpy loaders run as well. Each loader runs in its own process, whose peak
+RSS (VmHWM of /proc/self/status, Linux) is not that of the others.
+
+    python benchmarks/bench_load_results.py [--values 1e8] [--baseline-values 1e7] [--bins 20]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(here, "..", "daedalusmase_global_statistics"), os.path.join(here, "..", "tests")]
+
+import data  # noqa: E402
+
+LOADERS = ["load_results", "load_results_arrays", "iterate_results"]
+
+
+def write_results(filename, n, block=10 ** 7, seed=0):
+    # WindHeatingValues of n random hits, appended in blocks as save_file_results() does, with a single commit
+    rng = np.random.default_rng(seed)
+    data.CreateResults_CDF(filename)
+    resultsCDF = data.Dataset(filename, "a")
+    data.begin_append(resultsCDF, filename)
+    Committed = dict()
+    for first in range(0, n, block):
+        hits = rng.integers(0, len(data.Bins), min(block, n - first))
+        values = {"JH_values": rng.lognormal(-18, 1, len(hits))}
+        for B, BinValues in zip(data.Bins, data.group_hits_by_bin(hits, values, len(data.Bins))):
+            data.append_values(resultsCDF, B.ID + "_WindHeatingValues", BinValues["JH_values"], Committed)
+        data.append_values(resultsCDF, "allWindHeatingValues", values["JH_values"], Committed)
+    data.commit_append(resultsCDF, Committed)
+    resultsCDF.close()
+
+
+def load(loader, filename):
+    # reads every Bin and the values of all hits, returns the number of values read
+    BinIDs = [B.ID for B in data.Bins] + ["all"]
+    if loader == "load_results":
+        data.load_results(filename, "Wind_heating", loadTimeValues=False, loadMagLatValues=False, loadMLTvalues=False,
+                          loadAltValues=False, loadLatValues=False, loadKpValues=False)
+        return sum(len(B.JH_values) for B in data.Bins) + len(data.all_JH_values)
+    if loader == "load_results_arrays":
+        return sum(len(arrays["JH_values"]) for arrays in data.load_results_arrays(filename, "Wind_heating", BinIDs).values())
+    return sum(len(chunk["JH_values"]) for BinID, chunk in data.iterate_results(filename, "Wind_heating", BinIDs))
+
+
+def memory(field):
+    # MB of the VmRSS (current) or VmHWM (peak) field of the process
+    with open("/proc/self/status") as F:
+        return next(int(line.split()[1]) for line in F if line.startswith(field + ":")) / 1024
+
+
+def run(loader, filename):
+    # one loader, prints a row of the table
+    rss = memory("VmRSS")
+    start = time.perf_counter()
+    stdout, sys.stdout = sys.stdout, open(os.devnull, "w")  # load_results reports its progress
+    try:
+        n = load(loader, filename)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+    seconds = time.perf_counter() - start
+    peak = memory("VmHWM")
+    print("%20s %12d %9.2f %12.0f %9.0f %9.0f" % (loader, n, seconds, n / seconds, peak, peak - rss), flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--values", type=float, default=1e8, help="values of the Bins, as many again in allWindHeatingValues")
+    parser.add_argument("--baseline-values", type=float, default=1e7, help="values of the file of load_results, 0 for none")
+    parser.add_argument("--bins", type=int, default=20, help="the first BINS of the default Bins are kept, 0 keeps all of them")
+    parser.add_argument("--load", choices=LOADERS, help=argparse.SUPPRESS)
+    parser.add_argument("--file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.bins > 0:
+        del data.Bins[args.bins:]
+    if args.load:
+        run(args.load, args.file)
+        return
+    folder = tempfile.mkdtemp()
+    print("%20s %12s %9s %12s %9s %9s" % ("loader", "values", "time s", "values/s", "RSS MB", "+RSS MB"), flush=True)
+    for n, loaders in ((int(args.baseline_values), LOADERS), (int(args.values), LOADERS[1:])):
+        if n <= 0:
+            continue
+        filename = os.path.join(folder, "results_%d.nc" % n)
+        write_results(filename, n)
+        for loader in loaders:
+            subprocess.run([sys.executable, __file__, "--load", loader, "--file", filename, "--bins", str(args.bins)], check=True)
+        os.remove(filename)
+    os.rmdir(folder)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Time per value and peak memory of the statistics of a Bin (CalculateStatsOnData in exact and in streaming mode) and of the
+RunningStats and TDigest sketches alone, for Bins of 10^2 to 10^8 values. The values of the Bin are a numpy array (those of
+load_results are a list, which costs about 4 times more memory), the sketches are updated in chunks of StatsChunkSize.
+The rank error of the streaming median is printed next to the bound of TDigest.
+
+    python benchmarks/bench_stats.py [--sizes 1e2 1e3 1e4 1e5 1e6 1e7 1e8] [--compression 1000]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(here, "..", "daedalusmase_global_statistics"))
+
+import data  # noqa: E402
+
+
+def measure(function, n):
+    # seconds per call (repeated up to about 10^6 values for the small Bins) and peak MB of the last call
+    repeat = max(1, 10 ** 6 // n)
+    start = time.perf_counter()
+    for i in range(repeat - 1):
+        function()
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return (time.perf_counter() - start) / repeat, peak / 2 ** 20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1e2, 1e3, 1e4, 1e5, 1e6, 1e7, 1e8])
+    parser.add_argument("--compression", type=int, default=data.TDigestCompression)
+    args = parser.parse_args()
+
+    data.TDigestCompression = args.compression
+    del data.Bins[1:]
+    B = data.Bins[0]
+    rng = np.random.default_rng(0)
+    print("%10s %-14s %10s %9s %9s" % ("values", "statistics", "ns/value", "peak MB", "time s"))
+    for n in [int(size) for size in args.sizes]:
+        values = rng.lognormal(-18, 1, n)
+        B.JH_values = values
+        chunks = lambda: (values[i:i + data.StatsChunkSize] for i in range(0, n, data.StatsChunkSize))  # noqa: E731
+
+        def running():
+            sketch = data.RunningStats()
+            for chunk in chunks():
+                sketch.update(chunk)
+
+        def digest():
+            sketch = data.TDigest(args.compression)
+            for chunk in chunks():
+                sketch.update(chunk)
+            return sketch
+
+        for name, function in (("exact", lambda: data.CalculateStatsOnData(True)),
+                               ("streaming", lambda: data.CalculateStatsOnData(False)),
+                               ("RunningStats", running), ("TDigest", digest)):
+            seconds, peak = measure(function, n)
+            print("%10d %-14s %10.1f %9.1f %9.3f" % (n, name, seconds / n * 1e9, peak, seconds), flush=True)
+        median = digest().quantile(0.5)
+        print("%10d median rank error %.3f%% (bound %.3f%%)" % (n, abs(np.mean(values <= median) - 0.5) * 100,
+                                                               4 * np.pi * 0.5 / args.compression * 100))
+    B.JH_values = list()
+
+
+if __name__ == "__main__":
+    main()
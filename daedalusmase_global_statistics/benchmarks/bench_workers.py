@@ -0,0 +1,52 @@
+"""
+Wall time of calc_stats_for_tiegcm with 1 to N worker processes on a folder of synthetic TIEGCM files, with the speedup
+and the parallel efficiency against one worker.
+
+    python benchmarks/bench_workers.py [--workers 1 2 4] [--files 8] [--ntime 24] [--grid 57 72 144] [--bins 20]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(here, "..", "daedalusmase_global_statistics"), os.path.join(here, "..", "tests")]
+
+import data  # noqa: E402
+from synthetic_statistics import write_tiegcm_folder  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--ntime", type=int, default=24, help="time steps per file")
+    parser.add_argument("--grid", type=int, nargs=3, default=[57, 72, 144], help="levels, latitudes and longitudes")
+    parser.add_argument("--bins", type=int, default=20, help="the first BINS of the default Bins are kept, 0 keeps all of them")
+    args = parser.parse_args()
+
+    if args.bins > 0:
+        del data.Bins[args.bins:]
+    folder = tempfile.mkdtemp()
+    nlev, nlat, nlon = args.grid
+    write_tiegcm_folder(os.path.join(folder, "tiegcm"), args.files, ntime=args.ntime, nlev=nlev, nlat=nlat, nlon=nlon)
+    times = {}
+    for workers in args.workers:
+        results = os.path.join(folder, "results_%d" % workers)
+        start = time.perf_counter()
+        data.calc_stats_for_tiegcm(os.path.join(folder, "tiegcm"), results + "/", NumOfWorkers=workers)
+        times[workers] = time.perf_counter() - start
+        shutil.rmtree(results)
+    shutil.rmtree(folder)
+
+    print("%8s %10s %9s %11s" % ("workers", "time s", "speedup", "efficiency"))
+    base = times[args.workers[0]] * args.workers[0]
+    for workers, seconds in times.items():
+        print("%8d %10.2f %9.2f %11.2f" % (workers, seconds, base / seconds, base / seconds / workers))
+    print("%d CPUs" % (os.cpu_count() or 1))
+
+
+if __name__ == "__main__":
+    main()
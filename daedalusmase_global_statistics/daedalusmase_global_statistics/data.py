@@ -40,9 +40,11 @@ import numpy as np
 import os
 import time
 import threading
+import concurrent.futures
 import glob
 import copy
 import calendar
+import bisect
 
 from utils import *
 
@@ -466,7 +468,7 @@ def is_MLT_inside_range( MLT, MLT_min, MLT_max ):
 
     
     
-def GetMatchedBin( MLT, MagLat, Altitude, Kp, Latitude ):
+def GetMatchedBin( MLT, MagLat, Altitude, Kp, Latitude, BinsToSearch=None ):
     """
     Finds and returns the Bin object which matches the position of the satellite described by the arguments.
     
@@ -476,21 +478,14 @@ def GetMatchedBin( MLT, MagLat, Altitude, Kp, Latitude ):
             Altitude: The Altitude  
             Kp: the Kp-index  
             Latitude: the Latitude  
+            BinsToSearch: the list of Bins to search. By default the Bins of the module.
     Returns:
             Bin: the Bin in which the position represented by the arguments is matched.
     """    
-    MatchedBin = None
-    for B in Bins:
-        if Latitude >= B.Lat_min  and  Latitude <= B.Lat_max:
-            if is_MLT_inside_range(MLT, B.MLT_min, B.MLT_max):
-                if MagLat   > B.MagLat_min    and  MagLat   <= B.MagLat_max:
-                    if Altitude > B.Altitude_min  and  Altitude <= B.Altitude_max:
-                        Kp_min_to_check = B.Kp_min
-                        if Kp_min_to_check == 0: Kp_min_to_check = -1
-                        if Kp       > Kp_min_to_check and  Kp       <= B.Kp_max:
-                            MatchedBin = B
-                            break
-    return MatchedBin
+    if BinsToSearch is None: BinsToSearch = Bins
+    idx = get_bin_lookup( BinsToSearch ).match( MLT, MagLat, Altitude, Kp, Latitude )
+    if idx < 0: return None
+    return BinsToSearch[idx]
 
 
 
@@ -523,6 +518,117 @@ def getBinByItsID( aBinID ):
 
 
 
+# Precompiled form of a list of Bins used by GetMatchedBin() and match_bins(). 
+# Each axis (MLT, MagLat, Altitude, Kp, Latitude) is split into cells by the range limits of all Bins, so that every Bin covers whole cells. 
+# Table holds, for every combination of cells, the index of the first matching Bin in the list or -1. The last cell of each axis is for nan values.
+class BinLookup:
+    
+    def __init__(self, BinsToSearch):
+        self.SearchedBins = tuple( BinsToSearch )
+        MLT_min      = np.array( [B.MLT_min for B in BinsToSearch], dtype=float )[:, None]
+        MLT_max      = np.array( [B.MLT_max for B in BinsToSearch], dtype=float )[:, None]
+        MagLat_min   = np.array( [B.MagLat_min for B in BinsToSearch], dtype=float )[:, None]
+        MagLat_max   = np.array( [B.MagLat_max for B in BinsToSearch], dtype=float )[:, None]
+        Altitude_min = np.array( [B.Altitude_min for B in BinsToSearch], dtype=float )[:, None]
+        Altitude_max = np.array( [B.Altitude_max for B in BinsToSearch], dtype=float )[:, None]
+        Kp_min       = np.array( [-1 if B.Kp_min == 0 else B.Kp_min for B in BinsToSearch], dtype=float )[:, None]
+        Kp_max       = np.array( [B.Kp_max for B in BinsToSearch], dtype=float )[:, None]
+        Lat_min      = np.array( [B.Lat_min for B in BinsToSearch], dtype=float )[:, None]
+        Lat_max      = np.array( [B.Lat_max for B in BinsToSearch], dtype=float )[:, None]
+        # the ranges are min<value<=max except Latitude which is min<=value<=max, that is min<=value<nextafter(max)
+        self.Edges = [ np.unique( np.concatenate( ([0.], MLT_min.ravel(), MLT_max.ravel()) ) ),
+                       np.unique( np.concatenate( ([0.], MagLat_min.ravel(), MagLat_max.ravel()) ) ),
+                       np.unique( np.concatenate( ([0.], Altitude_min.ravel(), Altitude_max.ravel()) ) ),
+                       np.unique( np.concatenate( ([0.], Kp_min.ravel(), Kp_max.ravel()) ) ),
+                       np.unique( np.concatenate( ([0.], Lat_min.ravel(), np.nextafter(Lat_max, np.inf).ravel()) ) ) ]
+        self.EdgeLists = [ E.tolist() for E in self.Edges ]
+        # one representative value for each cell: the right edge for min<value<=max cells, the left edge for min<=value<max cells
+        MLT, MagLat, Altitude, Kp = [ np.concatenate( (E, [E[-1]+1, np.nan]) ) for E in self.Edges[:4] ]
+        Lat = np.concatenate( ([self.Edges[4][0]-1], self.Edges[4], [np.nan]) )
+        # which cells each Bin covers, with the same comparisons as the linear search
+        with np.errstate(invalid='ignore'):
+            in_MLT = np.where( MLT_min < MLT_max, (MLT > MLT_min) & (MLT <= MLT_max), 
+                               np.where( MLT_min == MLT_max, True, (MLT > MLT_min) | (MLT <= MLT_max) ) )
+            in_MagLat   = (MagLat > MagLat_min) & (MagLat <= MagLat_max)
+            in_Altitude = (Altitude > Altitude_min) & (Altitude <= Altitude_max)
+            in_Kp       = (Kp > Kp_min) & (Kp <= Kp_max)
+            in_Lat      = (Lat >= Lat_min) & (Lat <= Lat_max)
+        self.Table = np.full( (len(MLT), len(MagLat), len(Altitude), len(Kp), len(Lat)), -1, dtype=np.int32 )
+        for i in range(len(BinsToSearch)-1, -1, -1): # the first matching Bin is written last
+            self.Table[ np.ix_(in_MLT[i], in_MagLat[i], in_Altitude[i], in_Kp[i], in_Lat[i]) ] = i
+    
+    def describes(self, BinsToSearch):
+        return self.SearchedBins == tuple( BinsToSearch )
+    
+    def match(self, MLT, MagLat, Altitude, Kp, Latitude):
+        # index of the Bin matching a single position, -1 if there is none
+        cells = list()
+        for n, value in enumerate( (MLT, MagLat, Altitude, Kp, Latitude) ):
+            if value is np.ma.masked or value != value:
+                cells.append( self.Table.shape[n] - 1 )
+            elif n < 4:
+                cells.append( bisect.bisect_left( self.EdgeLists[n], value ) )
+            else:
+                cells.append( bisect.bisect_right( self.EdgeLists[n], value ) )
+        return int( self.Table[ tuple(cells) ] )
+    
+    def match_array(self, MLT, MagLat, Altitude, Kp, Latitude):
+        # index of the Bin matching each position, -1 where there is none
+        cells = list()
+        for n, values in enumerate( np.broadcast_arrays( *[ np.ma.filled( np.ma.asarray(V, dtype=float), np.nan ) for V in (MLT, MagLat, Altitude, Kp, Latitude) ] ) ):
+            cell = np.searchsorted( self.Edges[n], values, side='left' if n < 4 else 'right' )
+            cell[ np.isnan(values) ] = self.Table.shape[n] - 1
+            cells.append( cell )
+        return self.Table[ tuple(cells) ]
+
+CompiledBins = None # the BinLookup of the most recently searched list of Bins
+
+def get_bin_lookup( BinsToSearch=None ):
+    """
+    Returns the BinLookup of a list of Bins, compiling it again if Bins have been added, removed or replaced.  
+    Call compile_bins() after changing the ranges of an existing Bin.
+    
+    Args:
+        BinsToSearch: the list of Bins. By default the Bins of the module.
+    """
+    global CompiledBins
+    if BinsToSearch is None: BinsToSearch = Bins
+    if CompiledBins is None  or  not CompiledBins.describes( BinsToSearch ):
+        CompiledBins = BinLookup( BinsToSearch )
+    return CompiledBins
+
+def compile_bins( BinsToSearch=None ):
+    """
+    Compiles again the lookup table of a list of Bins. It is needed only when the ranges of an existing Bin have been changed.
+    
+    Args:
+        BinsToSearch: the list of Bins. By default the Bins of the module.
+    """
+    global CompiledBins
+    if BinsToSearch is None: BinsToSearch = Bins
+    CompiledBins = BinLookup( BinsToSearch )
+    return CompiledBins
+
+def match_bins( MLT, MagLat, Altitude, Kp, Latitude, BinsToSearch=None ):
+    """
+    Vectorized form of GetMatchedBin(). Finds the Bin of many positions at once. The arguments can be arrays of any (broadcastable) shape or scalars.  
+    Masked or nan values match no Bin.
+    
+    Args:
+            MLT: the Magnetic Local Times  
+            MagLat: The Magnetic Latitudes  
+            Altitude: The Altitudes  
+            Kp: the Kp-indices  
+            Latitude: the Latitudes  
+            BinsToSearch: the list of Bins to search. By default the Bins of the module.
+    Returns:
+            integer array: for each position the index of the matched Bin inside BinsToSearch, -1 where no Bin matches.
+    """
+    return get_bin_lookup( BinsToSearch ).match_array( MLT, MagLat, Altitude, Kp, Latitude )
+
+
+# Chunk size (number of values) of the result-file variables. Appends touch only the last chunks of each variable.
+ResultsChunkSize = 4096
 
 def CreateResults_CDF( ResultsFilename,  CALCULATIONS_Title="", CALCULATIONS_Description="", CALCULATIONS_RegionName="", CALCULATIONS_OrbitFilesPath="", CALCULATIONS_TIEGCMfolder=""):
     """
@@ -576,137 +682,213 @@ def CreateResults_CDF( ResultsFilename,  CALCULATIONS_Title="", CALCULATIONS_Des
             VAR_BinInfo.JH_min = "{:.3e}".format(B.JH_min)
         # create structure for each bin
         resultsCDF.createDimension( B.ID+"_time_dim", None )
-        VAR_BinTimeValues             = resultsCDF.createVariable( B.ID+"_TimeValues", "f4", (B.ID+"_time_dim",) )
+        VAR_BinTimeValues             = resultsCDF.createVariable( B.ID+"_TimeValues", "f4", (B.ID+"_time_dim",), chunksizes=(ResultsChunkSize,) )
         VAR_BinTimeValues.description = "UTC timestamp"
         VAR_BinTimeValues.units       = "seconds"
         resultsCDF.createDimension( B.ID+"_jh_dim", None )
-        VAR_BinJHvalues = resultsCDF.createVariable( B.ID+"_JHValues", "f4", (B.ID+"_jh_dim",) )
+        VAR_BinJHvalues = resultsCDF.createVariable( B.ID+"_JHValues", "f4", (B.ID+"_jh_dim",), chunksizes=(ResultsChunkSize,) )
         VAR_BinJHvalues.description = "Ohmic"
         VAR_BinJHvalues.units       = "W/m3"
         resultsCDF.createDimension( B.ID+"_maglat_dim", None )
-        VAR_BinMagLatValues = resultsCDF.createVariable( B.ID+"_MagLatValues", "f4", (B.ID+"_maglat_dim",) )
+        VAR_BinMagLatValues = resultsCDF.createVariable( B.ID+"_MagLatValues", "f4", (B.ID+"_maglat_dim",), chunksizes=(ResultsChunkSize,) )
         VAR_BinMagLatValues.description = "Magnetic Latitude"
         VAR_BinMagLatValues.units       = "degrees"
         resultsCDF.createDimension( B.ID+"_mlt_dim", None )
-        VAR_BinMLTValues = resultsCDF.createVariable( B.ID+"_MLTValues", "f4", (B.ID+"_mlt_dim",) )
+        VAR_BinMLTValues = resultsCDF.createVariable( B.ID+"_MLTValues", "f4", (B.ID+"_mlt_dim",), chunksizes=(ResultsChunkSize,) )
         VAR_BinMLTValues.description = "Magnetic Local Time"
         VAR_BinMLTValues.units       = "hours"
         resultsCDF.createDimension( B.ID+"_alt_dim", None )
-        VAR_BinAltitudeValues = resultsCDF.createVariable( B.ID+"_AltitudeValues", "f4", (B.ID+"_alt_dim",) )
+        VAR_BinAltitudeValues = resultsCDF.createVariable( B.ID+"_AltitudeValues", "f4", (B.ID+"_alt_dim",), chunksizes=(ResultsChunkSize,) )
         VAR_BinAltitudeValues.description = "Altitude from the surface of the Earth"
         VAR_BinAltitudeValues.units       = "km"
         resultsCDF.createDimension( B.ID+"_lat_dim", None )
-        VAR_BinLatValues = resultsCDF.createVariable( B.ID+"_LatValues", "f4", (B.ID+"_lat_dim",) )
+        VAR_BinLatValues = resultsCDF.createVariable( B.ID+"_LatValues", "f4", (B.ID+"_lat_dim",), chunksizes=(ResultsChunkSize,) )
         VAR_BinLatValues.description = "Latitude"
         VAR_BinLatValues.units       = "degrees"
         resultsCDF.createDimension( B.ID+"_kp_dim", None )
-        VAR_BinKpValues = resultsCDF.createVariable( B.ID+"_KpValues", "f4", (B.ID+"_kp_dim",) )
+        VAR_BinKpValues = resultsCDF.createVariable( B.ID+"_KpValues", "f4", (B.ID+"_kp_dim",), chunksizes=(ResultsChunkSize,) )
         VAR_BinKpValues.description = "Kp index of Sun activity"
         VAR_BinKpValues.units       = "-"
         resultsCDF.createDimension( B.ID+"_eex_dim", None )
-        VAR_BinEEXValues = resultsCDF.createVariable( B.ID+"_EEXValues", "f4", (B.ID+"_eex_dim",) )
+        VAR_BinEEXValues = resultsCDF.createVariable( B.ID+"_EEXValues", "f4", (B.ID+"_eex_dim",), chunksizes=(ResultsChunkSize,) )
         VAR_BinEEXValues.description = "Electric field strength East. (SI)"
         VAR_BinEEXValues.units       = "V/m"
         resultsCDF.createDimension( B.ID+"_eey_dim", None )
-        VAR_BinEEYValues = resultsCDF.createVariable( B.ID+"_EEYValues", "f4", (B.ID+"_eey_dim",) )
+        VAR_BinEEYValues = resultsCDF.createVariable( B.ID+"_EEYValues", "f4", (B.ID+"_eey_dim",), chunksizes=(ResultsChunkSize,) )
         VAR_BinEEYValues.description = "Electric field strength North. (SI)"
         VAR_BinEEYValues.units       = "V/m"
         resultsCDF.createDimension( B.ID+"_ped_dim", None )
-        VAR_BinPedersenValues = resultsCDF.createVariable( B.ID+"_PedersenValues", "f4", (B.ID+"_ped_dim",) )
+        VAR_BinPedersenValues = resultsCDF.createVariable( B.ID+"_PedersenValues", "f4", (B.ID+"_ped_dim",), chunksizes=(ResultsChunkSize,) )
         VAR_BinPedersenValues.description = "SIGMA_PED"
         VAR_BinPedersenValues.units       = "S/m"
         resultsCDF.createDimension( B.ID+"_den_dim", None )
-        VAR_BinDensityValues = resultsCDF.createVariable( B.ID+"_DensityValues", "f4", (B.ID+"_den_dim",) )
+        VAR_BinDensityValues = resultsCDF.createVariable( B.ID+"_DensityValues", "f4", (B.ID+"_den_dim",), chunksizes=(ResultsChunkSize,) )
         VAR_BinDensityValues.description = "Total Density"
         VAR_BinDensityValues.units       = "g/cm3"
         resultsCDF.createDimension( B.ID+"_lev_dim", None )
-        VAR_BinLevValues = resultsCDF.createVariable( B.ID+"_LevValues", "f4", (B.ID+"_lev_dim",) )
+        VAR_BinLevValues = resultsCDF.createVariable( B.ID+"_LevValues", "f4", (B.ID+"_lev_dim",), chunksizes=(ResultsChunkSize,) )
         VAR_BinLevValues.description = "midpoint levels"
         VAR_BinLevValues.units       = ""
         resultsCDF.createDimension( B.ID+"_hal_dim", None )
-        VAR_BinHallValues = resultsCDF.createVariable( B.ID+"_HallValues", "f4", (B.ID+"_hal_dim",) )
+        VAR_BinHallValues = resultsCDF.createVariable( B.ID+"_HallValues", "f4", (B.ID+"_hal_dim",), chunksizes=(ResultsChunkSize,) )
         VAR_BinHallValues.description = "SIGMA_HAL"
         VAR_BinHallValues.units       = "S/m"
         resultsCDF.createDimension( B.ID+"_convh_dim", None )
-        VAR_BinConvhValues = resultsCDF.createVariable( B.ID+"_ConvectionHeatingValues", "f4", (B.ID+"_convh_dim",) )
+        VAR_BinConvhValues = resultsCDF.createVariable( B.ID+"_ConvectionHeatingValues", "f4", (B.ID+"_convh_dim",), chunksizes=(ResultsChunkSize,) )
         VAR_BinConvhValues.description = "Convection Heating"
         VAR_BinConvhValues.units       = "W/m3"
         resultsCDF.createDimension( B.ID+"_windh_dim", None )
-        VAR_BinWindhValues = resultsCDF.createVariable( B.ID+"_WindHeatingValues", "f4", (B.ID+"_windh_dim",) )
+        VAR_BinWindhValues = resultsCDF.createVariable( B.ID+"_WindHeatingValues", "f4", (B.ID+"_windh_dim",), chunksizes=(ResultsChunkSize,) )
         VAR_BinWindhValues.description = "Wind Correction"
         VAR_BinWindhValues.units       = "W/m3"
     ## save data for all hits
     resultsCDF.createDimension( "time_dim", None )
-    VAR_TimeValues         = resultsCDF.createVariable("allTimeValues", "f4", ("time_dim",) )
+    VAR_TimeValues         = resultsCDF.createVariable("allTimeValues", "f4", ("time_dim",), chunksizes=(ResultsChunkSize,) )
     VAR_TimeValues.description = "UTC timestamp"
     VAR_TimeValues.units       = "seconds"
     resultsCDF.createDimension( "jh_dim", None )
-    VAR_JHvalues = resultsCDF.createVariable("allJHValues", "f4", ("jh_dim",) )
+    VAR_JHvalues = resultsCDF.createVariable("allJHValues", "f4", ("jh_dim",), chunksizes=(ResultsChunkSize,) )
     VAR_JHvalues.description = "Ohmic"
     VAR_JHvalues.units       = "W/m3"
     resultsCDF.createDimension( "maglat_dim", None )
-    VAR_MagLatValues = resultsCDF.createVariable("allMagLatValues", "f4", ("maglat_dim",) )
+    VAR_MagLatValues = resultsCDF.createVariable("allMagLatValues", "f4", ("maglat_dim",), chunksizes=(ResultsChunkSize,) )
     VAR_MagLatValues.description = "Magnetic Latitude"
     VAR_MagLatValues.units       = "degrees"
     resultsCDF.createDimension( "mlt_dim", None )
-    VAR_MLTValues = resultsCDF.createVariable("allMLTValues", "f4", ("mlt_dim",) )
+    VAR_MLTValues = resultsCDF.createVariable("allMLTValues", "f4", ("mlt_dim",), chunksizes=(ResultsChunkSize,) )
     VAR_MLTValues.description = "Magnetic Local Time"
     VAR_MLTValues.units       = "hours"
     resultsCDF.createDimension( "alt_dim", None )
-    VAR_AltitudeValues = resultsCDF.createVariable("allAltitudeValues", "f4", ("alt_dim",) )
+    VAR_AltitudeValues = resultsCDF.createVariable("allAltitudeValues", "f4", ("alt_dim",), chunksizes=(ResultsChunkSize,) )
     VAR_AltitudeValues.description = "Altitude from the surface of the Earth"
     VAR_AltitudeValues.units       = "km"
     resultsCDF.createDimension( "lat_dim", None )
-    VAR_LatValues = resultsCDF.createVariable("allLatValues", "f4", ("lat_dim",) )
+    VAR_LatValues = resultsCDF.createVariable("allLatValues", "f4", ("lat_dim",), chunksizes=(ResultsChunkSize,) )
     VAR_LatValues.description = "Latitude"
     VAR_LatValues.units       = "degrees"
     resultsCDF.createDimension( "kp_dim", None )
-    VAR_KpValues = resultsCDF.createVariable("allKpValues", "f4", ("kp_dim",) )
+    VAR_KpValues = resultsCDF.createVariable("allKpValues", "f4", ("kp_dim",), chunksizes=(ResultsChunkSize,) )
     VAR_KpValues.description = "Kp index of Sun activity"
     VAR_KpValues.units       = "-"
     resultsCDF.createDimension( "bins_dim", None )
     VAR_HittedBinIDs = resultsCDF.createVariable("allHittedBinIDs", "S1", ("bins_dim","char8",) )
     VAR_HittedBinIDs.description = "The ID of the bin, where the hit occured"
     resultsCDF.createDimension( "eex_dim", None )
-    VAR_EEXvalues = resultsCDF.createVariable("allEEXValues", "f4", ("eex_dim",) )
+    VAR_EEXvalues = resultsCDF.createVariable("allEEXValues", "f4", ("eex_dim",), chunksizes=(ResultsChunkSize,) )
     VAR_EEXvalues.description = "Electric field strength East. (SI)"
     VAR_EEXvalues.units       = "V/m"
     resultsCDF.createDimension( "eey_dim", None )
-    VAR_EEYvalues = resultsCDF.createVariable("allEEYValues", "f4", ("eey_dim",) )
+    VAR_EEYvalues = resultsCDF.createVariable("allEEYValues", "f4", ("eey_dim",), chunksizes=(ResultsChunkSize,) )
     VAR_EEYvalues.description = "Electric field strength North. (SI)"
     VAR_EEYvalues.units       = "V/m"
     resultsCDF.createDimension( "ped_dim", None )
-    VAR_Pedersenvalues = resultsCDF.createVariable("allPedersenValues", "f4", ("ped_dim",) )
+    VAR_Pedersenvalues = resultsCDF.createVariable("allPedersenValues", "f4", ("ped_dim",), chunksizes=(ResultsChunkSize,) )
     VAR_Pedersenvalues.description = "Pedersen Conductivity"
     VAR_Pedersenvalues.units       = "S/m"
     resultsCDF.createDimension( "den_dim", None )
-    VAR_Densityvalues = resultsCDF.createVariable("allDensityValues", "f4", ("den_dim",) )
+    VAR_Densityvalues = resultsCDF.createVariable("allDensityValues", "f4", ("den_dim",), chunksizes=(ResultsChunkSize,) )
     VAR_Densityvalues.description = "Total Density"
     VAR_Densityvalues.units       = "g/cm3"
     resultsCDF.createDimension( "lev_dim", None )
-    VAR_LevValues = resultsCDF.createVariable("allLevValues", "f4", ("lev_dim",) )
+    VAR_LevValues = resultsCDF.createVariable("allLevValues", "f4", ("lev_dim",), chunksizes=(ResultsChunkSize,) )
     VAR_LevValues.description = "midpoint levels"
     VAR_LevValues.units       = ""
     resultsCDF.createDimension( "hal_dim", None )
-    VAR_Hallvalues = resultsCDF.createVariable("allHallValues", "f4", ("hal_dim",) )
+    VAR_Hallvalues = resultsCDF.createVariable("allHallValues", "f4", ("hal_dim",), chunksizes=(ResultsChunkSize,) )
     VAR_Hallvalues.description = "Hall Conductivity"
     VAR_Hallvalues.units       = "S/m"
     resultsCDF.createDimension( "convh_dim", None )
-    VAR_ConvhValues = resultsCDF.createVariable("allConvectionHeatingValues", "f4", ("convh_dim",) )
+    VAR_ConvhValues = resultsCDF.createVariable("allConvectionHeatingValues", "f4", ("convh_dim",), chunksizes=(ResultsChunkSize,) )
     VAR_ConvhValues.description = "Convection Heating"
     VAR_ConvhValues.units       = "W/m3"
     resultsCDF.createDimension( "windh_dim", None )
-    VAR_WindhValues = resultsCDF.createVariable("allWindHeatingValues", "f4", ("windh_dim",) )
+    VAR_WindhValues = resultsCDF.createVariable("allWindHeatingValues", "f4", ("windh_dim",), chunksizes=(ResultsChunkSize,) )
     VAR_WindhValues.description = "Wind Correction"
     VAR_WindhValues.units       = "W/m3"
+    # nothing has been appended yet
+    init_committed_lengths( resultsCDF )
     resultsCDF.close()
     
     
+# The committed lengths of all result-file variables are stored together in the global attribute CommittedLengths, 
+# each variable holds its position in it (CommitIndex). commit_append() replaces the whole attribute at once, 
+# so the lengths are either all from before or all from after a save, even if the save is interrupted while committing.
+def init_committed_lengths( resultsCDF ):
+    """
+    Creates the CommittedLengths attribute of a result-file and the CommitIndex of its variables, if they do not exist. 
+    The variables of files written before CommittedLengths was introduced keep the lengths they had.
+    """
+    if "CommittedLengths" in resultsCDF.ncattrs(): return
+    Lengths = list()
+    for VAR in resultsCDF.variables.values():
+        if VAR.dtype != np.float32: continue
+        Lengths.append( committed_length(VAR) )
+        VAR.CommitIndex = len(Lengths) - 1
+    resultsCDF.CommittedLengths = np.array( Lengths, dtype=np.int64 )
+
+def committed_length( VAR ):
+    """
+    Returns the number of values of a result-file variable which belong to completed saves. 
+    Files written before CommittedLengths was introduced are read as they are: up to the CommittedLength of each variable or complete.
+    """
+    try:
+        return int( np.atleast_1d( VAR.group().CommittedLengths )[ VAR.CommitIndex ] )
+    except AttributeError:
+        pass
+    try:
+        return int( VAR.CommittedLength )
+    except AttributeError:
+        return VAR.shape[0]
+
+def read_committed( resultsCDF, VariableName ):
+    """
+    Reads the values of a result-file variable which belong to completed saves.
+    """
+    VAR = resultsCDF.variables[ VariableName ]
+    return VAR[ :committed_length(VAR) ]
+
+def begin_append( resultsCDF, BatchName ):
+    """
+    Marks the result-file as being written. The mark stays in the file if the writing is interrupted, see commit_append().
+    Values written after the mark are not visible to the readers before commit_append().
+    """
+    init_committed_lengths( resultsCDF )
+    resultsCDF.AppendInProgress = BatchName if len(BatchName) > 0 else "unnamed"
+    resultsCDF.sync()
+
+def append_values( resultsCDF, VariableName, newValues, Committed ):
+    """
+    Writes newValues after the committed values of a result-file variable and remembers the new length in the dictionary Committed.
+    Values left by an interrupted save are overwritten.
+    """
+    if len(newValues) == 0: return
+    VAR = resultsCDF.variables[ VariableName ]
+    start = Committed.get( VariableName, committed_length(VAR) )
+    VAR[ start : start+len(newValues) ] = np.asarray( newValues )
+    Committed[ VariableName ] = start + len(newValues)
+
+def commit_append( resultsCDF, Committed ):
+    """
+    Makes the values written by append_values() visible to read_committed() and removes the mark of begin_append(). 
+    The new lengths of all variables are written with a single attribute, after the values. 
+    If the save is interrupted before that, the readers see none of its values, if it is interrupted afterwards only the mark is left.
+    """
+    resultsCDF.sync()
+    Lengths = np.array( np.atleast_1d( resultsCDF.CommittedLengths ), dtype=np.int64 )
+    for VariableName, length in Committed.items():
+        Lengths[ resultsCDF.variables[ VariableName ].CommitIndex ] = length
+    resultsCDF.CommittedLengths = Lengths
+    resultsCDF.sync()
+    resultsCDF.delncattr( "AppendInProgress" )
+    resultsCDF.sync()
+    
+    
 def SaveResults_CDF( ResultsFilename, DataFilename ):
     """
     Append the results in a NetCDF file which can contain results of several calculations.
     The data will be saved in ResultsFilename and they come from calculations on the netcdf DataFilename.
     DataFilename is needed to check if the file contains already the results of calculations on that file.
+    The new values are written after the values already in the file, without reading them, and become visible to load_results() only when the whole save has finished.
     
     Args:
         ResultsFilename: the netcdf file where the results will be stored.
@@ -727,43 +909,19 @@ def SaveResults_CDF( ResultsFilename, DataFilename ):
         resultsCDF.close()
         return
     resultsCDF.LastExecDurationSec = ConvertLeadingZerosToSpaces("{0:.0f}".format(CALCULATIONS_ExecutionDuration)).strip()
+    begin_append( resultsCDF, DataFilename )
+    Committed = dict()
     # save data for each bin spearately 
     for B in Bins:
         # save data about the hits inside the bin
         if len(B.Time_values) > 0:
-            resultsCDF.variables[B.ID+"_TimeValues"][:]      = resultsCDF.variables[B.ID+"_TimeValues"][:].tolist() + B.Time_values
-            resultsCDF.variables[B.ID+"_JHValues"][:]        = resultsCDF.variables[B.ID+"_JHValues"][:].tolist() + B.JH_values        
-            resultsCDF.variables[B.ID+"_MagLatValues"][:]    = resultsCDF.variables[B.ID+"_MagLatValues"][:].tolist() + B.MagLat_values
-            resultsCDF.variables[B.ID+"_MLTValues"][:]       = resultsCDF.variables[B.ID+"_MLTValues"][:].tolist() + B.MLT_values
-            resultsCDF.variables[B.ID+"_AltitudeValues"][:]  = resultsCDF.variables[B.ID+"_AltitudeValues"][:].tolist() + B.Altitude_values
-            resultsCDF.variables[B.ID+"_LatValues"][:]       = resultsCDF.variables[B.ID+"_LatValues"][:].tolist() + B.Lat_values
-            resultsCDF.variables[B.ID+"_KpValues"][:]        = resultsCDF.variables[B.ID+"_KpValues"][:].tolist() + B.Kp_values
-            resultsCDF.variables[B.ID+"_EEXValues"][:]       = resultsCDF.variables[B.ID+"_EEXValues"][:].tolist() + B.EEX_values        
-            resultsCDF.variables[B.ID+"_EEYValues"][:]       = resultsCDF.variables[B.ID+"_EEYValues"][:].tolist() + B.EEY_values
-            resultsCDF.variables[B.ID+"_PedersenValues"][:]  = resultsCDF.variables[B.ID+"_PedersenValues"][:].tolist() + B.Pedersen_values
-            resultsCDF.variables[B.ID+"_DensityValues"][:]   = resultsCDF.variables[B.ID+"_DensityValues"][:].tolist() + B.Density_values
-            resultsCDF.variables[B.ID+"_LevValues"][:]       = resultsCDF.variables[B.ID+"_LevValues"][:].tolist() + B.Lev_values
-            resultsCDF.variables[B.ID+"_HallValues"][:]      = resultsCDF.variables[B.ID+"_HallValues"][:].tolist() + B.Hall_values
-            resultsCDF.variables[B.ID+"_ConvectionHeatingValues"][:] = resultsCDF.variables[B.ID+"_ConvectionHeatingValues"][:].tolist() + B.ConvectionHeating_values
-            resultsCDF.variables[B.ID+"_WindHeatingValues"][:] = resultsCDF.variables[B.ID+"_WindHeatingValues"][:].tolist() + B.WindHeating_values
-    ## save data for all hits
+            for attr, name in HitFields:
+                append_values( resultsCDF, B.ID+"_"+name, getattr(B, attr), Committed )
+    ## save data for all hits (the lists all_<attr> of the module)
     if len(all_Time_values) > 0:
-        resultsCDF.variables["allTimeValues"][:]     = resultsCDF.variables["allTimeValues"][:].tolist() + all_Time_values
-        resultsCDF.variables["allJHValues"][:]       = resultsCDF.variables["allJHValues"][:].tolist() + all_JH_values    
-        resultsCDF.variables["allMagLatValues"][:]   = resultsCDF.variables["allMagLatValues"][:].tolist() + all_MagLat_values
-        resultsCDF.variables["allMLTValues"][:]      = resultsCDF.variables["allMLTValues"][:].tolist() + all_MLT_values
-        resultsCDF.variables["allAltitudeValues"][:] = resultsCDF.variables["allAltitudeValues"][:].tolist() + all_Altitude_values
-        resultsCDF.variables["allLatValues"][:]      = resultsCDF.variables["allLatValues"][:].tolist() + all_Lat_values
-        resultsCDF.variables["allKpValues"][:]       = resultsCDF.variables["allKpValues"][:].tolist() + all_Kp_values
-        #resultsCDF.variables["allHittedBinIDs"][:]   = resultsCDF.variables["allHittedBinIDs"][:].tolist() + netCDF4.stringtochar(np.array(all_HittedBin_IDs[:], 'S8'))
-        resultsCDF.variables["allEEXValues"][:]      = resultsCDF.variables["allEEXValues"][:].tolist() + all_EEX_values
-        resultsCDF.variables["allEEYValues"][:]      = resultsCDF.variables["allEEYValues"][:].tolist() + all_EEY_values
-        resultsCDF.variables["allPedersenValues"][:] = resultsCDF.variables["allPedersenValues"][:].tolist() + all_Pedersen_values
-        resultsCDF.variables["allDensityValues"][:]  = resultsCDF.variables["allDensityValues"][:].tolist() + all_Density_values
-        resultsCDF.variables["allLevValues"][:]      = resultsCDF.variables["allLevValues"][:].tolist() + all_Lev_values
-        resultsCDF.variables["allHallValues"][:]     = resultsCDF.variables["allHallValues"][:].tolist() + all_Hall_values
-        resultsCDF.variables["allConvectionHeatingValues"][:] = resultsCDF.variables["allConvectionHeatingValues"][:].tolist() + all_ConvectionHeating_values
-        resultsCDF.variables["allWindHeatingValues"][:] = resultsCDF.variables["allWindHeatingValues"][:].tolist() + all_WindHeating_values
+        for attr, name in HitFields:
+            append_values( resultsCDF, "all"+name, globals()["all_"+attr], Committed )
+    commit_append( resultsCDF, Committed )
     #
     resultsCDF.close()    
     
@@ -820,6 +978,8 @@ def load_results( filepath, VariableToLoad, loadBinValues=True, loadGlobalValues
         if file_idx % 10 == 0: print( "Now Loading", All_ResultFilenames[file_idx] )
         #if file_idx == 30: break
         resultsCDF = Dataset( All_ResultFilenames[file_idx], 'r' )
+        if "AppendInProgress" in resultsCDF.ncattrs():
+            print( "!!! The last save into", All_ResultFilenames[file_idx], "(", resultsCDF.AppendInProgress, ") was not completed. Only the values of completed saves are loaded." )
         #### load general information
         if file_idx == 0:
             try:
@@ -841,56 +1001,56 @@ def load_results( filepath, VariableToLoad, loadBinValues=True, loadGlobalValues
         if loadBinValues:
             for B in Bins:
                 try:
-                    if loadTimeValues and len(CALCULATIONS_OrbitFilesPath) > 0: concatLists( B.Time_values, list(resultsCDF.variables[ B.ID+"_TimeValues" ][:]) )
-                    if loadMagLatValues: concatLists( B.MagLat_values, list(resultsCDF.variables[ B.ID+"_MagLatValues" ][:]) )
-                    if loadMLTvalues: concatLists( B.MLT_values, list(resultsCDF.variables[ B.ID+"_MLTValues" ][:]) )
-                    if loadAltValues: concatLists( B.Altitude_values, list(resultsCDF.variables[ B.ID+"_AltitudeValues" ][:]) )
+                    if loadTimeValues and len(CALCULATIONS_OrbitFilesPath) > 0: concatLists( B.Time_values, list(read_committed( resultsCDF, B.ID+"_TimeValues" )) )
+                    if loadMagLatValues: concatLists( B.MagLat_values, list(read_committed( resultsCDF, B.ID+"_MagLatValues" )) )
+                    if loadMLTvalues: concatLists( B.MLT_values, list(read_committed( resultsCDF, B.ID+"_MLTValues" )) )
+                    if loadAltValues: concatLists( B.Altitude_values, list(read_committed( resultsCDF, B.ID+"_AltitudeValues" )) )
                     try:
-                        if loadLatValues: concatLists(B.Lat_values, list(resultsCDF.variables[ B.ID+"_LatValues" ][:]) )
+                        if loadLatValues: concatLists(B.Lat_values, list(read_committed( resultsCDF, B.ID+"_LatValues" )) )
                     except:
                         pass
-                    if loadKpValues: concatLists(B.Kp_values, list(resultsCDF.variables[ B.ID+"_KpValues" ][:]) )
+                    if loadKpValues: concatLists(B.Kp_values, list(read_committed( resultsCDF, B.ID+"_KpValues" )) )
                     if VariableToLoad == "Ohmic":    
                         try:
-                            Ohmics = resultsCDF.variables[ B.ID+"_ConvectionHeatingValues" ][:] + resultsCDF.variables[ B.ID+"_WindHeatingValues" ][:]
+                            Ohmics = read_committed( resultsCDF, B.ID+"_ConvectionHeatingValues" ) + read_committed( resultsCDF, B.ID+"_WindHeatingValues" )
                             concatLists( B.JH_values, list(Ohmics) ) #    if VariableToLoad == "Ohmic":     concatLists( B.JH_values, list(resultsCDF.variables[ B.ID+"_ConvenctionHeatingValues" ][:]+resultsCDF.variables[ B.ID+"_WindHeatingValues" ][:]) )
                         except:
-                            Ohmics = resultsCDF.variables[ B.ID+"_JHValues" ][:]
+                            Ohmics = read_committed( resultsCDF, B.ID+"_JHValues" )
                             concatLists( B.JH_values, list(Ohmics) )
-                    if VariableToLoad == "EEX":    concatLists( B.JH_values, list(resultsCDF.variables[ B.ID+"_EEXValues" ][:])*1000 ) #if VariableToLoad == "EEX_si":    B.EEX_values = list(resultsCDF.variables[ B.ID+"_EEXValues" ][:])
-                    if VariableToLoad == "EEY":    concatLists( B.JH_values, list(resultsCDF.variables[ B.ID+"_EEYValues" ][:])*1000 ) #if VariableToLoad == "EEY_si":    B.EEY_values = list(resultsCDF.variables[ B.ID+"_EEYValues" ][:])
-                    if VariableToLoad == "SIGMA_PED": concatLists( B.JH_values, list(resultsCDF.variables[ B.ID+"_PedersenValues" ][:]) ) #if VariableToLoad == "SIGMA_PED": B.Pedersen_values = list(resultsCDF.variables[ B.ID+"_PedersenValues" ][:])
-                    if VariableToLoad == "SIGMA_HAL": concatLists( B.JH_values, list(resultsCDF.variables[ B.ID+"_HallValues" ][:]) ) #if VariableToLoad == "SIGMA_HAL": B.Hall_values = list(resultsCDF.variables[ B.ID+"_HallValues" ][:])
+                    if VariableToLoad == "EEX":    concatLists( B.JH_values, list(read_committed( resultsCDF, B.ID+"_EEXValues" ))*1000 ) #if VariableToLoad == "EEX_si":    B.EEX_values = list(resultsCDF.variables[ B.ID+"_EEXValues" ][:])
+                    if VariableToLoad == "EEY":    concatLists( B.JH_values, list(read_committed( resultsCDF, B.ID+"_EEYValues" ))*1000 ) #if VariableToLoad == "EEY_si":    B.EEY_values = list(resultsCDF.variables[ B.ID+"_EEYValues" ][:])
+                    if VariableToLoad == "SIGMA_PED": concatLists( B.JH_values, list(read_committed( resultsCDF, B.ID+"_PedersenValues" )) ) #if VariableToLoad == "SIGMA_PED": B.Pedersen_values = list(resultsCDF.variables[ B.ID+"_PedersenValues" ][:])
+                    if VariableToLoad == "SIGMA_HAL": concatLists( B.JH_values, list(read_committed( resultsCDF, B.ID+"_HallValues" )) ) #if VariableToLoad == "SIGMA_HAL": B.Hall_values = list(resultsCDF.variables[ B.ID+"_HallValues" ][:])
                     try:
-                        if VariableToLoad == "Convection_heating": concatLists( B.JH_values, list(resultsCDF.variables[ B.ID+"_ConvectionHeatingValues" ][:]) )
+                        if VariableToLoad == "Convection_heating": concatLists( B.JH_values, list(read_committed( resultsCDF, B.ID+"_ConvectionHeatingValues" )) )
                     except:
-                        if VariableToLoad == "Convection_heating": concatLists( B.JH_values, list(resultsCDF.variables[ B.ID+"_ConvenctionHeatingValues" ][:]) )
-                    if VariableToLoad == "Wind_heating": concatLists( B.JH_values, list(resultsCDF.variables[ B.ID+"_WindHeatingValues" ][:]) )
+                        if VariableToLoad == "Convection_heating": concatLists( B.JH_values, list(read_committed( resultsCDF, B.ID+"_ConvenctionHeatingValues" )) )
+                    if VariableToLoad == "Wind_heating": concatLists( B.JH_values, list(read_committed( resultsCDF, B.ID+"_WindHeatingValues" )) )
                 except: # data about this region do not exist inside this netcdf file
                     continue
         #### load collective data about all bins
         if loadGlobalValues:
-            if loadTimeValues and len(CALCULATIONS_OrbitFilesPath) > 0: concatLists( all_Time_values, list(resultsCDF.variables[ "allTimeValues" ][:]) )
-            if loadMagLatValues:  concatLists( all_MagLat_values, list(resultsCDF.variables[ "allMagLatValues" ][:]) )
-            if loadMLTvalues: concatLists( all_MLT_values, list(resultsCDF.variables[ "allMLTValues" ][:]) )
-            if loadAltValues: concatLists( all_Altitude_values, list(resultsCDF.variables[ "allAltitudeValues" ][:]) )
+            if loadTimeValues and len(CALCULATIONS_OrbitFilesPath) > 0: concatLists( all_Time_values, list(read_committed( resultsCDF, "allTimeValues" )) )
+            if loadMagLatValues:  concatLists( all_MagLat_values, list(read_committed( resultsCDF, "allMagLatValues" )) )
+            if loadMLTvalues: concatLists( all_MLT_values, list(read_committed( resultsCDF, "allMLTValues" )) )
+            if loadAltValues: concatLists( all_Altitude_values, list(read_committed( resultsCDF, "allAltitudeValues" )) )
             try:
-                if loadLatValues: concatLists( all_Lat_values, list(resultsCDF.variables[ "allLatValues" ][:]) )
+                if loadLatValues: concatLists( all_Lat_values, list(read_committed( resultsCDF, "allLatValues" )) )
             except:
                 pass
-            if loadKpValues: concatLists( all_Kp_values, list(resultsCDF.variables[ "allKpValues" ][:]) )
+            if loadKpValues: concatLists( all_Kp_values, list(read_committed( resultsCDF, "allKpValues" )) )
             if VariableToLoad == "Ohmic": 
                 try:
-                    Ohmics = resultsCDF.variables[ "allConvectionHeatingValues" ][:] + resultsCDF.variables[ "allWindHeatingValues" ][:]
+                    Ohmics = read_committed( resultsCDF, "allConvectionHeatingValues" ) + read_committed( resultsCDF, "allWindHeatingValues" )
                     concatLists( all_JH_values, list(Ohmics) ) #if VariableToLoad == "Ohmic":     concatLists( all_JH_values, list(resultsCDF.variables[ "allConvenctionHeatingValues" ][:] + resultsCDF.variables[ "allWindHeatingValues" ][:]) )
                 except:
-                    Ohmics = resultsCDF.variables[ "allJHValues" ][:]
+                    Ohmics = read_committed( resultsCDF, "allJHValues" )
                     concatLists( all_JH_values, list(Ohmics) ) 
-            if VariableToLoad == "EEX":    concatLists( all_JH_values, list(resultsCDF.variables[ "allEEXValues" ][:]*1000) )#if VariableToLoad == "EEX_si":    all_EEX_values = list(resultsCDF.variables[ "allEEXValues" ][:])
-            if VariableToLoad == "EEY":    concatLists( all_JH_values, list(resultsCDF.variables[ "allEEYValues" ][:]*1000) )#if VariableToLoad == "EEY_si":    all_EEY_values = list(resultsCDF.variables[ "allEEYValues" ][:])
-            if VariableToLoad == "SIGMA_PED": concatLists( all_JH_values, list(resultsCDF.variables[ "allPedersenValues" ][:]) )#if VariableToLoad == "SIGMA_PED": all_Pedersen_values = list(resultsCDF.variables[ "allPedersenValues" ][:])
-            if VariableToLoad == "SIGMA_HAL": concatLists( all_JH_values, list(resultsCDF.variables[ "allHallValues" ][:]) )#if VariableToLoad == "SIGMA_HAL": all_Hall_values = list(resultsCDF.variables[ "allHallValues" ][:])
-            if VariableToLoad == "JH/mass":   concatLists( all_JH_values, list(resultsCDF.variables[ "allJHValues" ][:]/(1000*resultsCDF.variables[ "allDensityValues" ][:]) ) )
+            if VariableToLoad == "EEX":    concatLists( all_JH_values, list(read_committed( resultsCDF, "allEEXValues" )*1000) )#if VariableToLoad == "EEX_si":    all_EEX_values = list(resultsCDF.variables[ "allEEXValues" ][:])
+            if VariableToLoad == "EEY":    concatLists( all_JH_values, list(read_committed( resultsCDF, "allEEYValues" )*1000) )#if VariableToLoad == "EEY_si":    all_EEY_values = list(resultsCDF.variables[ "allEEYValues" ][:])
+            if VariableToLoad == "SIGMA_PED": concatLists( all_JH_values, list(read_committed( resultsCDF, "allPedersenValues" )) )#if VariableToLoad == "SIGMA_PED": all_Pedersen_values = list(resultsCDF.variables[ "allPedersenValues" ][:])
+            if VariableToLoad == "SIGMA_HAL": concatLists( all_JH_values, list(read_committed( resultsCDF, "allHallValues" )) )#if VariableToLoad == "SIGMA_HAL": all_Hall_values = list(resultsCDF.variables[ "allHallValues" ][:])
+            if VariableToLoad == "JH/mass":   concatLists( all_JH_values, list(read_committed( resultsCDF, "allJHValues" )/(1000*read_committed( resultsCDF, "allDensityValues" )) ) )
             if VariableToLoad == "JH/pressure": 
                 #newVals = np.zeros( len(resultsCDF.variables[ "allJHValues" ]) )
                 #for i in range( 0, len(resultsCDF.variables[ "allJHValues" ]) ):
@@ -898,12 +1058,12 @@ def load_results( filepath, VariableToLoad, loadBinValues=True, loadGlobalValues
                 #concatLists( all_JH_values, list(newVals) )
                 #print( "QQQQ ", resultsCDF.variables[ "allJHValues" ][1], resultsCDF.variables[ "allJHValues" ][1000] )
                 #print( "QQQQ ", resultsCDF.variables[ "allAltitudeValues" ][1],  resultsCDF.variables[ "allAltitudeValues" ][1000] )
-                concatLists( all_JH_values, list(resultsCDF.variables[ "allJHValues" ][:]/(0.00005*np.exp(-resultsCDF.variables[ "allLevValues" ][:]) ) ) )
+                concatLists( all_JH_values, list(read_committed( resultsCDF, "allJHValues" )/(0.00005*np.exp(-read_committed( resultsCDF, "allLevValues" )) ) ) )
             try:
-                if VariableToLoad == "Convection_heating": concatLists( all_JH_values, list(resultsCDF.variables[ "allConvectionHeatingValues" ][:]) )
+                if VariableToLoad == "Convection_heating": concatLists( all_JH_values, list(read_committed( resultsCDF, "allConvectionHeatingValues" )) )
             except:
-                if VariableToLoad == "Convection_heating": concatLists( all_JH_values, list(resultsCDF.variables[ "allConvenctionHeatingValues" ][:]) )
-            if VariableToLoad == "Wind_heating": concatLists( all_JH_values, list(resultsCDF.variables[ "allWindHeatingValues" ][:]) )
+                if VariableToLoad == "Convection_heating": concatLists( all_JH_values, list(read_committed( resultsCDF, "allConvenctionHeatingValues" )) )
+            if VariableToLoad == "Wind_heating": concatLists( all_JH_values, list(read_committed( resultsCDF, "allWindHeatingValues" )) )
         #### close and go on
         resultsCDF.close()
     ########
@@ -966,6 +1126,115 @@ def load_results( filepath, VariableToLoad, loadBinValues=True, loadGlobalValues
     CalculateStatsOnData()
     print( "Results loaded for", VariableToLoad, "    ", datetime.now(), "\n" )
 
+
+LoadChunkSize = 1000000 # how many values of a result-file variable iterate_results() reads at once
+
+def result_sources( resultsCDF, Prefix, VariableToLoad ):
+    """
+    Returns the result-file variables from which VariableToLoad (see load_results()) is calculated and the function which calculates it from their values.
+    VariableToLoad can also be the name of a result-file variable without its prefix, for example JHValues.
+    
+    Args:
+        Prefix: "all" for the variables of all hits or the Bin ID followed by "_" for the variables of a Bin.
+    """
+    def exist( *names ): return all( Prefix+name in resultsCDF.variables for name in names )
+    if VariableToLoad == "Ohmic":
+        if exist( "ConvectionHeatingValues", "WindHeatingValues" ): return ["ConvectionHeatingValues", "WindHeatingValues"], lambda convection, wind: convection + wind
+        return ["JHValues"], lambda v: v
+    if VariableToLoad == "EEX":       return ["EEXValues"], lambda v: v*1000
+    if VariableToLoad == "EEY":       return ["EEYValues"], lambda v: v*1000
+    if VariableToLoad == "SIGMA_PED": return ["PedersenValues"], lambda v: v
+    if VariableToLoad == "SIGMA_HAL": return ["HallValues"], lambda v: v
+    if VariableToLoad == "Convection_heating":
+        if exist( "ConvectionHeatingValues" ): return ["ConvectionHeatingValues"], lambda v: v
+        return ["ConvenctionHeatingValues"], lambda v: v
+    if VariableToLoad == "Wind_heating": return ["WindHeatingValues"], lambda v: v
+    if VariableToLoad == "JH/mass":      return ["JHValues", "DensityValues"], lambda jh, density: jh/(1000*density)
+    if VariableToLoad == "JH/pressure":  return ["JHValues", "LevValues"], lambda jh, lev: jh/(0.00005*np.exp(-lev))
+    return [VariableToLoad], lambda v: v
+
+def in_range( values, Range, isMLT=False ):
+    """
+    Returns a boolean array which is True where values lie inside Range=(min, max]. MLT ranges like 22-2 are handled as in is_MLT_inside_range().
+    """
+    Range_min, Range_max = Range
+    if isMLT and Range_min > Range_max: 
+        return (values > Range_min) | (values <= Range_max)
+    if isMLT and Range_min == Range_max:
+        return np.ones( len(values), dtype=bool )
+    return (values > Range_min) & (values <= Range_max)
+
+def iterate_results( filepath, VariableToLoad, BinIDs=None, Fields=(), KpRange=None, MLTRange=None, AltitudeRange=None, ChunkSize=None ):
+    """
+    Reads the values of a netcdf result-file or a result-folder in chunks, so that variables larger than the memory can be processed. 
+    The filters are applied while reading: the variables of the filters are read first and the rest of a chunk is read only if some of its values pass. 
+    Bins whose variables do not exist inside a file are skipped, as in load_results().
+    
+    Args:
+        filepath: the netcdf result-filename or a folder (the last character has to be a slash '/') which contains many netcdf result-files.
+        VariableToLoad: the variable which the user is interested in (see load_results()).
+        BinIDs: the IDs of the Bins to read. "all" stands for the values of all hits. Default: the IDs of all Bins.
+        Fields: the Bin attributes of parallel data to read as well, for example ("MLT_values", "Kp_values"). See HitFields.
+        KpRange, MLTRange, AltitudeRange: (min, max) filters. Only values with min < value <= max are returned.
+        ChunkSize: how many values are read at once. Default: LoadChunkSize.
+    Yields:
+        (BinID, chunk) where chunk is a dictionary of numpy arrays with the key "JH_values" for VariableToLoad (as in load_results()) and one key per Field.
+    """
+    if ChunkSize is None: ChunkSize = LoadChunkSize
+    if BinIDs is None: BinIDs = [ B.ID for B in Bins ]
+    FieldNames = dict( HitFields )
+    Filters = [ (FieldNames[F], R, F=="MLT_values") for F, R in (("Kp_values", KpRange), ("MLT_values", MLTRange), ("Altitude_values", AltitudeRange)) if R is not None ]
+    if filepath[-1] == '/':
+        All_ResultFilenames = sorted( glob.glob(filepath+"*.nc") )
+    else:
+        All_ResultFilenames = [ filepath ]
+    for ResultFilename in All_ResultFilenames:
+        resultsCDF = Dataset( ResultFilename, 'r' )
+        try:
+            for BinID in BinIDs:
+                Prefix = "all" if BinID == "all" else BinID+"_"
+                Sources, calculate = result_sources( resultsCDF, Prefix, VariableToLoad )
+                FieldVariables = [ FieldNames[F] for F in Fields ]
+                Names = set( Sources + FieldVariables + [name for name, R, isMLT in Filters] )
+                if not all( Prefix+name in resultsCDF.variables for name in Names ): continue
+                VARs = { name: resultsCDF.variables[Prefix+name] for name in Names }
+                for VAR in VARs.values(): VAR.set_var_chunk_cache( size=0 ) # each value is read once, caching only costs memory
+                length = min( committed_length(VAR) for VAR in VARs.values() )
+                for start in range( 0, length, ChunkSize ):
+                    stop = min( start+ChunkSize, length )
+                    read = lambda name: np.ma.filled( VARs[name][start:stop], np.nan )
+                    passed = None
+                    for name, Range, isMLT in Filters:
+                        inside = in_range( read(name), Range, isMLT )
+                        passed = inside if passed is None else passed & inside
+                    if passed is not None:
+                        if not passed.any(): continue
+                        if passed.all(): passed = None
+                    select = (lambda values: values) if passed is None else (lambda values: values[passed])
+                    chunk = { "JH_values": select( calculate(*[read(name) for name in Sources]) ) }
+                    for F, name in zip( Fields, FieldVariables ):
+                        chunk[F] = select( read(name) )
+                    yield BinID, chunk
+        finally:
+            resultsCDF.close()
+
+def load_results_arrays( filepath, VariableToLoad, BinIDs=None, Fields=(), KpRange=None, MLTRange=None, AltitudeRange=None ):
+    """
+    Reads the values of a netcdf result-file or a result-folder into numpy arrays, one per Bin and variable, without filling the Bins. 
+    It is the array counterpart of load_results(), see iterate_results() for the arguments.
+    Returns:
+        a dictionary with the Bin IDs as keys and dictionaries of numpy arrays as values, with the key "JH_values" for VariableToLoad and one key per Field. 
+        Bins without values are not included.
+    """
+    Chunks = dict()
+    for BinID, chunk in iterate_results( filepath, VariableToLoad, BinIDs, Fields, KpRange, MLTRange, AltitudeRange ):
+        Chunks.setdefault( BinID, list() ).append( chunk )
+    Results = dict()
+    for BinID in list( Chunks ):
+        chunks = Chunks.pop( BinID ) # the chunks of each Bin are released as soon as they are joined
+        Results[ BinID ] = { key: np.concatenate([chunk[key] for chunk in chunks]) for key in chunks[0] }
+    return Results
+
     
     
     
@@ -1265,291 +1534,416 @@ def calc_stats_for_orbit( TIEGCM_filesPath, Orbit_filesPath, ResultsFilename ):
         
         
         
-DiskAccessLock = threading.Lock()   
-class Thread_ValueAssigner (threading.Thread):
+# The Bin attributes which are filled for every hit and the names of the corresponding result-file variables.
+# The per-bin variables are named <Bin ID>_<name> and the variables for all hits all<name>
+HitFields = [ ("Time_values",              "TimeValues"),
+              ("JH_values",                "JHValues"),
+              ("MagLat_values",            "MagLatValues"),
+              ("MLT_values",               "MLTValues"),
+              ("Altitude_values",          "AltitudeValues"),
+              ("Lat_values",               "LatValues"),
+              ("Kp_values",                "KpValues"),
+              ("EEX_values",               "EEXValues"),
+              ("EEY_values",               "EEYValues"),
+              ("Pedersen_values",          "PedersenValues"),
+              ("Hall_values",              "HallValues"),
+              ("Density_values",           "DensityValues"),
+              ("Lev_values",               "LevValues"),
+              ("ConvectionHeating_values", "ConvectionHeatingValues"),
+              ("WindHeating_values",       "WindHeatingValues") ]
+
+# The 4D variables which are loaded from a TIEGCM file during the calculation
+TIEGCM_4D_Fields = 11
+
+
+def assign_values_from_file( DataFilename, BinsToFill=None ):
     """
-    This thread executes the actual calculation using a single source file (DataFilename) and producing one result file (ResultsFilename): 
-        - reads the netcdf orbit or tiegcm file
+    Executes the actual calculation using a single TIEGCM file: 
+        - reads the netcdf tiegcm file
         - checks every space-time position
-        - assign the position's data to the corresponding Bin 
-        - saves the above data into a netcdf results-file
-    Threads are employed in order to speed up the calculation when there are many source files. 
-    There will be one thread for each source file
+        - assigns the position's data to the corresponding Bin 
+    All positions of the file are checked and assigned at once with array operations (see match_bins).  
+    It does not modify the Bins or the all_* lists of the module, so it can be executed by a separate process for each source file.
+    
+    Args:
+        DataFilename: the netcdf tiegcm file to be read.
+        BinsToFill: the list of Bins to be filled. By default the Bins of the module.
+    Returns:
+        (hits, values) where hits is an integer array holding, for each hit, the index of the matched Bin inside BinsToFill 
+        and values is a dictionary with a numpy array for each Bin attribute of HitFields, in the order of the hits.  
+        None if the file could not be read.
+    """
+    if BinsToFill is None: BinsToFill = Bins
+    print( "Worker start",  datetime.now().strftime("%d-%m-%Y %H:%M:%S"), DataFilename, "\n" )
+    MagLat_min =  1000
+    MagLat_max = -1000
+    MLT_min    =  1000
+    MLT_max    = -1000
+    Altitude_min    =  1000
+    Altitude_max    = -1000
+    Lat_min     =  1000
+    Lat_max     = -1000    
+    Kp_min     =  1000
+    Kp_max     = -1000
+    for B in BinsToFill:
+        if B.MagLat_min < MagLat_min: MagLat_min = B.MagLat_min 
+        if B.MagLat_max > MagLat_max: MagLat_max = B.MagLat_max
+        if B.MLT_min < MLT_min: MLT_min = B.MLT_min 
+        if B.MLT_max > MLT_max: MLT_max = B.MLT_max
+        if B.Altitude_min < Altitude_min: Altitude_min = B.Altitude_min 
+        if B.Altitude_max > Altitude_max: Altitude_max = B.Altitude_max
+        if B.Lat_min < Lat_min: Lat_min = B.Lat_min 
+        if B.Lat_max > Lat_max: Lat_max = B.Lat_max                        
+        if B.Kp_min < Kp_min: Kp_min = B.Kp_min 
+        if B.Kp_max > Kp_max: Kp_max = B.Kp_max            
+    
+    # parse TIEGCM file
+    try:
+        CDFroot = Dataset( DataFilename, 'r' )
+        print( "Reading", DataFilename )
+    except:
+        print ( "WRONG FORMAT:", DataFilename )
+        return None
+    try:
+        FileStartTimeStamp = calendar.timegm( datetime.strptime( CDFroot.variables['time'].units[14:],  "%Y-%m-%d %H:%M:%S" ).utctimetuple() ) # ex: "minutes since 2015-1-1 0:0:0"
+    except:
+        print ( "WRONG CONTENTS:", DataFilename )
+        CDFroot.close()
+        return None
+    length_time = CDFroot.variables['Ohmic'].shape[0]
+    length_lev  = CDFroot.variables['Ohmic'].shape[1]
+    length_lat  = CDFroot.variables['Ohmic'].shape[2]
+    length_lon  = CDFroot.variables['Ohmic'].shape[3]
+    # Load or calculate all basic values from the netcdf file
+    try:
+        TIMEs   = CDFroot.variables['time'][:] # minutes since the start time
+        LATs    = CDFroot.variables['lat'][:] 
+        ALTs    = CDFroot.variables['ZGMID'][:, :, :, :] / 100000 # it is stored in cm inside the file
+        JHs     = CDFroot.variables['Ohmic'][:, :, :, :]
+        KPs     = CDFroot.variables['Kp'][:]
+        MAGLATs = CDFroot.variables['mlat_qdf'][:, :, :, :] 
+        MLTs    = CDFroot.variables['mlt_qdf'][:, :, :, :] 
+        EEXs    = CDFroot.variables['EEX'][:, :, :, :] 
+        EEYs    = CDFroot.variables['EEY'][:, :, :, :] 
+        PEDs    = CDFroot.variables['SIGMA_PED'][:, :, :, :] 
+        HALs    = CDFroot.variables['SIGMA_HAL'][:, :, :, :]
+        DENs    = CDFroot.variables['DEN'][:, :, :, :] 
+        LEVs    = CDFroot.variables['lev'][:] 
+        try:
+            CONV_H  = CDFroot.variables['Convection_heating'][:, :, :, :]
+        except:
+            CONV_H  = CDFroot.variables['Convenction_heating'][:, :, :, :]
+        WIND_H  = CDFroot.variables['Wind_heating'][:, :, :, :]
+    except Exception as e:
+        print( "Worker aborted while reading",  datetime.now().strftime("%d-%m-%Y %H:%M:%S"), DataFilename, ":", e, repr(e), "\n" )
+        CDFroot.close()
+        return None
+    CDFroot.close()
+    print( "Worker file read done",  datetime.now().strftime("%d-%m-%Y %H:%M:%S"), DataFilename, "\n" )
+
+    # all positions in the order lat, lon, lev, time
+    def loop_order( A ):
+        return np.ma.filled( np.ma.asarray(A, dtype=float), np.nan ).transpose(2, 3, 1, 0)
+    LAT    = np.ma.filled( np.ma.asarray(LATs, dtype=float), np.nan )
+    KP     = np.ma.filled( np.ma.asarray(KPs, dtype=float), np.nan )
+    ALT    = loop_order( ALTs )
+    MAGLAT = loop_order( MAGLATs )
+    MLT    = loop_order( MLTs )
+    # keep the positions inside the overall ranges of the Bins
+    with np.errstate(invalid='ignore'):
+        candidates = ~( (LAT < Lat_min) | (LAT > Lat_max) )[:, None, None, None]
+        candidates = candidates & (ALT >= Altitude_min) & (ALT <= Altitude_max) & (MAGLAT >= MagLat_min) & (MAGLAT <= MagLat_max)
+        if MLT_min < MLT_max:
+            candidates &= (MLT > MLT_min) & (MLT <= MLT_max)
+        elif MLT_min > MLT_max:
+            candidates &= (MLT > MLT_min) | (MLT <= MLT_max)
+        candidates &= ( (KP >= Kp_min) & (KP <= Kp_max) )[None, None, None, :]
+    idx_lat, idx_lon, idx_lev, idx_time = np.nonzero( candidates )
+    del candidates
+    # assign all of them to Bins at once
+    matched = match_bins( MLT[idx_lat, idx_lon, idx_lev, idx_time], MAGLAT[idx_lat, idx_lon, idx_lev, idx_time], ALT[idx_lat, idx_lon, idx_lev, idx_time], 
+                          KP[idx_time], LAT[idx_lat], BinsToFill )
+    inBin = matched >= 0
+    hits = matched[inBin].astype(int)
+    idx_lat, idx_lon, idx_lev, idx_time = idx_lat[inBin], idx_lon[inBin], idx_lev[inBin], idx_time[inBin]
+    def hit_values( A ):
+        return np.ma.filled( np.ma.asarray( A[idx_time, idx_lev, idx_lat, idx_lon], dtype=float ), np.nan )
+    values = dict()
+    values["Time_values"]              = np.trunc( np.ma.filled( FileStartTimeStamp + TIMEs[idx_time]*120*60, np.nan ) ).astype(float)
+    values["JH_values"]                = hit_values( JHs )
+    values["MagLat_values"]            = MAGLAT[idx_lat, idx_lon, idx_lev, idx_time]
+    values["MLT_values"]               = MLT[idx_lat, idx_lon, idx_lev, idx_time]
+    values["Altitude_values"]          = ALT[idx_lat, idx_lon, idx_lev, idx_time]
+    values["Lat_values"]               = LAT[idx_lat]
+    values["Kp_values"]                = KP[idx_time]
+    values["EEX_values"]               = hit_values( EEXs )
+    values["EEY_values"]               = hit_values( EEYs )
+    values["Pedersen_values"]          = hit_values( PEDs )
+    values["Hall_values"]              = hit_values( HALs )
+    values["Density_values"]           = hit_values( DENs )
+    values["Lev_values"]               = np.ma.filled( np.ma.asarray( LEVs, dtype=float ), np.nan )[idx_lev]
+    values["ConvectionHeating_values"] = hit_values( CONV_H )
+    values["WindHeating_values"]       = hit_values( WIND_H )
+    print( "Worker finish",  datetime.now().strftime("%d-%m-%Y %H:%M:%S"), DataFilename, "\n", len(hits), "matches" )
+    return hits, values
+
+
+def group_hits_by_bin( hits, values, NumOfBins ):
+    """
+    Splits the result of assign_values_from_file() per Bin with a single sort of the hits.
+    
+    Args:
+        hits, values: the result of assign_values_from_file().
+        NumOfBins: the number of Bins which were given to assign_values_from_file().
+    Returns:
+        list with a dictionary for each Bin, holding a numpy array for each Bin attribute of HitFields in the order of the hits.
+    """
+    order  = np.argsort( hits, kind='stable' )
+    bounds = np.cumsum( np.bincount( hits, minlength=NumOfBins ) )[:-1]
+    BinValues = [ dict() for i in range(NumOfBins) ]
+    for attr in values:
+        for i, part in enumerate( np.split( values[attr][order], bounds ) ):
+            BinValues[i][attr] = part
+    return BinValues
+
+
+def save_file_results( ResultsFilename, hits, values, BinsToFill=None ):
+    """
+    Stores the result of assign_values_from_file() into a result-file created by CreateResults_CDF().
+    
+    Args:
+        ResultsFilename: the netcdf file where the results will be stored.
+        hits, values: the result of assign_values_from_file().
+        BinsToFill: the list of Bins which was given to assign_values_from_file(). By default the Bins of the module.
+    """
+    if BinsToFill is None: BinsToFill = Bins
+    resultsCDF = Dataset( ResultsFilename, 'a' )
+    resultsCDF.DateOfUpdate = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
+    resultsCDF.Region = CALCULATIONS_RegionName
+    resultsCDF.DataPath = CALCULATIONS_TIEGCMfolder
+    begin_append( resultsCDF, ResultsFilename )
+    Committed = dict()
+    if len(hits) > 0:
+        # save data for each bin seperately, keeping the order of the hits
+        for B, BinValues in zip( BinsToFill, group_hits_by_bin( hits, values, len(BinsToFill) ) ):
+            if len(BinValues["JH_values"]) > 0:
+                for attr, name in HitFields:
+                    append_values( resultsCDF, B.ID+"_"+name, BinValues[attr], Committed )
+        ## save data for all hits
+        for attr, name in HitFields:
+            append_values( resultsCDF, "all"+name, values[attr], Committed )
+    commit_append( resultsCDF, Committed )
+    resultsCDF.close()
+
+
+class Thread_ValueAssigner (threading.Thread):
+    """
+    This thread executes the calculation of assign_values_from_file() for a single source file (DataFilename) and saves the result into one result file (ResultsFilename).
+    calc_stats_for_tiegcm() executes the same calculation in separate processes.
     """
     def __init__(self, DataFilename, ResultsFilename):
         threading.Thread.__init__(self)
         self.DataFilename = DataFilename
         self.ResultsFilename = ResultsFilename
     def run(self):
-        global Bins
-        global all_JH_values
-        DataFilename = self.DataFilename
-        ResultsFilename = self.ResultsFilename
-        print( "Thread start",  datetime.now().strftime("%d-%m-%Y %H:%M:%S"), ResultsFilename, "\n" )
-        MagLat_min =  1000
-        MagLat_max = -1000
-        MLT_min    =  1000
-        MLT_max    = -1000
-        Altitude_min    =  1000
-        Altitude_max    = -1000
-        Lat_min     =  1000
-        Lat_max     = -1000    
-        Kp_min     =  1000
-        Kp_max     = -1000
-        localBins = copy.deepcopy(Bins)
-        for B in localBins:
-            B.reset()
-            if B.MagLat_min < MagLat_min: MagLat_min = B.MagLat_min 
-            if B.MagLat_max > MagLat_max: MagLat_max = B.MagLat_max
-            if B.MLT_min < MLT_min: MLT_min = B.MLT_min 
-            if B.MLT_max > MLT_max: MLT_max = B.MLT_max
-            if B.Altitude_min < Altitude_min: Altitude_min = B.Altitude_min 
-            if B.Altitude_max > Altitude_max: Altitude_max = B.Altitude_max
-            if B.Lat_min < Lat_min: Lat_min = B.Lat_min 
-            if B.Lat_max > Lat_max: Lat_max = B.Lat_max                        
-            if B.Kp_min < Kp_min: Kp_min = B.Kp_min 
-            if B.Kp_max > Kp_max: Kp_max = B.Kp_max            
-        all_JH_values.clear()
-        all_MagLat_values.clear()
-        all_MLT_values.clear()
-        all_Altitude_values.clear()
-        all_Lat_values.clear()
-        all_Kp_values.clear()
-        all_Time_values.clear()
-        all_HittedBin_IDs.clear()
-        all_EEX_values.clear()
-        all_EEY_values.clear()
-        all_Pedersen_values.clear()
-        all_Density_values.clear()
-        all_Lev_values.clear()
-        all_Hall_values.clear()
-        all_ConvectionHeating_values.clear()
-        all_WindHeating_values.clear()
-        Matches = 0
-        
-        # parse TIEGCM file
-        try:
-            CDFroot = Dataset( DataFilename, 'r' )
-            print( "Reading", DataFilename )
-        except:
-            print ( "WRONG FORMAT:", DataFilename )
-            return
-        try:
-            FileStartTimeStamp = calendar.timegm( datetime.strptime( CDFroot.variables['time'].units[14:],  "%Y-%m-%d %H:%M:%S" ).utctimetuple() ) # ex: "minutes since 2015-1-1 0:0:0"
-        except:
-            print ( "WRONG CONTENTS:", DataFilename )
-            return
-        length_time = CDFroot.variables['Ohmic'].shape[0]
-        length_lev  = CDFroot.variables['Ohmic'].shape[1]
-        length_lat  = CDFroot.variables['Ohmic'].shape[2]
-        length_lon  = CDFroot.variables['Ohmic'].shape[3]
-        # wait until disk is released
-        DiskAccessLock.acquire()
-        # Load or calculate all basic values from the netcdf file
-        try:
-            TIMEs   = CDFroot.variables['time'][:] # minutes since the start time
-            LATs    = CDFroot.variables['lat'][:] 
-            ALTs    = CDFroot.variables['ZGMID'][:, :, :, :] / 100000 # it is stored in cm inside the file
-            JHs     = CDFroot.variables['Ohmic'][:, :, :, :]
-            KPs     = CDFroot.variables['Kp'][:]
-            MAGLATs = CDFroot.variables['mlat_qdf'][:, :, :, :] 
-            MLTs    = CDFroot.variables['mlt_qdf'][:, :, :, :] 
-            EEXs    = CDFroot.variables['EEX'][:, :, :, :] 
-            EEYs    = CDFroot.variables['EEY'][:, :, :, :] 
-            PEDs    = CDFroot.variables['SIGMA_PED'][:, :, :, :] 
-            HALs    = CDFroot.variables['SIGMA_HAL'][:, :, :, :]
-            DENs    = CDFroot.variables['DEN'][:, :, :, :] 
-            LEVs    = CDFroot.variables['lev'][:] 
-            try:
-                CONV_H  = CDFroot.variables['Convection_heating'][:, :, :, :]
-            except:
-                CONV_H  = CDFroot.variables['Convenction_heating'][:, :, :, :]
-            WIND_H  = CDFroot.variables['Wind_heating'][:, :, :, :]
-        except Exception as e:
-            print( "Thread aborted while reading",  datetime.now().strftime("%d-%m-%Y %H:%M:%S"), ResultsFilename[-26:], ":", e, repr(e), "\n" )
-            DiskAccessLock.release()
-            return 
-        DiskAccessLock.release()
-        print( "Thread file read done",  datetime.now().strftime("%d-%m-%Y %H:%M:%S"), ResultsFilename[-26:], "\n" )
-    
-        step = 1
-        for idx_lat in range(0, length_lat, step):
-            if idx_lat%2==0: print("Thread Calculating Lat",  idx_lat, ResultsFilename[-26:])
-            current_Lat = LATs[idx_lat] 
-            if current_Lat < Lat_min  or  current_Lat > Lat_max: continue
-            for idx_lon in range(0, length_lon, step):
-                for idx_lev in range(0, length_lev, step):
-                    for idx_time in range(0, length_time, step):                    
-                        in_Altitude_range = in_MagLat_range = in_MLT_range = in_Kp_range = False
-                            
-                        current_Altitude = ALTs[idx_time, idx_lev, idx_lat, idx_lon]
-                        if current_Altitude >= Altitude_min and current_Altitude <= Altitude_max:
-                            in_Altitude_range = True
-                        
-                        if in_Altitude_range:
-                            current_MagLat = MAGLATs[ idx_time, idx_lev, idx_lat, idx_lon ]
-                            if current_MagLat >= MagLat_min and current_MagLat <= MagLat_max:
-                                in_MagLat_range = True
-                                
-                        if in_MagLat_range:
-                            current_MLT = MLTs[ idx_time, idx_lev, idx_lat, idx_lon ]
-                            if in_MagLat_range:
-                                in_MLT_range = is_MLT_inside_range( current_MLT, MLT_min, MLT_max )
-                        
-                        if in_MLT_range:
-                            current_Kp = KPs[idx_time]
-                            if current_Kp >= Kp_min and current_Kp <= Kp_max:
-                                in_Kp_range = True   
-                                
-                        if in_Kp_range:                    
-                            matchedBin = GetMatchedBin( current_MLT, current_MagLat, current_Altitude, current_Kp, current_Lat )
-                            if matchedBin is not None:
-                                for B in localBins:
-                                    if B.ID == matchedBin.ID:
-                                        matchedBin = B
-                                current_time = int( FileStartTimeStamp + TIMEs[idx_time]*120*60 )
-                                current_JH = JHs[idx_time, idx_lev, idx_lat ,idx_lon] #CDFroot.variables['Joule Heating'][idx_time, idx_lev, idx_lat, idx_lon]
-                                matchedBin.JH_values.append( current_JH )
-                                matchedBin.MagLat_values.append( current_MagLat )
-                                matchedBin.MLT_values.append( current_MLT )
-                                matchedBin.Altitude_values.append( current_Altitude )
-                                matchedBin.Kp_values.append( current_Kp )
-                                matchedBin.Time_values.append( current_time )
-                                matchedBin.EEX_values.append( EEXs[ idx_time, idx_lev, idx_lat, idx_lon ] ) 
-                                matchedBin.EEY_values.append( EEYs[ idx_time, idx_lev, idx_lat, idx_lon ] ) 
-                                matchedBin.Pedersen_values.append( PEDs[ idx_time, idx_lev, idx_lat, idx_lon ] ) 
-                                matchedBin.Hall_values.append( HALs[ idx_time, idx_lev, idx_lat, idx_lon ] ) 
-                                matchedBin.Density_values.append( DENs[ idx_time, idx_lev, idx_lat, idx_lon ] ) 
-                                matchedBin.Lev_values.append( LEVs[ idx_lev ] ) 
-                                matchedBin.ConvectionHeating_values.append( CONV_H[ idx_time, idx_lev, idx_lat, idx_lon ] ) 
-                                matchedBin.WindHeating_values.append( WIND_H[ idx_time, idx_lev, idx_lat, idx_lon ] ) 
-                                all_JH_values.append( current_JH )
-                                all_MagLat_values.append( current_MagLat )
-                                all_MLT_values.append( current_MLT )
-                                all_Altitude_values.append( current_Altitude )
-                                all_Kp_values.append( current_Kp )
-                                all_Time_values.append( current_time )
-                                all_HittedBin_IDs.append( matchedBin.ID )
-                                all_EEX_values.append( EEXs[ idx_time, idx_lev, idx_lat, idx_lon ] )
-                                all_EEY_values.append( EEYs[ idx_time, idx_lev, idx_lat, idx_lon ] )
-                                all_Pedersen_values.append( PEDs[ idx_time, idx_lev, idx_lat, idx_lon ] )
-                                all_Hall_values.append( HALs[ idx_time, idx_lev, idx_lat, idx_lon ] )
-                                all_Density_values.append( DENs[ idx_time, idx_lev, idx_lat, idx_lon ] )
-                                all_Lev_values.append( LEVs[ idx_lev ] )
-                                all_ConvectionHeating_values.append( CONV_H[ idx_time, idx_lev, idx_lat, idx_lon ] ) 
-                                all_WindHeating_values.append( WIND_H[ idx_time, idx_lev, idx_lat, idx_lon ] )
-                                Matches += 1
-                    #break
-                #break
-        CDFroot.close()
-        # wait until disk is released
-        #DiskAccessLock.acquire()
-        #### SAVE Results ####
+        result = assign_values_from_file( self.DataFilename )
+        if result is None: return
         try:
-            # save general info
-            resultsCDF = Dataset( ResultsFilename, 'a' )
-            resultsCDF.DateOfUpdate = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
-            resultsCDF.Region = CALCULATIONS_RegionName
-            resultsCDF.DataPath = CALCULATIONS_TIEGCMfolder
-            # save data for each bin seperately 
-            for B in localBins:
-                # save data about the hits inside the bin
-                if len(B.Time_values) > 0:
-                    resultsCDF.variables[B.ID+"_TimeValues"][:]      = B.Time_values
-                    resultsCDF.variables[B.ID+"_JHValues"][:]        = B.JH_values        
-                    resultsCDF.variables[B.ID+"_MagLatValues"][:]    = B.MagLat_values
-                    resultsCDF.variables[B.ID+"_MLTValues"][:]       = B.MLT_values
-                    resultsCDF.variables[B.ID+"_AltitudeValues"][:]  = B.Altitude_values
-                    resultsCDF.variables[B.ID+"_LatValues"][:]       = B.Lat_values
-                    resultsCDF.variables[B.ID+"_KpValues"][:]        = B.Kp_values
-                    resultsCDF.variables[B.ID+"_EEXValues"][:]       = B.EEX_values        
-                    resultsCDF.variables[B.ID+"_EEYValues"][:]       = B.EEY_values
-                    resultsCDF.variables[B.ID+"_PedersenValues"][:]  = B.Pedersen_values
-                    resultsCDF.variables[B.ID+"_HallValues"][:]      = B.Hall_values
-                    resultsCDF.variables[B.ID+"_DensityValues"][:]   = B.Density_values
-                    resultsCDF.variables[B.ID+"_LevValues"][:]       = B.Lev_values
-                    resultsCDF.variables[B.ID+"_ConvectionHeatingValues"][:] = B.ConvectionHeating_values
-                    resultsCDF.variables[B.ID+"_WindHeatingValues"][:] = B.WindHeating_values
-            ## save data for all hits
-            resultsCDF.variables["allTimeValues"][:]     = all_Time_values
-            resultsCDF.variables["allJHValues"][:]       = all_JH_values    
-            resultsCDF.variables["allMagLatValues"][:]   = all_MagLat_values
-            resultsCDF.variables["allMLTValues"][:]      = all_MLT_values
-            resultsCDF.variables["allAltitudeValues"][:] = all_Altitude_values
-            resultsCDF.variables["allLatValues"][:]      = all_Lat_values
-            resultsCDF.variables["allKpValues"][:]       = all_Kp_values
-            #resultsCDF.variables["allHittedBinIDs"][:]   = netCDF4.stringtochar(np.array(all_HittedBin_IDs[:], 'S8'))
-            resultsCDF.variables["allEEXValues"][:]      = all_EEX_values
-            resultsCDF.variables["allEEYValues"][:]      = all_EEY_values
-            resultsCDF.variables["allPedersenValues"][:] = all_Pedersen_values
-            resultsCDF.variables["allHallValues"][:]     = all_Hall_values
-            resultsCDF.variables["allDensityValues"][:]  = all_Density_values
-            resultsCDF.variables["allLevValues"][:]      = all_Lev_values
-            resultsCDF.variables["allConvectionHeatingValues"][:] = all_ConvectionHeating_values
-            resultsCDF.variables["allWindHeatingValues"][:] = all_WindHeating_values
-            #
-            resultsCDF.close()    
+            save_file_results( self.ResultsFilename, *result )
         except Exception as e:
-            print( "!!!! Thread error while writing",  datetime.now().strftime("%d-%m-%Y %H:%M:%S"), ResultsFilename[-26:], "\n" )
+            print( "!!!! Thread error while writing",  datetime.now().strftime("%d-%m-%Y %H:%M:%S"), self.ResultsFilename[-26:], "\n" )
             print( e )
-            #DiskAccessLock.release()
-        #DiskAccessLock.release()
-    
-        print( "Thread finish",  datetime.now().strftime("%d-%m-%Y %H:%M:%S"), ResultsFilename[-26:], "\n", Matches, "matches", len(localBins[0].JH_values), len(Bins[0].JH_values) )
-        print( "" )
 
         
         
-
         
-        
-def CalculateStatsOnData():
+# Statistics of the Bins. 
+# In exact mode all values of a Bin are processed at once. In approximate mode they are processed in chunks of StatsChunkSize values, 
+# using Welford's algorithm for the mean and variance (exact up to rounding) and t-digest sketches for the median and median absolute deviation.
+ExactStats         = True
+StatsChunkSize     = 1000000
+TDigestCompression = 1000
+
+
+class RunningStats:
+    """
+    Streaming count, min, max, mean and variance (Welford's algorithm, merging one chunk of values at a time). nan values are left out, as in TDigest.
+    """
+    def __init__(self):
+        self.Count = 0
+        self.Min   = np.inf
+        self.Max   = -np.inf
+        self.Mean  = 0.0
+        self.M2    = 0.0 # sum of squared deviations from the mean
+    
+    def update(self, values):
+        values = np.asarray( values, dtype=float ).ravel()
+        values = values[ ~np.isnan(values) ]
+        if len(values) == 0: return
+        n = len(values)
+        mean = values.mean()
+        M2 = np.sum( (values - mean)**2 )
+        delta = mean - self.Mean
+        total = self.Count + n
+        self.Mean += delta * n / total
+        self.M2   += M2 + delta**2 * self.Count * n / total
+        self.Count = total
+        self.Min = min( self.Min, values.min() )
+        self.Max = max( self.Max, values.max() )
+    
+    def variance(self):
+        # the variance around the mean: (1/N) * Sum{1->N}(X-Mean)^2 
+        return self.M2 / self.Count
+
+
+class TDigest:
+    """
+    Streaming quantile sketch (merging t-digest). The values are summarized by at most about Compression centroids (mean, weight), 
+    which are small near the extreme quantiles and large near the median, following the scale function k(q) = Compression/(2*pi) * asin(2q-1).  
+    Error bound: one unit of k is about 2*pi*sqrt(q(1-q))/Compression of the ranks around quantile q. A centroid starts inside one unit 
+    and, as it may absorb a centroid of an earlier update, spans at most about two units. quantile(q) interpolates between the centres 
+    of neighbouring centroids, so the rank of the returned value differs from q by at most about two units, 4*pi*sqrt(q(1-q))/Compression: 
+    0.63% of the values at the median and less towards the tails for Compression=1000 (the errors seen in tests stay below half of that). 
+    The error of the returned value itself depends on how dense the values are around the quantile. min and max are exact.
     """
-    This function uses the values assigned into the Bins to calculate mean, variance, deviation and stores them into the Bin class.
+    def __init__(self, Compression=TDigestCompression):
+        self.Compression = Compression
+        self.Means   = np.zeros(0)
+        self.Weights = np.zeros(0)
+        self.Count = 0
+        self.Min   = np.inf
+        self.Max   = -np.inf
+    
+    def update(self, values):
+        values = np.asarray( values, dtype=float ).ravel()
+        values = values[ ~np.isnan(values) ]
+        if len(values) == 0: return
+        self.Count += len(values)
+        self.Min = min( self.Min, values.min() )
+        self.Max = max( self.Max, values.max() )
+        # the centroids and the sorted values are two sorted runs, which the stable sort merges in linear time
+        means   = np.concatenate( (self.Means, np.sort(values)) )
+        weights = np.concatenate( (self.Weights, np.ones(len(values))) )
+        order   = np.argsort( means, kind='stable' )
+        means, weights = means[order], weights[order]
+        # merge neighbouring centroids which start inside the same unit of k
+        q_left = ( np.cumsum(weights) - weights ) / self.Count
+        k = np.floor( self.Compression / (2*np.pi) * ( np.arcsin( 2*q_left.clip(0, 1) - 1 ) + np.pi/2 ) ).astype(int)
+        groups = np.concatenate( ([0], np.cumsum( k[1:] != k[:-1] )) )
+        self.Weights = np.bincount( groups, weights=weights )
+        self.Means   = np.bincount( groups, weights=means*weights ) / self.Weights
+    
+    def quantile(self, q):
+        # linear interpolation between the centres of the centroids, from the exact min to the exact max
+        if self.Count == 0: return np.nan
+        centres = np.cumsum(self.Weights) - self.Weights/2
+        return float( np.interp( q * self.Count, np.concatenate( ([0], centres, [self.Count]) ), np.concatenate( ([self.Min], self.Means, [self.Max]) ) ) )
+    
+    def percentile(self, p):
+        return self.quantile( p / 100 )
+
+
+def stats_of_values( GetChunks, Exact=True, Compression=TDigestCompression ):
+    """
+    Calculates the statistics which CalculateStatsOnData() stores in the Bins. nan values (the masked values of the result-files) are left out in both modes.
+    
+    Args:
+        GetChunks: function without arguments which returns an iterable over the values in chunks (numpy arrays). 
+                   In approximate mode it is called twice, because the median absolute deviation needs the median.
+        Exact: True to calculate from all values at once, False to stream the chunks through RunningStats and TDigest.
+        Compression: the compression of the TDigest sketches (approximate mode only).
+    Returns:
+        dictionary with the keys min, max, mean, median, variance, medianVariance, medianAbsDev. None if there are no values.
+    """
+    if Exact:
+        values = np.concatenate( [ np.asarray(chunk, dtype=float).ravel() for chunk in GetChunks() ] + [np.zeros(0)] )
+        values = values[ ~np.isnan(values) ]
+        if len(values) == 0: return None
+        stats = { "min": values.min(), "max": values.max(), "mean": values.mean(), "median": np.percentile(values, 50) }
+        stats["variance"]       = np.mean( (values - stats["mean"])**2 )
+        stats["medianVariance"] = np.mean( (values - stats["median"])**2 )
+        stats["medianAbsDev"]   = np.percentile( np.abs(values - stats["median"]), 50 )
+        return stats
+    running = RunningStats()
+    digest  = TDigest( Compression )
+    for chunk in GetChunks():
+        running.update( chunk )
+        digest.update( chunk )
+    if running.Count == 0: return None
+    stats = { "min": running.Min, "max": running.Max, "mean": running.Mean, "median": digest.quantile(0.5), "variance": running.variance() }
+    # mean of (X-Median)^2 = variance + (Mean-Median)^2
+    stats["medianVariance"] = stats["variance"] + (stats["mean"] - stats["median"])**2
+    deviations = TDigest( Compression )
+    for chunk in GetChunks():
+        deviations.update( np.abs( np.asarray(chunk, dtype=float) - stats["median"] ) )
+    stats["medianAbsDev"] = deviations.quantile(0.5)
+    return stats
+
+
+def store_stats( B, stats ):
+    B.JH_min            = stats["min"]
+    B.JH_max            = stats["max"]
+    B.JH_mean           = stats["mean"]
+    B.JH_median         = stats["median"]
+    B.JH_variance       = stats["variance"]
+    B.JH_medianVariance = stats["medianVariance"]
+    B.JH_medianAbsDev   = stats["medianAbsDev"]
+
+
+def CalculateStatsOnData( Exact=None ):
+    """
+    This function uses the values assigned into the Bins to calculate min, max, mean, median, variance, median variance and median absolute deviation 
+    and stores them into the Bin class.
+    
+    Args:
+        Exact: True for exact statistics, False for the streaming estimators (see stats_of_values). By default ExactStats.
     """
     global Bins
+    if Exact is None: Exact = ExactStats
     for B in Bins:
         if len(B.JH_values) > 0:
-            # calculate the mean value
-            for aJHvalue in B.JH_values:
-                if B.JH_min > aJHvalue: B.JH_min = aJHvalue
-                if B.JH_max < aJHvalue: B.JH_max = aJHvalue
-                B.JH_mean += aJHvalue
-            B.JH_mean = B.JH_mean / len(B.JH_values)
-            
-            # calculate the median value
-            B.JH_median = np.percentile(B.JH_values, 50)
-            
-            # for Variance (around mean):
-            for aJHvalue in B.JH_values:
-                B.JH_variance += abs(aJHvalue - B.JH_mean)**2
-            B.JH_variance = B.JH_variance / len(B.JH_values)
-            
-            # for Median Variance (around median):
-            for aJHvalue in B.JH_values:
-                B.JH_medianVariance += abs(aJHvalue - B.JH_median)**2
-            B.JH_medianVariance = B.JH_medianVariance / len(B.JH_values)
-            
-            # for Median absolute deviation
-            AbsoluteDeviations = B.JH_values.copy()
-            for i in range(0, len(AbsoluteDeviations)):
-                AbsoluteDeviations[i] = abs(B.JH_median - AbsoluteDeviations[i])
-            B.JH_medianAbsDev = np.percentile(AbsoluteDeviations, 50)
-        
-        
-        
-        
-def calc_stats_for_tiegcm( TIEGCMfilesPath, ResultFilesPath ):
+            values = np.asarray( B.JH_values, dtype=float )
+            stats = stats_of_values( lambda: ( values[i:i+StatsChunkSize] for i in range(0, len(values), StatsChunkSize) ), Exact )
+            if stats is not None: store_stats( B, stats )
+
+
+def CalculateStatsOnResults( ResultsFilename, VariableName="JHValues", Exact=False ):
+    """
+    Calculates the statistics of each Bin directly from a result-file, reading the values in chunks of StatsChunkSize, 
+    so that Bins with more values than the memory can hold can be handled in approximate mode. The statistics are stored into the Bin class.
+    
+    Args:
+        ResultsFilename: a result-file created by CreateResults_CDF().
+        VariableName: the per-bin variable of the file (without the Bin ID), for example JHValues or PedersenValues.
+        Exact: True for exact statistics (all values of a Bin are loaded), False for the streaming estimators.
+    """
+    resultsCDF = Dataset( ResultsFilename, 'r' )
+    try:
+        for B in Bins:
+            if B.ID+"_"+VariableName not in resultsCDF.variables: continue
+            VAR = resultsCDF.variables[ B.ID+"_"+VariableName ]
+            length = committed_length( VAR )
+            stats = stats_of_values( lambda: ( np.ma.filled( VAR[i:min(i+StatsChunkSize, length)].astype(float), np.nan ) for i in range(0, length, StatsChunkSize) ), Exact )
+            if stats is not None: store_stats( B, stats )
+    finally:
+        resultsCDF.close()
+
+
+def calc_stats_for_tiegcm( TIEGCMfilesPath, ResultFilesPath, NumOfWorkers=5, MaxMemoryBytes=None ):
     """
     Reads the TIEGCM files and fills the correct Bin with values for each position. It stores the result in a netCDF file.  
     This function initiates the calculation.   
-    It creates a Thread_ValueAssigner for each source file which resides in TIEGCMfilesPath.  
-    It also tells the thread to store the result files into ResultFilesPath.  
-    There will be a result-file for each TIEGCM-file. These can be loaded all together as a directory.
+    Each source file which resides in TIEGCMfilesPath is handled by assign_values_from_file() in a separate worker process.  
+    The workers return their results and this function stores them into ResultFilesPath.  
+    There will be a result-file for each TIEGCM-file. These can be loaded all together as a directory.  
+    The result-files do not depend on the number of workers.
     
     Args:
         TIEGCM_filesPath: the folder which has all TIEGCM netcdf files. Needed to read the Kp index for each satellite position.
         ResultFilesPath: the netcdf file where the results of this calculation will be stored.
+        NumOfWorkers: the maximum number of TIEGCM files which are processed at the same time.
+        MaxMemoryBytes: approximate limit for the memory used by the TIEGCM data loaded by all workers together. 
+                        A file is started only when its data fit inside the limit, but at least one file is always processed. None means no limit.
 
     """
     startSecs = time.time()
@@ -1557,38 +1951,52 @@ def calc_stats_for_tiegcm( TIEGCMfilesPath, ResultFilesPath ):
     if path.exists( ResultFilesPath ) == False:
         os.mkdir( ResultFilesPath )
     
-    AllThreads = list()
+    # the workers get only the definitions of the bins, not the values loaded into them
+    BinsToFill = [ Bin(B.ID, B.Description, B.MLT_min, B.MLT_max, B.MagLat_min, B.MagLat_max, B.Altitude_min, B.Altitude_max, B.Lat_min, B.Lat_max, B.Kp_min, B.Kp_max, B.DesirableCumulativeTime) for B in Bins ]
+    
+    def save_finished( finished ):
+        for aFuture in sorted( finished, key=lambda f: Running[f][0] ):
+            ResultsFilename, fileBytes = Running.pop( aFuture )
+            try:
+                result = aFuture.result()
+            except Exception as e:
+                print( "Worker aborted",  datetime.now().strftime("%d-%m-%Y %H:%M:%S"), ResultsFilename[-26:], ":", e, repr(e), "\n" )
+                continue
+            if result is None: continue
+            try:
+                save_file_results( ResultsFilename, *result, BinsToFill )
+            except Exception as e:
+                print( "!!!! Error while writing",  datetime.now().strftime("%d-%m-%Y %H:%M:%S"), ResultsFilename[-26:], "\n" )
+                print( e )
+    
+    Running = dict() # future -> (ResultsFilename, estimated bytes of the loaded TIEGCM data)
     AllDataFiles = sorted( glob.glob( TIEGCMfilesPath + "/*/*.nc", recursive=True ) )
-    for currentDataFile in AllDataFiles:
-        if '\\' in currentDataFile: # windows
-            prefix = currentDataFile[ currentDataFile.rfind('\\')+1 : -3 ]
-        else: # linux
-            prefix = currentDataFile[ currentDataFile.rfind('/')+1 : -3 ]
-        ResultsFilename = ResultFilesPath + prefix + ".stats.nc"
-        if path.exists( ResultsFilename ): 
-            print("Skipping because exists:", ResultsFilename)
-            continue
-        else:
-            # wait if there are plenty alive threads
-            alive_counter = 0
-            for aThread in AllThreads:
-                if aThread.is_alive():
-                    alive_counter += 1
-            while alive_counter >= 5:
-                time.sleep(random.randint(10, 15))
-                alive_counter = 0
-                for aThread in AllThreads:
-                    if aThread.is_alive():
-                        alive_counter += 1
-            # spawn new thread
+    with concurrent.futures.ProcessPoolExecutor( max_workers=NumOfWorkers ) as executor:
+        for currentDataFile in AllDataFiles:
+            if '\\' in currentDataFile: # windows
+                prefix = currentDataFile[ currentDataFile.rfind('\\')+1 : -3 ]
+            else: # linux
+                prefix = currentDataFile[ currentDataFile.rfind('/')+1 : -3 ]
+            ResultsFilename = ResultFilesPath + prefix + ".stats.nc"
+            if path.exists( ResultsFilename ): 
+                print("Skipping because exists:", ResultsFilename)
+                continue
+            try:
+                CDFroot = Dataset( currentDataFile, 'r' )
+                fileBytes = TIEGCM_4D_Fields * CDFroot.variables['Ohmic'].size * 8
+                CDFroot.close()
+            except:
+                fileBytes = 0
+            # wait until a worker is free and the data of the file fit in memory
+            while len(Running) >= NumOfWorkers  or  ( len(Running) > 0  and  MaxMemoryBytes is not None  and  sum(b for f, b in Running.values()) + fileBytes > MaxMemoryBytes ):
+                finished, pending = concurrent.futures.wait( Running, return_when=concurrent.futures.FIRST_COMPLETED )
+                save_finished( finished )
+            # start a new worker
             CreateResults_CDF( ResultsFilename )
-            T = Thread_ValueAssigner(currentDataFile, ResultsFilename)
-            AllThreads.append(T)
-            T.start()
-            time.sleep(2)
+            Running[ executor.submit( assign_values_from_file, currentDataFile, BinsToFill ) ] = (ResultsFilename, fileBytes)
 
-    # wait for all threads to terminate
-    for T in AllThreads: T.join()
+        # wait for all workers to terminate
+        save_finished( concurrent.futures.wait( Running ).done )
     # finish it
     finishSecs = time.time()
     print( finishSecs-startSecs, " sec")    
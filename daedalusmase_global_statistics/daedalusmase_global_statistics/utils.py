@@ -82,8 +82,7 @@ def concatLists( a, b ):
     """
         Appends all items of list b at the of list a
     """
-    for item in b:
-        a.append( item )    
+    a.extend( b )    
 
         
         
\ No newline at end of file
@@ -0,0 +1,21 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "daedalusmase_global_statistics"))
+
+import data  # noqa: E402
+
+# a few of the default Bins, the result-files of all of them take seconds to create
+FEW_BINS = ("AEM_00", "AEM_05", "AEM_25", "AAA_L3", "AAA_M6", "AFM_L2", "AFM_L5")
+
+
+@pytest.fixture(scope="module")
+def few_bins():
+    saved = list(data.Bins)
+    data.ClearBins()
+    data.Bins.extend(B for B in saved if B.ID in FEW_BINS)
+    yield data.Bins
+    data.ClearBins()
+    data.Bins.extend(saved)
@@ -0,0 +1,58 @@
+"""Small synthetic TIEGCM files with the variables read by data.assign_values_from_file()."""
+import os
+
+import numpy as np
+from netCDF4 import Dataset
+
+
+def write_tiegcm(filename, ntime=8, nlev=20, nlat=24, nlon=24, seed=0):
+    """Random fields on a tiny grid, with positions spread over the default Bins and some masked values."""
+    rng = np.random.default_rng(seed)
+    shape = (ntime, nlev, nlat, nlon)
+    with Dataset(filename, "w") as root:
+        root.createDimension("time", None)
+        root.createDimension("lev", nlev)
+        root.createDimension("lat", nlat)
+        root.createDimension("lon", nlon)
+        time = root.createVariable("time", "f8", ("time",))
+        time.units = "minutes since 2015-1-1 0:0:0"
+        time[:] = 60.0 * np.arange(ntime) + 1440.0 * seed
+        root.createVariable("lat", "f8", ("lat",))[:] = np.linspace(-87.5, 87.5, nlat)
+        root.createVariable("lev", "f8", ("lev",))[:] = np.linspace(-7, 7, nlev)
+        root.createVariable("Kp", "f8", ("time",))[:] = rng.uniform(0, 9, ntime)
+        fields = {
+            "ZGMID": 100000 * np.sort(rng.uniform(90, 520, shape), axis=1),
+            "mlat_qdf": rng.uniform(-90, 90, shape),
+            "mlt_qdf": rng.uniform(0, 24, shape),
+            "Ohmic": rng.lognormal(-18, 2, shape),
+            "EEX": rng.normal(0, 0.02, shape),
+            "EEY": rng.normal(0, 0.02, shape),
+            "SIGMA_PED": rng.lognormal(-10, 1, shape),
+            "SIGMA_HAL": rng.lognormal(-10, 1, shape),
+            "DEN": rng.lognormal(-20, 1, shape),
+            "Convection_heating": rng.lognormal(-18, 2, shape),
+            "Wind_heating": rng.normal(0, 1e-8, shape),
+        }
+        masked = rng.random(shape) < 0.02
+        for name, values in fields.items():
+            var = root.createVariable(name, "f8", ("time", "lev", "lat", "lon"), fill_value=1e36)
+            var[:] = np.ma.masked_array(values, mask=masked if name == "Ohmic" else False)
+
+
+def write_tiegcm_folder(folder, nfiles=3, **kwargs):
+    """The folder layout calc_stats_for_tiegcm() reads: <folder>/<subfolder>/<file>.nc, kwargs are passed to write_tiegcm()"""
+    sub = os.path.join(folder, "run")
+    os.makedirs(sub, exist_ok=True)
+    for i in range(nfiles):
+        write_tiegcm(os.path.join(sub, "tiegcm_%02d.nc" % i), seed=i, **kwargs)
+    return folder
+
+
+def synthetic_hits(NumOfBins, n, seed=0):
+    """Random (hits, values) in the form returned by data.assign_values_from_file(), n hits spread over NumOfBins Bins."""
+    import data
+
+    rng = np.random.default_rng(seed)
+    hits = rng.integers(0, NumOfBins, n)
+    values = {attr: rng.normal(size=n).astype(np.float32).astype(float) for attr, name in data.HitFields}
+    return hits, values
@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+from netCDF4 import Dataset
+
+import data
+from synthetic_statistics import synthetic_hits
+
+pytestmark = pytest.mark.usefixtures("few_bins")
+
+
+@pytest.fixture
+def results(tmp_path):
+    filename = str(tmp_path / "results.nc")
+    data.CreateResults_CDF(filename)
+    return filename
+
+
+def read_all(filename):
+    with Dataset(filename) as root:
+        return {name: np.asarray(data.read_committed(root, name)) for name, VAR in root.variables.items() if VAR.dtype == np.float32}
+
+
+def expected_values(batches):
+    # what the result-file should hold after saving the batches, per variable
+    expected = {"all" + name: [] for attr, name in data.HitFields}
+    for B in data.Bins:
+        expected.update({B.ID + "_" + name: [] for attr, name in data.HitFields})
+    for hits, values in batches:
+        for attr, name in data.HitFields:
+            expected["all" + name].append(values[attr])
+            for i, B in enumerate(data.Bins):
+                expected[B.ID + "_" + name].append(values[attr][hits == i])
+    return {name: np.concatenate(parts) if parts else np.zeros(0) for name, parts in expected.items()}
+
+
+def assert_holds(filename, batches):
+    found = read_all(filename)
+    for name, values in expected_values(batches).items():
+        np.testing.assert_array_equal(found[name], values.astype(np.float32), err_msg=name)
+
+
+def test_appends_accumulate(results):
+    batches = [synthetic_hits(len(data.Bins), n, seed) for seed, n in enumerate((50, 0, 7000, 3))]
+    for hits, values in batches:
+        data.save_file_results(results, hits, values)
+        with Dataset(results) as root:
+            assert "AppendInProgress" not in root.ncattrs()
+    assert_holds(results, batches)
+
+
+class CrashBeforeUnmark:
+    # a result-file whose writing stops when commit_append() removes the mark of begin_append()
+    def __init__(self, root):
+        object.__setattr__(self, "root", root)
+
+    def __getattr__(self, name):
+        return getattr(self.root, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.root, name, value)
+
+    def delncattr(self, name):
+        raise KeyboardInterrupt
+
+
+def interrupted_save(filename, hits, values, commit):
+    # the steps of save_file_results(), stopped before or inside commit_append()
+    root = Dataset(filename, "a")
+    data.begin_append(root, "interrupted")
+    Committed = dict()
+    for B, BinValues in zip(data.Bins, data.group_hits_by_bin(hits, values, len(data.Bins))):
+        for attr, name in data.HitFields:
+            data.append_values(root, B.ID + "_" + name, BinValues[attr], Committed)
+    for attr, name in data.HitFields:
+        data.append_values(root, "all" + name, values[attr], Committed)
+    if commit:
+        with pytest.raises(KeyboardInterrupt):
+            data.commit_append(CrashBeforeUnmark(root), Committed)
+    root.close()
+
+
+@pytest.mark.parametrize("commit", [False, True], ids=["before_commit", "inside_commit"])
+def test_interrupted_save_is_all_or_nothing(results, commit):
+    first = synthetic_hits(len(data.Bins), 500, 1)
+    second = synthetic_hits(len(data.Bins), 800, 2)
+    data.save_file_results(results, *first)
+    interrupted_save(results, *second, commit)
+    with Dataset(results) as root:
+        assert root.AppendInProgress == "interrupted"
+    # the lengths are either all from before or all from after the interrupted save
+    assert_holds(results, [first, second] if commit else [first])
+    third = synthetic_hits(len(data.Bins), 300, 3)
+    data.save_file_results(results, *third)
+    assert_holds(results, [first, second, third] if commit else [first, third])
+
+
+def test_load_results_reads_committed_values(results):
+    first = synthetic_hits(len(data.Bins), 400, 4)
+    data.save_file_results(results, *first)
+    interrupted_save(results, *synthetic_hits(len(data.Bins), 900, 5), False)
+    data.load_results(results, "SIGMA_PED")
+    expected = expected_values([first])
+    np.testing.assert_array_equal(np.array(data.all_JH_values, dtype=np.float32), expected["allPedersenValues"])
+    for B in data.Bins:
+        np.testing.assert_array_equal(np.array(B.JH_values, dtype=np.float32), expected[B.ID + "_PedersenValues"])
+
+
+def test_files_without_committed_lengths(results):
+    # files written before CommittedLengths are read complete and get it at their next save
+    first = synthetic_hits(len(data.Bins), 600, 6)
+    data.save_file_results(results, *first)
+    with Dataset(results, "a") as root:
+        root.delncattr("CommittedLengths")
+        for VAR in root.variables.values():
+            if "CommitIndex" in VAR.ncattrs():
+                VAR.delncattr("CommitIndex")
+    assert_holds(results, [first])
+    second = synthetic_hits(len(data.Bins), 200, 7)
+    data.save_file_results(results, *second)
+    with Dataset(results) as root:
+        assert "CommittedLengths" in root.ncattrs()
+    assert_holds(results, [first, second])
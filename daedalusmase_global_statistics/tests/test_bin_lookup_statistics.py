@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+import data
+
+
+def is_MLT_inside_range_scan(MLT, MLT_min, MLT_max):
+    if MLT_min < MLT_max:
+        return (MLT > MLT_min and MLT <= MLT_max)
+    elif MLT_min == MLT_max:
+        return True
+    else:
+        return (MLT > MLT_min or MLT <= MLT_max)
+
+
+def scan(MLT, MagLat, Altitude, Kp, Latitude, BinsToSearch):
+    # the linear search of GetMatchedBin() before BinLookup, returning the index of the Bin
+    for i, B in enumerate(BinsToSearch):
+        if Latitude >= B.Lat_min and Latitude <= B.Lat_max:
+            if is_MLT_inside_range_scan(MLT, B.MLT_min, B.MLT_max):
+                if MagLat > B.MagLat_min and MagLat <= B.MagLat_max:
+                    if Altitude > B.Altitude_min and Altitude <= B.Altitude_max:
+                        Kp_min_to_check = B.Kp_min
+                        if Kp_min_to_check == 0: Kp_min_to_check = -1
+                        if Kp > Kp_min_to_check and Kp <= B.Kp_max:
+                            return i
+    return -1
+
+
+def random_bins(rng, n):
+    # ranges on a coarse grid, so that Bins overlap and share edges, with wrapping and equal MLT limits
+    def limits(choices):
+        a, b = rng.choice(choices, 2)
+        return min(a, b), max(a, b)
+    BinsToSearch = list()
+    for i in range(n):
+        MLT_min, MLT_max = rng.choice(np.arange(0, 25, 3), 2)
+        MagLat_min, MagLat_max = limits(np.arange(-90, 91, 15))
+        Altitude_min, Altitude_max = limits(np.arange(100, 501, 50))
+        Lat_min, Lat_max = limits(np.arange(-90, 91, 30))
+        Kp_min, Kp_max = limits(np.arange(0, 10, 1.5))
+        BinsToSearch.append(data.Bin("R%d" % i, "random", MLT_min, MLT_max, MagLat_min, MagLat_max, Altitude_min, Altitude_max,
+                                     Lat_min, Lat_max, Kp_min, Kp_max, 0))
+    return BinsToSearch
+
+
+def samples(rng, BinsToSearch, n):
+    # uniform values, the range limits of the Bins, their floating point neighbours and nan, on each axis
+    columns = list()
+    for attrs, low, high in ((("MLT_min", "MLT_max"), -1, 25), (("MagLat_min", "MagLat_max"), -95, 95),
+                             (("Altitude_min", "Altitude_max"), 50, 550), (("Kp_min", "Kp_max"), -1, 10),
+                             (("Lat_min", "Lat_max"), -95, 95)):
+        edges = np.array([getattr(B, a) for B in BinsToSearch for a in attrs] + [0.0], dtype=float)
+        special = np.concatenate((edges, np.nextafter(edges, -np.inf), np.nextafter(edges, np.inf), [np.nan]))
+        values = rng.uniform(low, high, n)
+        pick = rng.random(n) < 0.6
+        values[pick] = rng.choice(special, pick.sum())
+        columns.append(values)
+    return columns
+
+
+def check(BinsToSearch, columns):
+    expected = np.array([scan(*position, BinsToSearch) for position in zip(*columns)])
+    np.testing.assert_array_equal(data.match_bins(*columns, BinsToSearch), expected)
+    for position, index in zip(zip(*columns[:500]), expected[:500]):
+        found = data.GetMatchedBin(*position, BinsToSearch)
+        assert found is (None if index < 0 else BinsToSearch[index])
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_random_bins_match_the_scan(seed):
+    rng = np.random.default_rng(seed)
+    BinsToSearch = random_bins(rng, int(rng.integers(1, 40)))
+    check(BinsToSearch, samples(rng, BinsToSearch, 4000))
+
+
+def test_default_bins_match_the_scan():
+    rng = np.random.default_rng(100)
+    check(data.Bins, samples(rng, data.Bins, 20000))
+
+
+def test_shapes_and_masked_values():
+    rng = np.random.default_rng(7)
+    columns = samples(rng, data.Bins, 600)
+    expected = data.match_bins(*columns)
+    shaped = data.match_bins(*[c.reshape(20, 30) for c in columns[:3]], columns[3].reshape(20, 30), columns[4].reshape(20, 30))
+    np.testing.assert_array_equal(shaped, expected.reshape(20, 30))
+    # a masked value matches no Bin, as nan
+    masked = np.ma.masked_array(columns[1], mask=rng.random(600) < 0.3)
+    np.testing.assert_array_equal(data.match_bins(columns[0], masked, *columns[2:]), data.match_bins(columns[0], masked.filled(np.nan), *columns[2:]))
+
+
+def test_lookup_follows_changes_of_the_bins():
+    BinsToSearch = random_bins(np.random.default_rng(3), 10)
+    columns = samples(np.random.default_rng(4), BinsToSearch, 2000)
+    check(BinsToSearch, columns)
+    BinsToSearch.reverse()
+    check(BinsToSearch, columns)
+    BinsToSearch[0].Altitude_max += 25
+    data.compile_bins(BinsToSearch)
+    check(BinsToSearch, columns)
@@ -0,0 +1,56 @@
+import glob
+import os
+
+import numpy as np
+import pytest
+from netCDF4 import Dataset
+
+import data
+from synthetic_statistics import write_tiegcm_folder
+
+pytestmark = pytest.mark.usefixtures("few_bins")
+
+
+def run(tiegcm_folder, results_folder, **kwargs):
+    data.calc_stats_for_tiegcm(tiegcm_folder, results_folder + "/", **kwargs)
+    results = dict()
+    for filename in sorted(glob.glob(results_folder + "/*.nc")):
+        with Dataset(filename) as root:
+            assert "AppendInProgress" not in root.ncattrs()
+            results[os.path.basename(filename)] = {name: root.variables[name][:] for name in root.variables}
+    return results
+
+
+@pytest.fixture(scope="module")
+def tiegcm_folder(tmp_path_factory):
+    return write_tiegcm_folder(str(tmp_path_factory.mktemp("tiegcm")))
+
+
+@pytest.fixture(scope="module")
+def serial(tiegcm_folder, tmp_path_factory):
+    return run(tiegcm_folder, str(tmp_path_factory.mktemp("serial")), NumOfWorkers=1)
+
+
+def assert_same(results, expected):
+    assert results.keys() == expected.keys()
+    for filename in expected:
+        assert results[filename].keys() == expected[filename].keys()
+        for name, values in expected[filename].items():
+            np.testing.assert_array_equal(np.ma.filled(results[filename][name], np.nan), np.ma.filled(values, np.nan), err_msg=filename + " " + name)
+
+
+def test_serial_has_hits(serial):
+    assert len(serial) == 3
+    for variables in serial.values():
+        assert len(variables["allJHValues"]) > 0
+        assert sum(len(values) for name, values in variables.items() if name.endswith("_JHValues") and not name.startswith("all")) == len(variables["allJHValues"])
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_workers_give_identical_results(tiegcm_folder, serial, tmp_path, workers):
+    assert_same(run(tiegcm_folder, str(tmp_path), NumOfWorkers=workers), serial)
+
+
+def test_memory_limit_gives_identical_results(tiegcm_folder, serial, tmp_path):
+    # a limit below the size of one file runs the files one after the other
+    assert_same(run(tiegcm_folder, str(tmp_path), NumOfWorkers=3, MaxMemoryBytes=1), serial)
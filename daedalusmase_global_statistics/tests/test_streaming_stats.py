@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+import data
+
+
+def distributions(rng, n):
+    return {
+        "normal": rng.normal(3.0, 2.0, n),
+        "lognormal": rng.lognormal(-18, 2, n),
+        "uniform": rng.uniform(-1, 1, n),
+        "duplicates": rng.integers(0, 20, n).astype(float),
+        "offset": 1e6 + rng.normal(0, 1e-3, n),
+    }
+
+
+def chunks(values, rng):
+    # chunks of random sizes, including empty ones
+    bounds = np.sort(rng.integers(0, len(values), 12))
+    return np.split(values, bounds)
+
+
+@pytest.mark.parametrize("name", ["normal", "lognormal", "uniform", "duplicates", "offset"])
+def test_running_stats_match_numpy(name):
+    rng = np.random.default_rng(0)
+    values = distributions(rng, 200000)[name]
+    running = data.RunningStats()
+    for chunk in chunks(values, rng):
+        running.update(chunk)
+    assert running.Count == len(values)
+    assert running.Min == values.min() and running.Max == values.max()
+    np.testing.assert_allclose(running.Mean, np.mean(values), rtol=1e-12)
+    np.testing.assert_allclose(running.variance(), np.var(values), rtol=1e-9)
+
+
+def test_running_stats_leave_out_nan():
+    rng = np.random.default_rng(1)
+    values = rng.normal(size=50000)
+    with_nan = values.copy()
+    with_nan[rng.random(len(values)) < 0.1] = np.nan
+    running = data.RunningStats()
+    for chunk in chunks(with_nan, rng):
+        running.update(chunk)
+    kept = with_nan[~np.isnan(with_nan)]
+    assert running.Count == len(kept)
+    np.testing.assert_allclose(running.Mean, np.mean(kept), rtol=1e-12)
+    np.testing.assert_allclose(running.variance(), np.var(kept), rtol=1e-10)
+    running.update(np.full(10, np.nan))
+    assert running.Count == len(kept)
+
+
+QUANTILES = [0.0, 0.001, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 0.999, 1.0]
+
+
+@pytest.mark.parametrize("compression", [100, 300, 1000])
+@pytest.mark.parametrize("name", ["normal", "lognormal", "uniform", "duplicates", "offset"])
+@pytest.mark.parametrize("seed", [2, 3])
+def test_tdigest_rank_error(name, compression, seed):
+    rng = np.random.default_rng(seed)
+    values = distributions(rng, 200000)[name]
+    digest = data.TDigest(compression)
+    for chunk in chunks(values, rng):
+        digest.update(chunk)
+    assert digest.Count == len(values)
+    ordered = np.sort(values)
+    for q in QUANTILES:
+        found = digest.quantile(q)
+        assert ordered[0] <= found <= ordered[-1]
+        # the ranks (as fractions of all values) of the data values next to the returned one, which may lie between two of them
+        below = ordered[max(np.searchsorted(ordered, found, side="right") - 1, 0)]
+        above = ordered[min(np.searchsorted(ordered, found, side="left"), len(ordered) - 1)]
+        low = np.searchsorted(ordered, below, side="left") / len(values)
+        high = np.searchsorted(ordered, above, side="right") / len(values)
+        # the bound of the TDigest docstring: two units of k
+        bound = 4 * np.pi * np.sqrt(q * (1 - q)) / compression
+        assert low - bound <= q <= high + bound, (q, found, low, high, bound)
+    assert digest.quantile(0) == values.min() and digest.quantile(1) == values.max()
+    assert len(digest.Means) <= 2 * compression
+
+
+def test_tdigest_median_close_to_percentile():
+    rng = np.random.default_rng(3)
+    values = rng.normal(size=300000)
+    digest = data.TDigest(1000)
+    for chunk in chunks(values, rng):
+        digest.update(chunk)
+    for p in (5, 25, 50, 75, 95):
+        # values are dense around these percentiles, so the rank error is also a small value error
+        assert abs(digest.percentile(p) - np.percentile(values, p)) < 0.01
+
+
+@pytest.mark.parametrize("nan_fraction", [0.0, 0.2, 1.0])
+def test_stats_of_values_modes_agree(nan_fraction):
+    rng = np.random.default_rng(4)
+    values = rng.lognormal(-18, 1, 100000)
+    values[rng.random(len(values)) < nan_fraction] = np.nan
+    get_chunks = lambda: iter(np.array_split(values, 7))
+    exact = data.stats_of_values(get_chunks, Exact=True)
+    approximate = data.stats_of_values(get_chunks, Exact=False)
+    if nan_fraction == 1.0:
+        assert exact is None and approximate is None
+        return
+    kept = values[~np.isnan(values)]
+    assert exact["min"] == approximate["min"] == kept.min()
+    assert exact["max"] == approximate["max"] == kept.max()
+    np.testing.assert_allclose(exact["mean"], np.mean(kept), rtol=1e-12)
+    np.testing.assert_allclose(approximate["mean"], exact["mean"], rtol=1e-12)
+    np.testing.assert_allclose(approximate["variance"], exact["variance"], rtol=1e-9)
+    np.testing.assert_allclose(exact["median"], np.percentile(kept, 50), rtol=1e-12)
+    for key in ("median", "medianVariance", "medianAbsDev"):
+        np.testing.assert_allclose(approximate[key], exact[key], rtol=0.01)
@@ -0,0 +1,42 @@
+"""
+Lookups per second of supportfuctions.local (one value per call) and BracketIndex.local (all values at once),
+for uniform axes (time, lat, lon) and irregular ones across axis sizes.
+
+    python benchmarks/bench_bracket_index.py [--values 100000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "source_code"))
+
+import supportfuctions as SF  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--values", type=int, default=10**5)
+    parser.add_argument("--scalar-values", type=int, default=2000, help="values looked up one at a time with local")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print("%9s %6s %16s %20s %9s" % ("axis", "size", "local lookups/s", "BracketIndex lookups/s", "speedup"))
+    for size in (24, 72, 144, 1000, 10000):
+        for kind in ("uniform", "irregular"):
+            x = np.arange(size) * 2.5 - 90 if kind == "uniform" else np.sort(rng.uniform(-90, 90, size))
+            y = rng.uniform(x[0], x[-1], args.values)
+            start = time.perf_counter()
+            for v in y[:args.scalar_values]:
+                SF.local(v, x)
+            scalar = args.scalar_values / (time.perf_counter() - start)
+            start = time.perf_counter()
+            SF.BracketIndex(x).local(y)
+            batch = args.values / (time.perf_counter() - start)
+            print("%9s %6d %16.0f %20.0f %9.0f" % (kind, size, scalar, batch, batch / scalar))
+
+
+if __name__ == "__main__":
+    main()
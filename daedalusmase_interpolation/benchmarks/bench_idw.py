@@ -0,0 +1,62 @@
+"""
+Wall time of idwinterpolation (point by point) and idwinterpolation_kdtree along 1 day and 30 day orbits on a
+synthetic TIEGCM grid of hourly time steps. The KD-tree version runs cold (new idwtrees) and warm (the trees of the
+cold run, as for the next variable of the same file).
+
+    python benchmarks/bench_idw.py [--days 1 30] [--rate 1] [--nlev 57] [--scalar-max 20000] [--max-bytes 2147483648]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(here, "..", "source_code"), os.path.join(here, "..", "tests")]
+
+import interpolationmase_mainfunc as IM  # noqa: E402
+import supportfuctions as SF  # noqa: E402
+from synthetic_interpolation import SyntheticSteps, along_track_orbit  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--days", type=float, nargs="+", default=[1, 30], help="orbit durations in days")
+    parser.add_argument("--rate", type=float, default=1, help="samples per second of the orbit")
+    parser.add_argument("--nlev", type=int, default=57)
+    parser.add_argument("--scalar-max", type=int, default=20000, help="orbit points run point by point")
+    parser.add_argument("--max-bytes", type=int, default=2 * 1024 ** 3, help="memory limit of the cached trees")
+    args = parser.parse_args()
+
+    glat = np.arange(-88.75, 90, 2.5)
+    glon = np.arange(-180, 180, 2.5)
+    print("%6s %10s %18s %12s %12s %8s %9s %9s" % ("days", "points", "scalar points/s", "cold s", "warm s", "trees",
+                                                 "cold x", "warm x"))
+    for days in args.days:
+        nt = int(np.ceil(days * 24)) + 1
+        gtime = np.arange(nt) * 60.0
+        zg = SyntheticSteps(nt, args.nlev, glat, glon, "zg")
+        ne = SyntheticSteps(nt, args.nlev, glat, glon, "ne")
+        dtime, dlat, dlon, dalt = along_track_orbit(gtime, np.stack([zg[0], zg[1]]), days * 86400, rate=args.rate)
+        n = len(dtime)
+
+        trees = SF.idwtrees(glat, glon, zg, max_bytes=args.max_bytes)
+        start = time.perf_counter()
+        IM.idwinterpolation_kdtree(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, ne, trees=trees)
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        IM.idwinterpolation_kdtree(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, ne, trees=trees)
+        warm = time.perf_counter() - start
+
+        # the scalar version on the first points of the orbit, extrapolated to the whole orbit
+        m = min(n, args.scalar_max)
+        start = time.perf_counter()
+        IM.idwinterpolation(gtime, glat, glon, dtime[:m], dlat[:m], dlon[:m], dalt[:m], zg, ne)
+        scalar = m / (time.perf_counter() - start)
+        print("%6g %10d %18.0f %12.2f %12.2f %8d %9.1f %9.1f" % (days, n, scalar, cold, warm, trees.built,
+                                                                n / scalar / cold, n / scalar / warm))
+
+
+if __name__ == "__main__":
+    main()
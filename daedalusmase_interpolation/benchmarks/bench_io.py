@@ -0,0 +1,128 @@
+"""
+Wall time, NetCDF file opens and peak RSS of interpolating 20 variables along an orbit, reading and writing one
+variable per file session (model.readvar and inout.write, before) and with one reader and one writer session for all
+of them (runinterpolator, after). Both use trilinearinterpolation_batch, so the difference is the I/O.
+
+    python benchmarks/bench_io.py [--nt 24] [--variables 20] [--points 50000]
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+from netCDF4 import Dataset
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(here, "..", "source_code"), os.path.join(here, "..", "tests")]
+
+import inout  # noqa: E402
+import interpolationmase_mainfunc as IM  # noqa: E402
+from synthetic_interpolation import synthetic_grid, synthetic_orbit  # noqa: E402
+
+
+def make_files(folder, nt, nvar, points):
+    gtime, glat, glon, zg, ne = synthetic_grid(nt=nt, nlev=57)
+    model_file = os.path.join(folder, "model.nc")
+    nc = Dataset(model_file, "w")
+    for name, size in (("time", nt), ("lev", zg.shape[1]), ("lat", len(glat)), ("lon", len(glon))):
+        nc.createDimension(name, size)
+    nc.createVariable("time", "f8", ("time",))[:] = gtime
+    nc.createVariable("lev", "f8", ("lev",))[:] = np.arange(zg.shape[1])
+    nc.createVariable("lat", "f8", ("lat",))[:] = glat
+    nc.createVariable("lon", "f8", ("lon",))[:] = glon
+    nc.createVariable("ZGMID", "f4", ("time", "lev", "lat", "lon"))[:] = zg
+    names = ["VAR%02d" % i for i in range(nvar)]
+    for i, name in enumerate(names):
+        nc.createVariable(name, "f4", ("time", "lev", "lat", "lon"))[:] = ne * (1 + 0.1 * i)
+    nc.close()
+
+    # the orbit spans the second and third time steps only
+    dtime, dlat, dlon, dalt = synthetic_orbit(gtime[1:3], zg[1:3], points)
+    orbit_file = os.path.join(folder, "orbit.nc")
+    nc = Dataset(orbit_file, "w")
+    nc.createDimension("time", points)
+    for name, value in (("time", np.sort(dtime)), ("lat", dlat), ("lon", dlon), ("altitude", dalt)):
+        nc.createVariable(name, "f8", ("time",))[:] = value
+    nc.close()
+    return model_file, orbit_file, names
+
+
+def count_opens():
+    opens = [0]
+    dataset = inout.Dataset
+
+    def counted(*args, **kwargs):
+        opens[0] += 1
+        return dataset(*args, **kwargs)
+    inout.Dataset = counted
+    return opens
+
+
+def before(model_file, orbit_file, names, outfile):
+    # one file session per variable, whole variables read, as runinterpolator did before the reader and writer
+    model = inout.model(model_file, 500, 100)
+    orbit = inout.orbit(orbit_file)
+    dtime, dlat, dlon, dalt, index, int_final = orbit.createorbit(orbit.name, model.minAltitude, model.maxAltitude,
+                                                                   outfile, True)
+    gtime, glat, glon, glev, zg = model.readgrid(model.name)
+    for name in names:
+        var = model.readvar(model.name, name)
+        m = IM.trilinearinterpolation_batch(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, var)
+        inout.write(outfile, orbit.mergedata(index, int_final, m), name)
+
+
+def after(model_file, orbit_file, names, outfile):
+    IM.runinterpolator(model_file, orbit_file, tgvar=names, interpolation="Trilinear", Save=True, outfilename=outfile)
+
+
+def peak_rss():
+    # VmHWM of this process in MB, ru_maxrss keeps the peak of the parent process across exec on Linux
+    try:
+        with open("/proc/self/status") as status:
+            return [int(line.split()[1]) for line in status if line.startswith("VmHWM")][0] / 1024
+    except (OSError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run(mode, model_file, orbit_file, nvar):
+    names = ["VAR%02d" % i for i in range(nvar)]
+    opens = count_opens()
+    outfile = os.path.join(os.path.dirname(model_file), mode + ".nc")
+    start = time.perf_counter()
+    {"before": before, "after": after}[mode](model_file, orbit_file, names, outfile)
+    wall = time.perf_counter() - start
+    print("RESULT %s %.3f %d %.0f" % (mode, wall, opens[0], peak_rss()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--nt", type=int, default=24, help="time steps of the synthetic TIEGCM file")
+    parser.add_argument("--variables", type=int, default=20)
+    parser.add_argument("--points", type=int, default=50000, help="orbit samples")
+    parser.add_argument("--run", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.run:
+        run(args.run[0], args.run[1], args.run[2], args.variables)
+        return
+
+    with tempfile.TemporaryDirectory() as folder:
+        model_file, orbit_file, names = make_files(folder, args.nt, args.variables, args.points)
+        results = {}
+        for mode in ("before", "after"):
+            # every mode in its own process, for its own peak RSS
+            out = subprocess.run([sys.executable, __file__, "--variables", str(args.variables),
+                                  "--run", mode, model_file, orbit_file], capture_output=True, text=True, check=True)
+            line = [line for line in out.stdout.splitlines() if line.startswith("RESULT")][-1].split()
+            results[mode] = float(line[2]), int(line[3]), float(line[4])
+        print("%d variables, %d time steps, %d orbit points" % (args.variables, args.nt, args.points))
+        print("%7s %10s %11s %14s" % ("", "wall (s)", "file opens", "peak RSS (MB)"))
+        for mode, (wall, opens, rss) in results.items():
+            print("%7s %10.2f %11d %14.0f" % (mode, wall, opens, rss))
+
+
+if __name__ == "__main__":
+    main()
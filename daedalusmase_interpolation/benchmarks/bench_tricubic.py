@@ -0,0 +1,46 @@
+"""
+Points per second of tricubicsplineinterpolation (point by point) and tricubicsplineinterpolation_batch along a
+16 Hz orbit on a synthetic TIEGCM grid, with the hit rate of the coefficient cache of the batch version.
+
+    python benchmarks/bench_tricubic.py [--durations 600 5400] [--rate 16] [--scalar-max 2000]
+"""
+import argparse
+import os
+import sys
+import time
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(here, "..", "source_code"), os.path.join(here, "..", "tests")]
+
+import interpolationmase_mainfunc as IM  # noqa: E402
+import supportfuctions as SF  # noqa: E402
+from synthetic_interpolation import along_track_orbit, synthetic_grid  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--durations", type=float, nargs="+", default=[600, 5400], help="orbit durations in seconds")
+    parser.add_argument("--rate", type=float, default=16, help="samples per second of the orbit")
+    parser.add_argument("--scalar-max", type=int, default=2000, help="orbit points run point by point")
+    args = parser.parse_args()
+
+    gtime, glat, glon, zg, ne = synthetic_grid(nt=3, nlev=57)
+    print("%10s %18s %18s %9s %9s" % ("points", "scalar points/s", "batch points/s", "speedup", "hit rate"))
+    for duration in args.durations:
+        dtime, dlat, dlon, dalt = along_track_orbit(gtime, zg, duration, rate=args.rate)
+        n = len(dtime)
+        coefficients = SF.tricubiccoefficients(ne)
+        start = time.perf_counter()
+        IM.tricubicsplineinterpolation_batch(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, ne,
+                                             coefficients=coefficients)
+        batch = n / (time.perf_counter() - start)
+        # the scalar version on the first points of the orbit
+        m = min(n, args.scalar_max)
+        start = time.perf_counter()
+        IM.tricubicsplineinterpolation(gtime, glat, glon, dtime[:m], dlat[:m], dlon[:m], dalt[:m], zg, ne)
+        scalar = m / (time.perf_counter() - start)
+        print("%10d %18.0f %18.0f %9.1f %9.4f" % (n, scalar, batch, batch / scalar, coefficients.hitrate()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Points per second of trilinearinterpolation (point by point) and trilinearinterpolation_batch on a synthetic
+TIEGCM grid, for orbits of 10^4 to 10^6 samples.
+
+    python benchmarks/bench_trilinear.py [--sizes 10000 100000 1000000] [--scalar-max 10000]
+"""
+import argparse
+import os
+import sys
+import time
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(here, "..", "source_code"), os.path.join(here, "..", "tests")]
+
+import interpolationmase_mainfunc as IM  # noqa: E402
+from synthetic_interpolation import synthetic_grid, synthetic_orbit  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**4, 10**5, 10**6])
+    parser.add_argument("--scalar-max", type=int, default=10**4, help="largest orbit run point by point")
+    args = parser.parse_args()
+
+    gtime, glat, glon, zg, ne = synthetic_grid(nt=24, nlev=57)
+    print("%10s %18s %18s %9s" % ("points", "scalar points/s", "batch points/s", "speedup"))
+    for n in args.sizes:
+        dtime, dlat, dlon, dalt = synthetic_orbit(gtime, zg, n)
+        start = time.perf_counter()
+        IM.trilinearinterpolation_batch(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, ne)
+        batch = n / (time.perf_counter() - start)
+        scalar = float("nan")
+        if n <= args.scalar_max:
+            start = time.perf_counter()
+            IM.trilinearinterpolation(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, ne)
+            scalar = n / (time.perf_counter() - start)
+        print("%10d %18.0f %18.0f %9.1f" % (n, scalar, batch, batch / scalar))
+
+
+if __name__ == "__main__":
+    main()
@@ -77,6 +77,86 @@ class model:
 
 
 
+class reader:
+
+    """
+    reader keeps a single TIEGCM Dataset open for a whole interpolation run and reads only the time steps spanned by the orbit, for every requested variable.
+
+    """
+    def __init__(self,name):
+        """
+            Opens the TIEGCM file
+            Args:
+                name (String): the name of TIEGCM input file
+        """
+        self.name=name
+        self.dataset=Dataset(name)
+        self.window=slice(None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*args):
+        self.close()
+
+    def close(self):
+        """
+            Closes the TIEGCM file
+        """
+        self.dataset.close()
+
+    def readgrid(self):
+        """
+            reads the TIEGCM grid, without the altitudes that are read with readvar for the selected time steps only
+            Returns:
+                gtime (float): time as numpy array
+                glat (float): geodetic latitude as numpy array
+                glon (float): geodetic longitute as numpy array
+                glev (float): pressure level as numpy array
+        """
+        gtime=np.asarray(self.dataset.variables['time'][:])
+        glat=np.asarray(self.dataset.variables['lat'][:])
+        glon=np.asarray(self.dataset.variables['lon'][:])
+        glev=np.asarray(self.dataset.variables['lev'][:])
+        return gtime,glat,glon,glev
+
+    def settimewindow(self,gtime,dtime):
+        """
+            Selects the time steps used by the interpolation of the orbit, all subsequent reads are limited to them
+            Args:
+                gtime (float): 1D array of times of TIEGCM
+                dtime (float): 1D array of time of interpolation orbit
+            Returns:
+                window (slice): the selected time steps, gtime[window] is the time axis to interpolate on
+        """
+        counter=SF.BracketIndex(gtime).local(np.asarray(dtime,dtype=float))
+        if len(counter)==0:
+            self.window=slice(0,0)
+        else:
+            self.window=slice(int(counter.min()),min(int(counter.max())+2,len(gtime)))
+        return self.window
+
+    def hasvar(self,name):
+        """
+            Args:
+                name (String): the name of the variable
+            Returns:
+                found (bool): True if the variable exists in the TIEGCM file
+        """
+        return name in self.dataset.variables
+
+    def readvar(self,name):
+        """
+            reads the selected time steps of a variable
+            Args:
+                name (String): the name of the variable
+            Returns:
+                var (float): 4D numpy array of the variable
+        """
+        return np.asarray(self.dataset.variables[name][self.window])
+
+
+
 class orbit:
     """
         orbit class handles basic IO of Daedalus' orbit allocating arrays for the spatial components. The longitudinal component is matched to TIEGCM's and points in a specific altitudinal range are extracted to be passed to the interpolation routine. There is also an option for creating a Rocket orbit for getting vertical profiles of the said model.
@@ -110,7 +190,9 @@ class orbit:
         daed_alt_temp = orbit.variables['altitude'][:]
         daed_time_temp = orbit.variables['time'][:] #unix time
         
+        orbit.close()
         SF.startTime = daed_time_temp[0]
+        self.orbitdata=(daed_time_temp,daed_lat_temp,daed_lon_temp,daed_alt_temp)
         
 
 #         self.dt=daed_time_temp[2]-daed_time_temp[1]
@@ -135,6 +217,7 @@ class orbit:
         int_final=[None]*len(daed_alt_temp)
   
         counter2=0
+        shiftlon=max(daed_lon_temp)>180
         
         for i in range(0,len(daed_alt_temp)):
     
@@ -142,7 +225,7 @@ class orbit:
          
                 daed_time[counter2]=daed_time_temp[i]
                 daed_lat[counter2]=daed_lat_temp[i]
-                if max(daed_lon_temp)>180:
+                if shiftlon:
                     daed_lon[counter2]=daed_lon_temp[i]-180 #match TIEGCM grid
                 else:
                     daed_lon[counter2]=daed_lon_temp[i]
@@ -167,11 +250,19 @@ class orbit:
 
     #     return Rlat,Rlon,Ralt
 
-    # def mergedata(self,index,int_final,m):
-    #     for i in range(0,len(m)):
-    #         int_final[index[i]]=m[i]
-
-    #     return int_final    
+    def mergedata(self,index,int_final,m):
+        """
+            Function to place the interpolation results back to the positions of the whole orbit
+            Args:
+                index (int): list of the orbit positions of the interpolated points
+                int_final (list): list with one element per orbit point
+                m (float): 1D array of interpolation results
+            Returns:
+                merged (float): 1D array of results for the whole orbit, NaN outside of the altitude range
+        """
+        merged=np.full(len(int_final),np.nan)
+        merged[np.asarray(index,dtype=int)]=m
+        return merged
 
 
 
@@ -215,4 +306,61 @@ def write(outfile,m,varname):
     ncout = Dataset(outfile, "a", format="NETCDF4")
     data = ncout.createVariable(varname,"f4",('time'))
     data[:]=m
-    ncout.close()
\ No newline at end of file
+    ncout.close()
+
+
+class writer:
+    """
+        writer keeps the netCDF4 output file open for a whole interpolation run, with all output variables created up front.
+    """
+    def __init__(self,outfile,time,lat,lon,alt,varnames,zlib=False,chunksize=65536):
+        """
+            Creates the output file with the orbit parameters and an empty variable per interpolated variable
+            Args:
+                outfile (String): name of output file
+                time (String): list of timesteps of orbit
+                lat (float): list of latitudes of orbit
+                lon (float): list of longitudes of orbit
+                alt (float): list of altitudes of orbit
+                varnames (String): list of names of interpolated variables
+                zlib (bool): enables zlib compression of the interpolated variables
+                chunksize (int): chunk length of the interpolated variables along time
+        """
+        print("Output File Path:",outfile)
+        self.ncout = Dataset(outfile, "w", format="NETCDF4")
+        self.ncout.createDimension("time", len(time))
+        data = self.ncout.createVariable("time","f4","time")
+        data[:]=np.arange(0,len(time)) #time axis based on Daedalus Sampling rate
+        self.ncout.createDimension("lat",len(lat))
+        data = self.ncout.createVariable("lat","f4","lat")
+        data[:]=lat
+        self.ncout.createDimension("lon",len(lon))
+        data = self.ncout.createVariable("lon","f4","lon")
+        data[:]=lon
+        self.ncout.createDimension("altitude",len(alt))
+        data = self.ncout.createVariable("altitude","f4","time")
+        data[:]=alt
+        chunks=(max(1,min(chunksize,len(time))),)
+        for varname in varnames:
+            self.ncout.createVariable(varname,"f4",('time'),zlib=zlib,chunksizes=chunks)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*args):
+        self.close()
+
+    def write(self,varname,m):
+        """
+            Function to save interpolation results of a variable
+            Args:
+                varname (String): name of interpolated variable
+                m (float): 1D array of interpolation results
+        """
+        self.ncout.variables[varname][:]=m
+
+    def close(self):
+        """
+            Closes the output file
+        """
+        self.ncout.close()
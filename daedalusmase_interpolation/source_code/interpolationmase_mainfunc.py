@@ -81,6 +81,110 @@ def trilinearinterpolation(gtime,glat,glon,dtime,dlat,dlon,dalt,zg,ne):
 
     return m
 
+def gridindex(gtime,glat,glon,zg):
+    """
+        This function builds the search structures of the TIEGCM grid once, to be shared by all orbit points.
+        Args:
+            gtime (float): 1D array of times of TIEGCM
+            glat (float): 1D array of latitudes of TIEGCM
+            glon (float): 1D array of longitudes of TIEGCM
+            zg (float): 4D array of altitudes of TIEGCM midpoint levels
+        Returns:
+            index (tuple): BracketIndex of time, latitude and longitude and ColumnBracketIndex of altitude
+    """
+    return SF.BracketIndex(gtime),SF.BracketIndex(glat),SF.BracketIndex(glon,period=360),SF.ColumnBracketIndex(zg)
+
+def orbit_brackets(gtime,glat,glon,dtime,dlat,dlon,dalt,zg,index=None):
+    """
+        This function finds the TIEGCM grid cell of every orbit point at once, following the same rules as the point by point interpolation functions.
+        Args:
+            gtime (float): 1D array of times of TIEGCM
+            glat (float): 1D array of latitudes of TIEGCM
+            glon (float): 1D array of longitudes of TIEGCM
+            dtime (float): 1D array of time of interpolation orbit
+            dlat (float): 1D array of latitudes of interpolation orbit
+            dlon (float): 1D array of longitudes of interpolation orbit
+            dalt (float): 1D array of altitudes of interpolation orbit
+            zg (float): 4D array of altitudes of TIEGCM midpoint levels
+            index (tuple): search structures returned by gridindex, built if None
+        Returns:
+            counter (int): 1D array of time indices
+            r_local (int): 1D array of lower pressure level indices
+            theta_local (int): 1D array of lower latitude indices
+            phi_local (int): 1D array of lower longitude indices
+            alts (float): 2D array (N,2) of altitudes in km of the lower and upper level of each cell
+    """
+    if index is None:
+        index=gridindex(gtime,glat,glon,zg)
+    time_index,lat_index,lon_index,alt_index=index
+    dlat=np.asarray(dlat,dtype=float)
+    dlon=np.asarray(dlon,dtype=float)
+    dalt=np.asarray(dalt,dtype=float)
+
+    counter=time_index.local(dtime)
+    phi_local=lon_index.local(dlon)
+    theta_local=lat_index.local(dlat)
+
+    phi_local[dlon >= 177.5]=len(glon)-2
+    phi_local[dlon <= -177.5]=1
+    theta_local[dlat >= 87.5]=len(glat)-2
+    theta_local[dlat <= -87.5]=0
+
+    r_local,columns=alt_index.local(dalt,counter,theta_local,phi_local)
+    rows=np.arange(len(dalt))
+    alts=np.stack((columns[rows,r_local],columns[rows,r_local+1]),axis=1)
+
+    return counter,r_local,theta_local,phi_local,alts
+
+def trilinearinterpolation_batch(gtime,glat,glon,dtime,dlat,dlon,dalt,zg,ne,chunk_size=100000):
+    """
+        This function performs Trilinear interpolation of a given orbit in TIEGCM grid for all orbit points at once. Results are identical to trilinearinterpolation.
+        Args:
+            gtime (float): 1D array of times of TIEGCM
+            glat (float): 1D array of latitudes of TIEGCM
+            glon (float): 1D array of longitudes of TIEGCM
+            dtime (float): 1D array of time of interpolation orbit
+            dlat (float): 1D array of latitudes of interpolation orbit
+            dlon (float): 1D array of longitudes of interpolation orbit
+            dalt (float): 1D array of altitudes of interpolation orbit
+            zg (float): 4D array of altitudes of TIEGCM midpoint levels
+            ne (float): 4D array of variable values on gridded point of TIEGCM grid
+            chunk_size (int): number of orbit points processed together, bounds the memory of the altitude search
+        Returns:
+            m (float): 1D array of Trilinear Interpolation Results
+    """
+    deltaphi= np.abs(glon[2]-glon[1])
+    deltatheta=np.abs(glat[2]-glat[1])
+    zg=np.asarray(zg)
+    ne=np.asarray(ne)
+    dtime=np.asarray(dtime,dtype=float)
+    dlat=np.asarray(dlat,dtype=float)
+    dlon=np.asarray(dlon,dtype=float)
+    dalt=np.asarray(dalt,dtype=float)
+
+    m=np.zeros((len(dalt)))
+    index=gridindex(gtime,glat,glon,zg)
+
+    for start in range(0,len(dalt),chunk_size):
+        sl=slice(start,start+chunk_size)
+        counter,r_local,theta_local,phi_local,alts=orbit_brackets(gtime,glat,glon,dtime[sl],dlat[sl],dlon[sl],dalt[sl],zg,index)
+
+        dx=(dalt[sl]-alts[:,0])/(alts[:,1]-alts[:,0])
+        dy=(dlat[sl]-glat[theta_local])/deltatheta
+        dz=np.abs((dlon[sl]-glon[phi_local])/deltaphi)
+
+        # Gather the 8 corners, ordered as w1..w8 of trilinearinterpolation
+        m[sl]=ne[counter,r_local,theta_local,phi_local]*np.abs((1-dx)*(1-dy)*(1-dz))+\
+              ne[counter,r_local+1,theta_local,phi_local]*np.abs((dx)*(1-dy)*(1-dz))+\
+              ne[counter,r_local,theta_local+1,phi_local]*np.abs((1-dx)*(dy)*(1-dz))+\
+              ne[counter,r_local+1,theta_local+1,phi_local]*np.abs((dx)*(dy)*(1-dz))+\
+              ne[counter,r_local,theta_local,phi_local+1]*np.abs((1-dx)*(1-dy)*(dz))+\
+              ne[counter,r_local+1,theta_local,phi_local+1]*np.abs((dx)*(1-dy)*(dz))+\
+              ne[counter,r_local,theta_local+1,phi_local+1]*np.abs((1-dx)*(dy)*(dz))+\
+              ne[counter,r_local+1,theta_local+1,phi_local+1]*np.abs((dx)*(dy)*(dz))
+
+    return m
+
 def tricubicsplineinterpolation(gtime,glat,glon,dtime,dlat,dlon,dalt,zg,ne):
     """
         This function performs Inverse Distanse Weight interpolation of a given orbit in TIEGCM grid, using 8 closest gridded points.
@@ -258,6 +362,53 @@ def tricubicsplineinterpolation(gtime,glat,glon,dtime,dlat,dlon,dalt,zg,ne):
 
     return m
 
+def tricubicsplineinterpolation_batch(gtime,glat,glon,dtime,dlat,dlon,dalt,zg,ne,coefficients=None,chunk_size=100000):
+    """
+        This function performs Tricubic Spline interpolation of a given orbit in TIEGCM grid for all orbit points at once.
+        The spline coefficients of every visited cell are computed once and reused by all orbit points in that cell.
+        Args:
+            gtime (float): 1D array of times of TIEGCM
+            glat (float): 1D array of latitudes of TIEGCM
+            glon (float): 1D array of longitudes of TIEGCM
+            dtime (float): 1D array of time of interpolation orbit
+            dlat (float): 1D array of latitudes of interpolation orbit
+            dlon (float): 1D array of longitudes of interpolation orbit
+            dalt (float): 1D array of altitudes of interpolation orbit
+            zg (float): 4D array of altitudes of TIEGCM midpoint levels
+            ne (float): 4D array of variable values on gridded point of TIEGCM grid
+            coefficients (tricubiccoefficients): coefficient cache of ne, to be reused between calls. Created if None
+            chunk_size (int): number of orbit points processed together
+        Returns:
+            m (float): 1D array of Tricubic Spline Interpolation Results
+    """
+    deltaphi= np.abs(glon[2]-glon[1])
+    deltatheta=np.abs(glat[2]-glat[1])
+    zg=np.asarray(zg)
+    if coefficients is None:
+        coefficients=SF.tricubiccoefficients(np.asarray(ne))
+    dtime=np.asarray(dtime,dtype=float)
+    dlat=np.asarray(dlat,dtype=float)
+    dlon=np.asarray(dlon,dtype=float)
+    dalt=np.asarray(dalt,dtype=float)
+
+    m=np.zeros((len(dalt)))
+    powers=np.arange(4)
+    index=gridindex(gtime,glat,glon,zg)
+
+    for start in range(0,len(dalt),chunk_size):
+        sl=slice(start,start+chunk_size)
+        counter,r_local,theta_local,phi_local,alts=orbit_brackets(gtime,glat,glon,dtime[sl],dlat[sl],dlon[sl],dalt[sl],zg,index)
+
+        dx=(dalt[sl]-alts[:,0])/(alts[:,1]-alts[:,0])
+        dy=np.abs((dlat[sl]-glat[theta_local])/deltatheta)
+        dz=np.abs((dlon[sl]-glon[phi_local])/deltaphi)
+
+        # a[ii+4*j+16*k] multiplies dx**ii * dy**j * dz**k
+        a=coefficients.coefficients(counter,r_local,theta_local,phi_local).reshape(-1,4,4,4)
+        m[sl]=np.einsum("nkji,ni,nj,nk->n",a,dx[:,None]**powers,dy[:,None]**powers,dz[:,None]**powers)
+
+    return m
+
 def idwinterpolation(gtime,glat,glon,dtime,dlat,dlon,dalt,zg,ne):
     """
         This function performs Inverse Distanse Weight interpolation of a given orbit in TIEGCM grid, using 8 closest gridded points.
@@ -310,14 +461,14 @@ def idwinterpolation(gtime,glat,glon,dtime,dlat,dlon,dalt,zg,ne):
         p_7=[glat[theta_local+1],glon[phi_local+1],alts[r_local]]
         p_8=[glat[theta_local+1],glon[phi_local+1],alts[r_local+1]]
 
-        d_01=SF.euclidianDistance(p_0,p_1)
-        d_02=SF.euclidianDistance(p_0,p_2)
-        d_03=SF.euclidianDistance(p_0,p_3)
-        d_04=SF.euclidianDistance(p_0,p_4)
-        d_05=SF.euclidianDistance(p_0,p_5)
-        d_06=SF.euclidianDistance(p_0,p_6)
-        d_07=SF.euclidianDistance(p_0,p_7)
-        d_08=SF.euclidianDistance(p_0,p_8)
+        d_01=SF.euclidian_distance(p_0,p_1)
+        d_02=SF.euclidian_distance(p_0,p_2)
+        d_03=SF.euclidian_distance(p_0,p_3)
+        d_04=SF.euclidian_distance(p_0,p_4)
+        d_05=SF.euclidian_distance(p_0,p_5)
+        d_06=SF.euclidian_distance(p_0,p_6)
+        d_07=SF.euclidian_distance(p_0,p_7)
+        d_08=SF.euclidian_distance(p_0,p_8)
 
         if d_01==0: m[i]=ne[counter,r_local,theta_local,phi_local] 
         if d_02==0: m[i]=ne[counter,r_local+1,theta_local,phi_local] 
@@ -349,9 +500,55 @@ def idwinterpolation(gtime,glat,glon,dtime,dlat,dlon,dalt,zg,ne):
 
 
 
-def runinterpolator(model_data_file,orbit_file,tgvar="TN",interpolation="Trilinear",Save=True,outfilename="InterResults.nc"):
+def idwinterpolation_kdtree(gtime,glat,glon,dtime,dlat,dlon,dalt,zg,ne,k=8,p=2,trees=None):
     """
-        This function performs Inverse Distanse Weight interpolation of a given orbit in TIEGCM grid, using 8 closest gridded points.
+        This function performs Inverse Distanse Weight interpolation of a given orbit in TIEGCM grid, using the k closest gridded points found with a KD-tree.
+        Args:
+            gtime (float): 1D array of times of TIEGCM
+            glat (float): 1D array of latitudes of TIEGCM
+            glon (float): 1D array of longitudes of TIEGCM
+            dtime (float): 1D array of time of interpolation orbit
+            dlat (float): 1D array of latitudes of interpolation orbit
+            dlon (float): 1D array of longitudes of interpolation orbit
+            dalt (float): 1D array of altitudes of interpolation orbit
+            zg (float): 4D array of altitudes of TIEGCM midpoint levels
+            ne (float): 4D array of variable values on gridded point of TIEGCM grid
+            k (int): number of neighbours used
+            p (float): IDW power parameter
+            trees (idwtrees): cache of the grid trees, to be reused between variables. Created if None
+        Returns:
+            m (float): 1D array of Inverse Distanse Weight Interpolation Results
+    """
+    if trees is None:
+        trees=SF.idwtrees(glat,glon,zg)
+    dlat=np.asarray(dlat,dtype=float)
+    dlon=np.asarray(dlon,dtype=float)
+    dalt=np.asarray(dalt,dtype=float)
+
+    m=np.zeros((len(dalt)))
+    counter=SF.BracketIndex(gtime).local(dtime)
+    points=SF.geodetic_to_ecef(dlat,dlon,dalt)
+
+    for time in np.unique(counter):
+        sel=np.where(counter==time)[0]
+        dist,nearest=trees.tree(time).query(points[sel],k=k)
+        dist=dist.reshape(len(sel),k)
+        values=np.asarray(ne[time]).reshape(-1)[nearest.reshape(len(sel),k)]
+        with np.errstate(divide="ignore"):
+            weights=1/dist**p
+        exact=dist[:,0]==0
+        weights[exact]=0
+        weights[exact,0]=1
+        m[sel]=np.sum(weights*values,axis=1)/np.sum(weights,axis=1)
+
+    return m
+
+
+
+def runinterpolator(model_data_file,orbit_file,tgvar="TN",interpolation="Trilinear",Save=True,outfilename="InterResults.nc",zlib=False):
+    """
+        This function interpolates the selected TIEGCM variables along the given orbit. The TIEGCM file is opened once and only the time steps spanned by the orbit are read,
+        the output file is opened once with all output variables created up front.
         Args:
             model_data_file (String): name of TIEGCM input file, netCDF4 file
             orbit_file (String): name of orbit file, netCDF4 file
@@ -359,44 +556,52 @@ def runinterpolator(model_data_file,orbit_file,tgvar="TN",interpolation="Triline
             interpolation (String): Select between "Trilinear", "Tricubic" and "IDW"
             Save (bool): Enables the saving of orbit parameters in the ouput file the results
             outfilename (String): The name of the output file, default name is "InterResults.nc"
-            dalt (float): 1D array of altitudes of interpolation orbit
+            zlib (bool): Enables zlib compression of the interpolated variables in the output file
     """
 
     model=inout.model(model_data_file ,500,100)  #initialize model
     orbit=inout.orbit(orbit_file)                #initialize  orbit
     outfile=outfilename
-    dtime,dlat,dlon,dalt,index,int_final=orbit.createorbit(orbit.name,model.minAltitude,model.maxAltitude,outfile,Save)
-    gtime,glat,glon,glev,zg=model.readGrid(model.name)                                     #get model stats
+    dtime,dlat,dlon,dalt,index,int_final=orbit.createorbit(orbit.name,model.minAltitude,model.maxAltitude,outfile,False)
     if tgvar=='All':
         tgvar=['XNMBAR','TI','TN','OP','DEN','HALL','HE','PEDERSEN','POTEN','TE',
                 'O2_CM3', 'EEX', 'EEY', 'EEZ', 'ELECDEN', 'N2_CM3', 'NOP_LAM', 'NPLUS', '02P', 'O_CM3'
                 'UN', 'VN', 'WN_lev', 'HALL', 'N2D', 'N4S', 'NO', 'Ui_lev', 'Vi_lev', 'WI_LEV']  
-    #select variable
-    if interpolation=="Trilinear":
-        for jj in tqdm(range(len(tgvar))):
-            var=model.readvar(model.name,tgvar[jj])
-            interpolatedDataTrilinear=trilinearinterpolation(glat,glon,glev,dtime, dlat,dlon,dalt,zg,var)
-            interpolatedData=orbit.mergedata(index,int_final,interpolatedDataTrilinear)
-
-            if Save == True: 
-                inout.write(outfile,interpolatedData,tgvar[jj])
-                
-    if interpolation=="Tricubic":
-        for jj in tqdm(range(len(tgvar))):
-            var=model.readVar(model.name,tgvar[jj])
-
-            interpolatedDataTricubic=tricubicsplineinterpolation(gtime,glat,glon,glev,dtime, dlat,dlon,dalt,zg,var)
-            interpolatedData=orbit.mergeData(index,int_final,interpolatedDataTricubic)
-            
-            if Save == True: 
-                inout.write(outfile,interpolatedData,tgvar[jj])
-
-    if interpolation=="IDW":
-        for jj in tqdm(range(len(tgvar))):
-            var=model.readVar(model.name,tgvar[jj])
-
-            interpolatedDataTricubic=idwinterpolation(gtime,glat,glon,glev,dtime, dlat,dlon,dalt,zg,var)
-            interpolatedData=orbit.mergeData(index,int_final,interpolatedDataTricubic)
-            
-            if Save == True: 
-                inout.write(outfile,interpolatedData,tgvar[jj])
+    if isinstance(tgvar,str):
+        tgvar=[tgvar]
+
+    with inout.reader(model.name) as source:
+        gtime,glat,glon,glev=source.readgrid()                                     #get model stats
+        window=source.settimewindow(gtime,dtime)                                    #read only the time steps of the orbit
+        gtime=gtime[window]
+        zg=source.readvar('ZGMID')
+        for name in tgvar:
+            if not source.hasvar(name):
+                print("Variable",name,"not found in",model.name)
+        tgvar=[name for name in dict.fromkeys(tgvar) if source.hasvar(name)]
+
+        output=None
+        if Save == True:
+            output=inout.writer(outfile,*orbit.orbitdata,tgvar,zlib=zlib)
+        trees=None
+        if interpolation=="IDW":
+            trees=SF.idwtrees(glat,glon,zg)
+
+        try:
+            for name in tqdm(tgvar):
+                var=source.readvar(name)
+
+                #select variable
+                if interpolation=="Trilinear":
+                    interpolated=trilinearinterpolation_batch(gtime,glat,glon,dtime,dlat,dlon,dalt,zg,var)
+                if interpolation=="Tricubic":
+                    interpolated=tricubicsplineinterpolation_batch(gtime,glat,glon,dtime,dlat,dlon,dalt,zg,var)
+                if interpolation=="IDW":
+                    interpolated=idwinterpolation_kdtree(gtime,glat,glon,dtime,dlat,dlon,dalt,zg,var,trees=trees)
+                interpolatedData=orbit.mergedata(index,int_final,interpolated)
+
+                if output is not None:
+                    output.write(name,interpolatedData)
+        finally:
+            if output is not None:
+                output.close()
@@ -1,4 +1,6 @@
 import numpy as np
+from collections import OrderedDict
+from scipy.spatial import cKDTree
 RE=6378.137 #earth radiou in km
 startTime=0
 
@@ -33,16 +35,158 @@ def local(y,x):
         Returns:
             local_pos (int): index of the closest element of array
     """
-    local_pos=0
-    for i in range(0,len(x)-1):
-        if y >= x[i] and y < x[i+1]:
-            if y<=0:
-                local_pos=i+1
-                return (local_pos)
-            else:
-                local_pos=i
-                return (local_pos)
-    return (local_pos)
+    x=np.asarray(x)
+    inside=(x[:-1]<=y) & (y<x[1:])
+    if not inside.any():
+        return 0
+    local_pos=int(np.argmax(inside))
+    if y<=0:
+        return local_pos+1
+    return local_pos
+
+
+class BracketIndex:
+    """
+        BracketIndex is built once for a grid axis (time, latitude or longitude of TIEGCM) and finds the bracketing 
+        interval of many values at once. Uniformly spaced axes are indexed arithmetically in O(1), other axes use binary search.
+        Descending axes are supported and periodic axes (longitude) can wrap around.
+    """
+    def __init__(self,x,period=None):
+        """
+            Args:
+                x (float): 1D array of the axis, monotonic
+                period (float): period of the axis (360 for longitude), None for non periodic axes
+        """
+        self.x=np.asarray(x,dtype=float)
+        self.n=len(self.x)
+        self.period=period
+        self.descending=self.n>1 and self.x[0]>self.x[-1]
+        self.ascending_x=self.x[::-1] if self.descending else self.x
+        self.start=self.ascending_x[0]
+        step=np.diff(self.ascending_x)
+        self.uniform=self.n>2 and np.allclose(step,step[0],rtol=1e-9,atol=0)
+        self.step=step[0] if self.n>1 else 0.0
+
+    def search(self,y):
+        """
+            Finds for every element of y the largest i with ascending_x[i]<=y
+            Args:
+                y (float): 1D array of elements to search for
+            Returns:
+                pos (int): 1D array of indices, -1 below the axis and n-1 above it or for NaN
+        """
+        x=self.ascending_x
+        if not self.uniform:
+            return np.searchsorted(x,y,side="right")-1
+        pos=np.floor((y-self.start)/self.step)
+        pos=np.clip(np.where(np.isnan(pos),self.n-1,pos),-1,self.n-1).astype(int)
+        # correct round off of the arithmetic index against the actual nodes
+        pos=np.where((pos>=0) & (x[np.maximum(pos,0)]>y),pos-1,pos)
+        pos=np.where((pos<self.n-1) & (x[np.minimum(pos+1,self.n-1)]<=y),pos+1,pos)
+        return pos
+
+    def bracket(self,y):
+        """
+            Finds the interval [x[i],x[i+1]] containing every element of y
+            Args:
+                y (float): 1D array of elements to search for
+            Returns:
+                pos (int): 1D array of lower indices, -1 outside of the axis or for NaN. On periodic axes pos is n-1 for the interval wrapping to x[0].
+                On descending axes the interval is x[i]>=y>x[i+1], as in ColumnBracketIndex
+        """
+        y=np.asarray(y,dtype=float)
+        if self.period is not None:
+            y=self.start+np.mod(y-self.start,self.period)
+        pos=self.search(y)
+        if self.descending:
+            # y on a node belongs to the interval below it in ascending order
+            pos=np.where((pos>=0) & (self.ascending_x[np.maximum(pos,0)]==y),pos-1,pos)
+        if self.period is not None:
+            inside=(pos>=0) & ~np.isnan(y)
+        else:
+            inside=(pos>=0) & (pos<=self.n-2)
+        if self.descending:
+            pos=np.where(pos==self.n-1,self.n-1,self.n-2-pos)
+        return np.where(inside,pos,-1)
+
+    def local(self,y):
+        """
+            Vectorized version of local for this axis, ignoring the period
+            Args:
+                y (float): 1D array of elements to search for
+            Returns:
+                local_pos (int): 1D array with the same indices local would return for every element
+        """
+        y=np.asarray(y,dtype=float)
+        if self.descending:
+            return np.zeros(y.shape,dtype=int)
+        local_pos=self.search(y)
+        found=(local_pos>=0) & (local_pos<=self.n-2)
+        local_pos=np.where(found,local_pos,0)
+        local_pos=np.where(found & (y<=0),local_pos+1,local_pos)
+        return local_pos
+
+
+class ColumnBracketIndex:
+    """
+        ColumnBracketIndex finds the bracketing pressure levels of altitudes in the ZGMID columns of TIEGCM.
+        Every (time,lat,lon) column has its own altitudes, which may be ascending, descending or irregular.
+    """
+    def __init__(self,zg,scale=1e5):
+        """
+            Args:
+                zg (float): 4D array (time,lev,lat,lon) of altitudes of TIEGCM midpoint levels
+                scale (float): divisor converting zg to the units of the searched altitudes, cm to km by default
+        """
+        self.zg=np.asarray(zg)
+        self.scale=scale
+
+    def columns(self,time,lat,lon):
+        """
+            Args:
+                time (int): 1D array of time indices
+                lat (int): 1D array of latitude indices
+                lon (int): 1D array of longitude indices
+            Returns:
+                columns (float): 2D array (N,lev) of the altitudes of every requested column
+        """
+        return self.zg[time,:,lat,lon]/self.scale
+
+    def bracket(self,y,time,lat,lon):
+        """
+            Finds the first pair of levels [i,i+1] of each column bracketing y, in either direction
+            Args:
+                y (float): 1D array of altitudes
+                time (int): 1D array of time indices
+                lat (int): 1D array of latitude indices
+                lon (int): 1D array of longitude indices
+            Returns:
+                pos (int): 1D array of lower level indices, -1 if the altitude is outside of the column
+        """
+        y=np.asarray(y,dtype=float)[:,None]
+        cols=self.columns(time,lat,lon)
+        inside=((cols[:,:-1]<=y) & (y<cols[:,1:])) | ((cols[:,:-1]>=y) & (y>cols[:,1:]))
+        return np.where(inside.any(axis=1),np.argmax(inside,axis=1),-1)
+
+    def local(self,y,time,lat,lon):
+        """
+            Vectorized version of local over the requested columns
+            Args:
+                y (float): 1D array of altitudes
+                time (int): 1D array of time indices
+                lat (int): 1D array of latitude indices
+                lon (int): 1D array of longitude indices
+            Returns:
+                local_pos (int): 1D array with the same indices local would return for every column
+                cols (float): 2D array (N,lev) of the altitudes of the columns
+        """
+        y=np.asarray(y,dtype=float)
+        cols=self.columns(time,lat,lon)
+        inside=(cols[:,:-1]<=y[:,None]) & (y[:,None]<cols[:,1:])
+        found=inside.any(axis=1)
+        local_pos=np.where(found,np.argmax(inside,axis=1),0)
+        local_pos=np.where(found & (y<=0),local_pos+1,local_pos)
+        return local_pos,cols
 
 # A carries Tricubic Spline Coefficients.
 A = [
@@ -206,6 +350,147 @@ def third_order_mixed_derivative(f,time,x,y,z):
 
     return retval
 
+def central_difference(f,axis):
+    """
+        Central difference of a 3D array along one axis, same stencil as first_order_derivative
+        Args:
+            f (float): 3D array (lev,lat,lon) of the variable
+            axis (int): axis of derivation, 0 for lev, 1 for lat, 2 for lon
+        Returns:
+            retval (float): 3D array of the derivative, neighbours wrap around at the edges
+    """
+    return (np.roll(f,-1,axis)-np.roll(f,1,axis))/(2)
+
+
+def derivative_stencils(f):
+    """
+        Function to calculate all the derivatives needed by the tricubic interpolation for a whole time step at once.
+        Boundaries are set to zero exactly as in first_order_derivative, second_order_mixed_derivative and third_order_mixed_derivative
+        Args:
+            f (float): 3D array (lev,lat,lon) of the variable for one time index
+        Returns:
+            stencils (float): 4D array (8,lev,lat,lon) holding f, fdx, fdy, fdz, fdxdy, fdxdz, fdydz, fdxdydz
+    """
+    f=np.asarray(f,dtype=float)
+    nlev,nlat,nlon=f.shape
+    lev=np.arange(nlev)[:,None,None]
+    lat=np.arange(nlat)[None,:,None]
+    lon=np.arange(nlon)[None,None,:]
+    inner_lat=(lat>1) & (lat<nlat-1)
+    inner_lon=(lon>1) & (lon<nlon-1)
+    inner=(lev>1) & (lev<nlev-2) & inner_lat & inner_lon
+
+    fdx=central_difference(f,0)
+    fdy=central_difference(f,1)
+    fdz=central_difference(f,2)
+    fdxdy=central_difference(fdy,0)
+    fdxdz=central_difference(fdz,0)
+    fdydz=central_difference(fdz,1)
+    fdxdydz=central_difference(fdydz,0)
+
+    stencils=np.empty((8,nlev,nlat,nlon))
+    stencils[0]=f
+    stencils[1]=fdx
+    stencils[2]=np.where(inner_lat,fdy,0)
+    stencils[3]=np.where(inner_lon,fdz,0)
+    stencils[4]=np.where(inner,fdxdy,0)
+    stencils[5]=np.where(inner,fdxdz,0)
+    stencils[6]=np.where(inner,fdydz,0)
+    stencils[7]=np.where(inner,fdxdydz,0)
+    return stencils
+
+
+# Offsets (lev,lat,lon) of the 8 corners of a cell, same order as in tricubicsplineinterpolation
+CORNERS=np.array([[0,0,0],[1,0,0],[0,1,0],[1,1,0],[0,0,1],[1,0,1],[0,1,1],[1,1,1]])
+
+
+class tricubiccoefficients:
+    """
+        tricubiccoefficients keeps the 64 tricubic spline coefficients of the cells of one 4D variable already visited by an orbit,
+        so that orbit points falling in the same (time, lat, lon, lev) cell reuse them instead of recomputing derivatives.
+    """
+    def __init__(self,f,max_cells=200000):
+        """
+            Args:
+                f (float): 4D array (time,lev,lat,lon) of the variable
+                max_cells (int): maximum number of cached cells, the cache is emptied when exceeded
+        """
+        self.f=f
+        self.max_cells=max_cells
+        self.keys=np.zeros(0,dtype=np.int64)
+        self.coefs=np.zeros((0,64))
+        self.hits=0
+        self.misses=0
+        self.stencil_time=None
+        self.stencils=None
+
+    def hitrate(self):
+        """
+            Returns:
+                rate (float): fraction of orbit points that reused cached coefficients
+        """
+        total=self.hits+self.misses
+        if total==0:
+            return 0.0
+        return self.hits/total
+
+    def coefficients(self,time,lev,lat,lon):
+        """
+            Returns the coefficients of the cells of N orbit points, computing only the ones not in the cache
+            Args:
+                time (int): 1D array of time indices
+                lev (int): 1D array of lower pressure level indices
+                lat (int): 1D array of lower latitude indices
+                lon (int): 1D array of lower longitude indices
+            Returns:
+                a (float): 2D array (N,64) of tricubic spline coefficients
+        """
+        cells=np.ravel_multi_index((time,lat,lon,lev),(self.f.shape[0],self.f.shape[2],self.f.shape[3],self.f.shape[1]))
+        unique_cells,inverse=np.unique(cells,return_inverse=True)
+
+        pos=np.searchsorted(self.keys,unique_cells)
+        cached=np.zeros(len(unique_cells),dtype=bool)
+        inside=pos<len(self.keys)
+        cached[inside]=self.keys[pos[inside]]==unique_cells[inside]
+        missing=unique_cells[~cached]
+        self.misses+=len(missing)
+        self.hits+=len(cells)-len(missing)
+
+        if len(missing)>0:
+            if len(self.keys)+len(missing)>self.max_cells:
+                self.keys=np.zeros(0,dtype=np.int64)
+                self.coefs=np.zeros((0,64))
+            new_coefs=self.compute(missing)
+            keys=np.concatenate((self.keys,missing))
+            coefs=np.concatenate((self.coefs,new_coefs))
+            order=np.argsort(keys,kind="stable")
+            self.keys=keys[order]
+            self.coefs=coefs[order]
+
+        pos=np.searchsorted(self.keys,unique_cells)
+        return self.coefs[pos][inverse.reshape(-1)]
+
+    def compute(self,cells):
+        """
+            Computes the coefficients of the given cells, one time step at a time
+            Args:
+                cells (int): 1D array of linear cell indices
+            Returns:
+                a (float): 2D array (N,64) of tricubic spline coefficients
+        """
+        time,lat,lon,lev=np.unravel_index(cells,(self.f.shape[0],self.f.shape[2],self.f.shape[3],self.f.shape[1]))
+        x=np.zeros((len(cells),64))
+        for t in np.unique(time):
+            sel=np.where(time==t)[0]
+            if self.stencil_time!=t:
+                self.stencils=derivative_stencils(self.f[t])
+                self.stencil_time=t
+            for c in range(8):
+                corner=self.stencils[:,lev[sel]+CORNERS[c,0],lat[sel]+CORNERS[c,1],lon[sel]+CORNERS[c,2]]
+                x[sel,c::8]=corner.T
+        return np.einsum("ij,nj->ni",A,x)
+
+
 def euclidian_distance(p_r,  p_0):
     """
         Function to calculate EuclidianDistace detwwen two points in geodetic coordinates
@@ -231,3 +516,76 @@ def euclidian_distance(p_r,  p_0):
     return dist
 
 
+
+
+
+def geodetic_to_ecef(lat,lon,alt):
+    """
+        Function to convert arrays of points to ECEF coordinates, with the same spherical earth as euclidian_distance
+        Args:
+            lat (float): array of latitudes in degrees
+            lon (float): array of longitudes in degrees
+            alt (float): array of altitudes in km
+        Returns:
+            xyz (float): array (...,3) of ECEF coordinates in m
+    """
+    lat=np.deg2rad(lat)
+    lon=np.deg2rad(lon)
+    r=1.0e3*(np.asarray(alt,dtype=float)+RE)
+    return np.stack((r*np.cos(lon)*np.cos(lat),r*np.sin(lon)*np.cos(lat),r*np.sin(lat)),axis=-1)
+
+
+class idwtrees:
+    """
+        idwtrees keeps one cKDTree of the TIEGCM grid points in ECEF coordinates per time index, 
+        evicting the least recently used trees when the memory limit is reached.
+    """
+    def __init__(self,glat,glon,zg,max_bytes=2*1024**3):
+        """
+            Args:
+                glat (float): 1D array of latitudes of TIEGCM
+                glon (float): 1D array of longitudes of TIEGCM
+                zg (float): 4D array (time,lev,lat,lon) of altitudes of TIEGCM midpoint levels in cm
+                max_bytes (int): memory limit of the cached trees in bytes
+        """
+        self.glat=np.asarray(glat,dtype=float)
+        self.glon=np.asarray(glon,dtype=float)
+        self.zg=zg
+        self.max_bytes=max_bytes
+        self.trees=OrderedDict()
+        self.built=0
+
+    @staticmethod
+    def treebytes(tree):
+        """
+            Estimated memory of a tree: its copy of the points, the index permutation and about 64 bytes per node
+        """
+        return tree.data.nbytes+tree.indices.nbytes+64*tree.size
+
+    def nbytes(self):
+        """
+            Returns:
+                nbytes (int): estimated memory of all cached trees in bytes
+        """
+        return sum(self.treebytes(tree) for tree in self.trees.values())
+
+    def tree(self,time):
+        """
+            Returns the tree of a time index, building it if it is not cached. Points are ordered as ne[time].ravel() (lev,lat,lon)
+            Args:
+                time (int): time index
+            Returns:
+                tree (cKDTree): tree of the grid points of the time index
+        """
+        if time in self.trees:
+            self.trees.move_to_end(time)
+            return self.trees[time]
+        alt=np.asarray(self.zg[time],dtype=float)/1e5
+        lat=np.broadcast_to(self.glat[None,:,None],alt.shape)
+        lon=np.broadcast_to(self.glon[None,None,:],alt.shape)
+        tree=cKDTree(geodetic_to_ecef(lat,lon,alt).reshape(-1,3))
+        self.built+=1
+        self.trees[time]=tree
+        while len(self.trees)>1 and self.nbytes()>self.max_bytes:
+            self.trees.popitem(last=False)
+        return tree
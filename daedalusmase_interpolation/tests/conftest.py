@@ -0,0 +1,13 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "source_code"))
+
+from synthetic_interpolation import synthetic_grid  # noqa: E402
+
+
+@pytest.fixture
+def grid():
+    return synthetic_grid()
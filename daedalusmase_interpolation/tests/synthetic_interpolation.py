@@ -0,0 +1,82 @@
+"""Synthetic TIEGCM grids and orbits shared by the interpolation tests and benchmarks."""
+import numpy as np
+
+
+def synthetic_grid(nt=3, nlev=12, seed=0):
+    """
+        Synthetic TIEGCM-like grid: 2.5 degree latitude and longitude, altitudes (cm) increasing with the pressure
+        level and varying smoothly with time, latitude and longitude, and a smooth variable on it.
+    """
+    rng = np.random.default_rng(seed)
+    gtime = np.arange(nt) * 60.0
+    glat = np.arange(-88.75, 90, 2.5)
+    glon = np.arange(-180, 180, 2.5)
+    t, lev, lat, lon = np.meshgrid(np.arange(nt), np.arange(nlev), np.radians(glat), np.radians(glon), indexing="ij")
+    zg = (100 + 25 * lev + 5 * np.cos(lat) * np.sin(lon + t) + 0.1 * rng.random(t.shape)) * 1e5
+    ne = 1e5 * (1 + lev) * (2 + np.cos(lat) * np.cos(2 * lon - t)) + rng.random(t.shape)
+    return gtime, glat, glon, zg, ne
+
+
+def synthetic_orbit(gtime, zg, n, seed=1):
+    """Random orbit points inside the grid, including the latitude and longitude edges handled specially."""
+    rng = np.random.default_rng(seed)
+    dtime = rng.uniform(gtime[0], gtime[-1], n)
+    dlat = rng.uniform(-90, 90, n)
+    dlon = rng.uniform(-180, 180, n)
+    dalt = rng.uniform(zg[:, 1].max() / 1e5, zg[:, -2].min() / 1e5, n)
+    edges = np.array([-90, -88.75, -87.5, -87.4, 87.5, 87.6, 88.75, 90])
+    dlat[:len(edges)] = edges
+    dlon[:4] = [-180, -177.5, 177.5, 179.9]
+    return dtime, dlat, dlon, dalt
+
+
+
+def along_track_orbit(gtime, zg, duration, rate=16, period=5400, inclination=96, seed=1):
+    """
+        Circular orbit sampled at rate Hz for duration seconds from the first time step (gtime in minutes), with an
+        altitude oscillating inside the grid once per revolution, as consecutive samples of a satellite.
+    """
+    rng = np.random.default_rng(seed)
+    seconds = np.arange(0, duration, 1 / rate)
+    phase = 2 * np.pi * seconds / period + rng.uniform(0, 2 * np.pi)
+    inclination = np.radians(inclination)
+    dlat = np.degrees(np.arcsin(np.sin(inclination) * np.sin(phase)))
+    dlon = np.degrees(np.arctan2(np.cos(inclination) * np.sin(phase), np.cos(phase))) - 360 * seconds / 86400
+    dlon = (dlon + rng.uniform(-180, 180) + 180) % 360 - 180
+    low, high = zg[:, 1].max() / 1e5, zg[:, -2].min() / 1e5
+    dalt = (low + high) / 2 + 0.45 * (high - low) * np.sin(phase)
+    dtime = gtime[0] + seconds / 60
+    return dtime, dlat, dlon, dalt
+
+
+class SyntheticSteps:
+    """
+        Time steps of a synthetic TIEGCM-like grid computed when they are indexed, for orbits of many days whose whole
+        grid does not fit in memory. steps[t] and steps[t, ...] index the (lev, lat, lon) array of time step t,
+        the last computed step is kept.
+    """
+
+    def __init__(self, nt, nlev, glat, glon, quantity="zg"):
+        self.nt = nt
+        self.nlev = nlev
+        self.glat = glat
+        self.glon = glon
+        self.quantity = quantity
+        self.shape = (nt, nlev, len(glat), len(glon))
+        self.time = None
+        self.value = None
+
+    def step(self, t):
+        if t != self.time:
+            lev, lat, lon = np.meshgrid(np.arange(self.nlev), np.radians(self.glat), np.radians(self.glon), indexing="ij")
+            if self.quantity == "zg":
+                self.value = (100 + 25 * lev + 5 * np.cos(lat) * np.sin(lon + t)) * 1e5
+            else:
+                self.value = 1e5 * (1 + lev) * (2 + np.cos(lat) * np.cos(2 * lon - t))
+            self.time = t
+        return self.value
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            return self.step(int(key[0]))[key[1:]]
+        return self.step(int(key))
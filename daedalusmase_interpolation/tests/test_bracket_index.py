@@ -0,0 +1,123 @@
+import numpy as np
+from hypothesis import given, settings, strategies as st
+from hypothesis.extra import numpy as hnp
+
+import supportfuctions as SF
+
+
+def local_scan(y, x):
+    # the linear scan local used before BracketIndex, kept as the reference
+    local_pos = 0
+    for i in range(0, len(x) - 1):
+        if y >= x[i] and y < x[i + 1]:
+            if y <= 0:
+                return i + 1
+            return i
+    return local_pos
+
+
+def bracket_scan(y, x):
+    # first interval [x[i],x[i+1]] containing y in either direction, -1 if none
+    for i in range(0, len(x) - 1):
+        if (x[i] <= y < x[i + 1]) or (x[i] >= y > x[i + 1]):
+            return i
+    return -1
+
+
+finite = st.floats(-1e4, 1e4, allow_nan=False, allow_infinity=False)
+
+
+@st.composite
+def axes(draw):
+    """Ascending axes, uniform (as time, lat and lon of TIEGCM) or irregular, possibly reversed."""
+    n = draw(st.integers(2, 40))
+    if draw(st.booleans()):
+        start = draw(st.sampled_from([-180.0, -88.75, 0.0, 12.5, -3.0]))
+        step = draw(st.sampled_from([2.5, 5.0, 60.0, 0.1, 1.0 / 3]))
+        x = start + step * np.arange(n)
+    else:
+        x = np.unique(np.array(draw(st.lists(finite, min_size=n, max_size=n))))
+        if len(x) < 2:
+            x = np.array([0.0, 1.0])
+    if draw(st.integers(0, 4)) == 0:
+        x = x[::-1]
+    return x
+
+
+@st.composite
+def axis_and_values(draw):
+    x = draw(axes())
+    nodes = st.sampled_from(list(x))
+    between = st.floats(float(x.min()) - 10, float(x.max()) + 10, allow_nan=False)
+    y = draw(st.lists(st.one_of(nodes, between, finite, st.just(0.0), st.just(np.nan)), min_size=1, max_size=30))
+    return x, np.array(y)
+
+
+@settings(max_examples=300, deadline=None)
+@given(axis_and_values())
+def test_bracket_index_local_matches_scan(data):
+    x, y = data
+    expected = [local_scan(v, x) for v in y]
+    np.testing.assert_array_equal(SF.BracketIndex(x).local(y), expected)
+
+
+@settings(max_examples=300, deadline=None)
+@given(axis_and_values())
+def test_local_matches_scan(data):
+    x, y = data
+    assert [SF.local(v, x) for v in y] == [local_scan(v, x) for v in y]
+
+
+@settings(max_examples=300, deadline=None)
+@given(axis_and_values())
+def test_bracket_matches_scan(data):
+    x, y = data
+    expected = [bracket_scan(v, x) for v in y]
+    np.testing.assert_array_equal(SF.BracketIndex(x).bracket(y), expected)
+
+
+@settings(max_examples=200, deadline=None)
+@given(st.lists(st.one_of(st.floats(-720, 720, allow_nan=False), st.just(np.nan)), min_size=1, max_size=30),
+       st.sampled_from([2.5, 5.0, 7.5]))
+def test_periodic_bracket_wraps_longitude(y, step):
+    glon = np.arange(-180, 180, step)
+    y = np.array(y)
+    pos = SF.BracketIndex(glon, period=360).bracket(y)
+    wrapped = -180 + np.mod(y + 180, 360)
+    for p, w in zip(pos, wrapped):
+        if np.isnan(w):
+            assert p == -1
+        elif p == len(glon) - 1:
+            # interval from the last longitude to the first one plus the period
+            assert glon[-1] <= w < glon[0] + 360
+        else:
+            assert glon[p] <= w < glon[p + 1]
+
+
+@st.composite
+def columns_and_values(draw):
+    """ZGMID-like (time,lev,lat,lon) altitudes in cm with ascending, descending or irregular columns."""
+    nt, nlev, nlat, nlon = draw(st.tuples(st.integers(1, 3), st.integers(2, 12), st.integers(1, 3), st.integers(1, 3)))
+    zg = draw(hnp.arrays(float, (nt, nlev, nlat, nlon), elements=st.floats(0, 600e5, allow_nan=False)))
+    if draw(st.booleans()):
+        zg = np.sort(zg, axis=1)
+    n = draw(st.integers(1, 20))
+    index = st.tuples(st.integers(0, nt - 1), st.integers(0, nlat - 1), st.integers(0, nlon - 1))
+    cells = np.array(draw(st.lists(index, min_size=n, max_size=n)))
+    nodes = st.sampled_from(list(zg.ravel() / 1e5))
+    y = np.array(draw(st.lists(st.one_of(nodes, st.floats(-10, 610, allow_nan=False)), min_size=n, max_size=n)))
+    return zg, cells[:, 0], cells[:, 1], cells[:, 2], y
+
+
+@settings(max_examples=300, deadline=None)
+@given(columns_and_values())
+def test_column_bracket_index_matches_scan(data):
+    zg, time, lat, lon, y = data
+    index = SF.ColumnBracketIndex(zg)
+    local_pos, cols = index.local(y, time, lat, lon)
+    bracket = index.bracket(y, time, lat, lon)
+    for i in range(len(y)):
+        column = zg[time[i], :, lat[i], lon[i]] / 1e5
+        np.testing.assert_array_equal(cols[i], column)
+        assert local_pos[i] == local_scan(y[i], column)
+        assert bracket[i] == bracket_scan(y[i], column)
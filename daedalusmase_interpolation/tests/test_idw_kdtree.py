@@ -0,0 +1,83 @@
+import numpy as np
+
+import interpolationmase_mainfunc as IM
+import supportfuctions as SF
+from synthetic_interpolation import synthetic_orbit
+
+
+def idw_brute_force(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, ne, k=8, p=2):
+    # k nearest grid points of every orbit point by sorting the distances to all of them
+    counter = SF.BracketIndex(gtime).local(dtime)
+    m = np.zeros(len(dalt))
+    for i in range(len(dalt)):
+        alt = zg[counter[i]] / 1e5
+        lat = np.broadcast_to(glat[None, :, None], alt.shape)
+        lon = np.broadcast_to(glon[None, None, :], alt.shape)
+        grid = SF.geodetic_to_ecef(lat, lon, alt).reshape(-1, 3)
+        dist = np.sqrt(np.sum((grid - SF.geodetic_to_ecef(dlat[i], dlon[i], dalt[i])) ** 2, axis=1))
+        nearest = np.argsort(dist)[:k]
+        weights = 1 / dist[nearest] ** p
+        m[i] = np.sum(weights * ne[counter[i]].reshape(-1)[nearest]) / np.sum(weights)
+    return m
+
+
+def test_matches_brute_force(grid):
+    gtime, glat, glon, zg, ne = grid
+    dtime, dlat, dlon, dalt = synthetic_orbit(gtime, zg, 100)
+    for k, p in [(8, 2), (4, 1.5)]:
+        expected = idw_brute_force(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, ne, k=k, p=p)
+        result = IM.idwinterpolation_kdtree(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, ne, k=k, p=p)
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+
+def test_grid_nodes_return_node_values(grid):
+    gtime, glat, glon, zg, ne = grid
+    rng = np.random.default_rng(5)
+    n = 100
+    lev = rng.integers(0, zg.shape[1], n)
+    lat = rng.integers(0, len(glat), n)
+    lon = rng.integers(0, len(glon), n)
+    # the second time step, local returns its own index for its time
+    dtime = np.full(n, gtime[1])
+    result = IM.idwinterpolation_kdtree(gtime, glat, glon, dtime, glat[lat], glon[lon], zg[1, lev, lat, lon] / 1e5, zg,
+                                        ne)
+    np.testing.assert_array_equal(result, ne[1, lev, lat, lon])
+
+
+def test_trees_are_shared_between_calls(grid):
+    gtime, glat, glon, zg, ne = grid
+    dtime, dlat, dlon, dalt = synthetic_orbit(gtime, zg, 300, seed=2)
+    trees = SF.idwtrees(glat, glon, zg)
+    first = IM.idwinterpolation_kdtree(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, ne, trees=trees)
+    built = trees.built
+    second = IM.idwinterpolation_kdtree(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, 2 * ne, trees=trees)
+    assert trees.built == built
+    np.testing.assert_allclose(second, 2 * first, rtol=1e-14)
+
+
+def test_trees_evicted_over_max_bytes(grid):
+    gtime, glat, glon, zg, ne = grid
+    size = SF.idwtrees.treebytes(SF.idwtrees(glat, glon, zg).tree(0))
+    # room for two trees
+    trees = SF.idwtrees(glat, glon, zg, max_bytes=2 * size + size // 2)
+    trees.tree(0)
+    trees.tree(1)
+    trees.tree(0)
+    trees.tree(2)
+    # the least recently used tree is dropped
+    assert list(trees.trees) == [0, 2]
+    assert trees.nbytes() <= trees.max_bytes
+    assert trees.built == 3
+    trees.tree(1)
+    assert list(trees.trees) == [2, 1]
+    assert trees.built == 4
+
+
+def test_one_tree_kept_over_max_bytes(grid):
+    gtime, glat, glon, zg, ne = grid
+    trees = SF.idwtrees(glat, glon, zg, max_bytes=1)
+    for time in range(len(gtime)):
+        tree = trees.tree(time)
+        assert list(trees.trees) == [time]
+        assert trees.nbytes() > trees.max_bytes
+        assert trees.tree(time) is tree
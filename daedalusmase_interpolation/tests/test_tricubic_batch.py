@@ -0,0 +1,53 @@
+import numpy as np
+
+import interpolationmase_mainfunc as IM
+import supportfuctions as SF
+from synthetic_interpolation import synthetic_grid, synthetic_orbit
+
+
+def test_batch_matches_point_by_point():
+    # the scalar derivatives set the boundaries with the TIEGCM sizes (57 levels, 72 latitudes, 144 longitudes)
+    gtime, glat, glon, zg, ne = synthetic_grid(nt=2, nlev=57)
+    dtime, dlat, dlon, dalt = synthetic_orbit(gtime, zg, 200)
+    expected = IM.tricubicsplineinterpolation(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, ne)
+    result = IM.tricubicsplineinterpolation_batch(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, ne)
+    np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+
+def test_batch_does_not_depend_on_chunk_size(grid):
+    gtime, glat, glon, zg, ne = grid
+    dtime, dlat, dlon, dalt = synthetic_orbit(gtime, zg, 1000, seed=2)
+    whole = IM.tricubicsplineinterpolation_batch(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, ne)
+    chunked = IM.tricubicsplineinterpolation_batch(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, ne, chunk_size=97)
+    np.testing.assert_array_equal(chunked, whole)
+
+
+def test_hits_and_misses(grid):
+    gtime, glat, glon, zg, ne = grid
+    dtime, dlat, dlon, dalt = synthetic_orbit(gtime, zg, 500, seed=3)
+    # every point twice, the second one always finds the cell of the first
+    dtime, dlat, dlon, dalt = [np.repeat(x, 2) for x in (dtime, dlat, dlon, dalt)]
+    coefficients = SF.tricubiccoefficients(ne)
+    first = IM.tricubicsplineinterpolation_batch(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, ne,
+                                                 coefficients=coefficients)
+    cells = len(coefficients.keys)
+    assert coefficients.misses == cells
+    assert coefficients.hits == len(dalt) - cells
+    assert coefficients.hitrate() >= 0.5
+
+    second = IM.tricubicsplineinterpolation_batch(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, ne,
+                                                  coefficients=coefficients)
+    np.testing.assert_array_equal(second, first)
+    assert coefficients.misses == cells
+    assert coefficients.hits == 2 * len(dalt) - cells
+
+
+def test_cache_is_emptied_when_full(grid):
+    gtime, glat, glon, zg, ne = grid
+    dtime, dlat, dlon, dalt = synthetic_orbit(gtime, zg, 300, seed=4)
+    expected = IM.tricubicsplineinterpolation_batch(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, ne)
+    coefficients = SF.tricubiccoefficients(ne, max_cells=50)
+    result = IM.tricubicsplineinterpolation_batch(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, ne,
+                                                  coefficients=coefficients, chunk_size=40)
+    np.testing.assert_array_equal(result, expected)
+    assert len(coefficients.keys) <= 50
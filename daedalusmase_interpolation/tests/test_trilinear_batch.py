@@ -0,0 +1,21 @@
+import numpy as np
+
+import interpolationmase_mainfunc as IM
+from synthetic_interpolation import synthetic_orbit
+
+
+def test_batch_matches_point_by_point(grid):
+    gtime, glat, glon, zg, ne = grid
+    dtime, dlat, dlon, dalt = synthetic_orbit(gtime, zg, 3000)
+    expected = IM.trilinearinterpolation(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, ne)
+    result = IM.trilinearinterpolation_batch(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, ne)
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_batch_does_not_depend_on_chunk_size(grid):
+    gtime, glat, glon, zg, ne = grid
+    dtime, dlat, dlon, dalt = synthetic_orbit(gtime, zg, 1000, seed=2)
+    whole = IM.trilinearinterpolation_batch(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, ne)
+    chunked = IM.trilinearinterpolation_batch(gtime, glat, glon, dtime, dlat, dlon, dalt, zg, ne, chunk_size=97)
+    np.testing.assert_array_equal(chunked, whole)
+